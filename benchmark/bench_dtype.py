@@ -0,0 +1,91 @@
+"""
+
+배치 매서드를 배정밀도(float64, complex128)와 단정밀도(float32, complex64, dtype 연산 조건)로 계산해서 비교하는 벤치마크 파일입니다.
+
+경우마다 원소 하나당 걸린 시간(나노초), 결과 배열 크기의 비율(float64 / float32, memory), 배정밀도 결과와의 최대 오차를 출력합니다.
+오차는 단정밀도로 바꾼 입력을 배정밀도로 계산한 값과 비교하므로, 입력을 float32 로 바꿀 때 생기는 오차는 들어가지 않습니다.
+    - abs : 최대 절대 오차
+    - rel : 최대 상대 오차 (|참값| 이 1e-30 보다 작은 위치는 제외)
+    - ulp : 최대 오차를 float32 의 최소 단위(참값 위치의 np.spacing)로 나눈 값
+README 의 'dtype 별 정확도' 표는 이 파일의 출력입니다.
+
+실행 방법 : python benchmark/bench_dtype.py [--size 1000000]
+"""
+import argparse
+import timeit
+
+import numpy as np
+
+from calculator import ComplexCalculator
+
+SIZE = 1000000  # 입력 배열 크기
+
+
+def make_cases(rng: any, size: int) -> list:
+    """(이름, 배치 매서드 이름, 입력 배열들, 연산 조건) 목록을 반환합니다."""
+    angles = rng.uniform(-360, 360, size)
+    positive = np.exp(rng.uniform(-20, 20, size))
+    bases = rng.uniform(0.1, 10, size)
+    exponents = rng.uniform(-8, 8, size)
+    z = rng.normal(size=size) + 1j * rng.normal(size=size)
+    return [
+        ('sin', 'sin_batch', (angles,), {'angle_unit': 'degree'}),
+        ('cos', 'cos_batch', (angles,), {'angle_unit': 'degree'}),
+        ('tan', 'tan_batch', (rng.uniform(-80, 80, size),), {'angle_unit': 'degree'}),
+        ('sin (max_error=1e-6)', 'sin_batch', (angles,), {'angle_unit': 'degree', 'max_error': 1e-6}),
+        ('square_root', 'square_root_batch', (positive,), {}),
+        ('log', 'log_batch', (positive,), {}),
+        ('ln', 'ln_batch', (positive,), {}),
+        ('power', 'power_batch', (bases, exponents), {}),
+        ('add', 'add_batch', (bases, exponents), {}),
+        ('divide', 'divide_batch', (bases, exponents), {}),
+        ('complex_magnitude', 'complex_magnitude_batch', (z,), {}),
+        ('complex_argument', 'complex_argument_batch', (z,), {}),
+    ]
+
+
+def values_of(result: any) -> any:
+    """배치 매서드 결과에서 값 배열을 꺼냅니다. (BatchResult 는 values)"""
+    return result.values if isinstance(result, tuple) else result
+
+
+def errors(single: any, reference: any) -> tuple:
+    """단정밀도 결과와 배정밀도 참값의 (최대 절대 오차, 최대 상대 오차, 최대 ulp 오차)를 반환합니다."""
+    finite = np.isfinite(reference) & np.isfinite(single)
+    single = single[finite].astype(np.float64)
+    reference = reference[finite]
+    error = np.abs(single - reference)
+    nonzero = np.abs(reference) > 1e-30
+    relative = error[nonzero] / np.abs(reference[nonzero])
+    ulp = error / np.spacing(np.abs(reference).astype(np.float32)).astype(np.float64)
+    return float(error.max()), float(relative.max(initial=0.0)), float(ulp.max())
+
+
+def per_element(function: any, size: int) -> float:
+    """function 한번 실행에 걸리는 시간을 원소 하나당 나노초로 반환합니다."""
+    number = max(1, 1000000 // size)
+    seconds = min(timeit.repeat(function, number=number, repeat=5))
+    return seconds / number / size * 1e9
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='배치 매서드의 float64, float32 계산 시간과 오차를 비교합니다.')
+    parser.add_argument('--size', type=int, default=SIZE, help=f'입력 배열 크기 (기본값: {SIZE})')
+    args = parser.parse_args()
+
+    calc = ComplexCalculator()
+    rng = np.random.default_rng(0)
+    print(f"{'operation':<22}{'f64 ns/elem':>12}{'f32 ns/elem':>12}{'speedup':>9}{'memory':>8}"
+          f"{'abs':>11}{'rel':>11}{'ulp':>8}")
+    for name, method_name, inputs, kwargs in make_cases(rng, args.size):
+        method = getattr(calc, method_name)
+        single_inputs = tuple(value.astype(np.complex64 if value.dtype.kind == 'c' else np.float32)
+                              for value in inputs)  # 호출하는 쪽도 단정밀도 배열을 가지고 있는 경우
+        double = per_element(lambda: method(*inputs, **kwargs), args.size)
+        single = per_element(lambda: method(*single_inputs, dtype='float32', **kwargs), args.size)
+        single_values = values_of(method(*single_inputs, dtype='float32', **kwargs))
+        reference = values_of(method(*(value.astype(inputs[0].dtype) for value in single_inputs), **kwargs))
+        ratio = values_of(method(*inputs, **kwargs)).nbytes / single_values.nbytes
+        abs_error, rel_error, ulp_error = errors(single_values, reference)
+        print(f"{name:<22}{double:>12.2f}{single:>12.2f}{double / single:>8.2f}x{ratio:>7.1f}x"
+              f"{abs_error:>11.2e}{rel_error:>11.2e}{ulp_error:>8.1f}")
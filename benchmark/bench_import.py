@@ -0,0 +1,93 @@
+"""
+
+calculator 패키지의 import 시간을 측정하는 벤치마크 파일입니다.
+
+짧게 실행되는 작업 프로세스가 많기 때문에 import 시간이 중요합니다.
+경우마다 새 파이썬 프로세스를 띄워서 import 와 첫 호출까지 걸린 시간(인터프리터 시작 시간 제외)을 측정하고,
+불러오지 않아야 할 무거운 모듈(cmath, numpy, asyncio 등)을 불러왔는지 확인합니다.
+불러오지 않아야 할 모듈을 불러온 경우가 있으면 종료 코드 1 로 끝납니다.
+
+측정 전에 한번 실행해서 .pyc 파일을 만들어두므로, 소스 컴파일 시간은 포함되지 않습니다.
+
+실행 방법 : python benchmark/bench_import.py [--runs 20]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+RUNS = 20  # 경우마다 프로세스를 띄우는 횟수
+
+HEAVY_MODULES = ('typing', 'cmath', 'numpy', 'asyncio', 'calculator.server')
+
+# (이름, 실행할 코드, 불러오면 안 되는 모듈들)
+CASES = [
+    ('import calculator',
+     "import calculator",
+     HEAVY_MODULES),
+    ('Calculator().add',
+     "import calculator; calculator.Calculator().add(1, 2)",
+     HEAVY_MODULES),
+    ('EngineeringCalculator().sin',
+     "import calculator; calculator.EngineeringCalculator().sin(1)",
+     HEAVY_MODULES),
+    ('ComplexCalculator().complex_add',
+     "import calculator; calculator.ComplexCalculator().complex_add(1j, 2)",
+     ('numpy', 'asyncio', 'calculator.server')),
+    ('Calculator().add_batch',
+     "import calculator; calculator.Calculator().add_batch([1], [2])",
+     ('asyncio', 'calculator.server')),
+    ('import calculator.server',
+     "import calculator.server",
+     ()),
+]
+
+# 자식 프로세스에서 실행하는 코드. 걸린 시간(초)과 불러온 무거운 모듈들을 JSON 으로 출력함
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, [name for name in {heavy!r} if name in sys.modules]]))
+"""
+
+
+def run_once(code: str, env: dict) -> tuple:
+    """새 프로세스에서 code 를 실행하고 (걸린 시간(초), 불러온 무거운 모듈 목록)을 반환합니다."""
+    child = CHILD.format(code=code, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, '-c', child], env=env, check=True,
+                            capture_output=True, text=True).stdout
+    elapsed, loaded = json.loads(output)
+    return elapsed, loaded
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(prog='python benchmark/bench_import.py',
+                                     description='calculator 패키지의 import 시간을 측정합니다.')
+    parser.add_argument('--runs', type=int, default=RUNS, help=f'경우마다 프로세스를 띄우는 횟수 (기본값: {RUNS})')
+    args = parser.parse_args(argv)
+
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)  # .pyc 를 만들어 컴파일 시간을 빼고 측정
+
+    failed = False
+    print(f"{'case':<34}{'min ms':>9}{'median ms':>11}  loaded heavy modules")
+    for name, code, forbidden in CASES:
+        run_once(code, env)  # .pyc 생성용
+        times = []
+        for _ in range(args.runs):
+            elapsed, loaded = run_once(code, env)
+            times.append(elapsed * 1e3)
+        unexpected = [module for module in loaded if module in forbidden]
+        failed = failed or bool(unexpected)
+        note = ', '.join(loaded) or '-'
+        if unexpected:
+            note += f"  (unexpected: {', '.join(unexpected)})"
+        print(f"{name:<34}{min(times):>9.2f}{statistics.median(times):>11.2f}  {note}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+
+연산 조건(precision, return_float, angle_unit) 처리 비용을 비교하는 마이크로 벤치마크 파일입니다.
+
+before : 예전 방식. 매 호출마다 **kwargs 를 반복문으로 돌며 연산 조건을 추출합니다. (utils.get_kwarg + angle_unit 반복문)
+after  : utils.resolve_options 방식. 같은 키워드 인자 조합은 한번만 검사하고, 계산기에 묶인 Options 는 검사 없이 사용합니다.
+
+실행 방법 : python benchmark/bench_options.py
+"""
+import timeit
+
+from calculator import utils
+from calculator import EngineeringCalculator
+
+NUMBER = 200000  # 측정 반복 횟수
+
+
+def legacy_parse(**kwargs: dict[str, any]) -> tuple:
+    """예전 sin 매서드가 매 호출마다 하던 연산 조건 추출 과정을 그대로 흉내냅니다."""
+    precision, return_float = utils.get_kwarg(**kwargs)
+    angle_unit = 'radian'
+    for key, value in kwargs.items():
+        if key == 'angle_unit' and value == 'degree':
+            angle_unit = value
+    return precision, return_float, angle_unit
+
+
+def per_call(statement: str, namespace: dict) -> float:
+    """statement 한번 실행에 걸리는 시간(나노초)을 반환합니다."""
+    seconds = min(timeit.repeat(statement, globals=namespace, number=NUMBER, repeat=5))
+    return seconds / NUMBER * 1e9
+
+
+if __name__ == '__main__':
+    bound = utils.Options(precision=4, angle_unit='degree')
+    eng_calc = EngineeringCalculator()
+    bound_calc = EngineeringCalculator(options=bound)
+    namespace = {'legacy_parse': legacy_parse, 'utils': utils, 'bound': bound,
+                 'eng_calc': eng_calc, 'bound_calc': bound_calc}
+
+    cases = [
+        ('parse / before (kwargs loop)',
+         "legacy_parse(angle_unit='degree', precision=4)"),
+        ('parse / after (kwargs, cached)',
+         "utils.resolve_options(utils.DEFAULT_OPTIONS, {'angle_unit': 'degree', 'precision': 4})"),
+        ('parse / after (bound Options)',
+         "utils.resolve_options(bound, {})"),
+        ('sin / kwargs per call',
+         "eng_calc.sin(30, angle_unit='degree', precision=4)"),
+        ('sin / options= per call',
+         "eng_calc.sin(30, options=bound)"),
+        ('sin / bound Options',
+         "bound_calc.sin(30)"),
+    ]
+
+    print(f"{'case':<34}{'ns/call':>10}")
+    for name, statement in cases:
+        print(f"{name:<34}{per_call(statement, namespace):>10.1f}")
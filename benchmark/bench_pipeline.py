@@ -0,0 +1,38 @@
+"""
+
+배치 매서드를 차례로 부르는 방식과 Pipeline 으로 한번에 계산하는 방식을 비교하는 벤치마크 파일입니다.
+
+chained  : sin_batch -> power_batch -> np.round. 단계마다 입력 크기만한 중간 결과 배열을 만듭니다.
+pipeline : eng_calc.pipeline().sin(angle_unit='degree').power(2).round(4). CHUNK_SIZE 덩어리 단위로 모든 단계를 제자리에서 계산합니다.
+
+배열이 캐시보다 클수록(10만 개 이상) 메모리를 덜 읽고 쓰는 pipeline 이 빨라집니다.
+
+실행 방법 : python benchmark/bench_pipeline.py
+"""
+import timeit
+
+import numpy as np
+
+from calculator import EngineeringCalculator
+
+SIZES = (1000, 100000, 10000000)  # 입력 배열 크기
+
+
+def per_element(function: any, size: int) -> float:
+    """function 한번 실행에 걸리는 시간을 원소 하나당 나노초로 반환합니다."""
+    number = max(1, 1000000 // size)
+    seconds = min(timeit.repeat(function, number=number, repeat=5))
+    return seconds / number / size * 1e9
+
+
+if __name__ == '__main__':
+    eng_calc = EngineeringCalculator()
+    squared_sine = eng_calc.pipeline().sin(angle_unit='degree').power(2).round(4)
+
+    print(f"{'size':>10}{'chained ns/elem':>18}{'pipeline ns/elem':>18}")
+    for size in SIZES:
+        x = np.random.default_rng(size).uniform(0, 360, size)
+        chained = per_element(lambda: np.round(eng_calc.power_batch(
+            eng_calc.sin_batch(x, angle_unit='degree').values, 2).values, 4), size)
+        fused = per_element(lambda: squared_sine(x), size)
+        print(f"{size:>10}{chained:>18.1f}{fused:>18.1f}")
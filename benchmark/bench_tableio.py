@@ -0,0 +1,98 @@
+"""
+
+숫자 표 읽기, 결과 쓰기의 처리량(초당 줄 수)을 비교하는 벤치마크 파일입니다.
+
+before : csv 모듈로 한 줄씩 읽어 float() 로 바꾸고, 한 줄씩 calc.add 로 계산한 뒤 str(Result) 로 씁니다.
+after  : calculator.tableio 로 덩어리마다 배열로 읽고, add_batch 로 계산한 뒤 글자 행렬로 한번에 씁니다.
+
+실행 방법 : python benchmark/bench_tableio.py [--rows 200000]
+"""
+import argparse
+import csv
+import io
+import time
+
+import numpy as np
+
+from calculator import Calculator, tableio
+
+ROWS = 200000  # 표의 줄 수
+PRECISION = 4  # 출력 소수점 자릿수
+
+
+def make_table(rows: int) -> str:
+    """x, y 두 열의 숫자 표(CSV 문자열)를 만듭니다."""
+    values = np.random.default_rng(0).uniform(-1000, 1000, (rows, 2))
+    buffer = io.StringIO()
+    buffer.write('x,y\n')
+    np.savetxt(buffer, values, delimiter=',', fmt='%.6f')
+    return buffer.getvalue()
+
+
+def rows_per_second(function: any, rows: int, repeat: int = 3) -> float:
+    """function 을 repeat 번 실행해서 가장 빠른 시간으로 초당 줄 수를 계산합니다."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return rows / best
+
+
+def parse_before(text: str) -> list:
+    reader = csv.reader(io.StringIO(text))
+    next(reader)
+    return [[float(value) for value in row] for row in reader]
+
+
+def parse_after(text: str) -> any:
+    return tableio.read_table(io.StringIO(text))[1]
+
+
+def format_before(values: any) -> str:
+    calc = Calculator()
+    return ''.join(f"{calc.add(value, precision=PRECISION)}\n" for value in values.tolist())
+
+
+def format_after(values: any) -> bytes:
+    output = io.BytesIO()
+    tableio.write_table(output, [values], precision=PRECISION)
+    return output.getvalue()
+
+
+def end_to_end_before(text: str) -> str:
+    calc = Calculator()
+    reader = csv.reader(io.StringIO(text))
+    next(reader)
+    return ''.join(f"{calc.add(float(x), float(y), precision=PRECISION)}\n" for x, y in reader)
+
+
+def end_to_end_after(text: str) -> bytes:
+    output = io.BytesIO()
+    tableio.evaluate_table(Calculator(), 'add_batch', io.StringIO(text), output, precision=PRECISION)
+    return output.getvalue()
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(prog='python benchmark/bench_tableio.py',
+                                     description='숫자 표 읽기, 쓰기 처리량을 비교합니다.')
+    parser.add_argument('--rows', type=int, default=ROWS, help=f'표의 줄 수 (기본값: {ROWS})')
+    args = parser.parse_args(argv)
+
+    text = make_table(args.rows)
+    values = parse_after(text)[:, 0] + parse_after(text)[:, 1]
+
+    cases = [
+        ('parse CSV (2 columns)', lambda: parse_before(text), lambda: parse_after(text)),
+        (f'format results (precision={PRECISION})', lambda: format_before(values), lambda: format_after(values)),
+        ('read + add + write', lambda: end_to_end_before(text), lambda: end_to_end_after(text)),
+    ]
+    print(f"{'case':<34}{'before rows/s':>16}{'after rows/s':>16}{'speedup':>10}")
+    for name, before, after in cases:
+        slow = rows_per_second(before, args.rows)
+        fast = rows_per_second(after, args.rows)
+        print(f"{name:<34}{slow:>16,.0f}{fast:>16,.0f}{fast / slow:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
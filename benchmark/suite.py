@@ -0,0 +1,338 @@
+"""
+
+Calculator, EngineeringCalculator, ComplexCalculator 의 모든 매서드를 연산 조건 조합과 입력 크기별로 측정하는 벤치마크 모음입니다.
+
+연산 조건 조합 : none, precision(precision=4), return_float, precision+return_float, degree(angle_unit='degree'), degree+precision
+                 (매서드가 쓰지 않는 연산 조건은 측정하지 않습니다. 예 : complex_add 는 none 만)
+입력 크기      : 1 (스칼라), 1000, 100000
+                 배치(_batch) 매서드는 배열 길이, add 처럼 가변 인자를 받는 매서드는 인자 개수이며,
+                 인자 하나를 받는 스칼라 매서드(sin 등)는 1 만 측정합니다.
+기록 비용      : 이름에 +metrics 가 붙은 항목은 enable_metrics 를 켜고 측정한 것입니다. (예 : Calculator.add[none+metrics]/1 과 Calculator.add[none]/1)
+
+결과는 측정 항목마다 호출 한번에 걸린 시간(seconds)을 담은 JSON 파일로 저장하고,
+저장해둔 기준 결과(baseline)와 비교해서 threshold 보다 느려진 항목을 REGRESSION 으로 표시합니다.
+
+실행 방법 :
+    python benchmark/suite.py -o baseline.json                       # 측정하고 저장
+    python benchmark/suite.py -o current.json --baseline baseline.json  # 측정하고 기준과 비교 (느려진 항목이 있으면 종료 코드 1)
+    python benchmark/suite.py --compare baseline.json current.json     # 저장된 두 결과만 비교
+    python benchmark/suite.py --filter sin --min-time 0.05             # 이름에 sin 이 들어간 항목만 빠르게 측정
+"""
+import argparse
+import inspect
+import json
+import platform
+import sys
+import time
+import timeit
+from typing import NamedTuple
+
+import numpy as np
+from calculator import utils
+from calculator import Calculator, EngineeringCalculator, ComplexCalculator
+
+SIZES = (1, 1000, 100000)  # 입력 크기
+REPEAT = 5  # 측정 반복 횟수 (가장 빠른 값을 사용)
+MIN_TIME = 0.2  # 반복 한번의 최소 측정 시간(초)
+THRESHOLD = 0.15  # 이 비율보다 느려지면 REGRESSION 으로 표시
+
+OPTION_SETS = {
+    'none': {},
+    'precision': {'precision': 4},
+    'return_float': {'return_float': True},
+    'precision+return_float': {'precision': 4, 'return_float': True},
+    'degree': {'angle_unit': 'degree'},
+    'degree+precision': {'angle_unit': 'degree', 'precision': 4},
+    'degree+precision+max_error': {'angle_unit': 'degree', 'precision': 4, 'max_error': 1e-5},
+}
+ARITHMETIC = ('none', 'precision', 'return_float', 'precision+return_float')
+TRIGONOMETRIC = ARITHMETIC + ('degree', 'degree+precision', 'degree+precision+max_error')
+ROUNDING = ('none', 'precision')
+ANGLE = ('none', 'precision', 'degree', 'degree+precision')
+PLAIN = ('none',)
+
+SKIPPED = frozenset({'init', 'enable_cache', 'disable_cache', 'enable_metrics', 'disable_metrics',
+                     'add_accumulator', 'multiply_accumulator', 'statistics_accumulator', 'pipeline'})  # 계산을 하지 않는 매서드
+
+
+class Case(NamedTuple):
+    """측정할 매서드 하나와 그 입력, 연산 조건 조합입니다."""
+    calculator: type
+    method: str
+    make_args: any  # 입력 크기를 받아 인자 튜플을 반환하는 함수
+    sizes: tuple
+    option_sets: tuple
+    fixed: dict = {}  # 항상 넘기는 키워드 인자 (예 : coordinate)
+    options_object: bool = False  # 연산 조건을 키워드 인자 대신 options=utils.Options(...) 로 넘김 (evaluate)
+    metrics: bool = False  # enable_metrics 를 켜고 측정 (기록 비용 측정용, 이름에 +metrics 가 붙음)
+
+
+def floats(size: int, seed: int = 0, low: float = 0.5, high: float = 2.0) -> any:
+    """low 이상 high 미만의 정해진 실수 배열을 반환합니다. (같은 size, seed 면 실행마다 같은 값)"""
+    return np.random.default_rng([size, seed]).uniform(low, high, size)
+
+
+def complexes(size: int) -> any:
+    """정해진 복소수 배열을 반환합니다."""
+    return floats(size) + 1j * floats(size, seed=1)
+
+
+def operands(size: int) -> tuple:
+    """가변 인자 매서드의 인자들. 스칼라(1)는 피연산자 두 개입니다."""
+    return tuple(floats(max(size, 2)).tolist())
+
+
+def complex_operands(size: int) -> tuple:
+    return tuple(complexes(max(size, 2)).tolist())
+
+
+def one(size: int) -> tuple:
+    return (1.2345,)
+
+
+def one_complex(size: int) -> tuple:
+    return (1.2 + 3.4j,)
+
+
+def column(size: int) -> tuple:
+    return (floats(size),)
+
+
+def two_columns(size: int) -> tuple:
+    return floats(size), floats(size, seed=1)
+
+
+def complex_column(size: int) -> tuple:
+    return (complexes(size),)
+
+
+def expression(size: int) -> tuple:
+    return ("sin(x) + sqrt(y) * log(x)",)
+
+
+CASES = [
+    Case(Calculator, 'add', operands, SIZES, ARITHMETIC),
+    Case(Calculator, 'subtract', operands, SIZES, ARITHMETIC),
+    Case(Calculator, 'multiply', operands, SIZES, ARITHMETIC),
+    Case(Calculator, 'divide', operands, SIZES, ARITHMETIC),
+    Case(Calculator, 'add_batch', two_columns, SIZES, ARITHMETIC),
+    Case(Calculator, 'subtract_batch', two_columns, SIZES, ARITHMETIC),
+    Case(Calculator, 'multiply_batch', two_columns, SIZES, ARITHMETIC),
+    Case(Calculator, 'divide_batch', two_columns, SIZES, ARITHMETIC),
+    Case(Calculator, 'add_iter', lambda size: (floats(max(size, 2)).tolist(),), SIZES, ARITHMETIC),
+    Case(Calculator, 'multiply_iter', lambda size: (floats(max(size, 2)).tolist(),), SIZES, ARITHMETIC),
+    Case(Calculator, 'statistics', lambda size: (floats(max(size, 2)).tolist(),), SIZES, ARITHMETIC),
+    Case(Calculator, 'add_scan', lambda size: (floats(max(size, 2)).tolist(),), SIZES, ARITHMETIC),
+    Case(Calculator, 'subtract_scan', lambda size: (floats(max(size, 2)).tolist(),), SIZES, ARITHMETIC),
+    Case(Calculator, 'multiply_scan', lambda size: (floats(max(size, 2)).tolist(),), SIZES, ARITHMETIC),
+    Case(Calculator, 'divide_scan', lambda size: (floats(max(size, 2)).tolist(),), SIZES, ARITHMETIC),
+    Case(Calculator, 'add_scan_batch', column, SIZES, ARITHMETIC),
+    Case(Calculator, 'subtract_scan_batch', column, SIZES, ARITHMETIC),
+    Case(Calculator, 'multiply_scan_batch', column, SIZES, ARITHMETIC),
+    Case(Calculator, 'divide_scan_batch', column, SIZES, ARITHMETIC),
+    Case(Calculator, 'execute', lambda size: ('add',) + two_columns(size), SIZES, ARITHMETIC),
+
+    Case(EngineeringCalculator, 'square_root', one, (1,), ARITHMETIC),
+    Case(EngineeringCalculator, 'power', lambda size: (1.2345, 2.5), (1,), ARITHMETIC),
+    Case(EngineeringCalculator, 'log', one, (1,), ARITHMETIC),
+    Case(EngineeringCalculator, 'ln', one, (1,), ARITHMETIC),
+    Case(EngineeringCalculator, 'sin', one, (1,), TRIGONOMETRIC),
+    Case(EngineeringCalculator, 'cos', one, (1,), TRIGONOMETRIC),
+    Case(EngineeringCalculator, 'tan', one, (1,), TRIGONOMETRIC),
+    Case(EngineeringCalculator, 'square_root_batch', column, SIZES, ARITHMETIC),
+    Case(EngineeringCalculator, 'power_batch', two_columns, SIZES, ARITHMETIC),
+    Case(EngineeringCalculator, 'log_batch', column, SIZES, ARITHMETIC),
+    Case(EngineeringCalculator, 'ln_batch', column, SIZES, ARITHMETIC),
+    Case(EngineeringCalculator, 'sin_batch', column, SIZES, TRIGONOMETRIC),
+    Case(EngineeringCalculator, 'cos_batch', column, SIZES, TRIGONOMETRIC),
+    Case(EngineeringCalculator, 'tan_batch', column, SIZES, TRIGONOMETRIC),
+    Case(EngineeringCalculator, 'execute', lambda size: ('sin',) + column(size), SIZES, TRIGONOMETRIC),
+    Case(EngineeringCalculator, 'evaluate', expression, (1,), ROUNDING, {'variables': {'x': 1.5, 'y': 2.5}}, True),
+
+    Case(ComplexCalculator, 'complex_add', complex_operands, SIZES, PLAIN),
+    Case(ComplexCalculator, 'complex_subtract', complex_operands, SIZES, PLAIN),
+    Case(ComplexCalculator, 'complex_multiply', complex_operands, SIZES, PLAIN),
+    Case(ComplexCalculator, 'complex_divide', complex_operands, SIZES, PLAIN),
+    Case(ComplexCalculator, 'complex_magnitude', one_complex, (1,), ROUNDING),
+    Case(ComplexCalculator, 'complex_argument', one_complex, (1,), ANGLE),
+    Case(ComplexCalculator, 'cartesian_to_polar', one_complex, (1,), ANGLE, {'coordinate': 'cartesian'}),
+    Case(ComplexCalculator, 'complex_magnitude_batch', complex_column, SIZES, ROUNDING),
+    Case(ComplexCalculator, 'complex_argument_batch', complex_column, SIZES, ANGLE),
+    Case(ComplexCalculator, 'cartesian_to_polar_batch', complex_column, SIZES, ANGLE, {'coordinate': 'cartesian'}),
+
+    # enable_metrics 를 켰을 때의 비용. 같은 이름에서 +metrics 를 뺀 항목과 비교
+    Case(Calculator, 'add', operands, (1,), ('none',), metrics=True),
+    Case(Calculator, 'divide', operands, (1,), ('precision',), metrics=True),
+    Case(EngineeringCalculator, 'sin', one, (1,), ('none', 'degree+precision'), metrics=True),
+    Case(Calculator, 'add_batch', two_columns, SIZES, ('none',), metrics=True),
+]
+
+
+def missing_methods() -> list:
+    """CASES 에서 측정하지 않는 공개 매서드 목록을 반환합니다. (새 매서드를 추가하면 여기에 나타남)"""
+    covered = {(case.calculator, case.method) for case in CASES}
+    missing = []
+    for calculator in (Calculator, EngineeringCalculator, ComplexCalculator):
+        for name, _ in inspect.getmembers(calculator, inspect.isfunction):
+            if name.startswith('_') or name in SKIPPED or name not in calculator.__dict__:
+                continue
+            if (calculator, name) not in covered:
+                missing.append(f"{calculator.__name__}.{name}")
+    return missing
+
+
+def case_name(case: Case, option_set: str, size: int) -> str:
+    """측정 항목 이름을 만듭니다. (예 : EngineeringCalculator.sin[degree]/1)"""
+    suffix = '+metrics' if case.metrics else ''
+    return f"{case.calculator.__name__}.{case.method}[{option_set}{suffix}]/{size}"
+
+
+def measure(function: any, min_time: float = MIN_TIME, repeat: int = REPEAT) -> float:
+    """function 을 호출 한번에 걸리는 시간(초)을 반환합니다. 반복 한번이 min_time 이상 걸리도록 호출 횟수를 정합니다."""
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9) * 1.1))
+    best = min([elapsed] + timer.repeat(repeat=repeat - 1, number=number))
+    return best / number
+
+
+def run(pattern: str = '', min_time: float = MIN_TIME, repeat: int = REPEAT, log: any = sys.stderr) -> dict:
+    """
+    CASES 의 모든 항목을 측정합니다.
+
+    Args:
+        pattern (str): 이 문자열이 이름에 들어간 항목만 측정합니다. (기본값: '', 전부)
+        min_time (float): 반복 한번의 최소 측정 시간(초)을 받습니다.
+        repeat (int): 측정 반복 횟수를 받습니다.
+        log (any): 진행 상황을 출력할 파일 객체를 받습니다.
+
+    Returns:
+        dict: meta(실행 환경)와 results(항목 이름 -> 측정 결과)를 담은 딕셔너리를 반환합니다.
+    """
+    results = {}
+    for case in CASES:
+        calc = case.calculator()
+        if case.metrics:
+            calc.enable_metrics()
+        method = getattr(calc, case.method)
+        for size in case.sizes:
+            args = case.make_args(size)
+            for option_set in case.option_sets:
+                name = case_name(case, option_set, size)
+                if pattern not in name:
+                    continue
+                if case.options_object:
+                    kwargs = dict(case.fixed, options=utils.Options(**OPTION_SETS[option_set]))
+                else:
+                    kwargs = dict(case.fixed, **OPTION_SETS[option_set])
+                seconds = measure(lambda: method(*args, **kwargs), min_time=min_time, repeat=repeat)
+                results[name] = {'class': case.calculator.__name__, 'method': case.method,
+                                 'options': option_set, 'size': size, 'seconds': seconds}
+                print(f"{name:<68}{seconds * 1e9:>14.1f} ns", file=log)
+
+    meta = {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'repeat': repeat,
+        'min_time': min_time,
+    }
+    return {'meta': meta, 'results': results}
+
+
+def compare(baseline: dict, current: dict, threshold: float = THRESHOLD) -> list:
+    """
+    두 측정 결과를 비교합니다.
+
+    Args:
+        baseline (dict): 기준 측정 결과를 받습니다.
+        current (dict): 새 측정 결과를 받습니다.
+        threshold (float): 이 비율보다 느려지면 REGRESSION 으로 표시합니다. (기본값: 0.15, 15%)
+
+    Returns:
+        list: (항목 이름, 기준 시간, 새 시간, 비율, 상태) 목록을 반환합니다.
+              상태는 'REGRESSION', 'faster', 'ok', 'new'(기준에 없음), 'missing'(새 결과에 없음) 중 하나입니다.
+    """
+    rows = []
+    old, new = baseline['results'], current['results']
+    for name in sorted(old.keys() | new.keys()):
+        if name not in old:
+            rows.append((name, None, new[name]['seconds'], None, 'new'))
+            continue
+        if name not in new:
+            rows.append((name, old[name]['seconds'], None, None, 'missing'))
+            continue
+        before, after = old[name]['seconds'], new[name]['seconds']
+        ratio = after / before
+        if ratio > 1 + threshold:
+            status = 'REGRESSION'
+        elif ratio < 1 / (1 + threshold):
+            status = 'faster'
+        else:
+            status = 'ok'
+        rows.append((name, before, after, ratio, status))
+    return rows
+
+
+def print_comparison(rows: list, only_changes: bool = False):
+    """compare 결과를 표로 출력합니다."""
+    print(f"{'case':<68}{'baseline ns':>14}{'current ns':>14}{'ratio':>8}  status")
+    for name, before, after, ratio, status in rows:
+        if only_changes and status == 'ok':
+            continue
+        before_text = f"{before * 1e9:.1f}" if before is not None else '-'
+        after_text = f"{after * 1e9:.1f}" if after is not None else '-'
+        ratio_text = f"{ratio:.2f}" if ratio is not None else '-'
+        print(f"{name:<68}{before_text:>14}{after_text:>14}{ratio_text:>8}  {status}")
+    regressions = sum(1 for row in rows if row[4] == 'REGRESSION')
+    print(f"{len(rows)} cases, {regressions} regressions")
+
+
+def load(path: str) -> dict:
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python benchmark/suite.py',
+        description='계산기 매서드들을 연산 조건, 입력 크기별로 측정하고 기준 결과와 비교합니다.')
+    parser.add_argument('-o', '--output', help='측정 결과를 저장할 JSON 파일 경로')
+    parser.add_argument('--baseline', help='측정 후 비교할 기준 결과 JSON 파일 경로')
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'),
+                        help='측정하지 않고 저장된 두 결과만 비교')
+    parser.add_argument('--filter', default='', help='이 문자열이 이름에 들어간 항목만 측정')
+    parser.add_argument('--min-time', type=float, default=MIN_TIME,
+                        help=f'반복 한번의 최소 측정 시간(초) (기본값: {MIN_TIME})')
+    parser.add_argument('--repeat', type=int, default=REPEAT, help=f'측정 반복 횟수 (기본값: {REPEAT})')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help=f'이 비율보다 느려지면 REGRESSION (기본값: {THRESHOLD})')
+    parser.add_argument('--changes-only', action='store_true', help='비교 결과에서 ok 인 항목은 출력하지 않음')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        rows = compare(load(args.compare[0]), load(args.compare[1]), threshold=args.threshold)
+        print_comparison(rows, only_changes=args.changes_only)
+        return 1 if any(row[4] == 'REGRESSION' for row in rows) else 0
+
+    for name in missing_methods():
+        print(f"warning: {name} 은 측정 항목(CASES)에 없습니다.", file=sys.stderr)
+
+    current = run(args.filter, min_time=args.min_time, repeat=args.repeat)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(current, file, indent=2)
+    if args.baseline:
+        rows = compare(load(args.baseline), current, threshold=args.threshold)
+        print_comparison(rows, only_changes=args.changes_only)
+        return 1 if any(row[4] == 'REGRESSION' for row in rows) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
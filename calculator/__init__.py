@@ -1,8 +1,56 @@
 """
-현재는 아무것도 기능하지 않는 파이썬 파일입니다.
+
+calculator 패키지입니다. Calculator, EngineeringCalculator, ComplexCalculator 를 패키지에서 바로 가져올 수 있습니다.
+
+    >>> from calculator import Calculator
+    >>> Calculator().add(1, 2, 3, precision=2)
+    6.00
+
+짧게 실행되는 작업 프로세스가 많기 때문에 import 시간을 줄이려고, 클래스와 하위 모듈은 처음 쓸 때 불러옵니다. (모듈 수준 __getattr__)
+그래서 import calculator 나 Calculator 만 쓸 때는 cmath, numpy, asyncio(server.py) 를 불러오지 않습니다.
+import 시간은 python benchmark/bench_import.py 로 측정할 수 있습니다.
 """
 __version__ = '0.0.1'
 
+# 패키지에서 바로 쓸 수 있는 이름 -> 그 이름이 있는 하위 모듈
+_LAZY_ATTRIBUTES = {
+    'Calculator': 'basic',
+    'EngineeringCalculator': 'engineering',
+    'ComplexCalculator': 'complex',
+    'Options': 'utils',
+    'Result': 'utils',
+}
+
+# 처음 쓸 때 불러오는 하위 모듈
+_SUBMODULES = frozenset({'basic', 'engineering', 'complex', 'utils', 'accumulate', 'backend', 'cache', 'cli', 'expression',
+                         'columnio', 'jobs', 'metrics', 'pipeline', 'registry', 'scan', 'server', 'stats', 'tableio', 'trig_table'})
+
+
+def __getattr__(name: str) -> any:
+    """
+    패키지에 없는 이름을 처음 쓸 때 하위 모듈을 불러와서 반환합니다. 한번 불러온 이름은 패키지에 저장해둡니다.
+
+    Raises:
+        AttributeError: 패키지에 없는 이름인 경우 발생합니다.
+    """
+    from importlib import import_module  # 처음 쓸 때만 필요함
+
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(f'.{_LAZY_ATTRIBUTES[name]}', __name__), name)
+    elif name in _SUBMODULES:
+        value = import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | _SUBMODULES)
+
+
+__all__ = ['Calculator', 'EngineeringCalculator', 'ComplexCalculator', 'Options', 'Result']
+
 """
 
 문제 1: 기본 계산기 클래스 구현
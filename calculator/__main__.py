@@ -0,0 +1,9 @@
+"""
+
+python -m calculator 로 실행했을 때의 시작점입니다. cli.py 의 main 을 실행합니다.
+"""
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+
+이 파이썬 파일은 숫자 스트림(반복자, 제너레이터)을 조금씩 받아서 합과 곱을 구하는 누적기(accumulator) 클래스들로 이루어져있다.
+Calculator.add_accumulator, Calculator.multiply_accumulator 매서드로 만들어 쓴다.
+
+누적기는 지금까지의 합(또는 곱) 하나만 가지고 있기 때문에 입력이 메모리보다 커도 메모리 사용량이 일정하다.
+feed 로 덩어리(chunk)나 제너레이터를 여러번 나눠 넣을 수 있고, merge 로 다른 작업자(프로세스, 스레드)의 누적기를 합칠 수 있다.
+누적기는 pickle 할 수 있으므로 작업 프로세스에서 계산한 누적기를 돌려받아 merge 하면 된다.
+precision, return_float 은 result 에서 마지막 값에만 적용한다.
+"""
+
+from . import utils
+
+
+class SumAccumulator:
+    """
+    숫자들의 합을 조금씩 누적하는 누적기입니다.
+
+    Attributes:
+        total (any): 지금까지 넣은 숫자들의 합입니다.
+        options (utils.Options): result 에 적용할 연산 조건입니다.
+
+    Examples:
+        >>> calc = Calculator()
+        >>> accumulator = calc.add_accumulator(precision=2)
+        >>> accumulator.feed(range(1, 4)).feed(x for x in (4, 5))
+        SumAccumulator(total=15)
+        >>> accumulator.result()
+        15.00
+    """
+
+    __slots__ = ('total', 'options')
+
+    def __init__(self, options: utils.Options = None):
+        self.total = 0
+        self.options = options if options is not None else utils.DEFAULT_OPTIONS
+
+    def feed(self, values: any) -> 'SumAccumulator':
+        """
+        숫자들을 더합니다. 반복자, 제너레이터는 한 개씩 꺼내며 더하므로 메모리를 더 쓰지 않습니다.
+
+        Args:
+            values (any): 숫자들을 꺼낼 수 있는 iterable(리스트, 반복자, 제너레이터 등)을 받습니다.
+
+        Returns:
+            SumAccumulator: 이어서 부를 수 있도록 자기 자신을 반환합니다.
+        """
+        self.total = sum(values, self.total)
+        return self
+
+    def merge(self, other: 'SumAccumulator') -> 'SumAccumulator':
+        """
+        다른 누적기의 합을 더합니다. 연산 조건은 이 누적기의 것을 사용합니다.
+
+        Args:
+            other (SumAccumulator): 합칠 누적기를 받습니다.
+
+        Returns:
+            SumAccumulator: 자기 자신을 반환합니다.
+        """
+        self.total = self.total + other.total
+        return self
+
+    def result(self) -> any:
+        """
+        지금까지의 합에 연산 조건(precision, return_float)을 적용해서 반환합니다.
+
+        Returns:
+            any: 합을 반환합니다.
+        """
+        result = utils.round_result(
+            value=self.total, precision=self.options.precision)  # 소수점 자릿수 맞춤
+        # 결과를 실수형으로 반환할지 지정
+        return utils.fl(result=result, return_float=self.options.return_float)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(total={self.total!r})"
+
+
+class ProductAccumulator(SumAccumulator):
+    """
+    숫자들의 곱을 조금씩 누적하는 누적기입니다. 사용법은 SumAccumulator 와 같습니다.
+
+    Attributes:
+        total (any): 지금까지 넣은 숫자들의 곱입니다.
+        options (utils.Options): result 에 적용할 연산 조건입니다.
+
+    Examples:
+        >>> calc = Calculator()
+        >>> calc.multiply_accumulator().feed([2, 3]).merge(calc.multiply_accumulator().feed([4])).result()
+        24
+    """
+
+    __slots__ = ()
+
+    def __init__(self, options: utils.Options = None):
+        super().__init__(options)
+        self.total = 1
+
+    def feed(self, values: any) -> 'ProductAccumulator':
+        """
+        숫자들을 곱합니다. 반복자, 제너레이터는 한 개씩 꺼내며 곱하므로 메모리를 더 쓰지 않습니다.
+
+        Args:
+            values (any): 숫자들을 꺼낼 수 있는 iterable(리스트, 반복자, 제너레이터 등)을 받습니다.
+
+        Returns:
+            ProductAccumulator: 이어서 부를 수 있도록 자기 자신을 반환합니다.
+        """
+        self.total = utils.product(values, start=self.total)  # 정수가 많으면 균형 곱셈 트리
+        return self
+
+    def merge(self, other: 'ProductAccumulator') -> 'ProductAccumulator':
+        """
+        다른 누적기의 곱을 곱합니다. 연산 조건은 이 누적기의 것을 사용합니다.
+
+        Args:
+            other (ProductAccumulator): 합칠 누적기를 받습니다.
+
+        Returns:
+            ProductAccumulator: 자기 자신을 반환합니다.
+        """
+        self.total = self.total * other.total
+        return self
+
+
+__all__ = ['SumAccumulator', 'ProductAccumulator']
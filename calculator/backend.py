@@ -0,0 +1,540 @@
+"""
+
+이 파이썬 파일은 연산 하나를 입력 크기에 따라 가장 빠른 방법(backend)으로 계산하는 실행 계층으로 이루어져있다.
+Calculator.execute 매서드가 이 파일의 함수를 사용하며, 고른 방법은 계산기의 last_backend 속성에 남는다.
+
+계산 방법 (BACKENDS)
+    - scalar : 행마다 math 기반 스칼라 매서드(sin, add 등)를 부른다. numpy 배치 매서드의 고정 비용(수 마이크로초)이 없어 작은 입력에서 가장 빠르다.
+    - vector : 배치 매서드(sin_batch, add_batch 등) 한번으로 계산한다.
+    - process : 입력을 공유 메모리(multiprocessing.shared_memory)에 복사하고, 작업 프로세스들이 PROCESS_CHUNK 행씩 나눠
+                배치 매서드로 계산해서 공유 메모리의 결과 배열에 바로 쓴다. 입력을 pickle 로 보내지 않으므로 1억 행도 복사 두번으로 끝난다.
+모든 방법의 결과는 배치 매서드의 결과와 같은 형식(numpy 배열, utils.BatchResult, PolarArrays)이다.
+
+Planner 는 연산마다 두 경계 크기(scalar_max, process_min)로 고른다.
+    - 크기 n 이 scalar_max 이하이면 scalar, process_min 이상이면 process, 그 사이는 vector.
+    - 보정(calibrate)한 적이 없는 연산은 고정 기본값(DEFAULT_SCALAR_MAX, process 는 쓰지 않음)을 쓴다.
+      execute 는 보정을 하지 않으므로 첫 호출이 느려지거나 파일을 쓰는 일이 없다.
+    - 보정은 python -m calculator.backend --calibrate 나 calibrate() 로 따로 한다.
+      두 크기에서 시간을 재서 (고정 비용 + 원소당 비용 × n) 직선을 구하고 두 직선이 만나는 크기를 경계로 삼는다.
+    - CPU 가 하나이면 process 는 쓰지 않는다. (process_min = None)
+    - 보정 결과는 calibration_path() 의 JSON 파일에 저장하고 다음 실행부터 읽어서 쓴다.
+      파이썬, numpy, 패키지 버전, CPU 수가 다르면 저장된 결과를 버리고 기본값을 쓴다.
+scalar 로 계산하다 결과가 배치 매서드와 달라질 수 있는 경우(0나누기, numpy 정수 범위를 넘는 정수)에는 vector 로 다시 계산한다.
+dtype 연산 조건을 주면 스칼라 매서드는 배정밀도로만 계산하므로 scalar 대신 vector 를 쓴다.
+"""
+
+import argparse  # 명령줄 인자 해석용
+import json  # 보정 결과 파일 읽고 쓰기용
+import math  # 스칼라 결과의 nan 작성용
+import os  # 보정 파일 경로, CPU 개수 확인용
+import platform  # 보정 환경 확인용
+import sys  # 표준 출력용
+import time  # 보정 시간 측정용
+from itertools import repeat  # 스칼라 인자를 행마다 반복하는 용도
+import numpy as np
+from . import registry, utils
+
+BACKENDS = ('scalar', 'vector', 'process')
+DEFAULT_SCALAR_MAX = 8  # 보정하지 않은 실수 연산의 scalar 경계 크기 (보정하지 않으면 process 는 쓰지 않음)
+MAX_SCALAR_SIZE = 4096  # 보정 결과가 더 커도 scalar 는 이 크기까지만 사용
+MIN_PROCESS_SIZE = 1 << 18  # 보정 결과가 더 작아도 process 는 이 크기부터 사용
+PROCESS_CHUNK = 1 << 20  # 작업 프로세스에 한번에 넘기는 행 수
+PROBE_SIZE = 1024  # process 에서 결과 모양과 자료형을 알기 위해 먼저 계산하는 행 수
+
+_WORKERS = os.cpu_count() or 1  # 작업 프로세스 수
+
+
+def calibration_path() -> str:
+    """
+    보정 결과 파일 경로를 반환합니다. 환경 변수 CALCULATOR_CALIBRATION 이 있으면 그 경로를,
+    없으면 $XDG_CACHE_HOME(기본값 ~/.cache)/calculator/calibration.json 을 반환합니다.
+    """
+    path = os.environ.get('CALCULATOR_CALIBRATION')
+    if path:
+        return path
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'calculator', 'calibration.json')
+
+
+def _environment() -> dict:
+    """보정 결과가 유효한 실행 환경을 반환합니다."""
+    from . import __version__
+
+    return {'calculator': __version__, 'python': platform.python_version(), 'numpy': np.__version__,
+            'machine': platform.machine(), 'cpus': _WORKERS}
+
+
+def _size(columns: tuple) -> int:
+    """입력의 원소 수(가장 큰 열의 크기)를 반환합니다."""
+    size = 1
+    for column in columns:
+        if hasattr(column, 'size'):
+            size = max(size, column.size)
+        elif isinstance(column, (list, tuple)):
+            size = max(size, len(column))
+    return size
+
+
+class _Fallback(Exception):
+    """scalar 로 계산하면 배치 매서드와 결과가 달라지는 경우 vector 로 넘기기 위한 예외입니다."""
+
+
+def _rows(columns: tuple) -> tuple:
+    """입력 열들을 (결과 모양, 행 튜플 리스트)로 바꿉니다. 1차원 실수 열과 숫자만 받습니다."""
+    parts = []
+    length = None
+    for column in columns:
+        if isinstance(column, (int, float)):
+            parts.append(column)
+            continue
+        array = np.asarray(column)
+        if array.ndim == 0:
+            parts.append(array.item())
+            continue
+        if array.ndim > 1 or array.dtype.kind not in 'biuf' or (length is not None and len(array) != length):
+            raise _Fallback()  # 2차원 표, 복소수, 브로드캐스트가 필요한 입력은 배치 매서드로
+        length = len(array)
+        parts.append(array.tolist())
+    if length is None:
+        return (), [tuple(parts)]
+    return (length,), list(zip(*(part if isinstance(part, list) else repeat(part, length) for part in parts)))
+
+
+def _scalar(calc: any, operation: registry.Operation, columns: tuple, options: utils.Options) -> any:
+    """행마다 스칼라 매서드로 계산해서 배치 매서드와 같은 형식의 결과를 반환합니다."""
+    shape, rows = _rows(columns)
+    if ZeroDivisionError in operation.errors and any(0 in row[1:] for row in rows):
+        raise _Fallback()  # divide 는 0나누기 오류를 출력하므로 배치 매서드(inf, nan)로
+    method = getattr(calc, operation.name)
+    raw = options  # 소수점 자릿수, 실수형 변환은 마지막에 배열로 맞춤 (replace 는 수 마이크로초가 걸려 필요할 때만)
+    if options.precision or options.return_float:
+        raw = options.replace(precision=0, return_float=False)
+
+    if not operation.masked:
+        values = np.array([method(*row, options=raw) for row in rows])
+        if values.dtype == object:
+            raise _Fallback()  # numpy 정수 범위를 넘는 정수
+        values = utils.round_array(values=values.reshape(shape), precision=options.precision)
+        return utils.fl_array(values=values, return_float=options.return_float)
+
+    values = []
+    valid = []
+    errors = tuple(error for error in operation.errors if error is not ZeroDivisionError)
+    for row in rows:
+        try:
+            values.append(method(*row, options=raw))
+            valid.append(True)
+        except errors:  # 배치 매서드처럼 정의역 오류 위치는 nan 과 valid=False 로 표시
+            values.append(math.nan)
+            valid.append(False)
+    values = utils.round_array(values=np.array(values, dtype=float).reshape(shape), precision=options.precision)
+    values = utils.fl_array(values=values, return_float=options.return_float)
+    return utils.BatchResult(values=values, valid=np.array(valid, dtype=bool).reshape(shape))
+
+
+_pool = None  # process 에서 쓰는 작업 프로세스 실행기 (처음 쓸 때 만듦)
+_worker_calculators = {}  # 작업 프로세스 안에서 계산기 클래스마다 하나씩 만든 계산기
+
+
+def _get_pool() -> any:
+    """작업 프로세스 실행기를 반환합니다. 처음 부를 때 한번만 만듭니다."""
+    global _pool
+    if _pool is None:
+        from concurrent.futures import ProcessPoolExecutor  # process 를 쓸 때만 불러옴
+        _pool = ProcessPoolExecutor(max_workers=_WORKERS)
+    return _pool
+
+
+def _attach(spec: tuple) -> tuple:
+    """공유 메모리 정보 (이름, 자료형, 길이)로 공유 메모리를 열고 (공유 메모리, 배열)을 반환합니다."""
+    from multiprocessing import shared_memory
+
+    memory = shared_memory.SharedMemory(name=spec[0])
+    return memory, np.ndarray((spec[2],), dtype=spec[1], buffer=memory.buf)
+
+
+def _share(array: any) -> tuple:
+    """배열을 새 공유 메모리에 복사하고 (공유 메모리, 배열, 공유 메모리 정보)를 반환합니다."""
+    from multiprocessing import shared_memory
+
+    memory = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    shared = np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf)
+    shared[...] = array
+    return memory, shared, (memory.name, array.dtype.str, len(array))
+
+
+def _run_chunk(calculator_class: type, method: str, options: utils.Options, inputs: list, outputs: list,
+               start: int, stop: int):
+    """작업 프로세스에서 start 행부터 stop 행 전까지 배치 매서드로 계산해서 공유 메모리의 결과 배열에 씁니다."""
+    calc = _worker_calculators.get(calculator_class)
+    if calc is None:
+        calc = _worker_calculators[calculator_class] = calculator_class()
+    memories = []
+    parts = []
+    for kind, value in inputs:
+        if kind == 'value':  # 모든 행에 같은 숫자
+            parts.append(value)
+            continue
+        memory, array = _attach(value)
+        memories.append(memory)
+        parts.append(array[start:stop])
+    result = getattr(calc, method)(*parts, options=options)
+    for spec, value in zip(outputs, _split(result)):
+        memory, array = _attach(spec)
+        memories.append(memory)
+        array[start:stop] = value
+        del array
+    del parts, result
+    for memory in memories:
+        memory.close()
+
+
+def _split(result: any) -> tuple:
+    """배치 매서드의 결과를 배열 튜플로 나눕니다. (BatchResult, PolarArrays 는 튜플)"""
+    return tuple(result) if isinstance(result, tuple) else (result,)
+
+
+def _process(calc: any, operation: registry.Operation, columns: tuple, options: utils.Options) -> any:
+    """입력을 공유 메모리에 올리고 작업 프로세스들이 덩어리마다 배치 매서드로 계산합니다."""
+    arrays = [np.asarray(column) for column in columns]
+    if any(array.ndim > 1 for array in arrays) or len({len(array) for array in arrays if array.ndim}) != 1:
+        raise _Fallback()  # 2차원 표나 브로드캐스트가 필요한 입력은 배치 매서드로
+    length = max(len(array) for array in arrays if array.ndim)
+    method = getattr(calc, operation.batch)
+
+    # 첫 덩어리는 직접 계산해서 결과 모양(열 수)과 자료형을 알아냄
+    probe = method(*(array[:PROBE_SIZE] if array.ndim else array for array in arrays), options=options)
+    memories = []
+    try:
+        inputs = []
+        for array in arrays:
+            if array.ndim == 0:
+                inputs.append(('value', array.item()))
+            else:
+                memory, _, spec = _share(np.ascontiguousarray(array))
+                memories.append(memory)
+                inputs.append(('shared', spec))
+        outputs = []
+        targets = []
+        for value in _split(probe):
+            memory, target, spec = _share(np.empty(length, dtype=np.asarray(value).dtype))
+            memories.append(memory)
+            target[:len(value)] = value
+            targets.append(target)
+            outputs.append(spec)
+
+        pool = _get_pool()
+        futures = [pool.submit(_run_chunk, type(calc), operation.batch, options, inputs, outputs,
+                               start, min(start + PROCESS_CHUNK, length))
+                   for start in range(min(PROBE_SIZE, length), length, PROCESS_CHUNK)]
+        for future in futures:
+            future.result()
+        results = [np.array(target) for target in targets]  # 공유 메모리를 지우기 전에 복사
+        del targets, target
+    finally:
+        for memory in memories:
+            memory.close()
+            memory.unlink()
+    if isinstance(probe, tuple):
+        return type(probe)(*results)
+    return results[0]
+
+
+class Planner:
+    """
+    연산마다 scalar, vector, process 의 경계 크기를 가지고 있다가 입력 크기에 맞는 계산 방법을 고르는 객체입니다.
+    보정하지 않은 연산은 기본값(default_thresholds)으로 고릅니다.
+
+    Attributes:
+        path (str): 보정 결과 파일 경로입니다. None 이면 파일에 저장하지 않습니다.
+        workers (int): process 에서 쓰는 작업 프로세스 수입니다. 1 이면 process 를 쓰지 않습니다.
+        thresholds (dict): 보정한 연산 이름 -> {'scalar_max': int, 'process_min': int 또는 None} 입니다.
+
+    Examples:
+        >>> planner = get_planner()
+        >>> planner.choose(EngineeringCalculator(), 'sin', 3)
+        'scalar'
+        >>> planner.calibrate(EngineeringCalculator(), 'sin')
+        {'scalar_max': 6, 'process_min': None}
+    """
+
+    __slots__ = ('path', 'workers', 'thresholds')
+
+    def __init__(self, path: str = None, workers: int = None):
+        self.path = path
+        self.workers = _WORKERS if workers is None else workers
+        self.thresholds = {}
+        if path is not None:
+            self.load()
+
+    def load(self):
+        """보정 결과 파일을 읽습니다. 파일이 없거나, 깨졌거나, 실행 환경이 다르면 아무것도 읽지 않습니다."""
+        try:
+            with open(self.path, encoding='utf-8') as file:
+                saved = json.load(file)
+        except (OSError, ValueError):
+            return
+        if isinstance(saved, dict) and saved.get('environment') == _environment():
+            self.thresholds.update(saved.get('thresholds', {}))
+
+    def save(self):
+        """보정 결과를 파일에 씁니다. 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓰고 바꿉니다."""
+        if self.path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            temporary = f"{self.path}.{os.getpid()}.tmp"
+            with open(temporary, 'w', encoding='utf-8') as file:
+                json.dump({'environment': _environment(), 'thresholds': self.thresholds}, file, indent=1)
+            os.replace(temporary, self.path)
+        except OSError:
+            pass  # 쓸 수 없는 경로이면 이번 실행에서만 보정 결과를 사용
+
+    def calibrate(self, calc: any, name: str, save: bool = True) -> dict:
+        """
+        연산 하나의 경계 크기를 측정해서 저장합니다. 작업 프로세스가 여러 개이면 process 측정을 위해 작업 프로세스들을 띄웁니다.
+
+        Args:
+            calc (any): 측정에 사용할 계산기를 받습니다.
+            name (str): 연산 이름을 받습니다.
+            save (bool): 측정한 뒤 보정 결과 파일에 쓸지 여부를 받습니다. (기본값: True)
+
+        Returns:
+            dict: {'scalar_max': int, 'process_min': int 또는 None}을 반환합니다.
+        """
+        operation = registry.get(name)
+        sample = _sample(operation)
+        raw = utils.Options()
+
+        scalar_max = 0
+        if operation.domain == 'real':
+            small, large = 1, 32
+            scalar = _line([_seconds(lambda: _scalar(calc, operation, sample(size), raw)) for size in (small, large)],
+                           small, large)
+            vector = _line([_seconds(lambda: getattr(calc, operation.batch)(*sample(size), options=raw))
+                            for size in (small, large)], small, large)
+            scalar_max = min(MAX_SCALAR_SIZE, _crossing(scalar, vector) or 0)
+
+        process_min = None
+        if self.workers > 1:
+            small, large = 1 << 18, 1 << 21
+            vector = _line([_seconds(lambda: getattr(calc, operation.batch)(*sample(size), options=raw))
+                            for size in (small, large)], small, large)
+            _process(calc, operation, sample(small), raw)  # 작업 프로세스를 미리 띄움
+            process = _line([_seconds(lambda: _process(calc, operation, sample(size), raw))
+                             for size in (small, large)], small, large)
+            crossing = _crossing(vector, process)
+            process_min = None if crossing is None else max(MIN_PROCESS_SIZE, crossing)
+
+        self.thresholds[operation.name] = {'scalar_max': scalar_max, 'process_min': process_min}
+        if save:
+            self.save()
+        return self.thresholds[operation.name]
+
+    def calibrate_all(self, calc: any = None, names: list = None) -> dict:
+        """
+        배치 매서드가 있는 연산들의 경계 크기를 측정하고 보정 결과 파일에 한번 씁니다.
+
+        Args:
+            calc (any): 측정에 사용할 계산기를 받습니다. (기본값: None, ComplexCalculator)
+            names (list): 측정할 연산 이름들을 받습니다. (기본값: None, calc 에서 배치로 계산할 수 있는 모든 연산)
+
+        Returns:
+            dict: 연산 이름 -> {'scalar_max': int, 'process_min': int 또는 None}을 반환합니다.
+        """
+        if calc is None:
+            from .complex import ComplexCalculator
+            calc = ComplexCalculator()
+        if names is None:
+            names = [name for name, operation in registry.OPERATIONS.items()
+                     if operation.batch is not None and hasattr(calc, operation.batch)]
+        results = {registry.get(name).name: self.calibrate(calc, name, save=False) for name in names}
+        self.save()
+        return results
+
+    def default_thresholds(self, name: str) -> dict:
+        """
+        보정하지 않은 연산의 경계 크기를 반환합니다. 실수 연산은 DEFAULT_SCALAR_MAX 까지 scalar 로, process 는 쓰지 않습니다.
+
+        Args:
+            name (str): 연산 이름을 받습니다.
+
+        Returns:
+            dict: {'scalar_max': int, 'process_min': None}을 반환합니다.
+        """
+        scalar_max = DEFAULT_SCALAR_MAX if registry.get(name).domain == 'real' else 0
+        return {'scalar_max': scalar_max, 'process_min': None}
+
+    def choose(self, calc: any, name: str, size: int) -> str:
+        """
+        입력 크기에 맞는 계산 방법을 반환합니다. 보정하지 않은 연산은 측정하지 않고 기본값으로 고릅니다.
+
+        Args:
+            calc (any): 계산기를 받습니다.
+            name (str): 연산 이름을 받습니다.
+            size (int): 입력 원소 수를 받습니다.
+
+        Returns:
+            str: 'scalar', 'vector', 'process' 중 하나를 반환합니다.
+        """
+        thresholds = self.thresholds.get(name)
+        if thresholds is None:
+            thresholds = self.default_thresholds(name)
+        if size <= thresholds['scalar_max']:
+            return 'scalar'
+        if thresholds['process_min'] is not None and size >= thresholds['process_min']:
+            return 'process'
+        return 'vector'
+
+
+def _sample(operation: registry.Operation) -> any:
+    """보정에 쓸 입력을 만드는 함수를 반환합니다. (크기 -> 열 튜플)"""
+    count = operation.arity or 2
+    rng = np.random.default_rng(0)
+
+    def sample(size: int) -> tuple:
+        columns = rng.uniform(0.5, 2.0, (count, size))
+        if operation.domain == 'complex':
+            return (columns[0] + 1j * columns[-1],)
+        return tuple(columns)
+
+    return sample
+
+
+def _seconds(function: any) -> float:
+    """function 한번 실행에 걸리는 가장 짧은 시간(초)을 반환합니다. 보정이 길어지지 않도록 약 20ms 동안만 잽니다."""
+    best = math.inf
+    deadline = time.perf_counter() + 0.02
+    for _ in range(1000):
+        start = time.perf_counter()
+        function()
+        now = time.perf_counter()
+        best = min(best, now - start)
+        if now >= deadline:
+            break
+    return best
+
+
+def _line(times: list, small: int, large: int) -> tuple:
+    """두 크기에서 잰 시간으로 (고정 비용, 원소당 비용) 직선을 구합니다."""
+    slope = max((times[1] - times[0]) / (large - small), 0.0)
+    return times[0] - slope * small, slope
+
+
+def _crossing(cheap: tuple, costly: tuple) -> int:
+    """
+    고정 비용이 작은 방법(cheap)이 고정 비용이 큰 방법(costly)보다 빠른 가장 큰 크기를 반환합니다.
+    cheap 이 처음부터 느리면 0, 항상 빠르면 None 을 반환합니다.
+    """
+    if cheap[0] >= costly[0]:
+        return 0
+    if cheap[1] <= costly[1]:
+        return None
+    return int((costly[0] - cheap[0]) / (cheap[1] - costly[1]))
+
+
+_planner = None  # 기본 Planner (처음 쓸 때 보정 파일을 읽어서 만듦)
+
+
+def get_planner() -> Planner:
+    """calibration_path() 의 보정 파일을 쓰는 기본 Planner 를 반환합니다. 처음 부를 때 한번만 만듭니다."""
+    global _planner
+    if _planner is None:
+        _planner = Planner(calibration_path())
+    return _planner
+
+
+def calibrate(names: list = None) -> dict:
+    """
+    기본 Planner 로 연산들의 경계 크기를 측정해서 calibration_path() 에 저장합니다. 이후 execute 는 이 결과로 고릅니다.
+
+    Args:
+        names (list): 측정할 연산 이름들을 받습니다. (기본값: None, 배치 매서드가 있는 모든 연산)
+
+    Returns:
+        dict: 연산 이름 -> {'scalar_max': int, 'process_min': int 또는 None}을 반환합니다.
+
+    Examples:
+        >>> calibrate(['sin', 'add'])
+        {'sin': {'scalar_max': 6, 'process_min': None}, 'add': {'scalar_max': 12, 'process_min': None}}
+    """
+    return get_planner().calibrate_all(names=names)
+
+
+def execute(calc: any, name: str, columns: tuple, kwargs: dict, backend: str = None) -> any:
+    """
+    연산 하나를 입력 크기에 맞는 방법으로 계산하고, 고른 방법을 calc.last_backend 에 남깁니다.
+
+    Args:
+        calc (any): 계산에 사용할 계산기를 받습니다.
+        name (str): 연산 이름(짧은 이름 포함)을 받습니다. 배치 매서드가 있는 연산이어야 합니다.
+        columns (tuple): 배치 매서드에 넘길 입력 열(배열, 시퀀스, 숫자)들을 받습니다.
+        kwargs (dict): 연산 조건을 받습니다.
+        backend (str): 계산 방법을 직접 지정합니다. (기본값: None, 보정 결과 또는 기본값으로 고름)
+
+    Returns:
+        any: 배치 매서드와 같은 형식의 결과를 반환합니다.
+
+    Raises:
+        ValueError: 알 수 없는 연산이거나 배치 매서드가 없는 연산, 알 수 없는 계산 방법인 경우 발생합니다.
+    """
+    operation = registry.get(name)
+    if operation.batch is None or not hasattr(calc, operation.batch):
+        raise ValueError(f"이 계산기에서 배치로 계산할 수 없는 연산입니다: {name!r}")
+    if backend is not None and backend not in BACKENDS:
+        raise ValueError(f"backend 는 {BACKENDS} 중 하나여야 합니다: {backend!r}")
+    options = utils.resolve_options(calc.options, kwargs)
+    if backend is None:
+        backend = get_planner().choose(calc, operation.name, _size(columns))
+    if backend == 'scalar' and (operation.domain != 'real' or options.dtype is not None):
+        backend = 'vector'  # 스칼라 매서드는 복소수 배치 결과, 단정밀도(dtype) 계산을 만들지 않음
+    if options.error_policy is not None and operation.errors:
+        backend = 'vector'  # CheckedResult 의 오류 종류별 개수는 배치 매서드 한번으로 셈
+
+    try:
+        if backend == 'scalar':
+            result = _scalar(calc, operation, columns, options)
+        elif backend == 'process':
+            result = _process(calc, operation, columns, options)
+        else:
+            result = getattr(calc, operation.batch)(*columns, options=options)
+    except _Fallback:
+        backend = 'vector'
+        result = getattr(calc, operation.batch)(*columns, options=options)
+    calc.last_backend = backend
+    return result
+
+
+def main(argv: list = None) -> int:
+    """
+    명령줄 프로그램의 시작점입니다. --calibrate 를 주면 보정하고, 아니면 지금 쓰는 경계 크기를 출력합니다.
+
+    Returns:
+        int: 종료 코드를 반환합니다.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m calculator.backend',
+        description='execute 가 계산 방법(scalar, vector, process)을 고르는 경계 크기를 보정하거나 출력합니다.')
+    parser.add_argument('operations', nargs='*', help='연산 이름들 (기본값: 배치 매서드가 있는 모든 연산)')
+    parser.add_argument('--calibrate', action='store_true', help='경계 크기를 측정해서 보정 파일에 저장')
+    args = parser.parse_args(argv)
+
+    names = args.operations or None
+    planner = get_planner()
+    if args.calibrate:
+        thresholds = calibrate(names)
+    else:
+        names = names or [name for name, operation in registry.OPERATIONS.items() if operation.batch is not None]
+        thresholds = {registry.get(name).name: planner.thresholds.get(registry.get(name).name)
+                      or dict(planner.default_thresholds(name), default=True) for name in names}
+    print(f"calibration file: {planner.path}")
+    for name, values in thresholds.items():
+        print(f"{name:<28}{json.dumps(values)}")
+    return 0
+
+
+__all__ = ['BACKENDS', 'DEFAULT_SCALAR_MAX', 'Planner', 'calibration_path', 'calibrate', 'get_planner', 'execute',
+           'main']
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,905 @@
+"""
+
+editor : Kim Gwang-Jae
+date : 2024-10-1
+
+이 파이썬 파일은 사칙연산을 하는 계산기 클래스 Calculator로 이루어져있다.
+Calculator 클래스의 add, subtract, multiply, divide 매서드는 사칙연산을 위한 매서드이다.
+resolve_options, round_result, fl 는 사칙연산 매서드들의 코드에서 공통적으로 계속 쓰인 코드들은 매서드로 만들어 코드의 길이를 줄이고 보기 쉽게 정리하기 위해 만들었다.
+divide 매서드는 0나누기 오류를 방지하는 코드가 들어가있다.
+multiply, divide, multiply_iter 는 utils.product 로 곱하므로 큰 정수가 많으면 균형 곱셈 트리로 빠르게 곱한다.
+precision은 소수점 자릿수를 결정하는 입력이고 return_float는 결과를 실수(True) 혹은 정수형(False)으로 변환하는데 쓰이는 입력이다.
+precision의 초기값은 0, return_float의 초기값은 False이다.
+연산 조건은 utils.Options 로 계산기에 묶어두거나(Calculator(precision=2)) 매서드마다 키워드 인자 또는 options= 로 넘길 수 있다.
+add_batch, subtract_batch, multiply_batch, divide_batch 매서드는 numpy 배열(열)들을 한번에 계산하는 배치 버전 사칙연산 매서드이다.
+add_iter, multiply_iter 매서드는 반복자, 제너레이터를 한 개씩 꺼내며 더하거나 곱하기 때문에 메모리보다 큰 스트림도 계산할 수 있다.
+add_accumulator, multiply_accumulator 매서드는 덩어리로 나눠 넣고 합칠 수 있는 누적기(accumulate.py)를 만든다.
+add_scan, subtract_scan, multiply_scan, divide_scan 매서드는 모든 중간 결과(누적 합, 누적 곱 등)를 O(n) 으로 구하며(scan.py), _batch 버전은 긴 배열을 블록으로 나눠 병렬로 계산한다.
+statistics, statistics_accumulator 매서드는 평균, 분산, 최솟값, 최댓값을 한번 읽으면서 구하고 합칠 수 있는 통계 누적기(stats.py)를 쓴다.
+enable_metrics 매서드로 매서드별 호출 횟수, 걸린 시간, 오류 횟수 기록(metrics.py)을 켤 수 있다.
+error_policy 연산 조건('raise', 'nan', 'mask', 'skip')을 지정하면 divide 는 0나누기 오류를 출력하지 않고,
+divide_batch 는 유효성 마스크와 오류 종류별 개수를 담은 utils.CheckedResult 를 반환한다.
+dtype 연산 조건('float32', 'float64', 'complex64', 'complex128')을 주면 _batch 사칙연산은 그 정밀도로 계산하고 저장한다. (스캔, 통계는 항상 배정밀도)
+
+"""
+
+import math  # error_policy 의 nan 작성용
+from itertools import islice  # 첫 번째 인자를 뺀 나머지 인자들을 복사 없이 꺼내기 위한 용도
+from . import utils
+
+
+class Calculator:
+    """
+    사칙연산을 수행하는 계산기 클래스입니다.
+
+    사칙연산을 수행하는 계산기에 소수점 자릿수 설정 기능과 실수형 반환 여부 기능을 추가한 계산기입니다.
+    precision 을 지정하면 반환값은 utils.Result 로, 원래 값을 그대로 가지고 있다가 출력할 때만 소수점 자릿수를 맞춥니다.
+    그래서 calc.multiply(calc.add(1, 2, precision=2), 3) 처럼 결과를 이어서 계산할 수 있습니다.
+
+    Attributes:
+        options (utils.Options): 계산기에 묶인 기본 연산 조건입니다. 매서드의 키워드 인자가 이 값을 덮어씁니다.
+
+    Methods:
+        add(*args: int, **kwargs: dict[str, any]) -> any:
+            덧셈 연산을 수행합니다.
+        subtract(*args: int, **kwargs: dict[str, any]) -> any:
+            뺄셈 연산을 수행합니다.
+        multiply(*args: int, **kwargs: dict[str, any]) -> any:
+            곱셈 연산을 수행합니다.
+        divide(*args: int, **kwargs: dict[str, any]) -> any:
+            나눗셈 연산을 수행합니다.
+        add_batch(*columns: any, **kwargs: dict[str, any]) -> numpy.ndarray:
+            배열(열)들의 덧셈 연산을 한번에 수행합니다.
+        subtract_batch(*columns: any, **kwargs: dict[str, any]) -> numpy.ndarray:
+            배열(열)들의 뺄셈 연산을 한번에 수행합니다.
+        multiply_batch(*columns: any, **kwargs: dict[str, any]) -> numpy.ndarray:
+            배열(열)들의 곱셈 연산을 한번에 수행합니다.
+        divide_batch(*columns: any, **kwargs: dict[str, any]) -> numpy.ndarray:
+            배열(열)들의 나눗셈 연산을 한번에 수행합니다.
+        add_iter(values: Iterable, **kwargs: dict[str, any]) -> any:
+            반복자, 제너레이터의 숫자들을 한 개씩 꺼내며 더합니다.
+        multiply_iter(values: Iterable, **kwargs: dict[str, any]) -> any:
+            반복자, 제너레이터의 숫자들을 한 개씩 꺼내며 곱합니다.
+        execute(operation: str, *columns: any, backend: str = None, **kwargs: dict[str, any]) -> any:
+            배치 연산을 입력 크기에 맞는 방법(scalar, vector, process)으로 계산합니다.
+        add_accumulator(**kwargs: dict[str, any]) -> SumAccumulator:
+            덩어리로 나눠 넣고 합칠 수 있는 합 누적기를 만듭니다.
+        multiply_accumulator(**kwargs: dict[str, any]) -> ProductAccumulator:
+            덩어리로 나눠 넣고 합칠 수 있는 곱 누적기를 만듭니다.
+        enable_metrics(metrics: Metrics = None) -> Metrics:
+            매서드별 호출 횟수, 걸린 시간, 오류 횟수 기록을 켭니다.
+        disable_metrics() -> None:
+            기록을 끕니다.
+
+    Args:
+        *args (int): 연산에 사용할 숫자들을 가변 인자로 받습니다.
+        **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+            - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+            - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+
+    Returns:
+        any: 연산 결과를 반환합니다.
+
+    Raises:
+        ZeroDivisionError: divide() 메서드에서 0으로 나누는 경우 발생합니다.
+
+    Process:
+        1. 연산 조건을 지정하는 키워드를 저장합니다.
+        2. 연산을 수행합니다.
+        3. 소수점 자릿수를 맞춥니다.
+        4. 결과를 실수형으로 반환할지 지정합니다.
+        5. 변환된 결과를 반환합니다.
+
+    """
+
+    metrics = None  # enable_metrics 로 켠 기록 (기본값: None, 기록 꺼짐)
+    last_backend = None  # execute 가 마지막으로 고른 계산 방법 ('scalar', 'vector', 'process')
+
+    def init(self, *args: int, **kwargs: dict[str: any]):
+        pass
+
+    def __init__(self, options: utils.Options = None, **kwargs: dict[str, any]):
+        """
+        계산기를 만들고 기본 연산 조건(Options)을 묶어둡니다.
+
+        연산 조건은 만들 때 한번만 검사하며, 매서드를 키워드 인자 없이 부르면 검사 없이 묶어둔 조건을 그대로 사용합니다.
+
+        Args:
+            options (utils.Options): 계산기에 묶을 연산 조건을 받습니다. (기본값: None, 기본 조건 사용)
+            **kwargs (dict[str, any]): options 대신 precision, return_float, angle_unit, coordinate 를 키워드 인자로 받습니다.
+
+        Examples:
+            >>> calc = Calculator(precision=2)
+            >>> calc.add(1, 2, 3)
+            6.00
+        """
+        if options is None:
+            options = utils.DEFAULT_OPTIONS
+        self.options = utils.resolve_options(options, kwargs)
+
+    def enable_metrics(self, metrics: any = None) -> any:
+        """
+        매서드별 호출 횟수, 걸린 시간 히스토그램, 오류 횟수 기록을 켭니다.
+
+        이 계산기의 연산 매서드들을 기록을 남기는 함수로 감쌉니다. 켜지 않은 계산기는 아무 비용도 들지 않습니다.
+        metrics 에 다른 계산기의 기록을 넘기면 여러 계산기의 기록을 한곳에 모을 수 있습니다.
+
+        Args:
+            metrics (metrics.Metrics): 기록할 Metrics 를 받습니다. (기본값: None, 새로 만듦)
+
+        Returns:
+            metrics.Metrics: 사용하는 Metrics 를 반환합니다. snapshot() 으로 기록을 확인할 수 있습니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> metrics = calc.enable_metrics()
+            >>> calc.add(1, 2)
+            3
+            >>> metrics.snapshot()['add']['calls']
+            1
+        """
+        from . import metrics as metrics_module  # 기록을 켤 때만 불러옴
+
+        self.disable_metrics()
+        if metrics is None:
+            metrics = metrics_module.Metrics()
+        for name in metrics_module.operation_names(self):
+            setattr(self, name, metrics.wrap(name, getattr(self, name)))
+        self.metrics = metrics
+        self.__dict__.pop('_expression_namespace', None)  # evaluate 안의 함수들도 기록되도록 다시 만듦
+        return metrics
+
+    def disable_metrics(self):
+        """
+        enable_metrics 로 켠 기록을 끄고 원래 매서드로 되돌립니다.
+        """
+        for name, value in list(self.__dict__.items()):
+            if getattr(value, '__metrics__', None) is None:
+                continue
+            wrapped = value.__wrapped__
+            if getattr(wrapped, '__self__', None) is self:
+                del self.__dict__[name]  # 클래스의 매서드로 되돌림
+            else:
+                self.__dict__[name] = wrapped  # 캐시처럼 인스턴스에 붙어있던 함수로 되돌림
+        self.__dict__.pop('metrics', None)
+        self.__dict__.pop('_expression_namespace', None)
+
+    def _error(self, name: str, error: Exception, options: utils.Options, nan: any = math.nan) -> any:
+        """
+        error_policy 를 지정한 스칼라 매서드의 오류를 처리합니다. (error_policy 가 None 이면 부르지 않습니다.)
+        'raise' 는 error 를 발생시키고, 'nan', 'mask' 는 nan 을, 'skip' 은 None 을 반환합니다.
+        예외를 밖으로 내보내지 않는 경우에도 기록이 켜져 있으면 오류 횟수를 셉니다.
+        """
+        if options.error_policy == 'raise':
+            raise error
+        if self.metrics is not None:
+            self.metrics.count_error(name, error)
+        if options.error_policy == 'skip':
+            return None
+        return nan
+
+    def add(self, *args: int, **kwargs: dict[str, any]) -> any:
+        """
+        덧셈 연산을 수행합니다.
+
+
+
+        Args:
+            *args (int): 덧셈에 사용할 숫자들을 가변 인자로 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+
+        Returns:
+            any: 덧셈 결과를 반환합니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> calc.add(1, 2, 3)
+            6
+            >>> calc.add(1, 2, 3, precision=2)
+            6.00
+            >>> calc.add(1, 2, 3, return_float=True)
+            6.0
+        """
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+
+        result = sum(args)  # 덧셈 연산 수행
+        # 소수점 자릿수 맞춤 # 소수점 자릿수 맞춤
+        result = utils.round_result(value=result, precision=options.precision)
+        # 결과를 실수형으로 반환할지 지정 # 결과를 실수형으로 반환할지 지정
+        result = utils.fl(result=result, return_float=options.return_float)
+
+        return result
+
+    def subtract(self, *args: int, **kwargs: dict[str, any]) -> any:
+        """
+        뺄셈 연산을 수행합니다.
+
+        가변 인자에 처음으로 들어가는 숫자에서 나머지 숫자들을 뺀 값을 반환합니다.
+
+        Args:
+            *args (int): 뺄셈에 사용할 숫자들을 가변 인자로 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+
+        Returns:
+            any: 뺄셈 결과를 반환합니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> calc.subtract(10, 2, 3)
+            5
+            >>> calc.subtract(10, 2, 3, precision=2)
+            5.00
+            >>> calc.subtract(10, 2, 3, return_float=True)
+            5.0
+        """
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+
+        result = args[0] - sum(islice(args, 1, None))  # 뺄셈 연산 수행
+        result = utils.round_result(
+            value=result, precision=options.precision)  # 소수점 자릿수 맞춤
+        # 결과를 실수형으로 반환할지 지정
+        result = utils.fl(result=result, return_float=options.return_float)
+
+        return result
+
+    def multiply(self, *args: int, **kwargs: dict[str, any]) -> any:
+        """
+        곱셈 연산을 수행합니다.
+
+        Args:
+            *args (int): 곱셈에 사용할 숫자들을 가변 인자로 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+
+        Returns:
+            any: 곱셈 결과를 반환합니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> calc.multiply(2, 3, 4)
+            24
+            >>> calc.multiply(2, 3, 4, precision=2)
+            24.00
+            >>> calc.multiply(2, 3, 4, return_float=True)
+            24.0
+        """
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+
+        result = utils.product(args)  # 곱셈 연산 수행 (정수가 많으면 균형 곱셈 트리)
+        result = utils.round_result(
+            value=result, precision=options.precision)  # 소수점 자릿수 맞춤
+        # 결과를 실수형으로 반환할지 지정
+        result = utils.fl(result=result, return_float=options.return_float)
+
+        return result
+
+    def divide(self, *args: int, **kwargs: dict[str, any]) -> any:
+        """
+        나눗셈 연산을 수행합니다.
+
+        가변 인자에 처음으로 들어가는 숫자에서 나머지 숫자들로 나눈 값을 반환합니다.
+        0으로 나누는 경우 오류를 출력하고 None 을 반환합니다. error_policy 를 지정하면 출력하지 않고 error_policy 에 따라 처리합니다.
+
+        Args:
+            *args (int): 나눗셈에 사용할 숫자들을 가변 인자로 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+                - error_policy (str): 'raise' 이면 0나누기에서 ZeroDivisionError 를 발생시키고,
+                  'nan', 'mask' 이면 nan 을, 'skip' 이면 None 을 반환합니다. (기본값: None, 오류 출력)
+
+        Returns:
+            any: 나눗셈 결과를 반환합니다.
+
+        Raises:
+            ZeroDivisionError: error_policy='raise' 이고 0으로 나누는 경우 발생합니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> calc.divide(100, 2)
+            50
+            >>> calc.divide(100, 2, precision=3)
+            50.000
+            >>> calc.divide(100, 2, return_float=True)
+            50.0
+        """
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+
+        # 0나누기 오류 발생시 에러났다고 표시
+        try:
+            result = args[0] / utils.product(islice(args, 1, None))  # 나눗셈 연산 수행 (나누는 수들을 복사 없이 곱셈 트리로 곱함)
+            result = utils.round_result(
+                value=result, precision=options.precision)  # 소수점 자릿수 맞춤
+            # 결과를 실수형으로 반환할지 지정
+            result = utils.fl(result=result, return_float=options.return_float)
+            return result
+        except ZeroDivisionError as e:
+            if options.error_policy is not None:  # 정수, 실수, 복소수에 상관없이 같은 메시지로 처리
+                return self._error('divide', ZeroDivisionError("division by zero"), options)
+            if self.metrics is not None:  # 기록이 켜져 있으면 0나누기 횟수를 셈
+                self.metrics.count_error('divide', e)
+            print(" 에러났습니다 : ", e)  # 출력: "Division by zero is not allowed"
+
+    def add_iter(self, values: any, **kwargs: dict[str, any]) -> any:
+        """
+        반복자, 제너레이터의 숫자들을 한 개씩 꺼내며 더합니다.
+
+        add 와 결과가 같지만 숫자들을 튜플로 모으지 않기 때문에 입력이 메모리보다 커도 메모리 사용량이 일정합니다.
+        precision, return_float 은 마지막 합에만 적용합니다.
+
+        Args:
+            values (Iterable): 숫자들을 꺼낼 수 있는 iterable(리스트, 반복자, 제너레이터, 파일을 읽는 제너레이터 등)을 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+
+        Returns:
+            any: 덧셈 결과를 반환합니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> calc.add_iter(x * x for x in range(4))
+            14
+            >>> calc.add_iter((float(line) for line in open('numbers.txt')), precision=2)
+            123.45
+        """
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+
+        result = sum(values)  # 덧셈 연산 수행
+        result = utils.round_result(
+            value=result, precision=options.precision)  # 소수점 자릿수 맞춤
+        # 결과를 실수형으로 반환할지 지정
+        result = utils.fl(result=result, return_float=options.return_float)
+
+        return result
+
+    def multiply_iter(self, values: any, **kwargs: dict[str, any]) -> any:
+        """
+        반복자, 제너레이터의 숫자들을 한 개씩 꺼내며 곱합니다.
+
+        multiply 와 결과가 같지만 숫자들을 튜플로 모으지 않기 때문에 입력이 메모리보다 커도 메모리 사용량이 일정합니다.
+        precision, return_float 은 마지막 곱에만 적용합니다.
+
+        Args:
+            values (Iterable): 숫자들을 꺼낼 수 있는 iterable 을 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+
+        Returns:
+            any: 곱셈 결과를 반환합니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> calc.multiply_iter(range(1, 5), return_float=True)
+            24.0
+        """
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+
+        result = utils.product(values)  # 곱셈 연산 수행 (반복자는 덩어리씩 꺼내며 곱셈 트리로 곱함)
+        result = utils.round_result(
+            value=result, precision=options.precision)  # 소수점 자릿수 맞춤
+        # 결과를 실수형으로 반환할지 지정
+        result = utils.fl(result=result, return_float=options.return_float)
+
+        return result
+
+    def add_accumulator(self, **kwargs: dict[str, any]) -> any:
+        """
+        덩어리로 나눠 넣고 다른 작업자의 것과 합칠 수 있는 합 누적기를 만듭니다.
+
+        Args:
+            **kwargs (dict[str, any]): result 에 적용할 연산 조건(precision, return_float)을 키워드 인자로 받습니다.
+
+        Returns:
+            accumulate.SumAccumulator: 합 누적기를 반환합니다. feed, merge, result 매서드를 제공합니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> left = calc.add_accumulator(precision=2).feed([1, 2])
+            >>> right = calc.add_accumulator().feed(x for x in (3, 4))
+            >>> left.merge(right).result()
+            10.00
+        """
+        from . import accumulate  # 누적기를 쓸 때만 불러옴
+
+        return accumulate.SumAccumulator(utils.resolve_options(self.options, kwargs))
+
+    def multiply_accumulator(self, **kwargs: dict[str, any]) -> any:
+        """
+        덩어리로 나눠 넣고 다른 작업자의 것과 합칠 수 있는 곱 누적기를 만듭니다.
+
+        Args:
+            **kwargs (dict[str, any]): result 에 적용할 연산 조건(precision, return_float)을 키워드 인자로 받습니다.
+
+        Returns:
+            accumulate.ProductAccumulator: 곱 누적기를 반환합니다. feed, merge, result 매서드를 제공합니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> calc.multiply_accumulator().feed([2, 3]).feed([4]).result()
+            24
+        """
+        from . import accumulate  # 누적기를 쓸 때만 불러옴
+
+        return accumulate.ProductAccumulator(utils.resolve_options(self.options, kwargs))
+
+    def statistics(self, *values: any, ddof: int = 0, **kwargs: dict[str, any]) -> any:
+        """
+        숫자들의 개수, 평균, 분산, 표준편차, 최솟값, 최댓값을 한번 읽으면서 계산합니다.
+
+        add, divide 로 평균을 구하고 다시 읽어서 분산을 구하는 것과 달리 값들을 모아두지 않으므로 입력이 메모리보다 커도 됩니다.
+        precision, return_float 은 마지막 결과에만 적용합니다.
+
+        Args:
+            *values (any): 숫자, iterable(리스트, 반복자, 제너레이터), numpy 배열을 가변 인자로 받습니다. 섞어서 넣어도 됩니다.
+            ddof (int): 0 이면 모분산, 1 이면 표본분산으로 분산과 표준편차를 계산합니다. (기본값: 0)
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+
+        Returns:
+            stats.Statistics: (count, mean, variance, stddev, minimum, maximum)를 반환합니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> calc.statistics(2, 4, [4, 4, 5], (x for x in (5, 7, 9)), precision=2)
+            Statistics(count=8, mean=5.00, variance=4.00, stddev=2.00, minimum=2.00, maximum=9.00)
+            >>> calc.statistics(np.arange(5)).mean
+            2.0
+        """
+        from . import stats  # 통계를 쓸 때만 불러옴
+
+        # 연산 조건(Options)을 받음
+        accumulator = stats.RunningStats(utils.resolve_options(self.options, kwargs))
+        for value in values:
+            accumulator.feed(value)
+        return accumulator.result(ddof)
+
+    def statistics_accumulator(self, **kwargs: dict[str, any]) -> any:
+        """
+        덩어리로 나눠 넣고 다른 작업자의 것과 합칠 수 있는 통계 누적기를 만듭니다.
+
+        Args:
+            **kwargs (dict[str, any]): result 에 적용할 연산 조건(precision, return_float)을 키워드 인자로 받습니다.
+
+        Returns:
+            stats.RunningStats: 통계 누적기를 반환합니다. feed, merge, result 매서드를 제공합니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> shards = [calc.statistics_accumulator().feed(chunk) for chunk in ([1, 2], [3, 4, 5])]
+            >>> shards[0].merge(shards[1]).result(ddof=1).variance
+            2.5
+        """
+        from . import stats  # 통계를 쓸 때만 불러옴
+
+        return stats.RunningStats(utils.resolve_options(self.options, kwargs))
+
+    def _scan(self, operation: str, values: any, kwargs: dict[str, any]) -> list:
+        """add_scan, subtract_scan, multiply_scan, divide_scan 이 함께 쓰는 스캔 계산입니다."""
+        from . import scan  # 스캔을 쓸 때만 불러옴
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+
+        result = list(scan.prefix(operation, values))  # 스캔 연산 수행
+        if options.precision or options.return_float:
+            # 소수점 자릿수 맞춤, 결과를 실수형으로 반환할지 지정 (0나누기 자리(None)는 그대로 둠)
+            result = [value if value is None else utils.fl(
+                result=utils.round_result(value=value, precision=options.precision),
+                return_float=options.return_float) for value in result]
+        if operation == 'divide' and None in result:
+            error = ZeroDivisionError('division by zero')
+            if options.error_policy is not None:  # divide 처럼 0나누기 자리마다 error_policy 에 따라 처리
+                return [self._error('divide_scan', error, options) if value is None else value for value in result]
+            if self.metrics is not None:  # 기록이 켜져 있으면 0나누기 횟수를 셈
+                self.metrics.count_error('divide_scan', error)
+            print(" 에러났습니다 : ", error)
+        return result
+
+    def add_scan(self, values: any, **kwargs: dict[str, any]) -> list:
+        """
+        숫자들의 누적 합(앞에서부터 더한 모든 중간 결과)을 계산합니다.
+
+        i 번째 결과는 add(*values[:i + 1]) 와 같지만, 앞의 합에 이어서 더하므로 숫자 n 개에 O(n) 입니다.
+        반복자, 제너레이터는 한번만 읽습니다. precision, return_float 은 결과마다 적용합니다.
+
+        Args:
+            values (Iterable): 숫자들을 꺼낼 수 있는 iterable 을 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+
+        Returns:
+            list: 누적 합 리스트를 반환합니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> calc.add_scan([100, -20, 35])
+            [100, 80, 115]
+        """
+        return self._scan('add', values, kwargs)
+
+    def subtract_scan(self, values: any, **kwargs: dict[str, any]) -> list:
+        """
+        첫 숫자에서 나머지 숫자들을 차례로 뺀 모든 중간 결과를 계산합니다. i 번째 결과는 subtract(*values[:i + 1]) 와 같습니다.
+
+        Args:
+            values (Iterable): 숫자들을 꺼낼 수 있는 iterable 을 받습니다.
+            **kwargs (dict[str, any]): 연산 조건(precision, return_float)을 키워드 인자로 받습니다.
+
+        Returns:
+            list: 중간 결과 리스트를 반환합니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> calc.subtract_scan(iter([100, 20, 35]))
+            [100, 80, 45]
+        """
+        return self._scan('subtract', values, kwargs)
+
+    def multiply_scan(self, values: any, **kwargs: dict[str, any]) -> list:
+        """
+        숫자들의 누적 곱을 계산합니다. i 번째 결과는 multiply(*values[:i + 1]) 와 같습니다.
+
+        Args:
+            values (Iterable): 숫자들을 꺼낼 수 있는 iterable 을 받습니다.
+            **kwargs (dict[str, any]): 연산 조건(precision, return_float)을 키워드 인자로 받습니다.
+
+        Returns:
+            list: 누적 곱 리스트를 반환합니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> calc.multiply_scan([1000, 1.05, 1.05], precision=2)
+            [1000.00, 1050.00, 1102.50]
+        """
+        return self._scan('multiply', values, kwargs)
+
+    def divide_scan(self, values: any, **kwargs: dict[str, any]) -> list:
+        """
+        첫 숫자를 나머지 숫자들로 차례로 나눈 모든 중간 결과를 계산합니다. i 번째 결과는 divide(*values[:i + 1]) 와 같습니다.
+        0으로 나누는 중간 결과는 divide 처럼 오류를 출력하고 None 이 들어갑니다.
+        error_policy 를 지정하면 출력하지 않고 divide 처럼 'raise' 는 ZeroDivisionError 를, 'nan', 'mask' 는 nan 을, 'skip' 은 None 을 넣습니다.
+
+        Args:
+            values (Iterable): 숫자들을 꺼낼 수 있는 iterable 을 받습니다.
+            **kwargs (dict[str, any]): 연산 조건(precision, return_float, error_policy)을 키워드 인자로 받습니다.
+
+        Returns:
+            list: 중간 결과 리스트를 반환합니다.
+
+        Raises:
+            ZeroDivisionError: error_policy='raise' 이고 0으로 나누는 중간 결과가 있는 경우 발생합니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> calc.divide_scan([100, 2, 5])
+            [100, 50.0, 10.0]
+        """
+        return self._scan('divide', values, kwargs)
+
+    def _batch_dtype(self, columns: list, options: utils.Options, default: any = None) -> any:
+        """배치 사칙연산의 계산 자료형을 반환합니다. dtype 연산 조건이 없으면 default 를, 복소수 열이 있으면 복소수 자료형을 반환합니다."""
+        if options.dtype is None:
+            return default
+        return utils.compute_dtype(options, complex_=any(column.dtype.kind == 'c' for column in columns))
+
+    def add_batch(self, *columns: any, **kwargs: dict[str, any]) -> any:
+        """
+        배열(열)들의 덧셈 연산을 한번에 수행합니다.
+
+        add 매서드의 배치 버전입니다. 같은 길이의 배열들을 받아 같은 위치의 값끼리 더한 배열을 반환합니다.
+        2차원 배열 하나를 넣으면 각 열을 피연산자로 보고 행마다 더합니다.
+        precision 이 있어도 문자열로 바꾸지 않고 반올림한 숫자 배열을 반환합니다.
+
+        Args:
+            *columns (any): 덧셈에 사용할 numpy 배열 또는 같은 길이의 시퀀스들을 가변 인자로 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+                - dtype (str): 계산 자료형을 지정합니다. 'float32', 'complex64' 이면 단정밀도로 계산합니다. (기본값: None, 입력 자료형)
+
+        Returns:
+            numpy.ndarray: 덧셈 결과 배열을 반환합니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> calc.add_batch([1, 2], [3, 4], [5, 6])
+            array([ 9, 12])
+            >>> calc.add_batch([[1, 3, 5], [2, 4, 6]], return_float=True)
+            array([ 9., 12.])
+        """
+        import numpy as np  # 배치 연산에서만 numpy를 불러옴
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+
+        columns = utils.as_columns(*columns)
+        result = utils.reduce_columns(
+            np.add, columns, dtype=self._batch_dtype(columns, options))  # 덧셈 연산 수행
+        result = utils.round_array(
+            values=result, precision=options.precision)  # 소수점 자릿수 맞춤
+        # 결과를 실수형으로 반환할지 지정
+        result = utils.fl_array(values=result, return_float=options.return_float)
+
+        return result
+
+    def subtract_batch(self, *columns: any, **kwargs: dict[str, any]) -> any:
+        """
+        배열(열)들의 뺄셈 연산을 한번에 수행합니다.
+
+        subtract 매서드의 배치 버전입니다. 첫번째 열에서 나머지 열들을 같은 위치끼리 뺀 배열을 반환합니다.
+
+        Args:
+            *columns (any): 뺄셈에 사용할 numpy 배열 또는 같은 길이의 시퀀스들을 가변 인자로 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+                - dtype (str): 계산 자료형을 지정합니다. 'float32', 'complex64' 이면 단정밀도로 계산합니다. (기본값: None, 입력 자료형)
+
+        Returns:
+            numpy.ndarray: 뺄셈 결과 배열을 반환합니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> calc.subtract_batch([10, 20], [2, 4], [3, 6])
+            array([ 5, 10])
+        """
+        import numpy as np  # 배치 연산에서만 numpy를 불러옴
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+
+        columns = utils.as_columns(*columns)
+        result = utils.reduce_columns(
+            np.subtract, columns, dtype=self._batch_dtype(columns, options))  # 뺄셈 연산 수행
+        result = utils.round_array(
+            values=result, precision=options.precision)  # 소수점 자릿수 맞춤
+        # 결과를 실수형으로 반환할지 지정
+        result = utils.fl_array(values=result, return_float=options.return_float)
+
+        return result
+
+    def multiply_batch(self, *columns: any, **kwargs: dict[str, any]) -> any:
+        """
+        배열(열)들의 곱셈 연산을 한번에 수행합니다.
+
+        multiply 매서드의 배치 버전입니다. 같은 위치의 값끼리 곱한 배열을 반환합니다.
+        정수 배열은 numpy 정수(int64) 범위를 넘으면 오버플로가 나므로 큰 정수는 multiply 를 사용하세요.
+
+        Args:
+            *columns (any): 곱셈에 사용할 numpy 배열 또는 같은 길이의 시퀀스들을 가변 인자로 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+                - dtype (str): 계산 자료형을 지정합니다. 'float32', 'complex64' 이면 단정밀도로 계산합니다. (기본값: None, 입력 자료형)
+
+        Returns:
+            numpy.ndarray: 곱셈 결과 배열을 반환합니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> calc.multiply_batch([2, 3], [3, 4], [4, 5])
+            array([24, 60])
+        """
+        import numpy as np  # 배치 연산에서만 numpy를 불러옴
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+
+        columns = utils.as_columns(*columns)
+        result = utils.reduce_columns(
+            np.multiply, columns, dtype=self._batch_dtype(columns, options))  # 곱셈 연산 수행
+        result = utils.round_array(
+            values=result, precision=options.precision)  # 소수점 자릿수 맞춤
+        # 결과를 실수형으로 반환할지 지정
+        result = utils.fl_array(values=result, return_float=options.return_float)
+
+        return result
+
+    def divide_batch(self, *columns: any, **kwargs: dict[str, any]) -> any:
+        """
+        배열(열)들의 나눗셈 연산을 한번에 수행합니다.
+
+        divide 매서드의 배치 버전입니다. 첫번째 열을 나머지 열들로 같은 위치끼리 나눈 배열을 반환합니다.
+        0으로 나누는 위치는 오류를 출력하지 않고 inf 또는 nan 값이 들어갑니다.
+        error_policy 를 지정하면 나누는 열들이 0인 위치를 오류로 세서 utils.CheckedResult 를 반환합니다.
+        (0/0 은 invalid, 나머지 0나누기는 divide_by_zero 로 셉니다.)
+
+        Args:
+            *columns (any): 나눗셈에 사용할 numpy 배열 또는 같은 길이의 시퀀스들을 가변 인자로 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+                - dtype (str): 계산 자료형을 지정합니다. 'float32', 'complex64' 이면 단정밀도로 계산합니다. (기본값: None, 입력 자료형)
+                - error_policy (str): 'raise', 'nan', 'mask', 'skip' 중 하나를 지정합니다. (기본값: None)
+
+        Returns:
+            numpy.ndarray: 나눗셈 결과 배열(실수형)을 반환합니다. error_policy 를 지정하면 utils.CheckedResult 를 반환합니다.
+
+        Raises:
+            ZeroDivisionError: error_policy='raise' 이고 0으로 나누는 위치가 있는 경우 발생합니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> calc.divide_batch([100, 90], [2, 3], precision=3)
+            array([50., 30.])
+            >>> calc.divide_batch([100, 90, 0], [2, 0, 0], error_policy='nan')
+            CheckedResult(values=array([50., nan, nan]), valid=array([ True, False, False]), errors={'divide_by_zero': 1, 'invalid': 1})
+        """
+        import numpy as np  # 배치 연산에서만 numpy를 불러옴
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+
+        columns = utils.as_columns(*columns)
+        # 나눗셈 결과는 항상 실수형
+        dtype = self._batch_dtype(columns, options, default=np.result_type(*columns, float))
+        # 0나누기는 예외 대신 inf, nan 으로 표시
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = utils.reduce_columns(
+                np.true_divide, columns, dtype=dtype)  # 나눗셈 연산 수행
+        if options.error_policy is not None:
+            zero = np.zeros(result.shape, dtype=bool)  # 나누는 수가 0인 위치
+            for column in columns[1:]:
+                if options.dtype is not None:
+                    column = column.astype(dtype, copy=False)  # 단정밀도에서 0 이 되는 아주 작은 수도 0나누기
+                zero |= column == 0
+            undefined = zero & np.isnan(result)
+            flags = {'divide_by_zero': zero & ~undefined, 'invalid': undefined}
+            return utils.check_array(result, flags, options, error=(ZeroDivisionError, "division by zero"))
+        result = utils.round_array(
+            values=result, precision=options.precision)  # 소수점 자릿수 맞춤
+        # 결과를 실수형으로 반환할지 지정
+        result = utils.fl_array(values=result, return_float=options.return_float)
+
+        return result
+
+    def _scan_batch(self, operation: str, column: any, kwargs: dict[str, any]) -> any:
+        """add_scan_batch, subtract_scan_batch, multiply_scan_batch, divide_scan_batch 가 함께 쓰는 스캔 계산입니다."""
+        import numpy as np  # 배치 연산에서만 numpy를 불러옴
+        from . import scan  # 스캔을 쓸 때만 불러옴
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+
+        column = np.asarray(column)
+        result = scan.prefix_array(operation, column)  # 스캔 연산 수행 (긴 배열은 블록 병렬 스캔)
+        if operation == 'divide' and options.error_policy is not None:
+            zero = np.zeros(result.shape, dtype=bool)  # 나누는 수들의 누적 곱이 0인 위치 (0이 나온 뒤로 모두)
+            np.logical_or.accumulate(column[1:] == 0, out=zero[1:])
+            undefined = zero & np.isnan(result)
+            flags = {'divide_by_zero': zero & ~undefined, 'invalid': undefined}
+            return utils.check_array(result, flags, options, error=(ZeroDivisionError, "division by zero"))
+        result = utils.round_array(
+            values=result, precision=options.precision)  # 소수점 자릿수 맞춤
+        # 결과를 실수형으로 반환할지 지정
+        result = utils.fl_array(values=result, return_float=options.return_float)
+
+        return result
+
+    def add_scan_batch(self, column: any, **kwargs: dict[str, any]) -> any:
+        """
+        배열의 누적 합(np.cumsum)을 계산합니다. add_scan 의 배치 버전입니다.
+
+        배열이 scan.PARALLEL_MIN_SIZE(약 100만) 이상이고 CPU 가 여러 개이면 블록으로 나눠 스레드에서 두 단계로 계산합니다.
+        이때 더하는 순서가 달라지므로 실수 결과는 np.cumsum 과 반올림 오차만큼 다를 수 있습니다.
+
+        Args:
+            column (any): 1차원 numpy 배열 또는 시퀀스를 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+
+        Returns:
+            numpy.ndarray: 누적 합 배열을 반환합니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> calc.add_scan_batch([100, -20, 35])
+            array([100,  80, 115])
+        """
+        return self._scan_batch('add', column, kwargs)
+
+    def subtract_scan_batch(self, column: any, **kwargs: dict[str, any]) -> any:
+        """
+        subtract_scan 의 배치 버전입니다. 첫 값에서 나머지 값들의 누적 합을 뺀 배열을 반환합니다. 인자는 add_scan_batch 와 같습니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> calc.subtract_scan_batch([100, 20, 35])
+            array([100,  80,  45])
+        """
+        return self._scan_batch('subtract', column, kwargs)
+
+    def multiply_scan_batch(self, column: any, **kwargs: dict[str, any]) -> any:
+        """
+        multiply_scan 의 배치 버전입니다. 누적 곱(np.cumprod) 배열을 반환합니다. 인자는 add_scan_batch 와 같습니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> calc.multiply_scan_batch([1000, 1.05, 1.05], precision=2)
+            array([1000.  , 1050.  , 1102.5 ])
+        """
+        return self._scan_batch('multiply', column, kwargs)
+
+    def divide_scan_batch(self, column: any, **kwargs: dict[str, any]) -> any:
+        """
+        divide_scan 의 배치 버전입니다. 첫 값을 나머지 값들의 누적 곱으로 나눈 배열(실수형)을 반환합니다.
+        0으로 나누는 위치는 오류를 출력하지 않고 inf 또는 nan 값이 들어갑니다. 인자는 add_scan_batch 와 같습니다.
+        error_policy 를 지정하면 divide_batch 처럼 0나누기 위치를 세서 utils.CheckedResult 를 반환합니다.
+
+        Raises:
+            ZeroDivisionError: error_policy='raise' 이고 0으로 나누는 위치가 있는 경우 발생합니다.
+
+        Examples:
+            >>> calc = Calculator()
+            >>> calc.divide_scan_batch([100, 2, 0])
+            array([100.,  50.,  inf])
+            >>> calc.divide_scan_batch([100, 2, 0], error_policy='nan')
+            CheckedResult(values=array([100.,  50.,  nan]), valid=array([ True,  True, False]), errors={'divide_by_zero': 1})
+        """
+        return self._scan_batch('divide', column, kwargs)
+
+    def execute(self, operation: str, *columns: any, backend: str = None, **kwargs: dict[str, any]) -> any:
+        """
+        배치 매서드가 있는 연산을 입력 크기에 맞는 가장 빠른 방법으로 계산합니다.
+
+        작은 입력은 행마다 스칼라 매서드로(scalar), 중간 크기는 배치 매서드 한번으로(vector),
+        아주 큰 입력은 공유 메모리와 작업 프로세스로 나눠(process) 계산합니다. 경계 크기는 보정 파일(backend.calibration_path())에서
+        읽고, 보정하지 않은 연산은 고정 기본값을 씁니다. 보정은 python -m calculator.backend --calibrate 로 따로 합니다.
+        결과는 방법에 상관없이 배치 매서드의 결과와 같은 형식이며, 고른 방법은 last_backend 속성에 남습니다.
+
+        Args:
+            operation (str): 연산 이름을 받습니다. (예 : 'add', 'sin', 'sqrt', 'complex_magnitude')
+            *columns (any): 배치 매서드에 넘길 numpy 배열, 시퀀스, 숫자들을 가변 인자로 받습니다.
+            backend (str): 'scalar', 'vector', 'process' 중 하나로 계산 방법을 직접 지정합니다. (기본값: None, 자동으로 고름)
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다. (배치 매서드와 같음)
+
+        Returns:
+            any: 배치 매서드와 같은 형식의 결과를 반환합니다.
+
+        Raises:
+            ValueError: 이 계산기에 배치 매서드가 없는 연산이거나 알 수 없는 계산 방법인 경우 발생합니다.
+
+        Examples:
+            >>> calc = EngineeringCalculator()
+            >>> calc.execute('sin', [30, 90], angle_unit='degree', precision=2).values
+            array([0.5, 1. ])
+            >>> calc.last_backend
+            'scalar'
+        """
+        from . import backend as backends  # 실행 계층을 쓸 때만 불러옴
+
+        return backends.execute(self, operation, columns, kwargs, backend)
+
+
+__all__ = ['Calculator']  # 외부에서 import * 를 사용할 때 노출될 이름들을 명시
+
+if __name__ == '__main__':
+    # 클래스 테스트용 코드
+    print("Basic Calculator Demo:")
+    calc = Calculator()
+    print(calc.add(1, 2, 3, precision=2))  # 출력: 6.00
+    print(calc.subtract(10, 2, 3, return_float=True))  # 출력: 5.0
+    print(calc.multiply(2, 3, 4))  # 출력: 24
+    print(calc.divide(100, 2, precision=3))  # 출력: 50.000
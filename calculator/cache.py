@@ -0,0 +1,161 @@
+"""
+
+이 파이썬 파일은 EngineeringCalculator, ComplexCalculator 의 연산 결과를 저장해두고 다시 쓰는 메모이제이션(memoization) 캐시 MemoCache 로 이루어져있다.
+EngineeringCalculator.enable_cache 매서드로 켤 수 있으며, 켜지 않으면 아무 비용도 들지 않는다.
+
+캐시 키는 (매서드 이름, 입력값들, 입력값들의 자료형, 연산 조건) 이다. 1, 1.0, True 는 같은 값이지만 결과의 자료형이 다르므로 자료형도 키에 넣는다. 연산 조건은 연산 목록(registry.py)에서 그 연산이 쓰는 연산 조건만 포함한다.
+(예 : sin 은 precision, return_float, angle_unit, max_error 를 쓰고 coordinate 는 쓰지 않으므로 coordinate 만 다른 호출은 같은 결과를 다시 씀)
+캐시가 가득 차면 policy 에 따라 오래된 값을 지운다.
+    - 'lru' : 가장 오랫동안 쓰이지 않은 값을 지운다.
+    - 'size' : 가장 먼저 저장된 값을 지운다. (조회할 때 순서를 바꾸지 않아 lru 보다 조금 가볍다.)
+hits, misses, evictions 통계를 제공하며, 잠금(lock)을 사용하기 때문에 여러 스레드가 같은 캐시를 함께 써도 안전하다.
+"""
+
+import threading  # 여러 스레드에서 안전하게 쓰기 위한 잠금용
+from collections import OrderedDict  # 저장 순서를 기억하는 캐시 저장소용
+from . import registry, utils
+
+POLICIES = ('lru', 'size')  # 사용할 수 있는 캐시 삭제 정책
+
+
+class MemoCache:
+    """
+    연산 결과를 저장해두는 스레드 안전한 캐시입니다.
+
+    Attributes:
+        maxsize (int): 캐시에 저장할 최대 결과 개수입니다.
+        policy (str): 캐시가 가득 찼을 때 값을 지우는 정책입니다. ('lru' 또는 'size')
+        hits (int): 캐시에서 결과를 찾은 횟수입니다.
+        misses (int): 캐시에 결과가 없어 새로 계산한 횟수입니다.
+        evictions (int): 캐시가 가득 차서 지운 결과 개수입니다.
+
+    Raises:
+        ValueError: maxsize 가 1보다 작거나 알 수 없는 policy 인 경우 발생합니다.
+
+    Examples:
+        >>> eng_calc = EngineeringCalculator()
+        >>> cache = eng_calc.enable_cache(maxsize=1024, policy='lru')
+        >>> eng_calc.sin(30, angle_unit='degree', precision=4)
+        0.5000
+        >>> eng_calc.sin(30, angle_unit='degree', precision=4)
+        0.5000
+        >>> cache.stats()
+        {'hits': 1, 'misses': 1, 'evictions': 0, 'size': 1, 'maxsize': 1024, 'policy': 'lru'}
+    """
+
+    def __init__(self, maxsize: int = 4096, policy: str = 'lru'):
+        if maxsize < 1:
+            raise ValueError(f"maxsize 는 1 이상이어야 합니다: {maxsize!r}")
+        if policy not in POLICIES:
+            raise ValueError(f"policy 는 {POLICIES} 중 하나여야 합니다: {policy!r}")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: tuple) -> tuple:
+        """
+        캐시에서 결과를 찾습니다.
+
+        Args:
+            key (tuple): 캐시 키를 받습니다.
+
+        Returns:
+            tuple: (찾았는지 여부, 결과)를 반환합니다.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return False, None
+            if self.policy == 'lru':
+                self._data.move_to_end(key)  # 최근에 쓴 값으로 표시
+            self.hits += 1
+            return True, value
+
+    def put(self, key: tuple, value: any):
+        """
+        캐시에 결과를 저장합니다. 캐시가 가득 차면 정책에 따라 가장 오래된 값을 지웁니다.
+
+        Args:
+            key (tuple): 캐시 키를 받습니다.
+            value (any): 저장할 결과를 받습니다.
+        """
+        with self._lock:
+            if key in self._data:  # 다른 스레드가 먼저 저장한 키는 값만 바꾸고 최근에 쓴 값으로 표시
+                self._data[key] = value
+                if self.policy == 'lru':
+                    self._data.move_to_end(key)
+                return
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)  # 가장 오래된 값 삭제
+                self.evictions += 1
+
+    def clear(self):
+        """저장된 결과와 통계를 모두 지웁니다."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            dict: hits, misses, evictions, size, maxsize, policy 를 담은 딕셔너리를 반환합니다.
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                    'size': len(self._data), 'maxsize': self.maxsize, 'policy': self.policy}
+
+    def wrap(self, calc: any, name: str, method: any) -> any:
+        """
+        계산기 매서드를 캐시를 거치는 함수로 감쌉니다.
+
+        입력값을 해시할 수 없는 경우(리스트, numpy 배열 등)에는 캐시를 거치지 않고 바로 계산합니다.
+        오류가 난 계산은 저장하지 않습니다.
+
+        Args:
+            calc (any): 매서드가 묶인 계산기 객체를 받습니다. (연산 조건을 읽는 데 사용)
+            name (str): 캐시 키에 쓸 매서드 이름을 받습니다.
+            method (any): 감쌀 매서드를 받습니다.
+
+        Returns:
+            any: 캐시를 거치는 함수를 반환합니다.
+        """
+        fields = tuple(sorted(registry.get(name).options))  # 결과에 영향을 주는 연산 조건만 캐시 키에 넣음
+
+        def cached(*args: any, **kwargs: dict[str, any]) -> any:
+            if fields:
+                options = utils.resolve_options(calc.options, kwargs)
+                key = (name, args, tuple(map(type, args)), tuple([getattr(options, field) for field in fields]))
+            elif kwargs:  # 연산 조건을 받지 않는 연산에 키워드 인자가 들어오면 캐시 없이 불러서 원래 오류를 냄
+                return method(*args, **kwargs)
+            else:
+                key = (name, args, tuple(map(type, args)))
+            try:
+                found, value = self.get(key)
+            except TypeError:  # 해시할 수 없는 입력은 캐시하지 않음
+                return method(*args, **kwargs)
+            if not found:
+                value = method(*args, **kwargs)
+                self.put(key, value)
+            if isinstance(value, list):
+                value = list(value)  # 캐시된 리스트를 바깥에서 바꾸지 못하도록 복사
+            return value
+
+        cached.__name__ = name
+        cached.__doc__ = method.__doc__
+        cached.__wrapped__ = method
+        return cached
+
+
+__all__ = ['MemoCache', 'POLICIES']
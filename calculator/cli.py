@@ -0,0 +1,344 @@
+"""
+
+이 파이썬 파일은 계산 명령을 한 줄씩 읽어서 결과를 한 줄씩 출력하는 명령줄 프로그램(CLI)으로 이루어져있다.
+python -m calculator 로 실행한다.
+
+입력 한 줄은 "연산이름 숫자들 키워드=값들" 형식이다. 결과도 입력 한 줄마다 한 줄씩 같은 순서로 출력한다.
+    sin 30 angle_unit=degree precision=4     ->  0.5000
+    add 1 2 3                                ->  6
+    cartesian_to_polar 1+1j coordinate=cartesian precision=3  ->  [1.414, 0.785]
+빈 줄과 # 으로 시작하는 줄은 빈 줄로 출력하고, 오류가 난 줄은 "error: 오류 내용" 으로 출력한다.
+
+입력은 chunk_size 줄씩 나누어 읽고 계산한 뒤 바로 출력하기 때문에 입력 크기와 상관없이 메모리 사용량이 일정하다.
+한 덩어리 안에서 연속된 줄들이 같은 연산, 같은 연산 조건이면 묶어서 배치(_batch) 매서드로 한번에 계산한다.
+배치 계산 결과의 출력 형식은 한 줄씩 계산한 결과와 같다. 단, numpy 로 계산하기 때문에 math 로 계산한 값과 마지막 자리(1ulp)가 다를 수 있다.
+
+연산 이름, 인자 개수, 배치 매서드 등 연산 정보는 registry.py 의 연산 목록에서 찾는다.
+parse_line, evaluate_lines, evaluate_requests 는 다른 모듈(jobs.py, server.py 등)에서도 사용한다.
+"""
+
+import argparse  # 명령줄 인자 해석용
+import itertools  # 입력을 덩어리로 나누기 위한 용도
+import math  # 키워드 값의 nan, inf 확인용
+import sys  # 표준 입출력용
+from . import registry, utils
+from .complex import ComplexCalculator
+
+CHUNK_SIZE = 4096  # 한번에 읽어서 계산할 줄 수
+MIN_BATCH = 8  # 이 줄 수 이상 묶일 때만 배치 매서드를 사용
+
+
+def parse_number(token: str) -> any:
+    """
+    숫자 문자열을 int, float, complex 중 알맞은 자료형으로 변환합니다.
+
+    Raises:
+        ValueError: 숫자가 아닌 경우 발생합니다.
+    """
+    for kind in (int, float, complex):
+        try:
+            return kind(token)
+        except ValueError:
+            pass
+    raise ValueError(f"숫자가 아닙니다: {token!r}")
+
+
+def parse_option(value: str) -> any:
+    """키워드 값 문자열을 알맞은 자료형(int, float, bool, str)으로 변환합니다."""
+    if value in ('True', 'true'):
+        return True
+    if value in ('False', 'false'):
+        return False
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        number = float(value)  # max_error=1e-5 등
+    except ValueError:
+        return value
+    return number if math.isfinite(number) else value  # 'nan', 'inf' 는 문자열로 둠 (error_policy=nan 등)
+
+
+def parse_line(line: str) -> tuple:
+    """
+    입력 한 줄을 (연산 이름, 숫자 튜플, 키워드 인자 튜플)로 해석합니다.
+
+    Args:
+        line (str): "sin 30 angle_unit=degree precision=4" 형식의 입력 한 줄을 받습니다.
+
+    Returns:
+        tuple: (연산 이름, 숫자 튜플, ((키워드, 값), ...))를 반환합니다. 빈 줄이나 주석이면 None 을 반환합니다.
+
+    Raises:
+        ValueError: 알 수 없는 연산이거나 숫자가 아닌 값이 있는 경우 발생합니다.
+
+    Examples:
+        >>> parse_line("sin 30 angle_unit=degree precision=4")
+        ('sin', (30,), (('angle_unit', 'degree'), ('precision', 4)))
+    """
+    tokens = line.split()
+    if not tokens or tokens[0].startswith('#'):
+        return None
+
+    op = registry.get(tokens[0]).name
+
+    args = []
+    kwargs = []
+    for token in tokens[1:]:
+        key, sep, value = token.partition('=')
+        if sep:
+            kwargs.append((key, parse_option(value)))
+        else:
+            args.append(parse_number(token))
+    return op, tuple(args), tuple(kwargs)
+
+
+def format_error(error: Exception) -> str:
+    """오류를 출력할 한 줄 문자열로 변환합니다."""
+    return f"error: {error}"
+
+
+def evaluate_one(calc: ComplexCalculator, request: tuple) -> str:
+    """
+    해석한 입력 한 줄을 스칼라 매서드로 계산하고 출력할 문자열을 반환합니다.
+
+    Args:
+        calc (ComplexCalculator): 계산에 사용할 계산기를 받습니다.
+        request (tuple): parse_line 의 결과를 받습니다.
+
+    Returns:
+        str: 출력할 한 줄 문자열을 반환합니다.
+    """
+    op, args, kwargs = request
+    kwargs = dict(kwargs)
+    if 'error_policy' in registry.OPERATIONS[op].options:
+        kwargs.setdefault('error_policy', 'raise')  # divide 가 0나누기 오류를 표준 출력에 찍지 않고 예외를 발생시키도록 함
+    try:
+        result = registry.bind(calc, op)(*args, **kwargs)  # 연산 조건을 받지 않는 연산은 키워드 인자를 버림
+    except (ArithmeticError, ValueError, TypeError, IndexError) as e:
+        return format_error(e)
+    return str(result)
+
+
+def _group_key(request: any) -> tuple:
+    """배치로 묶을 수 있는 줄이면 묶음 키를, 아니면 None 을 반환합니다."""
+    if not isinstance(request, tuple):
+        return None
+    op, args, kwargs = request
+    operation = registry.OPERATIONS[op]
+    if operation.batch is None or operation.domain != 'real' or not args \
+            or len(args) != (operation.arity or len(args)):
+        return None  # 실수 배치 매서드가 있고 인자 개수가 맞는 연산만 묶음
+    types = tuple(type(arg) for arg in args)
+    if complex in types:
+        return None
+    if not operation.integer:
+        types = None  # 결과가 항상 실수인 연산은 정수, 실수 입력을 함께 묶음
+    return op, kwargs, types
+
+
+def evaluate_group(calc: ComplexCalculator, requests: list) -> list:
+    """
+    같은 연산, 같은 연산 조건, 같은 인자 자료형인 여러 줄을 배치 매서드로 한번에 계산합니다.
+
+    배치 매서드에는 반올림을 하지 않은 값을 받아서, 한 줄씩 계산할 때와 같은 방법(utils.round_result, utils.fl)으로 출력 형식을 맞춥니다.
+    정수 계산이 numpy 정수 범위를 넘을 수 있으면 한 줄씩 계산합니다.
+
+    Args:
+        calc (ComplexCalculator): 계산에 사용할 계산기를 받습니다.
+        requests (list): parse_line 의 결과들을 받습니다.
+
+    Returns:
+        list: 출력할 문자열들을 반환합니다.
+    """
+    import numpy as np  # 배치 계산에서만 numpy를 불러옴
+
+    op, kwargs, types = _group_key(requests[0])
+    operation = registry.OPERATIONS[op]
+    batch = registry.bind(calc, op, batch=True)
+    try:
+        options = utils.resolve_options(calc.options, dict(kwargs))
+    except (TypeError, ValueError) as e:
+        return [format_error(e)] * len(requests)
+    # 출력 형식은 나중에 맞춤. 줄마다 계산한 결과와 같아야 하므로 dtype 은 무시하고 배정밀도로 계산
+    raw = options.replace(precision=0, return_float=False, dtype=None)
+    if 'error_policy' in operation.options:
+        raw = raw.replace(error_policy='nan')  # 오류 위치는 CheckedResult 의 valid 마스크로 받음
+
+    try:
+        columns = [np.array(column, dtype=None if types else float)
+                   for column in zip(*(request[1] for request in requests))]
+    except OverflowError:  # numpy 정수 범위를 넘는 큰 정수
+        return [evaluate_one(calc, request) for request in requests]
+    if operation.integer and int in types:
+        # 정수 오버플로가 날 수 있으면 한 줄씩 계산
+        estimate = batch(*(column.astype(float) for column in columns), options=raw)
+        if not (np.abs(estimate) < 2.0 ** 62).all():
+            return [evaluate_one(calc, request) for request in requests]
+
+    result = batch(*columns, options=raw)
+
+    if isinstance(result, utils.CheckedResult):
+        values, valid = result.values, result.valid
+        if options.error_policy not in (None, 'raise'):  # 한 줄씩 계산할 때처럼 nan 또는 None 을 출력
+            error = str(None if options.error_policy == 'skip' else float('nan'))
+        elif len(result.errors) == 1:  # 오류 종류가 하나이면 한 줄씩 계산할 때 나는 예외의 메시지를 출력
+            if ZeroDivisionError in operation.errors:
+                error = format_error(ZeroDivisionError("division by zero"))
+            else:
+                exception, message = utils._MATH_ERRORS[next(iter(result.errors))]
+                error = format_error(exception(message))
+        else:
+            error = None  # 오류 종류가 여러 개이면 줄마다 종류를 알 수 없으므로 오류 줄만 한 줄씩 계산
+    else:
+        values, valid = result, None
+
+    lines = []
+    for index, value in enumerate(values.tolist()):
+        if valid is not None and not valid[index]:
+            lines.append(error if error is not None else evaluate_one(calc, requests[index]))
+            continue
+        value = utils.round_result(value=value, precision=options.precision)
+        value = utils.fl(result=value, return_float=options.return_float)
+        lines.append(str(value))
+    return lines
+
+
+def evaluate_lines(calc: ComplexCalculator, lines: list) -> list:
+    """
+    입력 줄들을 계산해서 출력할 문자열들을 같은 순서로 반환합니다.
+
+    연속된 줄이 MIN_BATCH 줄 이상 같은 연산, 같은 연산 조건으로 묶이면 배치 매서드로 계산하고, 나머지는 한 줄씩 계산합니다.
+
+    Args:
+        calc (ComplexCalculator): 계산에 사용할 계산기를 받습니다.
+        lines (list): 입력 줄들을 받습니다.
+
+    Returns:
+        list: 입력 줄마다 출력할 문자열(줄바꿈 제외)을 반환합니다.
+    """
+    requests = []
+    for line in lines:
+        try:
+            requests.append(parse_line(line))
+        except ValueError as e:
+            requests.append(e)
+
+    keys = [_group_key(request) for request in requests]
+
+    outputs = []
+    index = 0
+    while index < len(requests):
+        key = keys[index]
+        end = index + 1
+        if key is not None:
+            while end < len(requests) and keys[end] == key:
+                end += 1
+        if end - index >= MIN_BATCH:
+            outputs.extend(evaluate_group(calc, requests[index:end]))
+        else:
+            for request in requests[index:end]:
+                if request is None:
+                    outputs.append('')
+                elif isinstance(request, Exception):
+                    outputs.append(format_error(request))
+                else:
+                    outputs.append(evaluate_one(calc, request))
+        index = end
+    return outputs
+
+
+def evaluate_requests(calc: ComplexCalculator, requests: list) -> list:
+    """
+    서로 독립적인 요청들을 계산해서 출력할 문자열들을 같은 순서로 반환합니다.
+
+    evaluate_lines 와 달리 연속되지 않은 요청도 같은 연산, 같은 연산 조건이면 모아서 배치 매서드로 계산합니다.
+    여러 클라이언트의 요청을 모아서 계산하는 server.py 에서 사용합니다.
+
+    Args:
+        calc (ComplexCalculator): 계산에 사용할 계산기를 받습니다.
+        requests (list): parse_line 형식의 (연산 이름, 숫자 튜플, 키워드 인자 튜플)들을 받습니다.
+
+    Returns:
+        list: 요청마다 출력할 문자열을 반환합니다.
+    """
+    outputs = [None] * len(requests)
+    groups = {}
+    for index, request in enumerate(requests):
+        key = _group_key(request)
+        if key is None:
+            outputs[index] = evaluate_one(calc, request)
+        else:
+            groups.setdefault(key, []).append(index)
+
+    for indexes in groups.values():
+        if len(indexes) >= MIN_BATCH:
+            results = evaluate_group(calc, [requests[index] for index in indexes])
+        else:
+            results = [evaluate_one(calc, requests[index]) for index in indexes]
+        for index, result in zip(indexes, results):
+            outputs[index] = result
+    return outputs
+
+
+def stream(calc: ComplexCalculator, source: any, sink: any, chunk_size: int = CHUNK_SIZE):
+    """
+    source 에서 chunk_size 줄씩 읽어 계산하고 결과를 sink 에 바로 씁니다. 메모리는 한 덩어리만큼만 사용합니다.
+
+    Args:
+        calc (ComplexCalculator): 계산에 사용할 계산기를 받습니다.
+        source (any): 입력 줄들을 꺼낼 수 있는 파일 객체 또는 반복자를 받습니다.
+        sink (any): 결과를 쓸 파일 객체를 받습니다.
+        chunk_size (int): 한번에 읽어서 계산할 줄 수를 받습니다. (기본값: CHUNK_SIZE)
+    """
+    lines = iter(source)
+    while True:
+        chunk = list(itertools.islice(lines, chunk_size))
+        if not chunk:
+            break
+        outputs = evaluate_lines(calc, chunk)
+        sink.write('\n'.join(outputs))
+        sink.write('\n')
+
+
+def main(argv: list = None) -> int:
+    """
+    명령줄 프로그램의 시작점입니다.
+
+    Args:
+        argv (list): 명령줄 인자들을 받습니다. (기본값: None, sys.argv 사용)
+
+    Returns:
+        int: 종료 코드를 반환합니다.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m calculator',
+        description='계산 명령을 한 줄씩 읽어 결과를 한 줄씩 출력합니다. (예 : sin 30 angle_unit=degree precision=4)')
+    parser.add_argument('input', nargs='?', default='-',
+                        help='입력 파일 경로 (기본값: - , 표준 입력)')
+    parser.add_argument('-o', '--output', default='-',
+                        help='출력 파일 경로 (기본값: - , 표준 출력)')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+                        help=f'한번에 읽어서 계산할 줄 수 (기본값: {CHUNK_SIZE})')
+    args = parser.parse_args(argv)
+
+    calc = ComplexCalculator()
+    source = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8')
+    sink = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8', buffering=1 << 20)
+    try:
+        stream(calc, source, sink, chunk_size=args.chunk_size)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+        else:
+            sink.flush()
+    return 0
+
+
+__all__ = ['parse_line', 'evaluate_lines', 'evaluate_requests', 'stream', 'main']
+
+if __name__ == '__main__':
+    sys.exit(main())
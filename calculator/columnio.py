@@ -0,0 +1,210 @@
+"""
+
+이 파이썬 파일은 메모리보다 큰 숫자 열(column) 파일을 메모리 매핑(memmap)으로 읽고 쓰면서 계산기 배치 연산을 하는 함수들로 이루어져있다.
+python -m calculator.columnio sin_batch angles.f64 -o sines.f64 --option angle_unit=degree 로 실행한다.
+
+열 파일은 float64, complex128 같은 값을 빈틈없이 이어서 쓴 raw 바이너리 파일(자료형은 dtype 으로 지정)이나 .npy 파일이다.
+evaluate_columns 는 입력 열들을 chunk_size 행씩 잘라 add_batch, sin_batch, complex_magnitude_batch 같은 배치 매서드(또는 Pipeline)에 넘기고,
+결과를 메모리 매핑한 출력 파일의 같은 위치에 바로 쓴다. 열 전체를 메모리에 올리거나 리스트, CSV 로 바꾸지 않으므로
+파일 크기와 상관없이 메모리 사용량은 덩어리 몇 개 크기로 일정하다.
+(3천만 행 float64 열의 sin_batch 에서 익명 메모리 약 14MB. 이미 읽은 파일 페이지는 RSS 에 보이지만 운영체제가 언제든 회수할 수 있는 페이지 캐시다.)
+
+배치 매서드의 결과에 따라 출력 열의 수가 정해진다.
+    - numpy 배열 (add_batch, complex_magnitude_batch 등) : 출력 열 1개
+    - utils.BatchResult (sin_batch 등) : 값 열, 유효성(bool) 열. 유효성 열은 생략할 수 있고, 정의역 오류 개수는 반환값에 담긴다.
+    - utils.CheckedResult (error_policy 를 지정한 경우) : BatchResult 와 같고, 오류 종류별 개수도 반환값에 담긴다. ('skip' 은 쓸 수 없음)
+    - PolarArrays (cartesian_to_polar_batch) : 길이 열, 각도 열
+출력 열의 자료형은 첫 덩어리의 결과 자료형을 따른다. (--option dtype=float32 이면 float32 열 파일)
+"""
+
+import argparse  # 명령줄 인자 해석용
+import os  # 경로 자료형 확인, 파일 크기 확인용
+import sys  # 표준 오류 출력용
+import numpy as np
+from . import utils
+
+CHUNK_SIZE = 1 << 20  # 한번에 계산하는 행 수 (float64 열 하나당 8MiB)
+
+
+def open_column(path: any, dtype: str = 'float64', mode: str = 'r') -> any:
+    """
+    열 파일을 메모리 매핑으로 엽니다. 파일 내용을 읽어오지 않고, 잘라낸 부분을 쓸 때 그 부분만 디스크에서 읽습니다.
+
+    Args:
+        path (any): 열 파일 경로를 받습니다. .npy 파일이면 파일에 적힌 자료형과 모양을 사용합니다.
+        dtype (str): raw 바이너리 파일의 자료형을 받습니다. (기본값: 'float64')
+        mode (str): 'r' 이면 읽기 전용, 'r+' 이면 읽고 쓰기로 엽니다. (기본값: 'r')
+
+    Returns:
+        numpy.memmap: 메모리 매핑한 열을 반환합니다.
+
+    Examples:
+        >>> column = open_column('angles.f64')
+        >>> column[:3]
+        memmap([ 0., 30., 90.])
+    """
+    if os.fspath(path).endswith('.npy'):
+        return np.load(path, mmap_mode=mode)
+    if os.path.getsize(path) == 0:
+        return np.empty(0, dtype=dtype)  # 빈 파일은 메모리 매핑할 수 없음
+    return np.memmap(path, dtype=dtype, mode=mode)
+
+
+def create_column(path: any, dtype: any, length: int) -> any:
+    """
+    length 행짜리 열 파일을 만들고 메모리 매핑으로 엽니다. 이미 있는 파일은 덮어씁니다.
+
+    Args:
+        path (any): 만들 열 파일 경로를 받습니다. .npy 로 끝나면 .npy 형식으로 만듭니다.
+        dtype (any): 열의 자료형을 받습니다.
+        length (int): 행 수를 받습니다.
+
+    Returns:
+        numpy.memmap: 쓰기용으로 메모리 매핑한 열을 반환합니다.
+    """
+    if os.fspath(path).endswith('.npy'):
+        return np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=(length,))
+    if length == 0:
+        open(path, 'wb').close()
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='w+', shape=(length,))
+
+
+def _is_path(value: any) -> bool:
+    """파일 경로인지 확인합니다."""
+    return isinstance(value, (str, os.PathLike))
+
+
+def _split_result(result: any) -> tuple:
+    """배치 매서드의 결과를 출력 열들에 쓸 배열 튜플로 나눕니다. (BatchResult, PolarArrays 는 튜플)"""
+    if isinstance(result, tuple):
+        return tuple(result)
+    return (result,)
+
+
+def evaluate_columns(calc: any, operation: any, inputs: list, outputs: any,
+                     chunk_size: int = CHUNK_SIZE, dtype: str = 'float64', **kwargs: dict[str, any]) -> dict:
+    """
+    입력 열들을 chunk_size 행씩 잘라 배치 연산을 하고, 결과를 출력 열에 덩어리마다 바로 씁니다.
+
+    Args:
+        calc (any): 연산에 사용할 계산기를 받습니다. operation 이 함수이면 None 이어도 됩니다.
+        operation (any): 배치 매서드 이름(예 : 'sin_batch')이나, 배열들을 받는 함수(예 : Pipeline)를 받습니다.
+        inputs (list): 입력 열들을 받습니다. 파일 경로는 open_column 으로 열고, 숫자는 모든 덩어리에 그대로 넘깁니다.
+            (예 : power_batch 에 ['x.f64', 2] 를 넘기면 x 의 제곱)
+        outputs (any): 출력 열 하나 또는 출력 열들의 리스트를 받습니다. 파일 경로이면 create_column 으로 만들고,
+            배열(memmap 포함)이면 그 배열에 씁니다.
+        chunk_size (int): 한번에 계산하는 행 수를 받습니다. (기본값: CHUNK_SIZE)
+        dtype (str): raw 바이너리 입력 파일의 자료형을 받습니다. (기본값: 'float64')
+        **kwargs (dict[str, any]): 배치 매서드에 넘길 연산 조건을 받습니다. (예 : angle_unit='degree', precision=4)
+            dtype 인자는 입력 파일의 자료형이므로 계산 자료형은 options=utils.Options(dtype='float32') 로 넘깁니다.
+
+    Returns:
+        dict: {'rows': 행 수, 'chunks': 덩어리 수, 'invalid': 정의역 오류 개수, 'errors': 오류 종류별 개수}를 반환합니다.
+            errors 는 error_policy 를 지정했을 때만 채워집니다. (utils.CheckedResult)
+
+    Raises:
+        ValueError: 입력 열들의 길이가 다르거나, 출력 열이 결과보다 많은 경우 발생합니다.
+
+    Examples:
+        >>> eng_calc = EngineeringCalculator()
+        >>> evaluate_columns(eng_calc, 'sin_batch', ['angles.f64'], 'sines.f64', angle_unit='degree')
+        {'rows': 50000000, 'chunks': 48, 'invalid': 0, 'errors': {}}
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size 는 양의 정수여야 합니다: {chunk_size!r}")
+    function = getattr(calc, operation) if isinstance(operation, str) else operation
+    columns = [open_column(value, dtype) if _is_path(value) else value for value in inputs]
+    lengths = {len(column) for column in columns if getattr(column, 'ndim', 0) > 0}
+    if len(lengths) != 1:
+        raise ValueError(f"입력 열들의 길이가 같아야 합니다: {sorted(lengths)}")
+    length = lengths.pop()
+    if _is_path(outputs) or hasattr(outputs, 'shape'):
+        outputs = [outputs]
+
+    targets = None
+    chunks = invalid = 0
+    errors = {}  # error_policy 를 지정한 경우의 오류 종류별 개수
+    start = 0
+    while True:  # 빈 열도 결과 자료형을 알기 위해 한번은 계산
+        stop = min(start + chunk_size, length)
+        parts = [column[start:stop] if getattr(column, 'ndim', 0) > 0 else column for column in columns]
+        result = function(*parts, **kwargs)
+        if isinstance(result, utils.BatchResult):
+            invalid += result.valid.size - int(np.count_nonzero(result.valid))
+        elif isinstance(result, utils.CheckedResult):  # error_policy 를 지정한 경우
+            if np.shape(result.values) != result.valid.shape:
+                raise ValueError("출력 열의 행 수가 입력과 같아야 하므로 error_policy='skip' 은 쓸 수 없습니다.")
+            for kind, count in result.errors.items():
+                errors[kind] = errors.get(kind, 0) + count
+            invalid += sum(result.errors.values())
+            result = (np.ma.getdata(result.values), result.valid)  # 'mask' 도 값 열, 유효성 열로 씀
+        values = _split_result(result)
+        if targets is None:
+            if len(outputs) > len(values):
+                raise ValueError(f"출력 열이 결과보다 많습니다: 출력 {len(outputs)}개, 결과 {len(values)}개")
+            targets = [create_column(output, np.asarray(value).dtype, length) if _is_path(output) else output
+                       for output, value in zip(outputs, values)]
+        for target, value in zip(targets, values):
+            target[start:stop] = value
+        chunks += 1
+        start = stop
+        if start >= length:
+            break
+
+    for target in targets:
+        if isinstance(target, np.memmap):
+            target.flush()  # 디스크에 씀
+    return {'rows': length, 'chunks': chunks, 'invalid': invalid, 'errors': errors}
+
+
+def _parse_input(value: str) -> any:
+    """명령줄 입력 인자를 숫자(상수) 또는 파일 경로로 해석합니다."""
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def main(argv: list = None) -> int:
+    """
+    명령줄 프로그램의 시작점입니다.
+
+    Returns:
+        int: 정의역 오류가 없으면 0, 있으면 1을 반환합니다.
+    """
+    from . import cli
+    from .complex import ComplexCalculator
+
+    parser = argparse.ArgumentParser(
+        prog='python -m calculator.columnio',
+        description='열 파일(raw 바이너리, .npy)을 메모리 매핑으로 덩어리마다 계산해서 출력 열 파일에 씁니다.')
+    parser.add_argument('operation', help='배치 매서드 이름 (예 : sin_batch, add_batch, complex_magnitude_batch)')
+    parser.add_argument('inputs', nargs='+', help='입력 열 파일 경로 또는 숫자 상수')
+    parser.add_argument('-o', '--output', action='append', required=True,
+                        help='출력 열 파일 경로. 결과가 여러 열이면 여러번 지정 (예 : -o values.f64 -o valid.bool)')
+    parser.add_argument('--dtype', default='float64', help='raw 바이너리 입력 파일의 자료형 (기본값: float64)')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+                        help=f'한번에 계산하는 행 수 (기본값: {CHUNK_SIZE})')
+    parser.add_argument('--option', action='append', default=[], metavar='KEY=VALUE',
+                        help='연산 조건 (예 : --option angle_unit=degree --option precision=4)')
+    args = parser.parse_args(argv)
+
+    kwargs = {}
+    for option in args.option:
+        key, _, value = option.partition('=')
+        kwargs[key] = cli.parse_option(value)
+    if 'dtype' in kwargs:  # --dtype 은 입력 파일의 자료형이므로 계산 자료형은 Options 로 넘김
+        kwargs['options'] = utils.Options(dtype=kwargs.pop('dtype'))
+    inputs = [_parse_input(value) for value in args.inputs]
+
+    summary = evaluate_columns(ComplexCalculator(), args.operation, inputs, args.output,
+                               chunk_size=args.chunk_size, dtype=args.dtype, **kwargs)
+    print(f"{summary['rows']} rows, {summary['chunks']} chunks, {summary['invalid']} invalid", file=sys.stderr)
+    return 1 if summary['invalid'] else 0
+
+
+__all__ = ['open_column', 'create_column', 'evaluate_columns', 'main']
+
+if __name__ == '__main__':
+    sys.exit(main())
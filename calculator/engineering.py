@@ -0,0 +1,775 @@
+"""
+
+editor : Kim Gwang=Jae
+date : 2024-10-1
+
+이 파이썬 파일은 사칙연산을 하는 계산기 클래스 Calculator에 공학용 계산 기능을 추가한 EngineeringCalculator로 이루어져있다.
+precision은 소수점 자릿수를 결정하는 입력이고 return_float는 결과를 실수(True) 혹은 정수형(False)으로 변환하는데 쓰이는 입력이다.
+EngineeringCalculator는 Calculator의 확장 버전으로 공학계산 기능(제곱근, 제곱, 로그, 삼각함수 계산)이 추가되어있다.
+EngineeringCalculator의 매서드들은 대부분 math 라이브러리의 기능을 이용해 만들었고, 소수점 결정 기능과 실수형 변환 기능이 들어가있다.
+이름이 _batch 로 끝나는 매서드들은 numpy ufunc로 배열 전체를 한번에 계산하는 배치 버전이다.
+배치 매서드는 정의역 오류를 예외 대신 utils.BatchResult 의 valid 마스크로 알려준다. nan 입력은 스칼라 매서드(math)처럼 오류가 아닌 nan 결과가 된다.
+배치 매서드는 dtype 연산 조건('float32' 등)으로 계산 정밀도를 고를 수 있다. (기본값: float64)
+error_policy 연산 조건을 지정하면 스칼라 매서드는 정의역 오류를 error_policy 에 따라 처리하고, 배치 매서드는 오류 종류별 개수까지 담은 utils.CheckedResult 를 반환한다.
+enable_cache 매서드로 square_root, power, log, ln, sin, cos, tan 결과를 저장해두고 다시 쓰는 캐시(cache.py)를 켤 수 있다.
+evaluate 매서드는 "sin(30 deg) + sqrt(x) * log(y)" 같은 계산식 문자열을 계산한다. 계산식은 expression.py 에서 한번만 컴파일해 캐시해둔다.
+pipeline 매서드로 sin, power, round 같은 배치 연산 단계를 이어 붙여 큰 배열을 덩어리 단위로 한번에 계산할 수 있다. (pipeline.py)
+"""
+
+import math
+from . import utils
+from .basic import Calculator
+
+
+class EngineeringCalculator(Calculator):
+    """
+    EngineeringCalculator는 square_root, power, log, ln, sin, cos, tan 가 Calculator에 추가된 클래스이다.
+    square_root, power, log, ln, sin, cos, tan 매서드는 차례대로 제곱근, 거듭제곱, 로그, 자연로그, 사인, 코사인, 탄젠트을 처리하는 함수이다.
+    위 매서드들은 x을 써서 숫자를 입력으로 받는다.
+    power의 입력 y는 거듭제곱을 의미한다.
+    또한 **kwargs을 써서 조건을 지정해 줄 수 있다. 
+    kwargs에는 precision = int값, return_float = True or False 값을 사용하며 각각 소수점 자릿수, 출력의 실수형, 정수형을 결정하는 키워드입니다. 
+    sin, cos, tan 매서드는 angle_unit으로 입력값이 degree인지, raidans인지 표시해주는 키워드가 있으며 기본값은 degree이다.
+    angle_raidans 매서드는 degree로 받은 입력x를 raidans으로 변환해주는 함수이다.
+
+
+    매서드들은 이러한 순서로 동작한다.
+    1.utils.resolve_options 를 통해 연산 조건(Options)을 불러온다.
+    1-2. sin, cos, tan은 angle_raidans 매서드를 거쳐 키워드를 통해 입력이 각도인지, 라디안인지 확인하고 각도이면 라디안으로 변환한다.
+    2. 계산을 실시한다.
+    3. prec을 통해 소수점 자릿수를 결정짓는다.
+    4. fl을 통해 출력의 실수형, 정수형을 결정짓는다.
+    5. 변환된 결과를 출력한다.
+
+    Attributes:
+        None
+
+    Methods:
+        square_root(self, x: float, **kwargs: dict[str, any]) -> any:
+            제곱근 연산을 수행합니다.
+        power(self, x: float, y: float, **kwargs: dict[str, any]) -> any:
+            거듭제곱 연산을 수행합니다.
+        log(self, x: float, **kwargs: dict[str, any]) -> any:
+            밑이 10인 로그 연산을 수행합니다.
+        ln(self, x: float, **kwargs: dict[str, any]) -> any:
+            자연로그 연산을 수행합니다.
+        sin(self, x: float, **kwargs: dict[str, any]) -> any:
+            사인 연산을 수행합니다.
+        cos(self, x: float, **kwargs: dict[str, any]) -> any:
+            코사인 연산을 수행합니다.
+        tan(self, x: float, **kwargs: dict[str, any]) -> any:
+            탄젠트 연산을 수행합니다.
+        square_root_batch, power_batch, log_batch, ln_batch, sin_batch, cos_batch, tan_batch:
+            위 매서드들의 배치 버전입니다. 배열을 받아 utils.BatchResult(values, valid)를 반환합니다.
+        evaluate(self, expression: str, variables: dict = None, options: utils.Options = None) -> any:
+            계산식 문자열을 계산합니다.
+        pipeline(self, **kwargs: dict[str, any]) -> Pipeline:
+            여러 배치 연산을 덩어리 단위로 이어서 계산하는 파이프라인을 만듭니다.
+        enable_cache(self, maxsize: int = 4096, policy: str = 'lru', cache: MemoCache = None) -> MemoCache:
+            순수 연산 결과를 저장해두는 캐시를 켭니다.
+        disable_cache(self) -> None:
+            캐시를 끕니다.
+
+    Args:
+        *args (complex): 연산에 사용할 복소수들을 가변 인자로 받습니다.
+        x (complex): 복소수의 절대값 또는 편각을 계산할 때 사용할 복소수입니다.
+        **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+            - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+            - angle_unit (str): 'degree' 이면 출력이 극좌표형태일 때 라디안에서 각도로 변환합니다. (예 : angle_unit = 'degree')
+
+    Returns:
+        any: 연산 결과를 반환합니다.
+
+    """
+
+    cache = None  # enable_cache 로 켠 캐시 (기본값: None, 캐시 꺼짐)
+
+    def init(self, **kwargs):
+        pass
+
+    def enable_cache(self, maxsize: int = 4096, policy: str = 'lru', cache: any = None) -> any:
+        """
+        순수 연산(square_root, power, log, ln, sin, cos, tan 등) 결과를 저장해두는 캐시를 켭니다.
+
+        같은 입력과 같은 연산 조건(precision, return_float, angle_unit, coordinate)으로 다시 계산하면 저장된 결과를 반환합니다.
+        캐시를 켠 계산기에만 적용되며, 켜지 않은 계산기는 아무 비용도 들지 않습니다.
+        cache 에 다른 계산기의 캐시를 넘기면 여러 계산기(스레드)가 캐시 하나를 함께 쓸 수 있습니다.
+
+        Args:
+            maxsize (int): 캐시에 저장할 최대 결과 개수를 받습니다. (기본값: 4096)
+            policy (str): 캐시가 가득 찼을 때 지우는 정책입니다. 'lru' 또는 'size' (기본값: 'lru')
+            cache (cache.MemoCache): 함께 쓸 캐시를 받습니다. (기본값: None, 새 캐시를 만듦)
+
+        Returns:
+            cache.MemoCache: 사용하는 캐시를 반환합니다. stats() 로 hits, misses, evictions 를 확인할 수 있습니다.
+
+        Examples:
+            >>> eng_calc = EngineeringCalculator()
+            >>> cache = eng_calc.enable_cache(maxsize=1024)
+            >>> eng_calc.sin(30, angle_unit='degree', precision=4)
+            0.5000
+        """
+        from . import cache as cache_module  # 캐시를 켤 때만 불러옴
+        from . import registry
+
+        self.disable_cache()
+        metrics = self.metrics
+        self.disable_metrics()  # 캐시에서 찾은 호출도 기록되도록 기록은 캐시 바깥에서 감쌈
+        if cache is None:
+            cache = cache_module.MemoCache(maxsize=maxsize, policy=policy)
+        for name in registry.cacheable(self):  # 연산 목록에서 cacheable 로 표시된 순수 연산
+            setattr(self, name, cache.wrap(self, name, getattr(self, name)))
+        self.cache = cache
+        self.__dict__.pop('_expression_namespace', None)  # evaluate 도 캐시를 거치도록 다시 만듦
+        if metrics is not None:
+            self.enable_metrics(metrics)
+        return cache
+
+    def disable_cache(self):
+        """
+        enable_cache 로 켠 캐시를 끄고 원래 매서드로 되돌립니다.
+        """
+        if 'cache' not in self.__dict__:
+            return
+        from . import registry
+
+        metrics = self.metrics
+        self.disable_metrics()
+        for name in registry.cacheable(self):
+            self.__dict__.pop(name, None)
+        self.__dict__.pop('cache', None)
+        self.__dict__.pop('_expression_namespace', None)
+        if metrics is not None:
+            self.enable_metrics(metrics)
+
+    def evaluate(self, expression: str, variables: dict = None, options: utils.Options = None) -> any:
+        """
+        계산식 문자열을 계산합니다. 계산식은 처음 한번만 파싱, 컴파일하고 캐시해두기 때문에 같은 계산식을 여러번 계산해도 다시 파싱하지 않습니다.
+
+        계산식에는 숫자, 변수, + - * / ** 연산, 괄호와 sqrt, power, log, ln, sin, cos, tan 함수를 쓸 수 있습니다.
+        ComplexCalculator 에서는 magnitude, argument 함수도 쓸 수 있습니다.
+        '30 deg' 처럼 숫자나 변수 뒤에 deg 를 붙이면 각도를 라디안으로 변환합니다.
+        변수는 키워드 인자가 아닌 딕셔너리로 받으므로 options 같은 이름의 변수도 쓸 수 있지만, 함수 이름(sin 등)은 변수 이름으로 쓸 수 없습니다.
+        계산식 안의 함수들은 계산기에 묶인 연산 조건으로 계산하고, options 의 precision, return_float 은 최종 결과에만 적용합니다.
+
+        Args:
+            expression (str): 계산식 문자열을 받습니다. (예 : "sin(30 deg) + sqrt(x) * log(y)")
+            variables (dict): 계산식에 쓰인 변수 이름과 값을 받습니다. (기본값: None, 변수 없음)
+            options (utils.Options): 최종 결과에 적용할 연산 조건을 받습니다. (기본값: None, 계산기에 묶인 조건 사용)
+
+        Returns:
+            any: 계산 결과를 반환합니다.
+
+        Raises:
+            SyntaxError: 계산식의 문법이 틀린 경우 발생합니다.
+            ValueError: 허용되지 않은 문법이나 알 수 없는 함수가 쓰인 경우, 함수 이름을 변수로 넘긴 경우 발생합니다.
+            NameError: 계산식에 쓰인 변수의 값이 주어지지 않은 경우 발생합니다.
+            OverflowError: 정수 거듭제곱(**)의 결과가 너무 큰 경우 발생합니다. (expression.MAX_POWER_BITS)
+
+        Examples:
+            >>> eng_calc = EngineeringCalculator()
+            >>> eng_calc.evaluate("sin(30 deg) + sqrt(x) * log(y)", {'x': 16, 'y': 100}, options=utils.Options(precision=4))
+            8.5000
+        """
+        from . import expression as expression_module  # 계산식을 쓸 때만 불러옴
+
+        if options is None:
+            options = self.options
+        compiled = expression_module.compile_expression(expression)
+        namespace = self.__dict__.get('_expression_namespace')
+        if namespace is None:  # 함수 이름 딕셔너리는 계산기마다 한번만 만듦
+            namespace = expression_module.build_namespace(self)
+            self._expression_namespace = namespace
+
+        result = compiled(namespace, {} if variables is None else variables)  # 계산식 계산 수행
+        result = utils.round_result(
+            value=result, precision=options.precision)  # 소수점 자릿수 맞춤
+        # 결과를 실수형으로 반환할지 지정
+        result = utils.fl(result=result, return_float=options.return_float)
+
+        return result
+
+    def square_root(self, x: float, **kwargs: dict[str, any]) -> any:
+        """
+        제곱근. x=16 이면 결과로 4를 반환합니다.
+
+        Args:
+            x (int): 제곱근을 구할 숫자를 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+                - error_policy (str): 정의역 오류(ValueError)를 처리하는 방법입니다. 'raise' 이면 예외를 발생시키고,
+                  'nan', 'mask' 이면 nan 을, 'skip' 이면 None 을 반환합니다. (기본값: None, 예외 발생)
+
+        Returns:
+            any: 제곱근 결과을 반환합니다.
+
+        Examples:
+            >>> eng_calc = EngineeringCalculator()
+            >>> eng_calc.square_root(16, precision=3)
+            4.000
+        """
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+
+        try:
+            result = math.sqrt(x)  # 제곱근 연산을 수행
+        except ValueError as e:
+            if options.error_policy is None:
+                raise
+            return self._error('square_root', e, options)  # error_policy 에 따라 nan, None 반환 또는 예외 발생
+        result = utils.round_result(
+            value=result, precision=options.precision)  # 소수점 자릿수 맞춤
+        # 결과를 실수형으로 반환할지 지정
+        result = utils.fl(result=result, return_float=options.return_float)
+
+        return result
+
+    def power(self, x: float, y: float, **kwargs: dict[str, any]) -> any:
+        """
+        거듭제곱. x^y 이며 x=2, y=3 이면 2^3=8을 반환합니다.
+
+        Args:
+            x (int): 거듭제곱을 구할 숫자를 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+                - error_policy (str): 정의역 오류(ValueError), 오버플로(OverflowError)를 처리하는 방법입니다. 'raise' 이면 예외를 발생시키고,
+                  'nan', 'mask' 이면 nan 을, 'skip' 이면 None 을 반환합니다. (기본값: None, 예외 발생)
+
+        Returns:
+            any: 거듭제곱 결과를 반환합니다.
+
+        Examples:
+            >>> eng_calc = EngineeringCalculator()
+            >>> eng_calc.power(2,3)
+            8
+        """
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+
+        try:
+            result = math.pow(x, y)  # 거듭제곱 연산을 수행
+        except (ValueError, OverflowError) as e:
+            if options.error_policy is None:
+                raise
+            return self._error('power', e, options)  # error_policy 에 따라 nan, None 반환 또는 예외 발생
+        result = utils.round_result(
+            value=result, precision=options.precision)  # 소수점 자릿수 맞춤
+        # 결과를 실수형으로 반환할지 지정
+        result = utils.fl(result=result, return_float=options.return_float)
+
+        return result
+
+    def log(self, x: float, **kwargs: dict[str, any]) -> any:
+        """
+        로그. 밑이 10인 로그 매서드입니다. x=100 이면 log100=2를 반환합니다.
+
+        Args:
+            x (int): 밑이 10인 로그를 구할 숫자를 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+                - error_policy (str): 정의역 오류(ValueError)를 처리하는 방법입니다. 'raise' 이면 예외를 발생시키고,
+                  'nan', 'mask' 이면 nan 을, 'skip' 이면 None 을 반환합니다. (기본값: None, 예외 발생)
+
+        Returns:
+            any: 밑이 10인 로그 결과 반환합니다.
+
+        Examples:
+            >>> eng_calc = EngineeringCalculator()
+            >>> eng_calc.log(100)
+            2
+        """
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+
+        try:
+            result = math.log10(x)  # 밑이 10인 로그 연산을 수행
+        except ValueError as e:
+            if options.error_policy is None:
+                raise
+            return self._error('log', e, options)  # error_policy 에 따라 nan, None 반환 또는 예외 발생
+        result = utils.round_result(
+            value=result, precision=options.precision)  # 소수점 자릿수 맞춤
+        # 결과를 실수형으로 반환할지 지정
+        result = utils.fl(result=result, return_float=options.return_float)
+
+        return result
+
+    def ln(self, x: float, **kwargs: dict[str, any]) -> any:
+        """
+        자연로그. 밑이 e인 자연로그 매서드입니다. x=e(자연상수) 이면 lne=1을 반환합니다.
+
+        Args:
+            x (int): 자연로그를 구할 숫자를 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+                - error_policy (str): 정의역 오류(ValueError)를 처리하는 방법입니다. 'raise' 이면 예외를 발생시키고,
+                  'nan', 'mask' 이면 nan 을, 'skip' 이면 None 을 반환합니다. (기본값: None, 예외 발생)
+
+        Returns:
+            any: 자연로그 결과를 반환합니다.
+
+        Examples:
+            >>> eng_calc = EngineeringCalculator()
+            >>> eng_calc.ln(1)
+            0
+        """
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+
+        try:
+            result = math.log(x)  # 자연로그 연산을 수행
+        except ValueError as e:
+            if options.error_policy is None:
+                raise
+            return self._error('ln', e, options)  # error_policy 에 따라 nan, None 반환 또는 예외 발생
+        result = utils.round_result(
+            value=result, precision=options.precision)  # 소수점 자릿수 맞춤
+        # 결과를 실수형으로 반환할지 지정
+        result = utils.fl(result=result, return_float=options.return_float)
+
+        return result
+
+    def sin(self, x: float, **kwargs: dict[str, any]) -> any:
+        """
+        사인. 각도 혹은 라디안 x를 입력하고 키워드로 angle_unit = 'degree' 가 입력되면 라디안 값으로 변환하여 sin값을 계산해 결과값을 반환합니다.
+
+        Args:
+            x (int): 사인값을 구할 숫자를 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+                - error_policy (str): 정의역 오류(ValueError)를 처리하는 방법입니다. 'raise' 이면 예외를 발생시키고,
+                  'nan', 'mask' 이면 nan 을, 'skip' 이면 None 을 반환합니다. (기본값: None, 예외 발생)
+                - angle_unit (str): 'degree' 이면 출력이 극좌표형태일 때 라디안에서 각도로 변환합니다. (예 : angle_unit = 'degree')
+                - max_error (float): 최대 절대 오차입니다. 숫자 하나는 표를 읽는 것보다 math 모듈이 빠르므로
+                  항상 정확한 값(오차 한계 안)을 계산합니다. 표 계산은 배치 매서드에서 사용합니다.
+
+        Returns:
+            any: 사인 결과를 반환합니다.
+
+        Examples:
+            >>> eng_calc = EngineeringCalculator()
+            >>> eng_calc.sin(30, angle_unit='degree', precision=4)
+            0.5000
+        """
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+
+        x = utils.convert_to_radians(x=x, angle_unit=options.angle_unit)  # 각도를 라디안으로 변환
+
+        try:
+            result = math.sin(x)  # 사인 연산을 수행
+        except ValueError as e:
+            if options.error_policy is None:
+                raise
+            return self._error('sin', e, options)  # error_policy 에 따라 nan, None 반환 또는 예외 발생
+        result = utils.round_result(
+            value=result, precision=options.precision)  # 소수점 자릿수 맞춤
+        # 결과를 실수형으로 반환할지 지정
+        result = utils.fl(result=result, return_float=options.return_float)
+
+        return result
+
+    def cos(self, x: float, **kwargs: dict[str, any]) -> any:
+        """
+        코사인. 각도 혹은 라디안 x를 입력하고 키워드로 angle_unit = 'degree' 가 입력되면 라디안 값으로 변환하여 cos값을 계산해 결과값을 반환합니다.
+
+        Args:
+            x (int): 코사인 값을 구할 숫자를 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+                - error_policy (str): 정의역 오류(ValueError)를 처리하는 방법입니다. 'raise' 이면 예외를 발생시키고,
+                  'nan', 'mask' 이면 nan 을, 'skip' 이면 None 을 반환합니다. (기본값: None, 예외 발생)
+                - angle_unit (str): 'degree' 이면 출력이 극좌표형태일 때 라디안에서 각도로 변환합니다. (예 : angle_unit = 'degree')
+                - max_error (float): 최대 절대 오차입니다. 숫자 하나는 표를 읽는 것보다 math 모듈이 빠르므로
+                  항상 정확한 값(오차 한계 안)을 계산합니다. 표 계산은 배치 매서드에서 사용합니다.
+
+        Returns:
+            any: 코사인 결과를 반환합니다.
+
+        Examples:
+            >>> eng_calc = EngineeringCalculator()
+            >>> eng_calc.cos(60, angle_unit='degree')
+            0.5
+        """
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+        x = utils.convert_to_radians(x=x, angle_unit=options.angle_unit)  # 각도를 라디안으로 변환
+
+        try:
+            result = math.cos(x)  # 코사인 연산을 수행
+        except ValueError as e:
+            if options.error_policy is None:
+                raise
+            return self._error('cos', e, options)  # error_policy 에 따라 nan, None 반환 또는 예외 발생
+        result = utils.round_result(
+            value=result, precision=options.precision)  # 소수점 자릿수 맞춤
+        # 결과를 실수형으로 반환할지 지정
+        result = utils.fl(result=result, return_float=options.return_float)
+
+        return result
+
+    def tan(self, x: float, **kwargs: dict[str, any]) -> any:
+        """
+        탄젠트. 각도 혹은 라디안 x를 입력하고 키워드로 angle_unit = 'degree' 가 입력되면 라디안 값으로 변환하여 tan값을 계산해 결과값을 반환합니다.
+
+        Args:
+            x (int): 탄젠트 값을 구할 숫자를 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+                - error_policy (str): 정의역 오류(ValueError)를 처리하는 방법입니다. 'raise' 이면 예외를 발생시키고,
+                  'nan', 'mask' 이면 nan 을, 'skip' 이면 None 을 반환합니다. (기본값: None, 예외 발생)
+                - angle_unit (str): 'degree' 이면 출력이 극좌표형태일 때 라디안에서 각도로 변환합니다. (예 : angle_unit = 'degree')
+                - max_error (float): 최대 절대 오차입니다. 숫자 하나는 표를 읽는 것보다 math 모듈이 빠르므로
+                  항상 정확한 값(오차 한계 안)을 계산합니다. 표 계산은 배치 매서드에서 사용합니다.
+
+        Returns:
+            any: 탄젠트 결과를 반환합니다.
+
+        Examples:
+            >>> eng_calc = EngineeringCalculator()
+            >>> eng_calc.tan(0, angle_unit = 'degree')
+            0
+        """
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+        x = utils.convert_to_radians(x=x, angle_unit=options.angle_unit)  # 각도를 라디안으로 변환
+
+        try:
+            result = math.tan(x)  # 탄젠트 연산을 수행
+        except ValueError as e:
+            if options.error_policy is None:
+                raise
+            return self._error('tan', e, options)  # error_policy 에 따라 nan, None 반환 또는 예외 발생
+        result = utils.round_result(
+            value=result, precision=options.precision)  # 소수점 자릿수 맞춤
+        # 결과를 실수형으로 반환할지 지정
+        result = utils.fl(result=result, return_float=options.return_float)
+
+        return result
+
+    def _finish_batch(self, result: any, valid: any, options: utils.Options) -> utils.BatchResult:
+        """
+        배치 매서드의 공통 마무리 작업입니다. 정의역 오류 위치를 nan으로 채우고 소수점 자릿수, 실수형 변환을 적용합니다.
+
+        Args:
+            result (numpy.ndarray): 연산 결과 배열을 받습니다.
+            valid (numpy.ndarray): 정상적으로 계산된 위치가 True 인 부울 배열을 받습니다.
+            options (utils.Options): 이번 호출에 사용할 연산 조건을 받습니다.
+
+        Returns:
+            utils.BatchResult: 결과 배열과 유효성 마스크를 반환합니다.
+        """
+        import numpy as np  # 배치 연산에서만 numpy를 불러옴
+
+        if not valid.all():
+            result[~valid] = np.nan  # 정의역 오류 위치는 nan으로 표시
+        result = utils.round_array(
+            values=result, precision=options.precision)  # 소수점 자릿수 맞춤
+        # 결과를 실수형으로 반환할지 지정
+        result = utils.fl_array(values=result, return_float=options.return_float)
+
+        return utils.BatchResult(values=result, valid=valid)
+
+    def _trig_batch(self, name: str, x: any, kwargs: dict[str, any]) -> utils.BatchResult:
+        """
+        sin_batch, cos_batch, tan_batch 의 공통 구현입니다.
+        max_error 가 없으면 numpy 의 삼각함수로, 있으면 trig_table 의 표로 계산합니다.
+
+        Args:
+            name (str): 'sin', 'cos', 'tan' 중 하나를 받습니다.
+            x (any): 배열 또는 시퀀스를 받습니다.
+            kwargs (dict[str, any]): 매서드 호출 때 들어온 키워드 인자를 받습니다.
+
+        Returns:
+            utils.BatchResult: 결과 배열과 유효성 마스크를 반환합니다.
+        """
+        import numpy as np  # 배치 연산에서만 numpy를 불러옴
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+        if options.max_error is None:
+            x = utils.convert_to_radians_array(x, angle_unit=options.angle_unit,
+                                               dtype=utils.compute_dtype(options))  # 각도를 라디안으로 변환
+            valid = ~np.isinf(x)  # 무한대는 정의역 오류
+            with np.errstate(invalid='ignore'):
+                result = getattr(np, name)(x)  # 삼각함수 연산을 수행
+        else:
+            from . import trig_table  # 표 계산을 쓸 때만 불러옴
+
+            x = np.asarray(x, dtype=float)  # 표는 각도를 그대로 받으므로 라디안 변환 없음
+            valid = ~np.isinf(x)  # 무한대는 정의역 오류
+            result = getattr(trig_table, name)(x, options.angle_unit, options.max_error)
+            result = result.astype(utils.compute_dtype(options), copy=False)  # 표는 float64 로 계산함
+
+        if options.error_policy is not None:
+            return utils.check_array(result, {'invalid': ~valid}, options)  # 무한대는 invalid
+        return self._finish_batch(result, valid, options)
+
+    def pipeline(self, **kwargs: dict[str, any]) -> any:
+        """
+        여러 배치 연산을 이어서 계산하는 파이프라인을 만듭니다. (pipeline.py)
+        단계들은 입력을 캐시 크기의 덩어리로 나누어 한번에 계산하므로, 단계마다 중간 결과 배열을 만들지 않습니다.
+
+        Args:
+            **kwargs (dict[str, any]): 파이프라인 전체에 적용할 연산 조건을 받습니다.
+                - precision (int): 마지막 결과의 소수점 자릿수를 지정합니다. (기본값: 0)
+                - angle_unit (str): 삼각함수 단계의 기본 각도 단위를 지정합니다. (예 : angle_unit = 'degree')
+
+        Returns:
+            Pipeline: 단계가 없는 파이프라인을 반환합니다. sin(), power(2) 처럼 단계를 이어 붙여 사용합니다.
+
+        Examples:
+            >>> eng_calc = EngineeringCalculator()
+            >>> eng_calc.pipeline().sin(angle_unit='degree').power(2).round(4)([30, 90]).values
+            array([0.25, 1.  ])
+        """
+        from . import pipeline as pipeline_module  # 파이프라인을 쓸 때만 불러옴
+
+        return pipeline_module.Pipeline(utils.resolve_options(self.options, kwargs))
+
+    def square_root_batch(self, x: any, **kwargs: dict[str, any]) -> utils.BatchResult:
+        """
+        square_root의 배치 버전입니다. 배열 전체의 제곱근을 한번에 계산합니다.
+        음수는 ValueError 대신 valid 마스크가 False 가 됩니다.
+
+        Args:
+            x (any): 제곱근을 구할 배열 또는 시퀀스를 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+                - error_policy (str): 'raise', 'nan', 'mask', 'skip' 중 하나를 지정하면 utils.CheckedResult 를 반환합니다. (기본값: None)
+                - dtype (str): 'float32' 이면 단정밀도로 계산하고 결과도 float32 배열로 반환합니다. (기본값: None, float64)
+
+        Returns:
+            utils.BatchResult: 제곱근 결과 배열과 유효성 마스크를 반환합니다.
+
+        Examples:
+            >>> eng_calc = EngineeringCalculator()
+            >>> eng_calc.square_root_batch([16, -1])
+            BatchResult(values=array([ 4., nan]), valid=array([ True, False]))
+        """
+        import numpy as np  # 배치 연산에서만 numpy를 불러옴
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+        x = np.asarray(x, dtype=utils.compute_dtype(options))  # 계산 자료형 (기본값: float64)
+        valid = ~(x < 0)  # 음수는 정의역 오류
+        with np.errstate(invalid='ignore'):
+            result = np.sqrt(x)  # 제곱근 연산을 수행
+
+        if options.error_policy is not None:
+            return utils.check_array(result, {'invalid': ~valid}, options)  # 음수는 invalid
+        return self._finish_batch(result, valid, options)
+
+    def power_batch(self, x: any, y: any, **kwargs: dict[str, any]) -> utils.BatchResult:
+        """
+        power의 배치 버전입니다. 같은 위치의 x, y 끼리 x^y 를 한번에 계산합니다.
+        음수의 정수가 아닌 거듭제곱, 0의 음수 거듭제곱, 오버플로는 valid 마스크가 False 가 됩니다.
+
+        Args:
+            x (any): 밑 배열 또는 시퀀스를 받습니다.
+            y (any): 지수 배열, 시퀀스 또는 숫자를 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+                - error_policy (str): 'raise', 'nan', 'mask', 'skip' 중 하나를 지정하면 utils.CheckedResult 를 반환합니다. (기본값: None)
+                - dtype (str): 'float32' 이면 단정밀도로 계산하고 결과도 float32 배열로 반환합니다. (기본값: None, float64)
+
+        Returns:
+            utils.BatchResult: 거듭제곱 결과 배열과 유효성 마스크를 반환합니다.
+
+        Examples:
+            >>> eng_calc = EngineeringCalculator()
+            >>> eng_calc.power_batch([2, 3], 2).values
+            array([4., 9.])
+        """
+        import numpy as np  # 배치 연산에서만 numpy를 불러옴
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+        dtype = utils.compute_dtype(options)  # 계산 자료형 (기본값: float64)
+        x = np.asarray(x, dtype=dtype)
+        y = np.asarray(y, dtype=dtype)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            result = np.power(x, y)  # 거듭제곱 연산을 수행
+            # math.pow 가 ValueError, OverflowError 를 내는 경우를 마스크로 표시
+            undefined = (x < 0) & (y != np.floor(y))  # 음수의 정수가 아닌 거듭제곱
+            pole = (x == 0) & (y < 0)  # 0의 음수 거듭제곱
+            overflow = np.isinf(result) & np.isfinite(x) & np.isfinite(y) & ~pole
+        valid = ~(undefined | pole | overflow)
+
+        if options.error_policy is not None:
+            flags = {'divide_by_zero': pole, 'invalid': undefined, 'overflow': overflow}
+            return utils.check_array(np.asarray(result), flags, options)
+        return self._finish_batch(np.asarray(result), np.asarray(valid), options)
+
+    def log_batch(self, x: any, **kwargs: dict[str, any]) -> utils.BatchResult:
+        """
+        log의 배치 버전입니다. 배열 전체의 밑이 10인 로그를 한번에 계산합니다.
+        0 이하의 값은 ValueError 대신 valid 마스크가 False 가 됩니다.
+
+        Args:
+            x (any): 밑이 10인 로그를 구할 배열 또는 시퀀스를 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+                - error_policy (str): 'raise', 'nan', 'mask', 'skip' 중 하나를 지정하면 utils.CheckedResult 를 반환합니다. (기본값: None)
+                - dtype (str): 'float32' 이면 단정밀도로 계산하고 결과도 float32 배열로 반환합니다. (기본값: None, float64)
+
+        Returns:
+            utils.BatchResult: 로그 결과 배열과 유효성 마스크를 반환합니다.
+
+        Examples:
+            >>> eng_calc = EngineeringCalculator()
+            >>> eng_calc.log_batch([100, 0]).valid
+            array([ True, False])
+        """
+        import numpy as np  # 배치 연산에서만 numpy를 불러옴
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+        x = np.asarray(x, dtype=utils.compute_dtype(options))  # 계산 자료형 (기본값: float64)
+        valid = ~(x <= 0)  # 0 이하는 정의역 오류
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = np.log10(x)  # 밑이 10인 로그 연산을 수행
+
+        if options.error_policy is not None:  # 0은 divide_by_zero(-inf), 음수는 invalid
+            return utils.check_array(result, {'divide_by_zero': x == 0, 'invalid': x < 0}, options)
+        return self._finish_batch(result, valid, options)
+
+    def ln_batch(self, x: any, **kwargs: dict[str, any]) -> utils.BatchResult:
+        """
+        ln의 배치 버전입니다. 배열 전체의 자연로그를 한번에 계산합니다.
+        0 이하의 값은 ValueError 대신 valid 마스크가 False 가 됩니다.
+
+        Args:
+            x (any): 자연로그를 구할 배열 또는 시퀀스를 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+                - error_policy (str): 'raise', 'nan', 'mask', 'skip' 중 하나를 지정하면 utils.CheckedResult 를 반환합니다. (기본값: None)
+                - dtype (str): 'float32' 이면 단정밀도로 계산하고 결과도 float32 배열로 반환합니다. (기본값: None, float64)
+
+        Returns:
+            utils.BatchResult: 자연로그 결과 배열과 유효성 마스크를 반환합니다.
+
+        Examples:
+            >>> eng_calc = EngineeringCalculator()
+            >>> eng_calc.ln_batch([1, -1]).values
+            array([ 0., nan])
+        """
+        import numpy as np  # 배치 연산에서만 numpy를 불러옴
+
+        # 연산 조건(Options)을 받음
+        options = utils.resolve_options(self.options, kwargs)
+        x = np.asarray(x, dtype=utils.compute_dtype(options))  # 계산 자료형 (기본값: float64)
+        valid = ~(x <= 0)  # 0 이하는 정의역 오류
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = np.log(x)  # 자연로그 연산을 수행
+
+        if options.error_policy is not None:  # 0은 divide_by_zero(-inf), 음수는 invalid
+            return utils.check_array(result, {'divide_by_zero': x == 0, 'invalid': x < 0}, options)
+        return self._finish_batch(result, valid, options)
+
+    def sin_batch(self, x: any, **kwargs: dict[str, any]) -> utils.BatchResult:
+        """
+        sin의 배치 버전입니다. angle_unit = 'degree' 이면 배열 전체를 한번만 라디안으로 변환한 뒤 사인값을 계산합니다.
+        무한대 입력은 ValueError 대신 valid 마스크가 False 가 됩니다.
+
+        Args:
+            x (any): 사인값을 구할 배열 또는 시퀀스를 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+                - error_policy (str): 'raise', 'nan', 'mask', 'skip' 중 하나를 지정하면 utils.CheckedResult 를 반환합니다. (기본값: None)
+                - dtype (str): 'float32' 이면 단정밀도로 계산하고 결과도 float32 배열로 반환합니다. (기본값: None, float64)
+                - angle_unit (str): 'degree' 이면 입력을 각도에서 라디안으로 변환합니다. (예 : angle_unit = 'degree')
+                - max_error (float): 최대 절대 오차를 지정하면 미리 계산해둔 표로 빠르게 계산합니다. (예 : max_error = 1e-5)
+
+        Returns:
+            utils.BatchResult: 사인 결과 배열과 유효성 마스크를 반환합니다.
+
+        Examples:
+            >>> eng_calc = EngineeringCalculator()
+            >>> eng_calc.sin_batch([30, 90], angle_unit='degree', precision=4).values
+            array([0.5, 1. ])
+        """
+        return self._trig_batch('sin', x, kwargs)
+
+    def cos_batch(self, x: any, **kwargs: dict[str, any]) -> utils.BatchResult:
+        """
+        cos의 배치 버전입니다. angle_unit = 'degree' 이면 배열 전체를 한번만 라디안으로 변환한 뒤 코사인값을 계산합니다.
+        무한대 입력은 ValueError 대신 valid 마스크가 False 가 됩니다.
+
+        Args:
+            x (any): 코사인값을 구할 배열 또는 시퀀스를 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+                - error_policy (str): 'raise', 'nan', 'mask', 'skip' 중 하나를 지정하면 utils.CheckedResult 를 반환합니다. (기본값: None)
+                - dtype (str): 'float32' 이면 단정밀도로 계산하고 결과도 float32 배열로 반환합니다. (기본값: None, float64)
+                - angle_unit (str): 'degree' 이면 입력을 각도에서 라디안으로 변환합니다. (예 : angle_unit = 'degree')
+                - max_error (float): 최대 절대 오차를 지정하면 미리 계산해둔 표로 빠르게 계산합니다. (예 : max_error = 1e-5)
+
+        Returns:
+            utils.BatchResult: 코사인 결과 배열과 유효성 마스크를 반환합니다.
+
+        Examples:
+            >>> eng_calc = EngineeringCalculator()
+            >>> eng_calc.cos_batch([60, 180], angle_unit='degree', precision=4).values
+            array([ 0.5, -1. ])
+        """
+        return self._trig_batch('cos', x, kwargs)
+
+    def tan_batch(self, x: any, **kwargs: dict[str, any]) -> utils.BatchResult:
+        """
+        tan의 배치 버전입니다. angle_unit = 'degree' 이면 배열 전체를 한번만 라디안으로 변환한 뒤 탄젠트값을 계산합니다.
+        무한대 입력은 ValueError 대신 valid 마스크가 False 가 됩니다.
+
+        Args:
+            x (any): 탄젠트값을 구할 배열 또는 시퀀스를 받습니다.
+            **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+                - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+                - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+                - error_policy (str): 'raise', 'nan', 'mask', 'skip' 중 하나를 지정하면 utils.CheckedResult 를 반환합니다. (기본값: None)
+                - dtype (str): 'float32' 이면 단정밀도로 계산하고 결과도 float32 배열로 반환합니다. (기본값: None, float64)
+                - angle_unit (str): 'degree' 이면 입력을 각도에서 라디안으로 변환합니다. (예 : angle_unit = 'degree')
+                - max_error (float): 최대 절대 오차를 지정하면 미리 계산해둔 표로 빠르게 계산합니다. (예 : max_error = 1e-5)
+
+        Returns:
+            utils.BatchResult: 탄젠트 결과 배열과 유효성 마스크를 반환합니다.
+
+        Examples:
+            >>> eng_calc = EngineeringCalculator()
+            >>> eng_calc.tan_batch([0, 45], angle_unit='degree', precision=4).values
+            array([0., 1.])
+        """
+        return self._trig_batch('tan', x, kwargs)
+
+
+__all__ = ['EngineeringCalculator']  # 외부에서 import * 를 사용할 때 노출될 이름들을 명시
+
+if __name__ == '__main__':
+    # 클래스 테스트용 코드
+    print("Engineering Calculator Demo:")
+    eng_calc = EngineeringCalculator()
+    print(eng_calc.add(1, 2, 3, precision=2))  # 출력: 6.00
+    print(eng_calc.square_root(16, precision=3))  # 출력: 4.000
+    print(eng_calc.log(100, precision=4))  # 출력: 2.0000
+    print(eng_calc.sin(30, angle_unit='degree', precision=4))  # 출력: 0.5000
+
+    eng_calc.divide(5, 0)  # 에러처리 확인용 코드
@@ -0,0 +1,197 @@
+"""
+
+이 파이썬 파일은 계산식 문자열을 한번만 해석(파싱)해서 빠르게 다시 계산할 수 있도록 컴파일해주는 함수들로 이루어져있다.
+EngineeringCalculator.evaluate 매서드 내부에서 사용한다.
+
+compile_expression 은 "sin(30 deg) + sqrt(x) * log(y)" 같은 계산식을 AST로 해석하고 허용된 문법만 쓰였는지 검사한 뒤,
+파이썬 코드 객체로 컴파일한 CompiledExpression 을 반환한다.
+컴파일 결과는 계산식 문자열을 키로 하는 LRU 캐시(최대 CACHE_SIZE 개)에 저장되므로, 같은 계산식은 다시 파싱하지 않는다.
+build_namespace 는 계산식 안의 함수 이름(sin, sqrt, log 등)을 계산기의 매서드와 연결한 딕셔너리를 만든다.
+
+계산식에서 쓸 수 있는 문법은 숫자(복소수 포함), 변수, + - * / ** 연산, 괄호, 함수 호출뿐이다.
+'30 deg' 처럼 숫자나 변수 뒤에 deg 를 붙이면 각도를 라디안으로 변환한다.
+계산식은 사용자가 입력하는 문자열이므로 ** 는 피연산자를 먼저 검사하는 power 함수 호출로 컴파일한다.
+(9**9**9**9 처럼 결과가 MAX_POWER_BITS 비트를 넘는 정수 거듭제곱은 계산하지 않고 OverflowError 를 발생시킴)
+"""
+
+import ast  # 계산식 해석용
+import math  # 각도 변환용
+import re  # deg 표기 변환용
+from functools import lru_cache  # 컴파일 결과 캐시용
+from . import utils
+
+CACHE_SIZE = 512  # 컴파일한 계산식을 캐시에 저장할 최대 개수
+MAX_POWER_BITS = 1 << 16  # 계산식의 정수 거듭제곱 결과의 최대 비트 수 (약 2만 자리)
+
+# 계산식 함수 이름 -> 계산기 매서드 이름
+FUNCTIONS = {
+    'sqrt': 'square_root',
+    'square_root': 'square_root',
+    'pow': 'power',
+    'power': 'power',
+    'log': 'log',
+    'ln': 'ln',
+    'sin': 'sin',
+    'cos': 'cos',
+    'tan': 'tan',
+    'magnitude': 'complex_magnitude',
+    'argument': 'complex_argument',
+}
+
+# 계산식에 쓸 수 있는 AST 노드 종류
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.USub, ast.UAdd,
+)
+
+# '30 deg', '1.5deg', 'x deg' 를 'deg(30)', 'deg(1.5)', 'deg(x)' 로 바꾸기 위한 정규식
+# 숫자 앞에 글자나 점이 있으면 변수 이름(x30)이나 숫자의 일부이므로 바꾸지 않음
+_NUMBER_DEGREE = re.compile(r'(?<![\w.])(\d+(?:\.\d*)?(?:[eE][+-]?\d+)?|\.\d+)\s*deg\b')
+_NAME_DEGREE = re.compile(r'\b([A-Za-z_]\w*)\s+deg\b')
+
+
+class CompiledExpression:
+    """
+    컴파일이 끝난 계산식입니다.
+
+    Attributes:
+        text (str): 원래 계산식 문자열입니다.
+        code (code): 파이썬 코드 객체입니다.
+        variables (frozenset): 계산식에서 쓰인 변수 이름들입니다.
+    """
+
+    __slots__ = ('text', 'code', 'variables')
+
+    def __init__(self, text: str, code: any, variables: frozenset):
+        self.text = text
+        self.code = code
+        self.variables = variables
+
+    def __call__(self, namespace: dict, variables: dict) -> any:
+        """
+        계산식을 계산합니다.
+
+        Args:
+            namespace (dict): build_namespace 로 만든 함수 이름 딕셔너리를 받습니다.
+            variables (dict): 변수 이름과 값을 받습니다.
+
+        Returns:
+            any: 계산 결과를 반환합니다.
+
+        Raises:
+            ValueError: 함수 이름(sin 등)이나 _ 로 시작하는 이름을 변수로 넘긴 경우 발생합니다.
+        """
+        for name in variables:
+            if name in namespace or not isinstance(name, str) or name.startswith('_'):
+                raise ValueError(f"변수 이름으로 쓸 수 없습니다: {name!r}")  # 함수를 가리지 않도록 함
+        return eval(self.code, namespace, variables)
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({self.text!r})"
+
+
+def _check(tree: ast.AST) -> frozenset:
+    """
+    AST에 허용되지 않은 문법이 있는지 검사하고 계산식에 쓰인 변수 이름들을 반환합니다.
+
+    Raises:
+        ValueError: 허용되지 않은 문법이나 알 수 없는 함수가 쓰인 경우 발생합니다.
+    """
+    variables = set()
+    functions = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"계산식에 쓸 수 없는 문법입니다: {type(node).__name__}")
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or (node.func.id not in FUNCTIONS and node.func.id != 'deg'):
+                raise ValueError(f"알 수 없는 함수입니다: {ast.unparse(node.func)}")
+            if node.keywords:
+                raise ValueError("계산식의 함수에는 키워드 인자를 쓸 수 없습니다.")
+            functions.add(id(node.func))
+        elif isinstance(node, ast.Name) and id(node) not in functions:
+            variables.add(node.id)
+        elif isinstance(node, ast.Constant) and not isinstance(node.value, (int, float, complex)):
+            raise ValueError(f"계산식에는 숫자만 쓸 수 있습니다: {node.value!r}")
+
+    for name in variables:
+        if name.startswith('_') or name in FUNCTIONS or name == 'deg':
+            raise ValueError(f"변수 이름으로 쓸 수 없습니다: {name!r}")
+    return frozenset(variables)
+
+
+class _PowerToCall(ast.NodeTransformer):
+    """x ** y 를 _power(x, y) 호출로 바꿉니다. (compile 의 상수 접기로 큰 거듭제곱을 미리 계산하지 않도록 함)"""
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        self.generic_visit(node)
+        if not isinstance(node.op, ast.Pow):
+            return node
+        return ast.copy_location(ast.Call(func=ast.Name(id='_power', ctx=ast.Load()),
+                                          args=[node.left, node.right], keywords=[]), node)
+
+
+def _power(x: any, y: any) -> any:
+    """
+    계산식의 ** 연산입니다. 정수 거듭제곱의 결과가 MAX_POWER_BITS 비트를 넘으면 계산하지 않습니다.
+    실수, 복소수 거듭제곱은 결과가 너무 크면 파이썬이 바로 OverflowError 를 발생시키므로 그대로 계산합니다.
+
+    Raises:
+        OverflowError: 정수 거듭제곱의 결과가 너무 큰 경우 발생합니다.
+    """
+    base, exponent = utils._raw(x), utils._raw(y)
+    if isinstance(base, int) and isinstance(exponent, int) and exponent > 0 and abs(base) > 1:
+        if (abs(base).bit_length() - 1) * exponent > MAX_POWER_BITS:
+            raise OverflowError(f"계산식의 거듭제곱 결과가 너무 큽니다: {base!r} ** {exponent!r}")
+    return x ** y
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_expression(text: str) -> CompiledExpression:
+    """
+    계산식 문자열을 CompiledExpression 으로 컴파일합니다.
+
+    결과는 계산식 문자열을 키로 하는 LRU 캐시에 저장되므로 같은 계산식은 한번만 파싱합니다.
+    캐시 상태는 compile_expression.cache_info() 로 확인할 수 있습니다.
+
+    Args:
+        text (str): 계산식 문자열을 받습니다. (예 : "sin(30 deg) + sqrt(x) * log(y)")
+
+    Returns:
+        CompiledExpression: 컴파일한 계산식을 반환합니다.
+
+    Raises:
+        SyntaxError: 계산식의 문법이 틀린 경우 발생합니다.
+        ValueError: 허용되지 않은 문법이나 알 수 없는 함수가 쓰인 경우 발생합니다.
+
+    Examples:
+        >>> compile_expression("sin(30 deg) + sqrt(x)").variables
+        frozenset({'x'})
+    """
+    source = _NUMBER_DEGREE.sub(r'deg(\1)', text)
+    source = _NAME_DEGREE.sub(r'deg(\1)', source)
+    tree = ast.parse(source.strip(), mode='eval')
+    variables = _check(tree)
+    tree = ast.fix_missing_locations(_PowerToCall().visit(tree))
+    code = compile(tree, filename='<expression>', mode='eval')
+    return CompiledExpression(text, code, variables)
+
+
+def build_namespace(calc: any) -> dict:
+    """
+    계산식의 함수 이름을 계산기 매서드와 연결한 딕셔너리를 만듭니다.
+    계산기에 없는 매서드(예 : EngineeringCalculator 의 complex_magnitude)는 빠집니다.
+
+    Args:
+        calc (any): 계산식을 계산할 계산기 객체를 받습니다.
+
+    Returns:
+        dict: 함수 이름 -> 매서드 딕셔너리를 반환합니다.
+    """
+    namespace = {'__builtins__': {}, 'deg': math.radians, '_power': _power}
+    for name, method in FUNCTIONS.items():
+        if hasattr(calc, method):
+            namespace[name] = getattr(calc, method)
+    return namespace
+
+
+__all__ = ['CompiledExpression', 'compile_expression', 'build_namespace', 'MAX_POWER_BITS']
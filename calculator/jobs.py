@@ -0,0 +1,176 @@
+"""
+
+이 파이썬 파일은 큰 작업 파일(계산 명령을 한 줄씩 적은 파일)을 여러 프로세스로 나눠 계산하는 함수들로 이루어져있다.
+python -m calculator.jobs 입력파일 출력파일 --workers 32 로 실행한다. 입력 형식은 cli.py 와 같다.
+
+run_jobs 는 입력을 chunk_size 줄씩 덩어리로 나누고, ProcessPoolExecutor 의 작업 프로세스들이 덩어리마다 cli.evaluate_lines 로 계산한다.
+결과는 입력 순서 그대로 출력 파일에 쓴다.
+한번에 계산 중인 덩어리 수를 제한하기 때문에 입력 파일이 커도 메모리 사용량이 일정하다.
+덩어리 하나가 실패해도(작업 프로세스가 죽는 경우 포함) 그 덩어리의 줄들만 "error: ..." 로 쓰고 나머지 작업은 계속한다.
+작업 프로세스가 죽으면 그때 계산 중이던 덩어리들도 함께 실패하므로, 그런 덩어리는 새 실행기에서 혼자 한번 더 계산해본다.
+"""
+
+import argparse  # 명령줄 인자 해석용
+import itertools  # 입력을 덩어리로 나누기 위한 용도
+import os  # CPU 개수 확인용
+import sys  # 표준 오류 출력용
+from collections import deque  # 계산 중인 덩어리 목록용
+from concurrent.futures import Future, ProcessPoolExecutor  # 멀티 프로세스 실행용
+from concurrent.futures.process import BrokenProcessPool  # 작업 프로세스가 죽었을 때의 오류
+from . import cli
+
+CHUNK_SIZE = 65536  # 작업 프로세스 하나에 한번에 넘길 줄 수
+
+_calc = None  # 작업 프로세스마다 하나씩 만드는 계산기
+
+
+def _init_worker():
+    """작업 프로세스가 시작될 때 계산기를 한번만 만듭니다."""
+    global _calc
+    from .complex import ComplexCalculator
+    _calc = ComplexCalculator()
+
+
+def evaluate_chunk(lines: list) -> list:
+    """
+    작업 프로세스 안에서 덩어리 하나를 계산합니다.
+
+    Args:
+        lines (list): 입력 줄들을 받습니다.
+
+    Returns:
+        list: 입력 줄마다 출력할 문자열들을 반환합니다.
+    """
+    if _calc is None:
+        _init_worker()
+    return cli.evaluate_lines(_calc, lines)
+
+
+def _submit(executor: ProcessPoolExecutor, lines: list) -> Future:
+    """덩어리를 실행기에 넣습니다. 실행기가 이미 고장났다면 그 오류를 담은 future 를 반환합니다."""
+    try:
+        return executor.submit(evaluate_chunk, lines)
+    except BrokenProcessPool as e:
+        future = Future()
+        future.set_exception(e)
+        return future
+
+
+def run_jobs(input_path: str, output_path: str, workers: int = None,
+             chunk_size: int = CHUNK_SIZE, log: any = sys.stderr) -> dict:
+    """
+    작업 파일을 여러 프로세스로 나눠 계산하고 결과를 입력 순서대로 출력 파일에 씁니다.
+
+    Args:
+        input_path (str): 입력 파일 경로를 받습니다.
+        output_path (str): 출력 파일 경로를 받습니다.
+        workers (int): 작업 프로세스 개수를 받습니다. (기본값: None, CPU 개수)
+        chunk_size (int): 덩어리 하나의 줄 수를 받습니다. (기본값: CHUNK_SIZE)
+        log (any): 실패한 덩어리를 알려줄 파일 객체를 받습니다. (기본값: 표준 오류)
+
+    Returns:
+        dict: chunks(덩어리 수), lines(줄 수), failed(실패한 덩어리 번호와 오류 목록)를 반환합니다.
+
+    Examples:
+        >>> run_jobs('operations.txt', 'results.txt', workers=4)
+        {'chunks': 3, 'lines': 150000, 'failed': []}
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 2  # 한번에 계산 중인 덩어리 수 제한
+    summary = {'chunks': 0, 'lines': 0, 'failed': []}
+
+    with open(input_path, encoding='utf-8') as source, \
+            open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as sink:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+        pending = deque()  # (덩어리 번호, 입력 줄들, future)
+        chunks = iter(lambda: list(itertools.islice(source, chunk_size)), [])
+        try:
+            for index, lines in enumerate(chunks):
+                pending.append((index, lines, _submit(executor, lines)))
+                while len(pending) >= max_pending:
+                    executor = _write_next(pending, executor, sink, summary, log, workers)
+            while pending:
+                executor = _write_next(pending, executor, sink, summary, log, workers)
+        finally:
+            executor.shutdown(cancel_futures=True)
+    return summary
+
+
+def _write_next(pending: deque, executor: ProcessPoolExecutor, sink: any,
+                summary: dict, log: any, workers: int) -> ProcessPoolExecutor:
+    """
+    가장 먼저 넣은 덩어리의 결과를 기다려 출력 파일에 씁니다.
+    덩어리가 실패하면 그 덩어리의 줄들을 오류로 쓰고, 작업 프로세스가 죽었다면 새로 만들어 남은 덩어리를 다시 넣습니다.
+
+    Returns:
+        ProcessPoolExecutor: 계속 사용할 실행기를 반환합니다.
+    """
+    index, lines, future = pending.popleft()
+    try:
+        outputs = future.result()
+    except BrokenProcessPool:
+        # 작업 프로세스가 죽었으면 실행기를 새로 만들고, 이 덩어리만 혼자 다시 계산해봄
+        executor.shutdown(cancel_futures=True)
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+        outputs = _retry(executor, index, lines, summary, log)
+        if outputs is None:
+            executor.shutdown(cancel_futures=True)
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+            outputs = _failed(index, lines, BrokenProcessPool("worker process died"), summary, log)
+        for position, (other, other_lines, _) in enumerate(pending):
+            pending[position] = (other, other_lines, _submit(executor, other_lines))
+    except Exception as e:
+        outputs = _failed(index, lines, e, summary, log)
+
+    sink.write('\n'.join(outputs))
+    sink.write('\n')
+    summary['chunks'] += 1
+    summary['lines'] += len(lines)
+    return executor
+
+
+def _retry(executor: ProcessPoolExecutor, index: int, lines: list, summary: dict, log: any) -> list:
+    """덩어리 하나만 다시 계산합니다. 작업 프로세스가 또 죽으면 None 을 반환합니다."""
+    try:
+        return executor.submit(evaluate_chunk, lines).result()
+    except BrokenProcessPool:
+        return None
+    except Exception as e:
+        return _failed(index, lines, e, summary, log)
+
+
+def _failed(index: int, lines: list, error: Exception, summary: dict, log: any) -> list:
+    """실패한 덩어리를 기록하고 그 덩어리의 줄 수만큼 오류 줄을 반환합니다."""
+    summary['failed'].append((index, repr(error)))
+    print(f"chunk {index} failed: {error!r}", file=log)
+    return [cli.format_error(f"chunk {index} failed: {error!r}")] * len(lines)
+
+
+def main(argv: list = None) -> int:
+    """
+    명령줄 프로그램의 시작점입니다.
+
+    Returns:
+        int: 실패한 덩어리가 없으면 0, 있으면 1을 반환합니다.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m calculator.jobs',
+        description='작업 파일을 여러 프로세스로 나눠 계산하고 결과를 입력 순서대로 씁니다.')
+    parser.add_argument('input', help='입력 파일 경로')
+    parser.add_argument('output', help='출력 파일 경로')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='작업 프로세스 개수 (기본값: CPU 개수)')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+                        help=f'작업 프로세스에 한번에 넘길 줄 수 (기본값: {CHUNK_SIZE})')
+    args = parser.parse_args(argv)
+
+    summary = run_jobs(args.input, args.output, workers=args.workers, chunk_size=args.chunk_size)
+    print(f"{summary['lines']} lines, {summary['chunks']} chunks, "
+          f"{len(summary['failed'])} failed", file=sys.stderr)
+    return 1 if summary['failed'] else 0
+
+
+__all__ = ['run_jobs', 'evaluate_chunk', 'main']
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,246 @@
+"""
+
+이 파이썬 파일은 계산기 매서드마다 호출 횟수, 걸린 시간 분포(히스토그램), 오류 횟수를 기록하는 Metrics 와 기록을 내보내는 싱크(sink)들로 이루어져있다.
+Calculator.enable_metrics 매서드로 켤 수 있으며, 켜지 않으면 매서드 호출에 아무 비용도 들지 않는다.
+
+기록은 snapshot() 으로 딕셔너리로 꺼내거나, prometheus_text() 로 Prometheus 텍스트 형식으로 바꿀 수 있다.
+flush() 를 부르면 등록된 싱크들에 지금까지의 기록을 넘긴다.
+    - MemorySink : 마지막 기록을 메모리에 저장한다.
+    - PrometheusFileSink : Prometheus 텍스트 형식으로 파일에 쓴다. (node_exporter textfile collector 등에서 읽을 수 있음)
+export(snapshot) 매서드를 가진 객체라면 무엇이든 싱크로 쓸 수 있다.
+
+잠금(lock)을 사용하기 때문에 여러 스레드가 같은 Metrics 를 함께 써도 안전하다.
+"""
+
+import os  # 파일을 한번에 바꿔쓰기 위한 용도
+import threading  # 여러 스레드에서 안전하게 쓰기 위한 잠금용
+from bisect import bisect_left  # 히스토그램 구간 찾기용
+from time import perf_counter  # 걸린 시간 측정용
+
+# 걸린 시간 히스토그램의 구간 상한(초). 마지막 구간(+Inf)은 따로 셈
+BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+           1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0)
+
+# 계산을 하지 않아서 기록하지 않는 공개 매서드
+CONTROL_METHODS = frozenset({'init', 'enable_cache', 'disable_cache', 'enable_metrics', 'disable_metrics',
+                             'pipeline', 'execute'})
+
+
+def operation_names(calc: any) -> list:
+    """
+    계산기에서 기록할 연산 매서드 이름들을 반환합니다. (밑줄로 시작하지 않는 매서드 중 CONTROL_METHODS 를 뺀 것)
+
+    Args:
+        calc (any): 계산기 객체를 받습니다.
+
+    Returns:
+        list: 매서드 이름 목록을 반환합니다.
+    """
+    return [name for name in dir(type(calc))
+            if not name.startswith('_') and name not in CONTROL_METHODS and callable(getattr(type(calc), name))]
+
+
+class _OperationStats:
+    """매서드 하나의 기록입니다."""
+
+    __slots__ = ('calls', 'seconds', 'buckets', 'errors')
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)  # 마지막 칸은 +Inf 구간
+        self.errors = {}
+
+
+class Metrics:
+    """
+    매서드마다 호출 횟수, 걸린 시간 히스토그램, 오류 횟수를 기록하는 객체입니다.
+
+    Attributes:
+        sinks (list): flush 할 때 기록을 넘길 싱크 목록입니다.
+
+    Examples:
+        >>> calc = Calculator()
+        >>> metrics = calc.enable_metrics()
+        >>> calc.divide(1, 0)
+         에러났습니다 :  division by zero
+        >>> metrics.snapshot()['divide']['errors']
+        {'ZeroDivisionError': 1}
+    """
+
+    def __init__(self, sinks: list = None):
+        self.sinks = list(sinks) if sinks else []
+        self._operations = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, name: str) -> _OperationStats:
+        """매서드 이름의 기록을 반환합니다. 없으면 새로 만듭니다. (잠금 안에서 불러야 함)"""
+        stats = self._operations.get(name)
+        if stats is None:
+            stats = self._operations[name] = _OperationStats()
+        return stats
+
+    def observe(self, name: str, seconds: float):
+        """
+        매서드 호출 한번과 걸린 시간을 기록합니다.
+
+        Args:
+            name (str): 매서드 이름을 받습니다.
+            seconds (float): 걸린 시간(초)을 받습니다.
+        """
+        bucket = bisect_left(BUCKETS, seconds)
+        with self._lock:
+            stats = self._stats(name)
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.buckets[bucket] += 1
+
+    def count_error(self, name: str, error: Exception):
+        """
+        매서드에서 난 오류를 오류 종류(예외 클래스 이름)별로 기록합니다.
+
+        Args:
+            name (str): 매서드 이름을 받습니다.
+            error (Exception): 발생한 오류를 받습니다.
+        """
+        kind = type(error).__name__
+        with self._lock:
+            errors = self._stats(name).errors
+            errors[kind] = errors.get(kind, 0) + 1
+
+    def wrap(self, name: str, method: any) -> any:
+        """
+        매서드를 호출 횟수, 걸린 시간, 오류를 기록하는 함수로 감쌉니다.
+
+        Args:
+            name (str): 기록에 쓸 매서드 이름을 받습니다.
+            method (any): 감쌀 매서드를 받습니다.
+
+        Returns:
+            any: 기록을 남기는 함수를 반환합니다.
+        """
+        def instrumented(*args: any, **kwargs: dict[str, any]) -> any:
+            start = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            except Exception as e:
+                self.count_error(name, e)
+                raise
+            finally:
+                self.observe(name, perf_counter() - start)
+
+        instrumented.__name__ = name
+        instrumented.__doc__ = method.__doc__
+        instrumented.__wrapped__ = method
+        instrumented.__metrics__ = self  # disable_metrics 에서 찾기 위한 표시
+        return instrumented
+
+    def snapshot(self) -> dict:
+        """
+        지금까지의 기록을 반환합니다.
+
+        Returns:
+            dict: 매서드 이름 -> {'calls', 'seconds', 'buckets', 'errors'} 딕셔너리를 반환합니다.
+                  buckets 는 BUCKETS 의 구간 상한(마지막은 '+Inf') -> 그 상한 이하로 걸린 누적 호출 횟수입니다.
+        """
+        bounds = [repr(bound) for bound in BUCKETS] + ['+Inf']
+        result = {}
+        with self._lock:
+            for name, stats in sorted(self._operations.items()):
+                cumulative = 0
+                buckets = {}
+                for bound, count in zip(bounds, stats.buckets):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                result[name] = {'calls': stats.calls, 'seconds': stats.seconds,
+                                'buckets': buckets, 'errors': dict(stats.errors)}
+        return result
+
+    def clear(self):
+        """기록을 모두 지웁니다."""
+        with self._lock:
+            self._operations.clear()
+
+    def flush(self) -> dict:
+        """
+        지금까지의 기록을 모든 싱크에 넘깁니다.
+
+        Returns:
+            dict: 싱크에 넘긴 기록(snapshot)을 반환합니다.
+        """
+        snapshot = self.snapshot()
+        for sink in self.sinks:
+            sink.export(snapshot)
+        return snapshot
+
+
+def prometheus_text(snapshot: dict, prefix: str = 'calculator') -> str:
+    """
+    snapshot 을 Prometheus 텍스트 형식으로 바꿉니다.
+
+    호출 횟수는 {prefix}_latency_seconds_count, 오류 횟수는 {prefix}_errors_total 입니다.
+
+    Args:
+        snapshot (dict): Metrics.snapshot() 의 결과를 받습니다.
+        prefix (str): 지표 이름 앞에 붙일 문자열을 받습니다. (기본값: 'calculator')
+
+    Returns:
+        str: Prometheus 텍스트 형식 문자열을 반환합니다.
+    """
+    lines = [
+        f"# HELP {prefix}_errors_total Number of errors raised by calculator methods.",
+        f"# TYPE {prefix}_errors_total counter",
+    ]
+    for name, stats in snapshot.items():
+        for kind, count in sorted(stats['errors'].items()):
+            lines.append(f'{prefix}_errors_total{{method="{name}",error="{kind}"}} {count}')
+
+    lines += [
+        f"# HELP {prefix}_latency_seconds Time spent in calculator methods.",
+        f"# TYPE {prefix}_latency_seconds histogram",
+    ]
+    for name, stats in snapshot.items():
+        for bound, count in stats['buckets'].items():
+            lines.append(f'{prefix}_latency_seconds_bucket{{method="{name}",le="{bound}"}} {count}')
+        lines.append(f'{prefix}_latency_seconds_sum{{method="{name}"}} {stats["seconds"]!r}')
+        lines.append(f'{prefix}_latency_seconds_count{{method="{name}"}} {stats["calls"]}')
+    return '\n'.join(lines) + '\n'
+
+
+class MemorySink:
+    """
+    마지막으로 넘겨받은 기록을 메모리에 저장하는 싱크입니다.
+
+    Attributes:
+        last (dict): 마지막으로 넘겨받은 기록입니다. (처음에는 None)
+    """
+
+    def __init__(self):
+        self.last = None
+
+    def export(self, snapshot: dict):
+        self.last = snapshot
+
+
+class PrometheusFileSink:
+    """
+    기록을 Prometheus 텍스트 형식으로 파일에 쓰는 싱크입니다.
+    임시 파일에 쓴 뒤 바꿔치기 하므로, 파일을 읽는 쪽에서 반쯤 쓰인 파일을 보지 않습니다.
+
+    Attributes:
+        path (str): 기록을 쓸 파일 경로입니다.
+        prefix (str): 지표 이름 앞에 붙일 문자열입니다.
+    """
+
+    def __init__(self, path: str, prefix: str = 'calculator'):
+        self.path = path
+        self.prefix = prefix
+
+    def export(self, snapshot: dict):
+        temporary = f"{self.path}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as file:
+            file.write(prometheus_text(snapshot, prefix=self.prefix))
+        os.replace(temporary, self.path)
+
+
+__all__ = ['Metrics', 'MemorySink', 'PrometheusFileSink', 'prometheus_text', 'operation_names', 'BUCKETS']
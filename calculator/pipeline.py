@@ -0,0 +1,276 @@
+"""
+
+이 파이썬 파일은 여러 배치 연산을 이어서 한번에 계산하는 연산 파이프라인 클래스 Pipeline 으로 이루어져있다.
+EngineeringCalculator.pipeline 매서드로 만들어 쓴다.
+
+    >>> eng_calc = EngineeringCalculator()
+    >>> squared_sine = eng_calc.pipeline().sin(angle_unit='degree').power(2).round(4)
+    >>> squared_sine([30, 90]).values
+    array([0.25, 1.  ])
+
+sin_batch, power_batch 처럼 배치 매서드를 차례로 부르면 단계마다 입력 크기만한 중간 결과 배열을 새로 만들고,
+큰 배열은 캐시에 들어가지 않으므로 단계마다 메모리를 처음부터 끝까지 다시 읽고 쓰게 된다.
+Pipeline 은 입력을 CHUNK_SIZE 개씩 나누어, 한 덩어리(chunk)가 L2 캐시에 있는 동안 모든 단계를 제자리(in-place)에서 계산한다.
+덩어리는 결과 배열의 일부를 그대로 쓰고, 정의역 검사용 임시 배열은 덩어리 크기로 한번만 만들어 다시 사용한다.
+
+단계를 추가하는 매서드는 자기 자신을 바꾸지 않고 단계가 하나 더 붙은 새 Pipeline 을 반환하므로,
+앞부분이 같은 파이프라인을 여러개 만들어 써도 된다.
+정의역 오류는 배치 매서드와 같이 예외 대신 utils.BatchResult 의 valid 마스크로 알려준다.
+단계의 인자(power 의 지수, add 의 더할 값 등)는 숫자 하나만 받는다.
+"""
+
+import math  # 지수 검사용
+import numpy as np
+from . import utils
+
+CHUNK_SIZE = 32768  # 한번에 계산하는 원소 수 (float64 256KiB, 임시 배열을 합쳐도 L2 캐시 크기 안)
+
+
+class Pipeline:
+    """
+    배치 연산 단계들을 기록해두고, 입력 배열에 덩어리 단위로 이어서 계산하는 파이프라인입니다.
+
+    Attributes:
+        options (utils.Options): 파이프라인 전체에 적용할 연산 조건입니다. precision 은 마지막 결과에 적용하고,
+            angle_unit, max_error 는 삼각함수 단계의 기본값이 됩니다. (결과는 항상 실수형 배열입니다.)
+        steps (tuple): (단계 이름, 인자 튜플, 단계별 Options) 들의 튜플입니다.
+        chunk_size (int): 한번에 계산하는 원소 수입니다.
+
+    Examples:
+        >>> pipe = Pipeline().square_root().add(1)
+        >>> pipe([16, -1])
+        BatchResult(values=array([ 5., nan]), valid=array([ True, False]))
+    """
+
+    __slots__ = ('options', 'steps', 'chunk_size')
+
+    def __init__(self, options: utils.Options = None, steps: tuple = (), chunk_size: int = CHUNK_SIZE):
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError(f"chunk_size 는 양의 정수여야 합니다: {chunk_size!r}")
+        self.options = options if options is not None else utils.DEFAULT_OPTIONS
+        self.steps = steps
+        self.chunk_size = chunk_size
+
+    def _then(self, name: str, args: tuple = (), kwargs: dict = None) -> 'Pipeline':
+        """단계 하나를 덧붙인 새 Pipeline 을 반환합니다. 단계의 연산 조건은 여기서 한번만 검사합니다."""
+        for arg in args:
+            if not isinstance(arg, (int, float)) or isinstance(arg, bool):
+                raise TypeError(f"{name} 단계의 인자는 숫자여야 합니다: {arg!r}")
+        options = utils.resolve_options(self.options, kwargs) if kwargs else self.options
+        return Pipeline(self.options, self.steps + ((name, args, options),), self.chunk_size)
+
+    # 단계를 추가하는 매서드들
+    def add(self, y: float) -> 'Pipeline':
+        """x + y 단계를 추가합니다."""
+        return self._then('add', (y,))
+
+    def subtract(self, y: float) -> 'Pipeline':
+        """x - y 단계를 추가합니다."""
+        return self._then('subtract', (y,))
+
+    def multiply(self, y: float) -> 'Pipeline':
+        """x * y 단계를 추가합니다."""
+        return self._then('multiply', (y,))
+
+    def divide(self, y: float) -> 'Pipeline':
+        """x / y 단계를 추가합니다. y 가 0 이면 모든 위치가 정의역 오류입니다."""
+        return self._then('divide', (y,))
+
+    def power(self, y: float) -> 'Pipeline':
+        """x^y 단계를 추가합니다. 정의역 오류는 power_batch 와 같습니다."""
+        return self._then('power', (y,))
+
+    def square_root(self) -> 'Pipeline':
+        """제곱근 단계를 추가합니다. 음수는 정의역 오류입니다."""
+        return self._then('square_root')
+
+    def log(self) -> 'Pipeline':
+        """밑이 10인 로그 단계를 추가합니다. 0 이하는 정의역 오류입니다."""
+        return self._then('log')
+
+    def ln(self) -> 'Pipeline':
+        """자연로그 단계를 추가합니다. 0 이하는 정의역 오류입니다."""
+        return self._then('ln')
+
+    def sin(self, **kwargs: dict[str, any]) -> 'Pipeline':
+        """
+        사인 단계를 추가합니다. 무한대는 정의역 오류입니다.
+
+        Args:
+            **kwargs (dict[str, any]): 이 단계에만 쓸 연산 조건을 받습니다.
+                - angle_unit (str): 'degree' 이면 입력을 각도로 취급합니다.
+                - max_error (float): 최대 절대 오차를 지정하면 trig_table 의 표로 계산합니다.
+        """
+        return self._then('sin', (), kwargs)
+
+    def cos(self, **kwargs: dict[str, any]) -> 'Pipeline':
+        """코사인 단계를 추가합니다. 인자는 sin 과 같습니다."""
+        return self._then('cos', (), kwargs)
+
+    def tan(self, **kwargs: dict[str, any]) -> 'Pipeline':
+        """탄젠트 단계를 추가합니다. 인자는 sin 과 같습니다."""
+        return self._then('tan', (), kwargs)
+
+    def round(self, precision: int) -> 'Pipeline':
+        """소수점 precision 자리로 반올림하는 단계를 추가합니다."""
+        if not isinstance(precision, int) or isinstance(precision, bool):
+            raise TypeError(f"precision 은 정수여야 합니다: {precision!r}")
+        return self._then('round', (precision,))
+
+    def evaluate(self, x: any, out: any = None) -> utils.BatchResult:
+        """
+        입력 배열에 모든 단계를 덩어리 단위로 이어서 계산합니다.
+
+        Args:
+            x (any): 입력 배열 또는 시퀀스를 받습니다. (1차원이 아니면 펼쳐서 계산한 뒤 모양을 되돌립니다.)
+            out (numpy.ndarray): 결과를 쓸 float64 배열을 받습니다. (기본값: None, 새 배열을 만듦)
+                memmap 을 넘기면 결과를 파일에 바로 씁니다.
+
+        Returns:
+            utils.BatchResult: 결과 배열과 유효성 마스크를 반환합니다.
+        """
+        x = np.asarray(x, dtype=float)
+        if out is None:
+            out = np.empty(x.shape)
+        elif out.shape != x.shape or out.dtype != np.float64 or not out.flags.c_contiguous:
+            raise ValueError(f"out 은 입력과 모양이 같은 연속된 float64 배열이어야 합니다: {out.shape}, {out.dtype}")
+        flat_x = x.reshape(-1)
+        flat_out = out.reshape(-1)
+        invalid = np.zeros(flat_x.shape, dtype=bool)
+
+        steps = [_compile(name, args, options) for name, args, options in self.steps]
+        size = min(self.chunk_size, flat_x.size)
+        scratch = _Scratch(size)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            for start in range(0, flat_x.size, self.chunk_size):
+                stop = min(start + self.chunk_size, flat_x.size)
+                buffer = flat_out[start:stop]
+                bad = invalid[start:stop]
+                np.copyto(buffer, flat_x[start:stop])
+                scratch.resize(stop - start)
+                for step in steps:
+                    step(buffer, bad, scratch)
+                buffer[bad] = np.nan  # 정의역 오류 위치는 nan으로 표시
+                if self.options.precision:
+                    np.round(buffer, self.options.precision, out=buffer)  # 소수점 자릿수 맞춤
+
+        valid = np.logical_not(invalid, out=invalid).reshape(x.shape)
+        return utils.BatchResult(values=out, valid=valid)
+
+    __call__ = evaluate
+
+    def __repr__(self) -> str:
+        steps = '.'.join(f"{name}({', '.join(map(repr, args))})" for name, args, _ in self.steps)
+        return f"Pipeline({steps})" if steps else "Pipeline()"
+
+
+class _Scratch:
+    """덩어리 하나를 계산하는 동안 단계들이 같이 쓰는 임시 부울 배열들입니다. 덩어리 크기로 한번만 만듭니다."""
+
+    __slots__ = ('_masks', 'mask', 'second')
+
+    def __init__(self, size: int):
+        self._masks = np.empty((2, size), dtype=bool)
+        self.mask, self.second = self._masks
+
+    def resize(self, size: int):
+        """마지막 덩어리처럼 크기가 작은 덩어리에 맞춰 임시 배열의 앞부분만 보이게 합니다."""
+        self.mask, self.second = self._masks[:, :size]
+
+
+def _compile(name: str, args: tuple, options: utils.Options) -> any:
+    """
+    단계 하나를 덩어리를 제자리에서 바꾸는 함수 step(buffer, bad, scratch) 로 바꿉니다.
+    bad 는 정의역 오류가 난 위치를 True 로 누적하는 부울 배열입니다.
+    """
+    if name == 'add':
+        y = args[0]
+        return lambda buffer, bad, scratch: np.add(buffer, y, out=buffer)
+    if name == 'subtract':
+        y = args[0]
+        return lambda buffer, bad, scratch: np.subtract(buffer, y, out=buffer)
+    if name == 'multiply':
+        y = args[0]
+        return lambda buffer, bad, scratch: np.multiply(buffer, y, out=buffer)
+    if name == 'divide':
+        y = args[0]
+        if y == 0:
+            def divide_by_zero(buffer: any, bad: any, scratch: any):
+                bad[...] = True  # 0으로 나누기는 모든 위치가 정의역 오류
+            return divide_by_zero
+        return lambda buffer, bad, scratch: np.divide(buffer, y, out=buffer)
+    if name == 'round':
+        precision = args[0]
+        return lambda buffer, bad, scratch: np.round(buffer, precision, out=buffer)
+    if name == 'power':
+        return _compile_power(args[0])
+    if name in ('square_root', 'log', 'ln'):
+        return _compile_domain(name)
+    return _compile_trig(name, options)
+
+
+def _compile_power(y: float) -> any:
+    """거듭제곱 단계입니다. 지수가 숫자 하나라서 지수에 대한 검사는 여기서 한번만 합니다."""
+    fractional = y != math.floor(y) if math.isfinite(y) else False
+    negative = y < 0
+    finite = math.isfinite(y)
+
+    def power(buffer: any, bad: any, scratch: any):
+        mask = scratch.mask
+        # math.pow 가 ValueError, OverflowError 를 내는 경우를 마스크로 표시
+        if fractional:
+            np.less(buffer, 0, out=mask)  # 음수의 정수가 아닌 거듭제곱
+            bad |= mask
+        if negative:
+            np.equal(buffer, 0, out=mask)  # 0의 음수 거듭제곱
+            bad |= mask
+        if finite:
+            np.isfinite(buffer, out=mask)  # 유한한 값이 무한대가 되면 오버플로
+            np.power(buffer, y, out=buffer)
+            np.isinf(buffer, out=scratch.second)
+            mask &= scratch.second
+            bad |= mask
+        else:
+            np.power(buffer, y, out=buffer)
+
+    return power
+
+
+def _compile_domain(name: str) -> any:
+    """제곱근, 로그 단계입니다. 정의역을 벗어난 위치를 표시한 뒤 계산합니다."""
+    def step(buffer: any, bad: any, scratch: any):
+        mask = scratch.mask
+        if name == 'square_root':
+            np.less(buffer, 0, out=mask)  # 음수는 정의역 오류
+            bad |= mask
+            np.sqrt(buffer, out=buffer)
+        else:
+            np.less_equal(buffer, 0, out=mask)  # 0 이하는 정의역 오류
+            bad |= mask
+            (np.log10 if name == 'log' else np.log)(buffer, out=buffer)
+
+    return step
+
+
+def _compile_trig(name: str, options: utils.Options) -> any:
+    """삼각함수 단계입니다. 각도 변환과 max_error 표 계산은 EngineeringCalculator 의 배치 매서드와 같습니다."""
+    degree = options.angle_unit == 'degree'
+    max_error = options.max_error
+
+    def step(buffer: any, bad: any, scratch: any):
+        mask = scratch.mask
+        np.isinf(buffer, out=mask)  # 무한대는 정의역 오류
+        bad |= mask
+        if max_error is not None:
+            from . import trig_table  # 표 계산을 쓸 때만 불러옴
+
+            buffer[...] = getattr(trig_table, name)(buffer, options.angle_unit, max_error)
+            return
+        if degree:
+            np.radians(buffer, out=buffer)  # 각도를 라디안으로 변환
+        getattr(np, name)(buffer, out=buffer)
+
+    return step
+
+
+__all__ = ['Pipeline', 'CHUNK_SIZE']
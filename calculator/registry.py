@@ -0,0 +1,150 @@
+"""
+
+이 파이썬 파일은 이름으로 부를 수 있는 계산기 연산들의 정보(메타데이터)를 한곳에 모아둔 연산 목록(registry)으로 이루어져있다.
+작업 파일(cli.py, jobs.py)이나 서버 요청(server.py)의 연산 이름을 계산기 매서드로 바꿀 때, 캐시(enable_cache)를 켤 연산을 고를 때 사용한다.
+
+연산 하나의 정보(Operation)
+    - name : 연산 이름 (계산기 매서드 이름과 같음)
+    - kind : 매서드가 정의된 계산기 클래스 이름 ('Calculator', 'EngineeringCalculator', 'ComplexCalculator')
+    - arity : 인자 개수 (None 이면 가변 인자)
+    - domain : 입력 숫자의 종류 ('real' 실수, 'complex' 복소수)
+    - pure : 결과가 입력과 연산 조건에만 달려있는지 여부
+    - cacheable : enable_cache 가 결과를 저장하는 연산인지 여부 (가변 인자 사칙연산은 인자가 길 수 있어 저장하지 않음)
+    - options : 결과에 영향을 주는 연산 조건 이름들 (비어 있으면 키워드 인자를 받지 않음)
+    - batch : 배열을 한번에 계산하는 배치(_batch) 매서드 이름 (없으면 None)
+    - masked : 배치 매서드가 정의역 오류를 valid 마스크와 함께 utils.BatchResult 로 반환하는지 여부
+               (error_policy 를 지정하면 errors 가 있는 연산의 배치 매서드는 모두 utils.CheckedResult 를 반환함)
+    - integer : 정수 입력이면 결과도 정수인지 여부
+    - errors : 정의역 오류 등으로 날 수 있는 예외 클래스들
+
+bind 는 연산 이름으로 계산기에 묶인 매서드(또는 배치 매서드)를 찾아 바로 부를 수 있는 함수로 반환한다.
+연산 조건을 받지 않는 연산은 키워드 인자를 버리는 함수로 감싸서, 부르는 쪽에서 연산마다 인자 처리를 나누지 않아도 된다.
+bind 는 부를 때의 매서드를 묶으므로 enable_cache, enable_metrics 를 켠 뒤에는 다시 bind 해야 한다.
+"""
+
+from collections import namedtuple  # 연산 정보 자료형 작성용 (typing 보다 import 가 가벼움)
+
+Operation = namedtuple('Operation', ['name', 'kind', 'arity', 'domain', 'pure', 'cacheable', 'options', 'batch',
+                                     'masked', 'integer', 'errors'])
+
+_ARITHMETIC = frozenset({'precision', 'return_float'})  # 사칙연산의 연산 조건
+_CHECKED = _ARITHMETIC | {'error_policy'}  # 오류가 날 수 있는 나눗셈, 공학용 연산의 연산 조건
+_TRIGONOMETRIC = _CHECKED | {'angle_unit', 'max_error'}  # 삼각함수의 연산 조건
+_PLAIN = frozenset()  # 연산 조건을 받지 않음
+
+
+def _operation(name: str, kind: str, arity: int, options: frozenset, batch: str = None, domain: str = 'real',
+               cacheable: bool = True, integer: bool = False, errors: tuple = ()) -> Operation:
+    """기본값을 채워 Operation 을 만듭니다."""
+    masked = kind == 'EngineeringCalculator'  # 공학용 배치 매서드는 모두 BatchResult 를 반환함
+    return Operation(name, kind, arity, domain, True, cacheable, options, batch, masked, integer, errors)
+
+
+# 연산 이름 -> 연산 정보
+OPERATIONS = {operation.name: operation for operation in (
+    _operation('add', 'Calculator', None, _ARITHMETIC, 'add_batch', cacheable=False, integer=True),
+    _operation('subtract', 'Calculator', None, _ARITHMETIC, 'subtract_batch', cacheable=False, integer=True),
+    _operation('multiply', 'Calculator', None, _ARITHMETIC, 'multiply_batch', cacheable=False, integer=True),
+    _operation('divide', 'Calculator', None, _CHECKED, 'divide_batch', cacheable=False,
+               errors=(ZeroDivisionError,)),
+    _operation('square_root', 'EngineeringCalculator', 1, _CHECKED, 'square_root_batch', errors=(ValueError,)),
+    _operation('power', 'EngineeringCalculator', 2, _CHECKED, 'power_batch', errors=(ValueError, OverflowError)),
+    _operation('log', 'EngineeringCalculator', 1, _CHECKED, 'log_batch', errors=(ValueError,)),
+    _operation('ln', 'EngineeringCalculator', 1, _CHECKED, 'ln_batch', errors=(ValueError,)),
+    _operation('sin', 'EngineeringCalculator', 1, _TRIGONOMETRIC, 'sin_batch', errors=(ValueError,)),
+    _operation('cos', 'EngineeringCalculator', 1, _TRIGONOMETRIC, 'cos_batch', errors=(ValueError,)),
+    _operation('tan', 'EngineeringCalculator', 1, _TRIGONOMETRIC, 'tan_batch', errors=(ValueError,)),
+    _operation('complex_add', 'ComplexCalculator', None, _PLAIN, domain='complex'),
+    _operation('complex_subtract', 'ComplexCalculator', None, _PLAIN, domain='complex'),
+    _operation('complex_multiply', 'ComplexCalculator', None, _PLAIN, domain='complex'),
+    _operation('complex_divide', 'ComplexCalculator', None, frozenset({'error_policy'}), domain='complex',
+               errors=(ZeroDivisionError,)),
+    _operation('complex_magnitude', 'ComplexCalculator', 1, frozenset({'precision'}), 'complex_magnitude_batch',
+               domain='complex'),
+    _operation('complex_argument', 'ComplexCalculator', 1, frozenset({'precision', 'angle_unit'}),
+               'complex_argument_batch', domain='complex'),
+    _operation('cartesian_to_polar', 'ComplexCalculator', None, frozenset({'precision', 'angle_unit', 'coordinate'}),
+               'cartesian_to_polar_batch', domain='complex', errors=(IndexError, TypeError)),
+)}
+
+# 짧은 이름 -> 연산 이름
+ALIASES = {'sqrt': 'square_root', 'pow': 'power'}
+
+
+def get(name: str) -> Operation:
+    """
+    연산 이름(짧은 이름 포함)으로 연산 정보를 반환합니다.
+
+    Args:
+        name (str): 연산 이름을 받습니다. (예 : 'sin', 'sqrt')
+
+    Returns:
+        Operation: 연산 정보를 반환합니다.
+
+    Raises:
+        ValueError: 알 수 없는 연산인 경우 발생합니다.
+
+    Examples:
+        >>> get('sqrt').batch
+        'square_root_batch'
+    """
+    try:
+        return OPERATIONS[ALIASES.get(name, name)]
+    except (KeyError, TypeError):
+        raise ValueError(f"알 수 없는 연산입니다: {name!r}") from None
+
+
+def bind(calc: any, name: str, batch: bool = False) -> any:
+    """
+    연산 이름으로 계산기에 묶인 매서드를 찾아 바로 부를 수 있는 함수를 반환합니다.
+
+    Args:
+        calc (any): 연산을 계산할 계산기를 받습니다.
+        name (str): 연산 이름(짧은 이름 포함)을 받습니다.
+        batch (bool): True 이면 배치 매서드를 반환합니다. (기본값: False)
+
+    Returns:
+        any: (*args, **kwargs) 로 부르는 함수를 반환합니다. 연산 조건을 받지 않는 연산은 키워드 인자를 버립니다.
+
+    Raises:
+        ValueError: 알 수 없는 연산이거나 배치 매서드가 없는 연산인 경우 발생합니다.
+
+    Examples:
+        >>> sin = bind(EngineeringCalculator(), 'sin')
+        >>> sin(30, angle_unit='degree', precision=4)
+        0.5000
+        >>> bind(ComplexCalculator(), 'complex_add')(1j, 2, precision=4)
+        (2+1j)
+    """
+    operation = get(name)
+    method_name = operation.batch if batch else operation.name
+    if method_name is None:
+        raise ValueError(f"배치 매서드가 없는 연산입니다: {operation.name!r}")
+    method = getattr(calc, method_name)
+    if operation.options:
+        return method
+
+    def call(*args: any, **kwargs: dict[str, any]) -> any:
+        return method(*args)  # 연산 조건을 받지 않는 연산은 키워드 인자를 버림
+
+    call.__name__ = method_name
+    call.__doc__ = method.__doc__
+    call.__wrapped__ = method
+    return call
+
+
+def cacheable(calc: any) -> tuple:
+    """
+    계산기에 있는 연산 중 enable_cache 가 결과를 저장하는 연산 이름들을 반환합니다.
+
+    Args:
+        calc (any): 계산기를 받습니다.
+
+    Returns:
+        tuple: 연산 이름들을 반환합니다.
+    """
+    return tuple(name for name, operation in OPERATIONS.items()
+                 if operation.cacheable and operation.pure and hasattr(calc, name))
+
+
+__all__ = ['Operation', 'OPERATIONS', 'ALIASES', 'get', 'bind', 'cacheable']
@@ -0,0 +1,166 @@
+"""
+
+이 파이썬 파일은 덧셈, 뺄셈, 곱셈, 나눗셈의 모든 중간 결과(누적 합, 누적 곱 등)를 구하는 스캔(prefix scan) 함수들로 이루어져있다.
+Calculator 의 add_scan, subtract_scan, multiply_scan, divide_scan 과 이름 뒤에 _batch 가 붙은 배치 버전 매서드가 이 파일의 함수를 사용한다.
+
+스캔 결과의 i 번째 값은 add(*values[:i + 1]) 처럼 앞에서부터 i + 1 개의 숫자로 계산한 값과 같다.
+    - add, multiply : 누적 합, 누적 곱
+    - subtract : 첫 숫자에서 나머지 숫자들의 누적 합을 뺀 값 (subtract 매서드와 같은 순서)
+    - divide : 첫 숫자를 나머지 숫자들의 누적 곱으로 나눈 값 (divide 매서드와 같은 순서)
+앞의 중간 결과를 이어서 쓰므로 숫자 n 개의 스캔은 O(n) 이다. (add 를 길이가 늘어나는 조각마다 부르면 O(n²))
+
+prefix 는 iterable 을 한 개씩 꺼내며 중간 결과를 하나씩 내보내는 제너레이터이다. (itertools.accumulate)
+prefix_array 는 numpy 배열의 스캔(np.cumsum, np.cumprod)이며, 배열이 PARALLEL_MIN_SIZE 보다 길고 CPU 가 여러 개이면
+블록으로 나눠 두 단계로 스레드에서 나눠 계산한다. (numpy 의 누적 연산은 계산하는 동안 GIL 을 풀기 때문에 스레드로 나눠 계산됨)
+    1단계 : 블록마다 따로 누적 합(곱)을 구한다.
+    2단계 : 앞 블록들의 마지막 값들을 누적한 값을 블록마다 더한다(곱한다). 첫 블록은 2단계가 필요 없다.
+블록으로 나누면 실수의 더하는 순서가 달라지므로 결과가 한 스레드로 계산한 것과 반올림 오차만큼 다를 수 있다.
+"""
+
+import operator  # 누적 연산 함수 작성용
+import os  # CPU 개수 확인용
+from functools import partial  # 첫 숫자를 묶어둔 뺄셈, 나눗셈 함수 작성용
+from itertools import accumulate, chain  # 누적 연산, 첫 숫자를 다시 앞에 붙이는 용도
+
+OPERATIONS = ('add', 'subtract', 'multiply', 'divide')
+PARALLEL_MIN_SIZE = 1 << 20  # 이보다 긴 배열만 블록으로 나눠 스레드에서 계산
+BLOCK_MIN_SIZE = 1 << 18  # 블록 하나의 최소 길이 (너무 작으면 스레드 비용이 더 큼)
+WORKERS = os.cpu_count() or 1  # 기본 스레드 수
+
+_MISSING = object()  # 빈 입력 표시용
+
+
+def _safe_divide(numerator: any, denominator: any) -> any:
+    """나눗셈 결과를 반환합니다. 0으로 나누면 None 을 반환합니다. (divide 매서드의 반환값과 같음)"""
+    try:
+        return numerator / denominator
+    except ZeroDivisionError:
+        return None
+
+
+def prefix(operation: str, values: any) -> any:
+    """
+    숫자들의 스캔 중간 결과를 하나씩 내보내는 제너레이터를 반환합니다. 입력은 한번만 읽고 메모리에 모아두지 않습니다.
+
+    Args:
+        operation (str): 'add', 'subtract', 'multiply', 'divide' 중 하나를 받습니다.
+        values (any): 숫자들을 꺼낼 수 있는 iterable 을 받습니다.
+
+    Returns:
+        Iterator: 중간 결과들을 내보내는 반복자를 반환합니다. divide 는 0으로 나누는 중간 결과 자리에 None 을 내보냅니다.
+
+    Raises:
+        ValueError: 지원하지 않는 operation 인 경우 발생합니다.
+
+    Examples:
+        >>> list(prefix('add', [1, 2, 3, 4]))
+        [1, 3, 6, 10]
+        >>> list(prefix('subtract', iter([10, 1, 2])))
+        [10, 9, 7]
+    """
+    if operation not in OPERATIONS:
+        raise ValueError(f"지원하지 않는 스캔 연산입니다: {operation!r} (가능한 값: {OPERATIONS})")
+    iterator = iter(values)
+    first = next(iterator, _MISSING)
+    if first is _MISSING:
+        return iter(())
+    if operation == 'add':
+        return accumulate(chain((first,), iterator), operator.add)
+    if operation == 'multiply':
+        return accumulate(chain((first,), iterator), operator.mul)
+    if operation == 'subtract':
+        return chain((first,), map(partial(operator.sub, first), accumulate(iterator, operator.add)))
+    return chain((first,), map(partial(_safe_divide, first), accumulate(iterator, operator.mul)))
+
+
+def _blocked_accumulate(ufunc: any, values: any, out: any, workers: int) -> any:
+    """values 의 누적 연산(ufunc.accumulate)을 블록으로 나눠 workers 개의 스레드에서 두 단계로 계산해서 out 에 씁니다."""
+    import numpy as np
+    from concurrent.futures import ThreadPoolExecutor  # 병렬 스캔을 쓸 때만 불러옴
+
+    blocks = min(workers, values.size // BLOCK_MIN_SIZE)
+    if blocks < 2:
+        return ufunc.accumulate(values, out=out)
+    bounds = np.linspace(0, values.size, blocks + 1).astype(np.intp)
+    slices = [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+    with ThreadPoolExecutor(max_workers=blocks) as pool:
+        # 1단계 : 블록마다 따로 누적
+        list(pool.map(lambda part: ufunc.accumulate(values[part], out=out[part]), slices))
+        # 앞 블록들의 마지막 값을 누적한 값 (블록 수만큼만 계산하므로 한 스레드에서 계산)
+        offsets = ufunc.accumulate(out[bounds[1:-1] - 1])
+        # 2단계 : 두번째 블록부터 앞 블록들의 누적값을 더함(곱함)
+        list(pool.map(lambda item: ufunc(out[item[0]], item[1], out=out[item[0]]), zip(slices[1:], offsets)))
+    return out
+
+
+def accumulate_array(ufunc: any, values: any, out: any = None, workers: int = None) -> any:
+    """
+    1차원 배열의 누적 연산(np.add 이면 np.cumsum, np.multiply 이면 np.cumprod)을 반환합니다.
+    배열이 PARALLEL_MIN_SIZE 이상이고 workers 가 2 이상이면 블록 병렬 스캔으로 계산합니다.
+
+    Args:
+        ufunc (any): 결합법칙이 성립하는 numpy ufunc(np.add, np.multiply)를 받습니다.
+        values (any): 1차원 numpy 배열을 받습니다.
+        out (any): 결과를 쓸 배열을 받습니다. (기본값: None, 입력 자료형으로 새로 만듦)
+        workers (int): 스레드 수를 받습니다. (기본값: None, WORKERS)
+
+    Returns:
+        numpy.ndarray: 누적 결과 배열(out)을 반환합니다.
+    """
+    import numpy as np
+
+    workers = WORKERS if workers is None else workers
+    if out is None:
+        out = np.empty(values.shape, dtype=ufunc.accumulate(values[:1]).dtype)
+    if values.size >= PARALLEL_MIN_SIZE and workers > 1:
+        return _blocked_accumulate(ufunc, values, out, workers)
+    return ufunc.accumulate(values, out=out)
+
+
+def prefix_array(operation: str, values: any, workers: int = None) -> any:
+    """
+    1차원 numpy 배열의 스캔 결과 배열을 반환합니다. prefix 의 배열 버전입니다.
+
+    Args:
+        operation (str): 'add', 'subtract', 'multiply', 'divide' 중 하나를 받습니다.
+        values (any): 1차원 numpy 배열을 받습니다.
+        workers (int): 긴 배열을 나눠 계산할 스레드 수를 받습니다. (기본값: None, WORKERS)
+
+    Returns:
+        numpy.ndarray: 스캔 결과 배열을 반환합니다. divide 는 실수형이며 0으로 나누는 자리는 inf 또는 nan 입니다.
+
+    Raises:
+        ValueError: 지원하지 않는 operation 이거나 배열이 1차원이 아닌 경우 발생합니다.
+
+    Examples:
+        >>> prefix_array('multiply', np.array([1.0, 1.05, 1.05]))
+        array([1.    , 1.05  , 1.1025])
+    """
+    import numpy as np
+
+    if operation not in OPERATIONS:
+        raise ValueError(f"지원하지 않는 스캔 연산입니다: {operation!r} (가능한 값: {OPERATIONS})")
+    if values.ndim != 1:
+        raise ValueError(f"스캔은 1차원 배열만 계산합니다: {values.ndim}차원")
+    if operation == 'add':
+        return accumulate_array(np.add, values, workers=workers)
+    if operation == 'multiply':
+        return accumulate_array(np.multiply, values, workers=workers)
+
+    # subtract, divide : 나머지 숫자들의 누적 합(곱)을 결과 배열에 바로 쓰고 첫 숫자에서 빼거나(나누거나) 함
+    if operation == 'subtract':
+        ufunc, inverse, dtype = np.add, np.subtract, np.add.accumulate(values[:1]).dtype
+    else:
+        ufunc, inverse, dtype = np.multiply, np.true_divide, np.result_type(values, float)  # 나눗셈 결과는 항상 실수형
+    result = np.empty(values.shape, dtype=dtype)
+    if values.size == 0:
+        return result
+    result[0] = values[0]
+    accumulate_array(ufunc, values[1:], out=result[1:], workers=workers)
+    with np.errstate(divide='ignore', invalid='ignore'):  # 0나누기는 예외 대신 inf, nan 으로 표시
+        inverse(values[0], result[1:], out=result[1:])
+    return result
+
+
+__all__ = ['OPERATIONS', 'prefix', 'accumulate_array', 'prefix_array']
@@ -0,0 +1,393 @@
+"""
+
+이 파이썬 파일은 계산기의 모든 연산을 JSON 으로 주고받는 asyncio 기반 로컬 서버로 이루어져있다.
+python -m calculator.server --port 8765 로 실행하며, 기본적으로 localhost(127.0.0.1)에서만 접속을 받는다.
+
+프로토콜은 줄 단위 JSON 이다. (TCP 연결 하나에 요청 한 줄, 응답 한 줄)
+    요청 : {"id": 1, "op": "sin", "args": [30], "kwargs": {"angle_unit": "degree", "precision": 4}}
+    응답 : {"id": 1, "result": "0.5000"}    또는    {"id": 1, "error": "math domain error"}
+op, args, kwargs 의 의미는 cli.py 의 입력 한 줄과 같고, result 도 cli.py 가 출력하는 문자열과 같다.
+복소수는 "1+1j" 처럼 문자열로 보낸다.
+요청 여러 개를 JSON 배열로 한 줄에 보내면(배치 요청) 응답도 같은 순서의 JSON 배열로 한 줄에 돌려준다.
+배치 요청도 요청 하나씩 같은 큐를 거치므로 max_batch 개씩 나눠서 계산되고, 큐가 가득 차면 자리가 날 때까지 기다린다.
+
+한 연결에서 여러 요청을 응답을 기다리지 않고 연달아 보낼 수 있으며, 응답은 계산이 끝난 순서대로 오므로 id 로 맞춰야 한다.
+동시에 들어온 요청 하나짜리 요청들은 Coalescer 가 아주 짧은 시간(window) 동안 모아서
+같은 연산, 같은 연산 조건끼리 배치(_batch) 매서드로 한번에 계산한다. (cli.evaluate_requests)
+모아둔 요청 큐와 연결마다 계산 중인 요청 수에 상한이 있어서, 계산이 밀리면 서버는 요청을 더 읽지 않고 기다린다.(backpressure)
+"""
+
+import argparse  # 명령줄 인자 해석용
+import asyncio  # 비동기 서버용
+import json  # 요청, 응답 변환용
+import sys  # 표준 오류 출력용
+from concurrent.futures import ThreadPoolExecutor  # 계산하는 동안에도 요청을 받기 위한 계산 전용 스레드
+from . import cli, registry
+from .complex import ComplexCalculator
+
+HOST = '127.0.0.1'  # 기본 접속 주소 (localhost 만 허용)
+PORT = 8765  # 기본 포트
+WINDOW = 0.001  # 요청 하나짜리 요청들을 모으는 시간(초)
+MAX_BATCH = 4096  # 한번에 모아서 계산할 최대 요청 수
+QUEUE_SIZE = 16384  # 계산을 기다리는 요청 큐의 최대 크기
+MAX_INFLIGHT = 1024  # 연결 하나에서 동시에 계산 중일 수 있는 요청 수
+LINE_LIMIT = 1 << 24  # 요청 한 줄의 최대 바이트 수 (배치 요청 포함)
+
+_OPTION_TYPES = (str, int, float, bool, type(None))  # kwargs 값으로 쓸 수 있는 자료형
+
+
+def parse_request(message: any) -> tuple:
+    """
+    JSON 요청 하나를 cli.parse_line 과 같은 (연산 이름, 숫자 튜플, 키워드 인자 튜플) 형식으로 바꿉니다.
+
+    Args:
+        message (any): json.loads 로 읽은 요청 객체를 받습니다.
+
+    Returns:
+        tuple: (연산 이름, 숫자 튜플, ((키워드, 값), ...))를 반환합니다.
+
+    Raises:
+        ValueError: 요청 형식이 틀렸거나 알 수 없는 연산인 경우 발생합니다.
+
+    Examples:
+        >>> parse_request({"op": "sin", "args": [30], "kwargs": {"precision": 4, "angle_unit": "degree"}})
+        ('sin', (30,), (('angle_unit', 'degree'), ('precision', 4)))
+    """
+    if not isinstance(message, dict):
+        raise ValueError("요청은 JSON 객체여야 합니다.")
+    name = message.get('op')
+    if not isinstance(name, str):
+        raise ValueError("op 에 연산 이름이 없습니다.")
+    op = registry.get(name).name  # 알 수 없는 연산이면 ValueError
+
+    args = message.get('args', [])
+    kwargs = message.get('kwargs', {})
+    if not isinstance(args, list):
+        raise ValueError("args 는 배열이어야 합니다.")
+    if not isinstance(kwargs, dict) or not all(isinstance(value, _OPTION_TYPES) for value in kwargs.values()):
+        raise ValueError("kwargs 는 문자열, 숫자, true/false, null 값만 가진 객체여야 합니다.")
+
+    numbers = []
+    for arg in args:
+        if isinstance(arg, str):
+            numbers.append(cli.parse_number(arg))
+        elif isinstance(arg, (int, float)) and not isinstance(arg, bool):
+            numbers.append(arg)
+        else:
+            raise ValueError(f"숫자가 아닙니다: {arg!r}")
+    # 키워드 순서가 달라도 같은 묶음으로 계산되도록 정렬
+    return op, tuple(numbers), tuple(sorted(kwargs.items()))
+
+
+def make_response(request_id: any, output: str) -> dict:
+    """cli 형식의 출력 문자열을 JSON 응답 객체로 바꿉니다."""
+    if output.startswith('error: '):
+        return {'id': request_id, 'error': output[len('error: '):]}
+    return {'id': request_id, 'result': output}
+
+
+class Coalescer:
+    """
+    동시에 들어온 요청들을 짧은 시간 동안 모아서 한번에 계산하는 객체입니다.
+
+    계산은 이벤트 루프가 아닌 계산 전용 스레드 하나에서 하므로, 계산하는 동안에도 서버는 다음 요청들을 받아서 모아둡니다.
+
+    Attributes:
+        calc (ComplexCalculator): 계산에 사용할 계산기입니다.
+        window (float): 첫 요청이 들어온 뒤 다른 요청들을 더 기다리는 시간(초)입니다.
+        max_batch (int): 한번에 모아서 계산할 최대 요청 수입니다.
+        queue (asyncio.Queue): 계산을 기다리는 요청 큐입니다. 가득 차면 submit 이 기다립니다.
+        batches (int): 지금까지 계산한 묶음 수입니다.
+        requests (int): 지금까지 계산한 요청 수입니다.
+    """
+
+    def __init__(self, calc: ComplexCalculator, window: float = WINDOW, max_batch: int = MAX_BATCH,
+                 queue_size: int = QUEUE_SIZE):
+        self.calc = calc
+        self.window = window
+        self.max_batch = max_batch
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.batches = 0
+        self.requests = 0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='calculator')
+        self._task = None
+
+    def start(self):
+        """요청을 모아서 계산하는 작업을 시작합니다."""
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self):
+        """요청을 모으는 작업과 계산 스레드를 멈춥니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._executor.shutdown(wait=True)
+
+    async def submit(self, request: tuple) -> str:
+        """
+        요청 하나를 큐에 넣고 계산 결과를 기다립니다. 큐가 가득 차 있으면 자리가 날 때까지 기다립니다.
+
+        Args:
+            request (tuple): parse_request 의 결과를 받습니다.
+
+        Returns:
+            str: cli 형식의 출력 문자열을 반환합니다.
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((request, future))
+        return await future
+
+    async def submit_many(self, requests: list) -> list:
+        """
+        요청 여러 개를 순서대로 큐에 넣고 계산 결과들을 기다립니다. (배치 요청용)
+        요청 하나짜리 요청과 같은 큐를 거치므로 max_batch 개씩 나눠서 계산되고, 큐가 가득 차 있으면 자리가 날 때까지 기다립니다.
+
+        Args:
+            requests (list): parse_request 의 결과들을 받습니다.
+
+        Returns:
+            list: 요청마다 cli 형식의 출력 문자열을 반환합니다.
+        """
+        loop = asyncio.get_running_loop()
+        futures = []
+        for request in requests:
+            future = loop.create_future()
+            await self.queue.put((request, future))
+            futures.append(future)
+        return [await future for future in futures]
+
+    async def evaluate(self, requests: list) -> list:
+        """
+        요청 목록을 계산 스레드에서 한번에 계산합니다. (큐에서 모은 요청들을 계산할 때 사용)
+
+        Args:
+            requests (list): parse_request 의 결과들을 받습니다.
+
+        Returns:
+            list: 요청마다 cli 형식의 출력 문자열을 반환합니다.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, cli.evaluate_requests, self.calc, requests)
+
+    async def _run(self):
+        """큐에서 요청들을 모아 계산하고 결과를 돌려주는 것을 반복합니다."""
+        while True:
+            items = [await self.queue.get()]
+            if self.window > 0 and self.queue.qsize() < self.max_batch:
+                await asyncio.sleep(self.window)  # 동시에 들어오는 요청들을 조금 더 기다림
+            while len(items) < self.max_batch and not self.queue.empty():
+                items.append(self.queue.get_nowait())
+
+            try:
+                outputs = await self.evaluate([request for request, _ in items])
+            except Exception as e:
+                outputs = [cli.format_error(e)] * len(items)
+            self.batches += 1
+            self.requests += len(items)
+            for (_, future), output in zip(items, outputs):
+                if not future.done():  # 연결이 끊겨 취소된 요청은 건너뜀
+                    future.set_result(output)
+
+
+class CalculatorServer:
+    """
+    계산기 연산을 줄 단위 JSON 으로 제공하는 asyncio TCP 서버입니다.
+
+    Attributes:
+        calc (ComplexCalculator): 계산에 사용할 계산기입니다.
+        coalescer (Coalescer): 요청을 모아서 계산하는 객체입니다.
+        host (str): 접속을 받을 주소입니다.
+        port (int): 접속을 받을 포트입니다. 0 이면 start 할 때 빈 포트를 골라 채웁니다.
+
+    Examples:
+        >>> async def demo():
+        ...     async with CalculatorServer(port=0) as server:
+        ...         return await request({"id": 1, "op": "add", "args": [1, 2, 3]}, port=server.port)
+        >>> asyncio.run(demo())
+        {'id': 1, 'result': '6'}
+    """
+
+    def __init__(self, calc: ComplexCalculator = None, host: str = HOST, port: int = PORT,
+                 window: float = WINDOW, max_batch: int = MAX_BATCH, queue_size: int = QUEUE_SIZE,
+                 max_inflight: int = MAX_INFLIGHT):
+        self.calc = calc if calc is not None else ComplexCalculator()
+        self.host = host
+        self.port = port
+        self.max_inflight = max_inflight
+        self._coalescer_options = (window, max_batch, queue_size)
+        self.coalescer = None
+        self._server = None
+
+    async def start(self):
+        """서버를 시작합니다."""
+        self.coalescer = Coalescer(self.calc, *self._coalescer_options)
+        self.coalescer.start()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port, limit=LINE_LIMIT)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        """서버를 멈추고 계산 스레드를 정리합니다."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self.coalescer is not None:
+            await self.coalescer.close()
+
+    async def serve_forever(self):
+        """서버를 시작하고 멈출 때까지 요청을 받습니다."""
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def __aenter__(self) -> 'CalculatorServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: any):
+        await self.close()
+
+    async def handle_message(self, message: any) -> any:
+        """
+        JSON 요청 하나(또는 배치 요청 배열)를 계산하고 응답 객체를 반환합니다.
+
+        Args:
+            message (any): json.loads 로 읽은 요청 객체 또는 요청 배열을 받습니다.
+
+        Returns:
+            any: 응답 객체 또는 응답 배열을 반환합니다.
+        """
+        if isinstance(message, list):
+            return await self._handle_batch(message)
+
+        request_id = message.get('id') if isinstance(message, dict) else None
+        try:
+            request = parse_request(message)
+        except ValueError as e:
+            return {'id': request_id, 'error': str(e)}
+        return make_response(request_id, await self.coalescer.submit(request))
+
+    async def _handle_batch(self, messages: list) -> list:
+        """배치 요청의 요청들을 큐에 넣어 계산합니다. 형식이 틀린 요청은 그 요청만 오류로 응답합니다."""
+        responses = [None] * len(messages)
+        positions = []
+        requests = []
+        for position, message in enumerate(messages):
+            request_id = message.get('id') if isinstance(message, dict) else None
+            try:
+                requests.append(parse_request(message))
+            except ValueError as e:
+                responses[position] = {'id': request_id, 'error': str(e)}
+                continue
+            positions.append((position, request_id))
+
+        if requests:
+            outputs = await self.coalescer.submit_many(requests)
+            for (position, request_id), output in zip(positions, outputs):
+                responses[position] = make_response(request_id, output)
+        return responses
+
+    async def _respond(self, line: bytes, writer: asyncio.StreamWriter, slots: asyncio.Semaphore):
+        """요청 한 줄을 계산하고 응답 한 줄을 씁니다."""
+        try:
+            try:
+                message = json.loads(line)
+            except ValueError as e:
+                response = {'id': None, 'error': f"JSON 형식이 아닙니다: {e}"}
+            else:
+                response = await self.handle_message(message)
+            if not writer.is_closing():
+                writer.write(json.dumps(response).encode('utf-8') + b'\n')
+        finally:
+            slots.release()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """연결 하나의 요청들을 읽어서 계산합니다. 계산 중인 요청이 max_inflight 개가 되면 더 읽지 않고 기다립니다."""
+        slots = asyncio.Semaphore(self.max_inflight)
+        tasks = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:  # LINE_LIMIT 보다 긴 줄
+                    writer.write(json.dumps({'id': None, 'error': "요청이 너무 깁니다."}).encode('utf-8') + b'\n')
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                await slots.acquire()
+                task = asyncio.create_task(self._respond(line, writer, slots))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                await writer.drain()  # 클라이언트가 응답을 읽지 않으면 요청도 더 읽지 않음
+            if tasks:
+                await asyncio.gather(*tasks)
+            await writer.drain()
+        except ConnectionError:
+            for task in tasks:
+                task.cancel()
+        finally:
+            writer.close()
+
+
+async def request(message: any, host: str = HOST, port: int = PORT) -> any:
+    """
+    서버에 요청 하나(또는 배치 요청 배열)를 보내고 응답을 받는 간단한 클라이언트 함수입니다.
+
+    Args:
+        message (any): 요청 객체 또는 요청 배열을 받습니다.
+        host (str): 서버 주소를 받습니다. (기본값: HOST)
+        port (int): 서버 포트를 받습니다. (기본값: PORT)
+
+    Returns:
+        any: 응답 객체 또는 응답 배열을 반환합니다.
+    """
+    reader, writer = await asyncio.open_connection(host, port, limit=LINE_LIMIT)
+    try:
+        writer.write(json.dumps(message).encode('utf-8') + b'\n')
+        await writer.drain()
+        return json.loads(await reader.readline())
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+def main(argv: list = None) -> int:
+    """
+    명령줄 프로그램의 시작점입니다.
+
+    Returns:
+        int: 종료 코드를 반환합니다.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m calculator.server',
+        description='계산기 연산을 줄 단위 JSON 으로 제공하는 로컬 서버를 실행합니다.')
+    parser.add_argument('--host', default=HOST, help=f'접속을 받을 주소 (기본값: {HOST})')
+    parser.add_argument('--port', type=int, default=PORT, help=f'접속을 받을 포트 (기본값: {PORT})')
+    parser.add_argument('--window', type=float, default=WINDOW,
+                        help=f'요청들을 모으는 시간(초), 0 이면 기다리지 않음 (기본값: {WINDOW})')
+    parser.add_argument('--max-batch', type=int, default=MAX_BATCH,
+                        help=f'한번에 모아서 계산할 최대 요청 수 (기본값: {MAX_BATCH})')
+    parser.add_argument('--queue-size', type=int, default=QUEUE_SIZE,
+                        help=f'계산을 기다리는 요청 큐의 최대 크기 (기본값: {QUEUE_SIZE})')
+    args = parser.parse_args(argv)
+
+    server = CalculatorServer(host=args.host, port=args.port, window=args.window,
+                              max_batch=args.max_batch, queue_size=args.queue_size)
+    print(f"listening on {args.host}:{args.port}", file=sys.stderr)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+__all__ = ['CalculatorServer', 'Coalescer', 'parse_request', 'request', 'main']
+
+if __name__ == '__main__':
+    sys.exit(main())
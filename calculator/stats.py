@@ -0,0 +1,183 @@
+"""
+
+이 파이썬 파일은 숫자 스트림의 개수, 평균, 분산, 표준편차, 최솟값, 최댓값을 한번 읽으면서(single pass) 구하는 누적기 클래스로 이루어져있다.
+Calculator.statistics, Calculator.statistics_accumulator 매서드로 만들어 쓴다.
+
+평균과 분산은 값들을 모아두지 않고 (개수, 평균, 편차 제곱합 M2) 세 값만 가지고 계산한다.
+    - 덩어리 하나의 평균과 M2 는 덩어리 안에서 평균을 먼저 구하고 편차 제곱을 더해서 구한다. (합과 제곱합으로 구하는 방식과 달리 자릿수 손실이 없음)
+    - 덩어리들의 (개수, 평균, M2) 는 Chan 의 병합 공식으로 합친다.
+        n = n_a + n_b,  δ = 평균_b - 평균_a
+        평균 = 평균_a + δ · n_b / n,  M2 = M2_a + M2_b + δ² · n_a · n_b / n
+      숫자를 하나씩 넣으면 Welford 의 온라인 알고리즘과 같다.
+merge 도 같은 공식이라 여러 프로세스에서 나눠 계산한 누적기를 합쳐도 한번에 계산한 것과 같은 결과를 얻는다. (반올림 오차 범위 안에서)
+누적기는 pickle 할 수 있으므로 작업 프로세스에서 계산한 누적기를 돌려받아 merge 하면 된다.
+
+feed 는 숫자 하나, iterable(리스트, 반복자, 제너레이터), numpy 배열을 받는다.
+iterable 은 BLOCK_SIZE 개씩 꺼내서 계산하고, numpy 배열은 BLOCK_SIZE 개씩 잘라 numpy 로 계산하므로 memmap 열도 메모리를 조금만 쓴다.
+precision, return_float 은 result 에서 마지막 값에만 적용한다.
+"""
+
+import math  # 덩어리 합, 표준편차, nan 작성용
+from collections import namedtuple  # 통계 결과 자료형 작성용 (typing 보다 import 가 가벼움)
+from itertools import islice  # iterable 을 덩어리로 나눠 꺼내는 용도
+from . import utils
+
+BLOCK_SIZE = 65536  # 한번에 계산하는 숫자 수
+
+# 통계 결과. count 는 정수, 나머지는 연산 조건(precision, return_float)을 적용한 값
+Statistics = namedtuple('Statistics', ['count', 'mean', 'variance', 'stddev', 'minimum', 'maximum'])
+
+
+class RunningStats:
+    """
+    숫자들의 개수, 평균, 분산, 최솟값, 최댓값을 조금씩 누적하는 누적기입니다.
+
+    Attributes:
+        count (int): 지금까지 넣은 숫자 개수입니다.
+        mean (float): 지금까지 넣은 숫자들의 평균입니다.
+        m2 (float): 평균에서의 편차 제곱합입니다. (분산 = m2 / (count - ddof))
+        minimum (any): 최솟값입니다. 숫자를 넣지 않았으면 nan 입니다.
+        maximum (any): 최댓값입니다. 숫자를 넣지 않았으면 nan 입니다.
+        options (utils.Options): result 에 적용할 연산 조건입니다.
+
+    Examples:
+        >>> calc = Calculator()
+        >>> left = calc.statistics_accumulator(precision=2).feed([2, 4, 4, 4])
+        >>> right = calc.statistics_accumulator().feed(x for x in (5, 5, 7, 9))
+        >>> left.merge(right).result()
+        Statistics(count=8, mean=5.00, variance=4.00, stddev=2.00, minimum=2.00, maximum=9.00)
+    """
+
+    __slots__ = ('count', 'mean', 'm2', 'minimum', 'maximum', 'options')
+
+    def __init__(self, options: utils.Options = None):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.nan
+        self.maximum = math.nan
+        self.options = options if options is not None else utils.DEFAULT_OPTIONS
+
+    def _combine(self, count: int, mean: float, m2: float, minimum: any, maximum: any):
+        """(개수, 평균, M2, 최솟값, 최댓값) 덩어리 하나를 Chan 의 병합 공식으로 합칩니다."""
+        if count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2, self.minimum, self.maximum = count, mean, m2, minimum, maximum
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        if self.minimum == self.minimum:  # 이미 nan 이면 nan 을 유지함 (numpy 의 min, max 와 같음)
+            self.minimum = min(minimum, self.minimum)
+            self.maximum = max(maximum, self.maximum)
+
+    def _feed_block(self, block: list):
+        """파이썬 숫자 리스트 하나를 더합니다."""
+        count = len(block)
+        try:
+            mean = math.fsum(block) / count  # fsum 은 반올림 오차를 쌓지 않으면서 sum 과 속도가 비슷함
+        except ValueError:  # inf 와 -inf 가 함께 있으면 fsum 은 오류를 내지만 sum, numpy 는 nan
+            mean = math.nan
+        m2 = math.fsum([(value - mean) ** 2 for value in block])
+        minimum, maximum = min(block), max(block)
+        if mean != mean and any(value != value for value in block):
+            minimum = maximum = math.nan  # nan 이 있으면 numpy 와 같이 최솟값, 최댓값도 nan (min, max 는 순서에 따라 다름)
+        self._combine(count, mean, m2, minimum, maximum)
+
+    def _feed_array(self, array: any):
+        """numpy 배열을 BLOCK_SIZE 개씩 잘라 더합니다."""
+        import numpy as np  # 배열을 넣을 때만 numpy를 불러옴
+
+        array = array.reshape(-1)
+        for start in range(0, array.size, BLOCK_SIZE):
+            block = np.asarray(array[start:start + BLOCK_SIZE], dtype=float)
+            with np.errstate(invalid='ignore'):  # inf 가 있으면 편차가 nan 이 됨
+                mean = float(block.mean())
+                deviation = block - mean
+                m2 = float(np.dot(deviation, deviation))
+            self._combine(block.size, mean, m2, float(block.min()), float(block.max()))
+
+    def feed(self, values: any) -> 'RunningStats':
+        """
+        숫자들을 더합니다. 반복자, 제너레이터는 BLOCK_SIZE 개씩 꺼내므로 입력이 메모리보다 커도 메모리 사용량이 일정합니다.
+
+        Args:
+            values (any): 숫자 하나, 숫자들을 꺼낼 수 있는 iterable, numpy 배열(memmap 포함)을 받습니다.
+
+        Returns:
+            RunningStats: 이어서 부를 수 있도록 자기 자신을 반환합니다.
+        """
+        if getattr(values, 'ndim', None) is not None:  # numpy 배열 (0차원 배열은 숫자 하나로 취급)
+            if values.ndim:
+                self._feed_array(values)
+                return self
+            values = values.item()
+        if isinstance(values, utils.Result):  # precision 을 적용한 계산 결과는 원래 값을 사용
+            values = values.value
+        if isinstance(values, (int, float)):  # 숫자 하나 (Welford 의 갱신과 같음)
+            self._combine(1, float(values), 0.0, values, values)
+            return self
+
+        iterator = iter(values)
+        while True:
+            block = list(islice(iterator, BLOCK_SIZE))
+            if not block:
+                break
+            self._feed_block(block)
+        return self
+
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """
+        다른 누적기의 상태를 합칩니다. 연산 조건은 이 누적기의 것을 사용합니다.
+
+        Args:
+            other (RunningStats): 합칠 누적기를 받습니다.
+
+        Returns:
+            RunningStats: 자기 자신을 반환합니다.
+        """
+        self._combine(other.count, other.mean, other.m2, other.minimum, other.maximum)
+        return self
+
+    def variance(self, ddof: int = 0) -> float:
+        """
+        분산을 반환합니다. 개수가 ddof 이하이면 nan 을 반환합니다.
+
+        Args:
+            ddof (int): 0 이면 모분산, 1 이면 표본분산을 계산합니다. (기본값: 0)
+
+        Returns:
+            float: 분산을 반환합니다.
+        """
+        if self.count <= ddof:
+            return math.nan
+        return self.m2 / (self.count - ddof)
+
+    def result(self, ddof: int = 0) -> Statistics:
+        """
+        지금까지의 통계에 연산 조건(precision, return_float)을 적용해서 반환합니다.
+
+        Args:
+            ddof (int): 0 이면 모분산, 1 이면 표본분산으로 variance, stddev 를 계산합니다. (기본값: 0)
+
+        Returns:
+            Statistics: (개수, 평균, 분산, 표준편차, 최솟값, 최댓값)을 반환합니다.
+                숫자를 넣지 않았으면 개수는 0, 나머지는 nan 입니다.
+        """
+        variance = self.variance(ddof)
+        mean = self.mean if self.count else math.nan
+        values = (mean, variance, math.sqrt(variance), self.minimum, self.maximum)
+        precision, return_float = self.options.precision, self.options.return_float
+        return Statistics(self.count, *(
+            utils.fl(result=utils.round_result(value=value, precision=precision), return_float=return_float)
+            for value in values))
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(count={self.count!r}, mean={self.mean!r}, m2={self.m2!r}, "
+                f"minimum={self.minimum!r}, maximum={self.maximum!r})")
+
+
+__all__ = ['BLOCK_SIZE', 'Statistics', 'RunningStats']
@@ -0,0 +1,520 @@
+"""
+
+이 파이썬 파일은 숫자 표(CSV, TSV)를 덩어리 단위로 배열로 읽고, 계산 결과를 CSV, JSON Lines, raw 바이너리로 한번에 쓰는 함수들로 이루어져있다.
+python -m calculator.tableio add_batch operands.csv -o sums.csv --option precision=4 로 실행한다.
+
+읽기 : open_table 은 파일을 chunk_rows 줄씩 잘라 numpy.loadtxt(C 로 만든 파서)로 바로 실수형(또는 복소수형) 2차원 배열로 바꾼다.
+       한 줄씩 csv 모듈로 읽어 float() 로 바꾸는 방식보다 훨씬 빠르고, 한번에 덩어리 하나만 메모리에 둔다.
+       복소수는 파이썬 표기(1+2j, -3.5j)로 적는다. 첫 줄이 숫자가 아니면 열 이름(header)으로 취급한다.
+
+쓰기 : 값을 하나씩 str() 로 바꾸고 0을 붙이는 대신(utils.Result 의 출력 방식), format_fixed 가 배열 전체를 한번에
+       고정 소수점 문자열로 바꾼다. 숫자 자리마다 배열 연산(% 10, // 10)으로 글자 행렬(uint8)을 채우고,
+       구분자, 줄바꿈까지 붙인 행렬을 bytes 로 바꾼 뒤 빈칸(NUL)을 지운다. 결과는 '%.4f' % x 와 같다.
+       (x * 10^precision 의 반올림 경계에 걸친 드문 값만 파이썬 형식으로 다시 계산한다.) precision 이 0 이면(반올림하지 않음) repr 로 쓴다.
+
+evaluate_table 은 읽기, 배치 매서드 계산, 쓰기를 덩어리마다 이어서 한다. 처리량은 python benchmark/bench_tableio.py 로 측정한다.
+"""
+
+import argparse  # 명령줄 인자 해석용
+import itertools  # 파일을 덩어리로 나누기 위한 용도
+import json  # JSON Lines 의 열 이름 표기용
+import os  # 경로 자료형, 확장자 확인용
+import sys  # 표준 입출력용
+import numpy as np
+from . import utils
+
+CHUNK_ROWS = 65536  # 한번에 읽고 쓰는 줄 수
+
+FORMATS = ('csv', 'tsv', 'jsonl', 'binary')  # 쓸 수 있는 출력 형식
+_EXTENSIONS = {'.csv': 'csv', '.tsv': 'tsv', '.tab': 'tsv', '.jsonl': 'jsonl', '.ndjson': 'jsonl', '.bin': 'binary'}
+
+_PAD = 0  # 글자 행렬의 빈칸. bytes 로 바꾼 뒤 지움
+_MAX_EXACT = 2 ** 53  # 이보다 큰 정수부는 실수로 정확히 나타낼 수 없으므로 파이썬 형식으로 씀
+_TIE_TOLERANCE = 2.5e-16  # x * 10^precision 의 상대 반올림 오차 한계 (0.5 ulp 보다 조금 크게)
+
+
+def format_of(path: any, default: str = 'csv') -> str:
+    """경로의 확장자로 형식('csv', 'tsv', 'jsonl', 'binary')을 정합니다. 알 수 없는 확장자는 default 를 반환합니다."""
+    if not isinstance(path, (str, os.PathLike)):
+        return default
+    return _EXTENSIONS.get(os.path.splitext(os.fspath(path))[1].lower(), default)
+
+
+# ---------------------------------------------------------------- 읽기
+
+def _parse(lines: list, delimiter: str, dtype: any) -> any:
+    """줄 리스트를 (줄 수, 열 수) 배열로 바꿉니다."""
+    return np.loadtxt(lines, delimiter=delimiter, dtype=dtype, ndmin=2)
+
+
+def _is_header(line: str, delimiter: str, dtype: any) -> bool:
+    """첫 줄이 숫자로 읽히지 않으면 열 이름으로 봅니다."""
+    try:
+        _parse([line], delimiter, dtype)
+    except ValueError:
+        return True
+    return False
+
+
+def open_table(source: any, delimiter: str = None, dtype: any = float, header: bool = None,
+               chunk_rows: int = CHUNK_ROWS) -> tuple:
+    """
+    숫자 표 파일을 덩어리 단위로 읽는 반복자를 만듭니다.
+
+    Args:
+        source (any): 파일 경로나 텍스트 파일 객체(예 : sys.stdin)를 받습니다.
+        delimiter (str): 구분자를 받습니다. (기본값: None, .tsv 이면 탭, 아니면 쉼표)
+        dtype (any): 값의 자료형을 받습니다. 복소수 표는 complex 를 넘깁니다. (기본값: float)
+        header (bool): 첫 줄이 열 이름인지 지정합니다. (기본값: None, 첫 줄이 숫자가 아니면 열 이름)
+        chunk_rows (int): 덩어리 하나의 줄 수를 받습니다. (기본값: CHUNK_ROWS)
+
+    Returns:
+        tuple: (열 이름 리스트 또는 None, (줄 수, 열 수) 배열을 하나씩 내주는 반복자)를 반환합니다.
+
+    Examples:
+        >>> names, chunks = open_table('operands.csv')
+        >>> names
+        ['x', 'y']
+        >>> next(chunks)[:2]
+        array([[1. , 2. ],
+               [3.5, 4. ]])
+    """
+    if delimiter is None:
+        delimiter = '\t' if format_of(source) == 'tsv' else ','
+    opened = isinstance(source, (str, os.PathLike))
+    handle = open(source, encoding='utf-8', newline='') if opened else source
+    first = handle.readline()
+    if header is None:
+        header = bool(first.strip()) and _is_header(first, delimiter, dtype)
+    names = [name.strip() for name in first.rstrip('\r\n').split(delimiter)] if header else None
+
+    def chunks():
+        try:
+            lines = [] if header or not first.strip() else [first]
+            lines.extend(itertools.islice(handle, chunk_rows - len(lines)))
+            while lines:
+                yield _parse(lines, delimiter, dtype)
+                lines = list(itertools.islice(handle, chunk_rows))
+        finally:
+            if opened:
+                handle.close()
+
+    return names, chunks()
+
+
+def read_table(source: any, delimiter: str = None, dtype: any = float, header: bool = None) -> tuple:
+    """
+    숫자 표 파일 전체를 배열 하나로 읽습니다. 인자는 open_table 과 같습니다.
+
+    Returns:
+        tuple: (열 이름 리스트 또는 None, (줄 수, 열 수) 배열)을 반환합니다.
+    """
+    names, chunks = open_table(source, delimiter=delimiter, dtype=dtype, header=header)
+    parts = list(chunks)
+    if not parts:
+        return names, np.empty((0, len(names) if names else 0), dtype=dtype)
+    return names, np.concatenate(parts)
+
+
+# ---------------------------------------------------------------- 고정 소수점 글자 행렬
+
+def _python_matrix(strings: list) -> any:
+    """문자열 리스트를 글자 행렬로 바꿉니다. (배열 연산으로 만들 수 없는 값을 위한 느린 경로)"""
+    if not strings:
+        return np.zeros((0, 1), dtype=np.uint8)
+    encoded = np.array([text.encode('ascii') for text in strings])  # 오른쪽을 NUL 로 채운 고정 길이 bytes
+    return encoded.view(np.uint8).reshape(len(strings), -1)
+
+
+def _python_strings(values: any, precision: int, plus: bool) -> list:
+    """값들을 파이썬 형식으로 문자열로 바꿉니다. precision 이 0 이면 repr 을 씁니다."""
+    if values.dtype.kind in 'iub':
+        suffix = '.' + '0' * precision if precision else ''
+        strings = [f"{value}{suffix}" for value in values.tolist()]  # 큰 정수도 실수로 바꾸지 않음 (Result 와 같음)
+    elif precision:
+        strings = [f"{value:.{precision}f}" for value in values.tolist()]
+    else:
+        strings = [repr(value) for value in values.tolist()]
+    if plus:
+        strings = [text if text.startswith('-') else '+' + text for text in strings]
+    return strings
+
+
+def _fixed_matrix(values: any, precision: int, plus: bool = False) -> any:
+    """
+    실수(또는 정수) 배열을 소수점 precision 자리의 글자 행렬로 바꿉니다.
+
+    글자 행렬은 (값 개수, 폭) uint8 배열이고, 한 행이 값 하나의 글자들입니다. 폭보다 짧은 값은 앞을 NUL 로 채웁니다.
+
+    Args:
+        values (numpy.ndarray): 1차원 실수형 또는 정수형 배열을 받습니다.
+        precision (int): 소수점 자릿수를 받습니다. 0 이면 실수는 repr, 정수는 그대로 씁니다.
+        plus (bool): 양수 앞에 + 를 붙일지 여부를 받습니다. (복소수의 허수부용)
+
+    Returns:
+        numpy.ndarray: 글자 행렬을 반환합니다.
+    """
+    count = values.size
+    if values.dtype.kind in 'iub':
+        negative = values < 0
+        magnitude = np.abs(values.astype(np.int64)).astype(np.uint64)
+        top = int(magnitude.max()) * 10 ** precision if count else 0
+        if top >= _MAX_EXACT:
+            return _python_matrix(_python_strings(values, precision, plus))
+        scaled = magnitude * np.uint64(10 ** precision)
+        finite = None
+    else:
+        if not precision:
+            return _python_matrix(_python_strings(values, precision, plus))  # 반올림하지 않으면 repr
+        finite = np.isfinite(values)
+        negative = np.signbit(values)
+        with np.errstate(over='ignore', invalid='ignore'):  # 아주 큰 값은 inf 가 되어 아래에서 파이썬 형식으로 씀
+            scaled = np.abs(values) * 10.0 ** precision
+            if not finite.all():
+                scaled[~finite] = 0
+            rounded = np.rint(scaled)
+            # 곱셈의 반올림 오차(0.5 ulp) 때문에 반올림 경계(.5)에 걸친 값은 파이썬 형식으로 다시 반올림
+            near_tie = np.abs(np.abs(scaled - rounded) - 0.5) <= scaled * _TIE_TOLERANCE
+        top = rounded.max() if count else 0
+        if top >= _MAX_EXACT:
+            return _python_matrix(_python_strings(values, precision, plus))
+        scaled = rounded.astype(np.uint64)
+        for index in np.flatnonzero(near_tie).tolist():
+            text = f"{abs(float(values[index])):.{precision}f}"
+            scaled[index] = int(text.replace('.', ''))
+        top = int(scaled.max()) if count else 0
+
+    digits = max(len(str(int(top))), precision + 1)  # 정수부가 0 이어도 한 자리는 씀
+    width = max(1 + digits + (1 if precision else 0), 5)  # 부호 + 숫자 + 소수점. -inf 가 들어갈 폭
+    matrix = np.zeros((count, width), dtype=np.uint8)
+    column = width - 1
+    for position in range(digits):  # 일의 자리 아래부터 한 자리씩 채움
+        if position == precision and precision:
+            matrix[:, column] = ord('.')
+            column -= 1
+        digit = (scaled % 10).astype(np.uint8)
+        digit += ord('0')
+        if position > precision:
+            digit[scaled == 0] = _PAD  # 정수부 앞의 0은 지움
+        matrix[:, column] = digit
+        scaled //= 10
+        column -= 1
+    matrix[:, 0] = np.where(negative, ord('-'), ord('+') if plus else _PAD)  # 부호는 맨 앞. 빈칸을 지우면 숫자에 붙음
+
+    if finite is not None and not finite.all():  # nan, inf 는 파이썬 표기로 덮어씀
+        for index in np.flatnonzero(~finite).tolist():
+            text = repr(float(values[index]))
+            if plus and not text.startswith('-'):
+                text = '+' + text
+            matrix[index] = _PAD
+            matrix[index, width - len(text):] = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+    return matrix
+
+
+def _complex_matrices(values: any, precision: int) -> tuple:
+    """복소수 배열을 (실수부 글자 행렬, 부호를 붙인 허수부 글자 행렬)로 바꿉니다."""
+    return _fixed_matrix(values.real, precision), _fixed_matrix(values.imag, precision, plus=True)
+
+
+def _join(count: int, parts: list) -> bytes:
+    """
+    글자 행렬과 고정 문자열(bytes)들을 가로로 이어붙여 값 count 개의 글자들을 만들고, 빈칸(NUL)을 지운 bytes 로 반환합니다.
+    """
+    widths = [part.shape[1] if isinstance(part, np.ndarray) else len(part) for part in parts]
+    rows = np.empty((count, sum(widths)), dtype=np.uint8)
+    start = 0
+    for part, width in zip(parts, widths):
+        if isinstance(part, np.ndarray):
+            rows[:, start:start + width] = part
+        else:
+            rows[:, start:start + width] = np.frombuffer(part, dtype=np.uint8)
+        start += width
+    return rows.tobytes().replace(b'\0', b'')
+
+
+def format_fixed(values: any, precision: int) -> list:
+    """
+    배열 전체를 한번에 소수점 precision 자리의 문자열로 바꿉니다. ('%.{precision}f' % x 와 같은 결과)
+
+    Args:
+        values (any): 실수형, 정수형 또는 복소수형 배열을 받습니다.
+        precision (int): 소수점 자릿수를 받습니다. 0 이면 반올림하지 않고 repr 로 씁니다.
+
+    Returns:
+        list: 문자열 리스트를 반환합니다.
+
+    Examples:
+        >>> format_fixed(np.array([0.5, -2 / 3, 6]), 4)
+        ['0.5000', '-0.6667', '6.0000']
+    """
+    values = np.asarray(values).reshape(-1)
+    if values.dtype.kind == 'c':
+        real, imag = _complex_matrices(values, precision)
+        text = _join(values.size, [real, imag, b'j\n'])
+    else:
+        text = _join(values.size, [_fixed_matrix(values, precision), b'\n'])
+    return text.decode('ascii').split('\n')[:-1]
+
+
+# ---------------------------------------------------------------- 쓰기
+
+def _as_columns(columns: any) -> list:
+    """열 배열 하나, 2차원 배열, 열 배열 리스트를 1차원 배열 리스트로 맞춥니다."""
+    if isinstance(columns, np.ndarray):
+        return [columns] if columns.ndim == 1 else [columns[:, k] for k in range(columns.shape[1])]
+    return [np.asarray(column).reshape(-1) for column in columns]
+
+
+def _output(destination: any) -> tuple:
+    """(바이너리 쓰기 객체, 다 쓴 뒤 닫아야 하는지)를 반환합니다. 텍스트 스트림(sys.stdout 등)은 그 아래 바이너리 버퍼를 씁니다."""
+    if isinstance(destination, (str, os.PathLike)):
+        return open(destination, 'wb'), True
+    return getattr(destination, 'buffer', destination), False
+
+
+def _csv_block(columns: list, precision: int, delimiter: str) -> bytes:
+    """열들을 CSV 줄들의 bytes 로 바꿉니다."""
+    separator = delimiter.encode()
+    parts = []
+    for column in columns:
+        if column.dtype.kind == 'c':
+            parts.extend(_complex_matrices(column, precision))
+            parts.append(b'j')
+        else:
+            parts.append(_fixed_matrix(column, precision))
+        parts.append(separator)
+    parts[-1] = b'\n'
+    return _join(len(columns[0]), parts)
+
+
+def _json_value(column: any, precision: int) -> list:
+    """JSON 값 하나의 글자 행렬 조각들입니다. nan, inf 는 JSON 에 없으므로 null, 복소수는 [실수부, 허수부] 로 씁니다."""
+    if column.dtype.kind == 'c':
+        return ([b'['] + _json_value(np.ascontiguousarray(column.real), precision) + [b',']
+                + _json_value(np.ascontiguousarray(column.imag), precision) + [b']'])
+    matrix = _fixed_matrix(column, precision)
+    if column.dtype.kind == 'f':
+        bad = ~np.isfinite(column)
+        if bad.any():
+            matrix = np.pad(matrix, ((0, 0), (max(0, 4 - matrix.shape[1]), 0)))  # null 이 들어갈 폭
+            matrix[bad] = _PAD
+            matrix[bad, -4:] = np.frombuffer(b'null', dtype=np.uint8)
+    return [matrix]
+
+
+def _jsonl_block(columns: list, names: list, precision: int) -> bytes:
+    """열들을 JSON Lines 줄들의 bytes 로 바꿉니다. ({"x":1.0000,"y":2.0000})"""
+    parts = []
+    for index, (column, name) in enumerate(zip(columns, names)):
+        parts.append(('{' if index == 0 else ',').encode() + json.dumps(name).encode() + b':')
+        parts.extend(_json_value(column, precision))
+    parts.append(b'}\n')
+    return _join(len(columns[0]), parts)
+
+
+def _binary_block(columns: list) -> bytes:
+    """열들을 행 순서(한 행의 값들을 이어서)의 raw 바이너리 bytes 로 바꿉니다."""
+    if len(columns) == 1:
+        return np.ascontiguousarray(columns[0]).tobytes()
+    return np.column_stack(columns).tobytes()
+
+
+class TableWriter:
+    """
+    계산 결과 열들을 덩어리마다 이어서 쓰는 객체입니다. 열 이름(header)은 처음 쓸 때 한번만 씁니다.
+
+    Attributes:
+        output_format (str): 'csv', 'tsv', 'jsonl', 'binary' 중 하나입니다.
+        names (list): 열 이름 리스트입니다. None 이면 CSV 에 header 를 쓰지 않고, JSON Lines 는 c0, c1, ... 을 씁니다.
+        precision (int): 소수점 자릿수입니다. 0 이면 반올림하지 않고 repr 로 씁니다.
+        rows (int): 지금까지 쓴 줄 수입니다.
+
+    Examples:
+        >>> with TableWriter('sums.csv', names=['sum'], precision=2) as writer:
+        ...     writer.write([np.array([1.5, 2.25])])
+    """
+
+    def __init__(self, destination: any, output_format: str = None, names: list = None, precision: int = 0,
+                 delimiter: str = None):
+        if output_format is None:
+            output_format = format_of(destination)
+        if output_format not in FORMATS:
+            raise ValueError(f"output_format 은 {FORMATS} 중 하나여야 합니다: {output_format!r}")
+        self.output_format = output_format
+        self.names = names
+        self.precision = precision
+        self.delimiter = delimiter if delimiter is not None else ('\t' if output_format == 'tsv' else ',')
+        self.rows = 0
+        self._handle, self._close = _output(destination)
+        self._started = False
+
+    def write(self, columns: any):
+        """
+        열들을 씁니다.
+
+        Args:
+            columns (any): 같은 길이의 1차원 배열 리스트나 2차원 배열(열 단위)을 받습니다.
+        """
+        columns = _as_columns(columns)
+        if not columns:
+            return
+        if not self._started:
+            self._started = True
+            if self.names is not None and self.output_format in ('csv', 'tsv'):
+                self._handle.write((self.delimiter.join(self.names) + '\n').encode())
+        for start in range(0, len(columns[0]), CHUNK_ROWS):  # 큰 배열은 나눠서 변환 (글자 행렬 메모리 제한)
+            part = [column[start:start + CHUNK_ROWS] for column in columns]
+            if self.output_format == 'binary':
+                block = _binary_block(part)
+            elif self.output_format == 'jsonl':
+                names = self.names or [f"c{index}" for index in range(len(part))]
+                block = _jsonl_block(part, names, self.precision)
+            else:
+                block = _csv_block(part, self.precision, self.delimiter)
+            self._handle.write(block)
+        self.rows += len(columns[0])
+
+    def close(self):
+        """파일을 닫습니다. 파일 객체를 받은 경우에는 비우기(flush)만 합니다."""
+        if self._close:
+            self._handle.close()
+        else:
+            self._handle.flush()
+
+    def __enter__(self) -> 'TableWriter':
+        return self
+
+    def __exit__(self, *exc_info: any):
+        self.close()
+
+
+def write_table(destination: any, columns: any, names: list = None, precision: int = 0,
+                output_format: str = None, delimiter: str = None) -> int:
+    """
+    열들을 한번에 씁니다. 인자는 TableWriter 와 같습니다.
+
+    Returns:
+        int: 쓴 줄 수를 반환합니다.
+
+    Examples:
+        >>> write_table('out.jsonl', [np.array([0.5, np.nan])], names=['sin'], precision=4)
+        2
+    """
+    with TableWriter(destination, output_format=output_format, names=names, precision=precision,
+                     delimiter=delimiter) as writer:
+        writer.write(columns)
+    return writer.rows
+
+
+# ---------------------------------------------------------------- 읽기 + 계산 + 쓰기
+
+def _result_columns(result: any, name: str) -> tuple:
+    """배치 매서드의 결과를 (출력 열 리스트, 열 이름 리스트, 정의역 오류 개수)로 나눕니다."""
+    if isinstance(result, utils.BatchResult):
+        valid = result.valid
+        return [result.values], [name], valid.size - int(np.count_nonzero(valid))
+    if isinstance(result, utils.CheckedResult):  # error_policy 를 지정한 경우 ('skip' 이면 오류 행을 쓰지 않음)
+        values = np.ma.filled(result.values, np.nan) if np.ma.isMaskedArray(result.values) else result.values
+        return [values], [name], sum(result.errors.values())
+    if isinstance(result, tuple):  # PolarArrays
+        return list(result), list(result._fields), 0
+    return [np.asarray(result).reshape(-1)], [name], 0
+
+
+def evaluate_table(calc: any, operation: any, source: any, destination: any, output_format: str = None,
+                   delimiter: str = None, dtype: any = float, header: bool = None, chunk_rows: int = CHUNK_ROWS,
+                   **kwargs: dict[str, any]) -> dict:
+    """
+    숫자 표를 덩어리마다 읽어 배치 매서드로 계산하고 결과를 씁니다. 표의 열들이 배치 매서드의 인자 순서대로 들어갑니다.
+
+    Args:
+        calc (any): 연산에 사용할 계산기를 받습니다. operation 이 함수(예 : Pipeline)이면 None 이어도 됩니다.
+        operation (any): 배치 매서드 이름(예 : 'add_batch')이나 배열들을 받는 함수를 받습니다.
+        source (any): 입력 표 파일 경로나 텍스트 파일 객체를 받습니다.
+        destination (any): 출력 파일 경로나 파일 객체를 받습니다.
+        output_format (str): 출력 형식을 받습니다. (기본값: None, 출력 경로의 확장자로 정하고 모르면 csv)
+        delimiter (str): 입력 표의 구분자를 받습니다. (기본값: None, .tsv 이면 탭, 아니면 쉼표)
+        dtype (any): 입력 값의 자료형을 받습니다. 복소수 표는 complex 를 넘깁니다. (기본값: float)
+        header (bool): 입력 첫 줄이 열 이름인지 지정합니다. 열 이름이 있으면 출력에도 열 이름을 씁니다. (기본값: None, 자동)
+        chunk_rows (int): 덩어리 하나의 줄 수를 받습니다. (기본값: CHUNK_ROWS)
+        **kwargs (dict[str, any]): 배치 매서드에 넘길 연산 조건을 받습니다. precision 은 출력 소수점 자릿수로도 씁니다.
+
+    Returns:
+        dict: {'rows': 줄 수, 'chunks': 덩어리 수, 'invalid': 정의역 오류 개수}를 반환합니다.
+
+    Examples:
+        >>> calc = Calculator()
+        >>> evaluate_table(calc, 'add_batch', 'operands.csv', 'sums.csv', precision=2)
+        {'rows': 1000000, 'chunks': 16, 'invalid': 0}
+    """
+    function = getattr(calc, operation) if isinstance(operation, str) else operation
+    owner = calc if calc is not None else operation
+    precision = utils.resolve_options(getattr(owner, 'options', utils.DEFAULT_OPTIONS), kwargs).precision
+    name = operation.removesuffix('_batch') if isinstance(operation, str) else 'value'
+
+    names, chunks = open_table(source, delimiter=delimiter, dtype=dtype, header=header, chunk_rows=chunk_rows)
+    writer = None
+    count = invalid = rows = 0
+    try:
+        for chunk in chunks:
+            result = function(*[chunk[:, k] for k in range(chunk.shape[1])], **kwargs)
+            columns, column_names, errors = _result_columns(result, name)
+            if writer is None:
+                writer = TableWriter(destination, output_format=output_format, names=column_names,
+                                     precision=precision)
+                if names is None and writer.output_format != 'jsonl':
+                    writer.names = None  # 입력에 열 이름이 없으면 CSV 에도 쓰지 않음
+            writer.write(columns)
+            count += 1
+            invalid += errors
+            rows += len(chunk)
+    finally:
+        if writer is None:
+            writer = TableWriter(destination, output_format=output_format)  # 빈 입력도 출력 파일은 만듦
+        writer.close()
+    return {'rows': rows, 'chunks': count, 'invalid': invalid}
+
+
+def main(argv: list = None) -> int:
+    """
+    명령줄 프로그램의 시작점입니다.
+
+    Returns:
+        int: 정의역 오류가 없으면 0, 있으면 1을 반환합니다.
+    """
+    from . import cli
+    from .complex import ComplexCalculator
+
+    parser = argparse.ArgumentParser(
+        prog='python -m calculator.tableio',
+        description='숫자 표(CSV, TSV)를 덩어리마다 배치 매서드로 계산해서 CSV, JSON Lines, raw 바이너리로 씁니다.')
+    parser.add_argument('operation', help='배치 매서드 이름 (예 : add_batch, sin_batch)')
+    parser.add_argument('input', nargs='?', default='-', help="입력 표 파일 경로 (기본값: '-', 표준 입력)")
+    parser.add_argument('-o', '--output', default='-', help="출력 파일 경로 (기본값: '-', 표준 출력)")
+    parser.add_argument('--format', choices=FORMATS, default=None, help='출력 형식 (기본값: 출력 확장자, 모르면 csv)')
+    parser.add_argument('--delimiter', default=None, help='입력 구분자 (기본값: .tsv 이면 탭, 아니면 쉼표)')
+    parser.add_argument('--complex', action='store_true', help='입력 값을 복소수로 읽음')
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS, help=f'덩어리 하나의 줄 수 (기본값: {CHUNK_ROWS})')
+    parser.add_argument('--option', action='append', default=[], metavar='KEY=VALUE',
+                        help='연산 조건 (예 : --option precision=4 --option angle_unit=degree)')
+    args = parser.parse_args(argv)
+
+    kwargs = {}
+    for option in args.option:
+        key, _, value = option.partition('=')
+        kwargs[key] = cli.parse_option(value)
+    source = sys.stdin if args.input == '-' else args.input
+    destination = sys.stdout if args.output == '-' else args.output
+
+    summary = evaluate_table(ComplexCalculator(), args.operation, source, destination, output_format=args.format,
+                             delimiter=args.delimiter, dtype=complex if args.complex else float,
+                             chunk_rows=args.chunk_rows, **kwargs)
+    print(f"{summary['rows']} rows, {summary['chunks']} chunks, {summary['invalid']} invalid", file=sys.stderr)
+    return 1 if summary['invalid'] else 0
+
+
+__all__ = ['open_table', 'read_table', 'format_fixed', 'TableWriter', 'write_table', 'evaluate_table',
+           'format_of', 'main']
+
+if __name__ == '__main__':
+    sys.exit(main())
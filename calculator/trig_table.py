@@ -0,0 +1,167 @@
+"""
+
+이 파이썬 파일은 미리 계산해둔 표(lookup table)와 선형 보간으로 사인, 코사인 배열을 빠르게 계산하는 함수들로 이루어져있다.
+연산 조건 max_error 를 주면 EngineeringCalculator 의 sin_batch, cos_batch, tan_batch 가 이 파일의 함수를 사용한다.
+
+표는 max_error 마다 처음 쓸 때 한번만 만들고(get_table) 다시 사용한다.
+표의 칸 수 n 은 2의 거듭제곱이라, 입력을 한바퀴 안으로 줄이는 계산을 나머지 연산 대신 비트 연산(& (n - 1))으로 한다.
+코사인은 사인 표를 1/4 바퀴(n / 4 칸) 옮겨 읽고, 각도(degree) 입력은 라디안으로 바꾸지 않고 바로 표의 위치로 바꾼다.
+
+오차 한계 (결과와 정확한 값의 차이의 절댓값이 max_error 이하)
+    - 선형 보간 오차는 칸 간격 h 에 대해 h² / 8 이하이므로, h 를 이 값이 max_error / 2 이하가 되도록 잡는다.
+    - 나머지 max_error / 2 는 부동소수점 반올림 오차 몫이다. 입력이 아주 크면 이 몫을 넘을 수 있으므로
+      절댓값이 limit 를 넘는 입력(무한대, nan 포함)은 numpy 의 정확한 함수로 계산한다.
+    - MIN_ARRAY_SIZE 보다 작은 배열도 정확한 함수로 계산한다. (표 계산은 numpy 함수를 여러번 불러서 작은 배열에서는 더 느림)
+    - 탄젠트는 표를 쓰지 않고 정확한 np.tan 으로 계산한다. (tan 함수 설명 참고)
+
+숫자 하나(sin, cos, tan 매서드)는 math 모듈이 표를 읽는 파이썬 코드보다 빠르므로 이 파일을 쓰지 않는다.
+"""
+
+import math  # 표 크기 계산용
+from functools import lru_cache  # 만든 표를 다시 쓰기 위한 캐시용
+import numpy as np
+
+MIN_SIZE = 16  # 표의 최소 칸 수
+MIN_ARRAY_SIZE = 1024  # 이보다 작은 배열은 numpy 함수 호출 횟수가 적은 정확한 함수가 더 빠름
+
+
+class TrigTable:
+    """
+    한바퀴를 n 칸으로 나눈 사인 표입니다.
+
+    Attributes:
+        max_error (float): 표로 계산한 사인, 코사인 값의 최대 절대 오차입니다.
+        size (int): 표의 칸 수입니다. (2의 거듭제곱)
+        values (numpy.ndarray): 칸마다의 사인 값입니다.
+        slopes (numpy.ndarray): 칸마다 다음 칸과의 사인 값 차이입니다. (보간용)
+        limit (float): 표의 위치 단위로 나타낸 입력 절댓값의 상한입니다. 이보다 크면 정확한 함수로 계산합니다.
+    """
+
+    __slots__ = ('max_error', 'size', 'values', 'slopes', 'limit')
+
+    def __init__(self, max_error: float):
+        step = math.sqrt(4 * max_error)  # 보간 오차 h² / 8 <= max_error / 2
+        size = max(MIN_SIZE, 1 << math.ceil(math.log2(2 * math.pi / step)))
+        values = np.sin(np.arange(size + 1) * (2 * math.pi / size))
+        values[size] = values[0]  # 한바퀴 끝은 처음과 같은 값
+
+        self.max_error = max_error
+        self.size = size
+        self.values = values[:size]
+        self.slopes = np.diff(values)
+        # 입력을 표의 위치로 바꿀 때의 반올림 오차(위치 * 2 ulp)가 max_error / 4 를 넘지 않는 범위
+        self.limit = max_error / (4 * (2 * math.pi / size) * 2 * np.finfo(float).eps)
+
+    def _position(self, x: any, angle_unit: str) -> tuple:
+        """입력 배열을 (칸 번호 배열, 칸 안에서의 위치(0 이상 1 미만) 배열)로 바꿉니다."""
+        scale = self.size / 360 if angle_unit == 'degree' else self.size / (2 * math.pi)
+        fraction = np.multiply(x, scale)
+        whole = np.floor(fraction)
+        fraction -= whole
+        index = whole.astype(np.intp)
+        index &= self.size - 1  # 한바퀴 안으로 줄임
+        return index, fraction
+
+    def _interpolate(self, index: any, fraction: any) -> any:
+        """칸 번호와 칸 안에서의 위치로 사인 값을 선형 보간합니다."""
+        result = self.slopes.take(index)
+        result *= fraction
+        result += self.values.take(index)
+        return result
+
+    def sin(self, x: any, angle_unit: str) -> any:
+        """사인 값 배열을 반환합니다. 입력 절댓값은 limit 이하여야 합니다."""
+        index, fraction = self._position(x, angle_unit)
+        return self._interpolate(index, fraction)
+
+    def cos(self, x: any, angle_unit: str) -> any:
+        """코사인 값 배열을 반환합니다. cos(x) = sin(x + 1/4 바퀴) 이므로 사인 표를 n / 4 칸 옮겨 읽습니다."""
+        index, fraction = self._position(x, angle_unit)
+        index += self.size // 4
+        index &= self.size - 1
+        return self._interpolate(index, fraction)
+
+    def in_range(self, x: any, angle_unit: str) -> bool:
+        """배열의 모든 값이 표로 계산할 수 있는 범위(limit 이하, 유한한 값)에 있는지 확인합니다."""
+        if x.size == 0:
+            return True
+        scale = self.size / 360 if angle_unit == 'degree' else self.size / (2 * math.pi)
+        bound = self.limit / scale
+        return bool(-bound <= x.min() and x.max() <= bound)  # nan 이 있으면 False
+
+
+@lru_cache(maxsize=16)
+def get_table(max_error: float) -> TrigTable:
+    """
+    max_error 에 맞는 표를 반환합니다. 처음 부를 때 한번만 만들고 이후에는 만들어둔 표를 반환합니다.
+
+    Args:
+        max_error (float): 최대 절대 오차를 받습니다.
+
+    Returns:
+        TrigTable: 사인 표를 반환합니다.
+    """
+    return TrigTable(max_error)
+
+
+def _exact(function: any, x: any, angle_unit: str) -> any:
+    """numpy 의 정확한 삼각함수로 계산합니다."""
+    if angle_unit == 'degree':
+        x = np.radians(x)
+    with np.errstate(invalid='ignore'):
+        return function(x)
+
+
+def _evaluate(method: str, function: any, x: any, angle_unit: str, max_error: float) -> any:
+    """표로 계산하되, 작은 배열과 표의 범위를 벗어난 입력은 정확한 함수로 계산합니다."""
+    if x.size < MIN_ARRAY_SIZE:
+        return _exact(function, x, angle_unit)
+    table = get_table(max_error)
+    if table.in_range(x, angle_unit):
+        return getattr(table, method)(x, angle_unit)
+
+    scale = table.size / 360 if angle_unit == 'degree' else table.size / (2 * math.pi)
+    inside = np.abs(x) <= table.limit / scale
+    result = _exact(function, x, angle_unit)
+    result[inside] = getattr(table, method)(x[inside], angle_unit)
+    return result
+
+
+def sin(x: any, angle_unit: str, max_error: float) -> any:
+    """
+    사인 값 배열을 절대 오차 max_error 이하로 계산합니다.
+
+    Args:
+        x (numpy.ndarray): 실수형 입력 배열을 받습니다.
+        angle_unit (str): 'degree' 이면 입력을 각도로, 아니면 라디안으로 취급합니다.
+        max_error (float): 최대 절대 오차를 받습니다.
+
+    Returns:
+        numpy.ndarray: 사인 값 배열을 반환합니다.
+
+    Examples:
+        >>> values = sin(np.arange(0, 360, 0.01), 'degree', 1e-5)
+        >>> bool(np.abs(values - np.sin(np.radians(np.arange(0, 360, 0.01)))).max() <= 1e-5)
+        True
+    """
+    return _evaluate('sin', np.sin, x, angle_unit, max_error)
+
+
+def cos(x: any, angle_unit: str, max_error: float) -> any:
+    """
+    코사인 값 배열을 절대 오차 max_error 이하로 계산합니다. 인자는 sin 과 같습니다.
+    """
+    return _evaluate('cos', np.cos, x, angle_unit, max_error)
+
+
+def tan(x: any, angle_unit: str, max_error: float) -> any:
+    """
+    탄젠트 값 배열을 절대 오차 max_error 이하로 계산합니다. 인자는 sin 과 같습니다.
+
+    탄젠트는 극점 근처에서 값이 끝없이 커져서 표 하나로 오차 한계를 지킬 수 없고, 사인 / 코사인 표로 나누어 계산하면
+    np.tan 보다 느리므로(numpy 의 tan 은 SIMD 로 계산됨) 정확한 np.tan 을 사용합니다. 정확한 값은 항상 오차 한계를 만족합니다.
+    """
+    return _exact(np.tan, x, angle_unit)
+
+
+__all__ = ['TrigTable', 'get_table', 'sin', 'cos', 'tan']
@@ -0,0 +1,788 @@
+"""
+
+editor : Kim Gwang=Jae
+date : 2024-10-1
+
+이 파이썬 파일은 사칙연산을 하는 계산기 클래스 Calculator 와 EngineeringCalculator 를 보조하는 함수들로 이루어져있다.
+Calculator 클래스의 add, subtract, multiply, divide 매서드는 사칙연산을 위한 매서드이다.
+get_kwarg, round_result, fl, convert_to_radians 는 사칙연산 매서드들의 코드에서 공통적으로 계속 쓰인 코드들은 매서드로 만들어 코드의 길이를 줄이고 보기 쉽게 정리하기 위해 만들었다.
+**kwargs 에 들어가는 키워드로는 'precision', 'return_float', 'angle_unit' 이다.
+precision은 소수점 자릿수를 결정하는 입력이고 return_float는 결과를 실수(True) 혹은 정수형(False)으로 변환하는데 쓰이는 입력이다.
+precision의 초기값은 0, return_float의 초기값은 False이다.
+precision=3, return_float=True or False, angle_unit = 'degree' 로 쓰인다.
+
+get_kwarg 는 키워드 파라미터에서 precision, return_float 의 value 값을 추출한다.
+round_result 는 입력한 값을 precision값에 맞춰 출력할 때 소수점 자릿수를 맞춰주는 Result 로 감싸주는 함수이다.
+Result 는 원래 값을 그대로 가지고 있다가 출력할 때만 문자열로 바꾸므로 결과를 이어서 계산할 수 있다.
+fl 는 return_float = True 이면 부동소수점으로 변환해주는 함수이다.
+convert_to_radians 는 angle_unit = 'degree' 이면 degree 각도를 radians 값으로 변환해주는 함수이다.
+product 는 곱셈 매서드들이 쓰는 곱 함수로, 정수가 많으면 균형 곱셈 트리로 곱해서 큰 정수 곱을 빠르게 계산한다.
+
+as_columns, reduce_columns, round_array, fl_array 는 numpy 배열을 한번에 계산하는 배치(batch) 매서드들을 보조하는 함수이다.
+numpy 는 배치 함수 안에서만 불러오기 때문에 스칼라 연산만 쓰는 경우에는 numpy 를 불러오지 않는다.
+convert_to_radians_array 는 convert_to_radians 의 배열 버전으로 배치 하나당 한번만 각도 변환을 한다.
+compute_dtype 은 dtype 연산 조건('float32', 'float64', 'complex64', 'complex128')에 맞는 배치 계산 자료형을 고르는 함수이다.
+BatchResult 는 공학용 배치 매서드의 결과(값 배열, 유효성 마스크)를 담는 자료형이다.
+error_policy 연산 조건을 지정하면 오류가 날 수 있는 배치 매서드(divide_batch, 공학용 배치 매서드)는 CheckedResult(값 배열, 유효성 마스크, 오류 종류별 개수)를 반환한다.
+check_array 는 오류 종류별 마스크로 error_policy 를 적용하는 함수로, 원소마다 예외를 잡지 않고 마스크 연산만으로 오류를 센다.
+
+Options 는 precision, return_float, angle_unit, coordinate, max_error, error_policy, dtype 연산 조건을 한번에 검사해서 담아두는 변경 불가능한 객체이다.
+resolve_options 는 계산기에 묶인 Options 와 매서드 호출 때 들어온 키워드 인자를 합쳐 Options 를 돌려준다.
+같은 키워드 인자 조합은 한번만 검사하고 캐시해두기 때문에 매 호출마다 키워드 인자를 반복문으로 다시 읽지 않는다.
+"""
+
+import math  # 곱셈, 나눗셈, 공학용 함수 작성용
+import operator  # 곱셈 트리에서 이웃한 값들을 곱하는 용도
+from itertools import chain, islice  # 반복자를 덩어리로 나눠 곱하는 용도
+from collections import OrderedDict, namedtuple  # 연산 조건 캐시(LRU), 배치 결과 자료형 작성용 (typing 보다 import 가 가벼움)
+
+
+# precision, return_float 값들 추출하는 매서드.
+def get_kwarg(**kwargs: dict[str: any]) -> any:
+    """
+    키워드 파라미터를 입력받아 precision의 값(정수), return_float의 값(부울)을 변수로 반환합니다.
+    precision의 기본값(소수점은 없다!)을 0으로 설정했습니다.
+    return_float의 기본값(float가 아님!)을 False로 설정했습니다.
+    add, subtract, multiply, divide 매서드 내부에서 동작하는 매서드입니다.
+
+    Args:
+        **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+            - precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+            - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+
+    Returns:
+        any: 추출한 연산 조건들을 반환합니다.
+
+    """
+    precision = 0
+    return_float = False
+    for key, value in kwargs.items():
+        if key == 'precision':
+            precision += value
+        elif key == 'return_float':
+            return_float = value
+    return precision, return_float
+
+# precision 에 맞춰 소수점을 맞춰주는 함수. 값은 그대로 두고 출력할 때만 0값을 소수점에 추가함
+
+
+class Result:
+    """
+    precision 이 지정된 연산 결과를 담는 가벼운 숫자 자료형입니다.
+
+    반올림하지 않은 원래 값(value)과 소수점 자릿수(precision)를 함께 저장하고,
+    print 등으로 출력할 때(__str__, __repr__, __format__)에만 소수점 자릿수를 맞춘 문자열로 바꿉니다.
+    계산에 다시 쓰이면 원래 값으로 계산되기 때문에 calc.square_root(calc.add(1, 2, precision=2)) 처럼
+    문자열로 바꿨다가 다시 숫자로 읽는 과정 없이 이어서 계산할 수 있습니다.
+    사칙연산, 비교, float(), int(), round() 를 지원하며 사칙연산 결과는 원래 값끼리 계산한 숫자입니다.
+
+    Attributes:
+        value (any): 반올림하지 않은 원래 값입니다.
+        precision (int): 출력할 때 사용할 소수점 자릿수입니다.
+
+    Examples:
+        >>> result = Result(6, 2)
+        >>> print(result)
+        6.00
+        >>> result + 1
+        7
+        >>> f"{Result(1 / 3, 4)}"
+        '0.3333'
+        >>> f"{Result(3, 2):>8}"
+        '    3.00'
+    """
+
+    __slots__ = ('value', 'precision')
+
+    def __init__(self, value: any, precision: int):
+        if isinstance(value, Result):
+            value = value.value
+        object.__setattr__(self, 'value', value)
+        object.__setattr__(self, 'precision', precision)
+
+    def __setattr__(self, key: str, value: any):
+        raise AttributeError("Result 는 값을 바꿀 수 없습니다.")
+
+    def __reduce__(self) -> tuple:
+        # 값을 바꿀 수 없는 객체라 pickle 할 때 생성자로 다시 만듦
+        return (Result, (self.value, self.precision))
+
+    # 출력할 때만 소수점 자릿수를 맞춤
+    def __str__(self) -> str:
+        if isinstance(self.value, int):
+            # 큰 정수도 그대로 출력하기 위해 실수로 바꾸지 않고 0을 붙임
+            return f"{self.value}." + self.precision * "0"
+        return format(self.value, f".{self.precision}f")
+
+    __repr__ = __str__
+
+    def __format__(self, spec: str) -> str:
+        if not spec:
+            return str(self)
+        rest = spec[2:] if len(spec) > 1 and spec[1] in '<>=^' else spec  # 채움 문자는 빼고 확인
+        if '.' in rest or rest[-1:].isalpha() or rest.endswith('%'):
+            return format(self.value, spec)  # 자릿수나 형식(f, e, %)을 지정하면 그대로 따름
+        # 폭, 정렬만 지정하면 precision 자릿수를 붙여서 출력 (큰 정수는 실수로 바꾸지 않도록 Decimal 로 출력)
+        value = self.value
+        if isinstance(value, int):
+            from decimal import Decimal
+            value = Decimal(value)
+        return format(value, f"{spec}.{self.precision}f")
+
+    # 숫자 변환
+    def __float__(self) -> float:
+        return float(self.value)
+
+    def __int__(self) -> int:
+        return int(self.value)
+
+    def __complex__(self) -> complex:
+        return complex(self.value)
+
+    def __round__(self, ndigits: int = None) -> any:
+        return round(self.value, ndigits)
+
+    def __bool__(self) -> bool:
+        return bool(self.value)
+
+    # 사칙연산은 원래 값으로 계산
+    def __add__(self, other: any) -> any:
+        return self.value + _raw(other)
+
+    def __radd__(self, other: any) -> any:
+        return _raw(other) + self.value
+
+    def __sub__(self, other: any) -> any:
+        return self.value - _raw(other)
+
+    def __rsub__(self, other: any) -> any:
+        return _raw(other) - self.value
+
+    def __mul__(self, other: any) -> any:
+        return self.value * _raw(other)
+
+    def __rmul__(self, other: any) -> any:
+        return _raw(other) * self.value
+
+    def __truediv__(self, other: any) -> any:
+        return self.value / _raw(other)
+
+    def __rtruediv__(self, other: any) -> any:
+        return _raw(other) / self.value
+
+    def __pow__(self, other: any) -> any:
+        return self.value ** _raw(other)
+
+    def __rpow__(self, other: any) -> any:
+        return _raw(other) ** self.value
+
+    def __neg__(self) -> any:
+        return -self.value
+
+    def __pos__(self) -> any:
+        return +self.value
+
+    def __abs__(self) -> any:
+        return abs(self.value)
+
+    # 비교도 원래 값으로 수행
+    def __eq__(self, other: any) -> bool:
+        return self.value == _raw(other)
+
+    def __lt__(self, other: any) -> bool:
+        return self.value < _raw(other)
+
+    def __le__(self, other: any) -> bool:
+        return self.value <= _raw(other)
+
+    def __gt__(self, other: any) -> bool:
+        return self.value > _raw(other)
+
+    def __ge__(self, other: any) -> bool:
+        return self.value >= _raw(other)
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+
+def _raw(value: any) -> any:
+    """Result 이면 원래 값을, 아니면 입력을 그대로 반환합니다."""
+    if isinstance(value, Result):
+        return value.value
+    return value
+
+
+def round_result(value: float, precision: int) -> any:
+    """
+    resolve_options 에서 얻은 precision값과 사칙연산을 거친 출력값 value를 입력받아 precision 에 맞춰 소수점을 맞춰 반환합니다.
+    precision 값이 있으면 값을 문자열로 바꾸지 않고 Result 로 감싸서 반환합니다.
+    Result 는 출력할 때만 소수점 자릿수가 precision의 값보다 작으면 작은 만큼 0을 채워 넣어서 보여줍니다.
+    precision 값이 없으면(0) 입력값을 그대로 반환합니다.
+    add, subtract, multiply, divide 매서드 내부에서 동작하는 매서드입니다.
+
+    Args:
+        value (float): 소수점 자릿수를 바꿀 값을 받습니다.
+        precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+
+    Returns:
+        any: precision 이 있으면 Result, 없으면 입력값을 그대로 반환합니다.
+
+    Examples:
+        >>> round_result(6, 2)
+        6.00
+        >>> round_result(1 / 3, 0)
+        0.3333333333333333
+    """
+    # precision 값이 주어진다면 출력할 때 소수점 자릿수를 맞추도록 Result 로 감쌈
+    if precision:
+        value = Result(value, precision)
+    return value
+
+
+def fl(result: float, return_float: bool) -> float:
+    """
+    resolve_options 에서 얻은 return_float 값과 사칙연산을 거친 출력값result을 입력받아 return_float 에 맞춰 반환합니다.
+    return_float 가 True 값이면 입력 result를 부동소수점으로 변환하여 반환합니다. 아니면 그대로 반환합니다.
+    result 가 Result 라면 precision 에 맞춰 반올림한 값을 부동소수점으로 반환합니다.
+
+    Args:
+        result (float): 변환할 값을 받습니다.
+        return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+
+    Returns:
+        any: 변환한 값을 반환합니다.
+    """
+    if return_float:
+        if isinstance(result, Result):
+            result = round(result.value, result.precision)
+        result = float(result)
+    else:
+        pass
+    return result
+
+
+PRODUCT_TREE_MIN = 64  # 정수가 이 개수 이상이면 균형 곱셈 트리로 곱함
+_PRODUCT_BLOCK = 4096  # 반복자를 곱할 때 한번에 꺼내는 숫자 수
+
+
+def _product_tree(values: list) -> int:
+    """정수 리스트를 이웃한 두 개씩 곱하는 단계를 반복해서 곱합니다. (균형 이진 트리 곱셈)"""
+    while len(values) > 1:
+        odd = values[-1] if len(values) % 2 else None  # 짝이 없는 마지막 값은 다음 단계로 넘김
+        values = list(map(operator.mul, values[::2], values[1::2]))
+        if odd is not None:
+            values.append(odd)
+    return values[0] if values else 1
+
+
+def product(values: any, start: any = 1) -> any:
+    """
+    숫자들의 곱을 반환합니다. math.prod 와 같은 값을 반환하지만, 정수가 많으면 더 빠르게 곱합니다.
+    math.prod 는 왼쪽부터 차례로 곱하므로 큰 정수 곱에서는 누적값이 계속 커져서 곱셈 비용이 숫자 개수의 제곱에 비례합니다.
+    정수가 PRODUCT_TREE_MIN 개 이상이면 이웃한 두 개씩 곱하는 균형 트리로 곱해서, 비슷한 크기의 정수끼리 곱하도록 합니다.
+    실수, 복소수 등 정수가 아닌 값은 곱하는 순서에 따라 반올림 결과가 달라질 수 있으므로 math.prod 와 같은 순서로 곱합니다.
+    multiply, divide, complex_multiply, complex_divide, multiply_iter, ProductAccumulator 내부에서 동작하는 함수입니다.
+
+    Args:
+        values (any): 곱할 숫자들을 받습니다. 리스트, 튜플이 아닌 반복자, 제너레이터는 _PRODUCT_BLOCK 개씩 꺼내며 곱하므로
+            메모리는 덩어리 하나와 부분곱 log(개수) 개만 사용합니다.
+        start (any): 곱의 시작값을 받습니다. (기본값: 1)
+
+    Returns:
+        any: 곱을 반환합니다.
+
+    Examples:
+        >>> product(range(1, 1001)) == math.factorial(1000)
+        True
+        >>> product([0.1, 0.2, 0.3])
+        0.006000000000000001
+    """
+    if isinstance(values, (list, tuple)):
+        if len(values) >= PRODUCT_TREE_MIN and type(start) is int and all(type(value) is int for value in values):
+            return start * _product_tree(list(values))
+        return math.prod(values, start=start)
+
+    if type(start) is not int:
+        return math.prod(values, start=start)
+    iterator = iter(values)
+    partials = []  # (곱한 숫자 수, 부분곱) 스택. 숫자 수가 같아지면 합쳐서 트리의 균형을 유지함
+    while True:
+        block = list(islice(iterator, _PRODUCT_BLOCK))
+        if not partials and len(block) < _PRODUCT_BLOCK:
+            return product(block, start)  # 덩어리 하나로 끝나는 짧은 입력은 리스트처럼 곱함
+        if not block:
+            break
+        if not all(type(value) is int for value in block):
+            # 정수가 아닌 값부터는 math.prod 와 같은 순서로 곱함 (앞의 정수 곱은 순서와 상관없이 정확함)
+            return math.prod(chain(block, iterator), start=start * _merge_partials(partials))
+        partials.append((len(block), _product_tree(block)))
+        while len(partials) > 1 and partials[-2][0] <= partials[-1][0]:
+            count, value = partials.pop()
+            partials[-1] = (partials[-1][0] + count, partials[-1][1] * value)
+    return start * _merge_partials(partials)
+
+
+def _merge_partials(partials: list) -> int:
+    """부분곱 스택을 작은 것(뒤)부터 곱해서 하나로 합칩니다."""
+    result = 1
+    for _, value in reversed(partials):
+        result *= value
+    return result
+
+
+def convert_to_radians(x: float, **kwargs: dict[str, any]) -> any:
+    """
+    디그리로 설정된 각도(입력x)를 라디안으로 변환해 출력하는 매서드. 키워드 파라미터kwargs 를 이용한다.
+    angle_unit = 'degree' 키워드가 있으면 입력 x를 degree에서 라디안으로 변환한 값을 반환합니다.
+    angle_raidans(180, angle_unit = 'degree') = 3.141592
+
+    Args:
+        x (float): 각도를 받습니다.
+        **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+            - angle_unit (str): 'degree' 이면 출력이 극좌표형태일 때 라디안에서 각도로 변환합니다. (예 : angle_unit = 'degree')
+            - return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+
+
+    Returns:
+        any: 변환한 값을 반환합니다.
+    """
+    if kwargs.get('angle_unit') == 'degree':
+        x = math.radians(x)
+
+    return x
+
+
+def as_columns(*args: any) -> list:
+    """
+    배치 연산에 쓰일 입력들을 numpy 배열(열, column) 리스트로 변환합니다.
+    입력이 2차원 배열 하나라면 각 열(arr[:, k])을 피연산자 하나로 취급합니다.
+    그 외에는 입력 하나하나를 피연산자 열로 취급하며, 길이가 같거나 브로드캐스트 가능한 배열이어야 합니다.
+
+    Args:
+        *args (any): numpy 배열, 리스트, 튜플 또는 스칼라를 가변 인자로 받습니다.
+
+    Returns:
+        list: numpy 배열로 변환된 열들의 리스트를 반환합니다.
+    """
+    import numpy as np  # 배치 연산에서만 numpy를 불러옴
+
+    if len(args) == 1:
+        table = np.asarray(args[0])
+        if table.ndim == 2:
+            return [table[:, k] for k in range(table.shape[1])]
+    return [np.asarray(arg) for arg in args]
+
+
+def reduce_columns(ufunc: any, columns: list, dtype: any = None) -> any:
+    """
+    열들을 ufunc로 왼쪽부터 차례대로 누적 연산합니다. add 이면 열들의 합, multiply 이면 곱이 됩니다.
+    결과 배열을 한번만 만들고 out= 으로 그 배열에 계속 덮어써서 중간 배열을 만들지 않습니다.
+
+    Args:
+        ufunc (numpy.ufunc): np.add, np.subtract, np.multiply, np.true_divide 같은 이항 ufunc를 받습니다.
+        columns (list): as_columns로 변환한 열들의 리스트를 받습니다.
+        dtype (any): 결과 배열의 자료형을 지정합니다. 지정하면 계산도 이 자료형으로 합니다. (기본값: None, 입력 자료형에서 결정)
+
+    Returns:
+        numpy.ndarray: 누적 연산 결과 배열을 반환합니다.
+    """
+    import numpy as np  # 배치 연산에서만 numpy를 불러옴
+
+    loop = dtype  # ufunc 계산 자료형 (None 이면 입력 자료형에서 결정)
+    if dtype is None:
+        dtype = np.result_type(*columns)
+    shape = np.broadcast_shapes(*(column.shape for column in columns))
+    result = np.empty(shape, dtype=dtype)
+    result[...] = columns[0]
+    for column in columns[1:]:
+        ufunc(result, column, out=result, dtype=loop)
+    return result
+
+
+def round_array(values: any, precision: int) -> any:
+    """
+    round_result의 배열 버전입니다. precision 값이 있으면 배열 전체를 한번에 반올림합니다.
+    문자열로 바꾸지 않기 때문에 결과는 숫자 배열 그대로입니다.
+
+    Args:
+        values (numpy.ndarray): 소수점 자릿수를 바꿀 배열을 받습니다.
+        precision (int): 소수점 자릿수를 지정합니다. (기본값: 0)
+
+    Returns:
+        numpy.ndarray: 반올림한 배열을 반환합니다.
+    """
+    import numpy as np  # 배치 연산에서만 numpy를 불러옴
+
+    if precision:
+        values = np.round(values, precision)
+    return values
+
+
+def fl_array(values: any, return_float: bool) -> any:
+    """
+    fl의 배열 버전입니다. return_float = True 이면 배열을 부동소수점 배열로 변환합니다.
+    이미 실수 배열이면 그대로 두므로 dtype='float32' 로 계산한 배열은 float32 그대로입니다.
+
+    Args:
+        values (numpy.ndarray): 변환할 배열을 받습니다.
+        return_float (bool): 결과를 실수형으로 반환할지 여부를 지정합니다. (기본값: False)
+
+    Returns:
+        numpy.ndarray: 변환한 배열을 반환합니다.
+    """
+    if return_float and values.dtype.kind != 'f':
+        values = values.astype(float)
+    return values
+
+
+def convert_to_radians_array(x: any, **kwargs: dict[str, any]) -> any:
+    """
+    convert_to_radians의 배열 버전입니다. angle_unit = 'degree' 이면 배열 전체를 한번에 라디안으로 변환합니다.
+    angle_unit 확인은 배열 하나당 한번만 합니다.
+
+    Args:
+        x (any): 각도 배열 또는 시퀀스를 받습니다.
+        **kwargs (dict[str, any]): 연산 조건을 지정하는 키워드 인자를 받습니다.
+            - angle_unit (str): 'degree' 이면 입력을 각도에서 라디안으로 변환합니다. (예 : angle_unit = 'degree')
+            - dtype (any): 배열의 실수 자료형을 지정합니다. (기본값: float)
+
+    Returns:
+        numpy.ndarray: 라디안으로 변환한 실수형 배열을 반환합니다.
+    """
+    import numpy as np  # 배치 연산에서만 numpy를 불러옴
+
+    x = np.asarray(x, dtype=kwargs.get('dtype', float))
+    if kwargs.get('angle_unit') == 'degree':
+        x = np.radians(x)
+    return x
+
+
+class BatchResult(namedtuple('BatchResult', ['values', 'valid'])):
+    """
+    공학용 배치 매서드의 결과를 담는 자료형입니다.
+
+    정의역 오류(음수의 제곱근, 0 이하의 로그 등)는 예외를 발생시키지 않고 valid 마스크로 알려줍니다.
+    오류가 난 위치의 values 값은 nan 입니다.
+
+    Attributes:
+        values (numpy.ndarray): 연산 결과 배열입니다.
+        valid (numpy.ndarray): 연산이 정상적으로 된 위치는 True, 정의역 오류가 난 위치는 False 인 부울 배열입니다.
+    """
+    __slots__ = ()
+
+
+ERROR_POLICIES = ('raise', 'nan', 'mask', 'skip')  # error_policy 로 쓸 수 있는 값
+ERROR_KINDS = ('divide_by_zero', 'invalid', 'overflow')  # 오류 종류 (IEEE 754 의 예외 플래그 이름)
+
+# 오류 종류 -> error_policy='raise' 일 때 발생시키는 예외 (math 모듈과 같은 예외, 같은 메시지)
+_MATH_ERRORS = {'divide_by_zero': (ValueError, "math domain error"), 'invalid': (ValueError, "math domain error"),
+                'overflow': (OverflowError, "math range error")}
+
+
+class CheckedResult(namedtuple('CheckedResult', ['values', 'valid', 'errors'])):
+    """
+    error_policy 를 지정한 배치 매서드의 결과를 담는 자료형입니다.
+
+    오류 종류는 IEEE 754 의 예외 플래그를 따릅니다.
+        - divide_by_zero : 0으로 나누기, 0의 로그, 0의 음수 거듭제곱처럼 결과가 무한대인 경우
+        - invalid : 0/0, 음수의 제곱근, 음수의 로그, 무한대의 삼각함수처럼 결과가 정의되지 않는 경우
+        - overflow : 결과가 실수 범위를 넘는 경우
+
+    Attributes:
+        values (numpy.ndarray): 연산 결과 배열입니다. error_policy 에 따라 오류 위치가 다릅니다.
+            - 'nan', 'raise' : 입력과 같은 모양이며 오류 위치는 nan 입니다.
+            - 'mask' : 오류 위치를 가린 numpy.ma.MaskedArray 입니다. (mean, sum 등이 오류 위치를 빼고 계산함)
+            - 'skip' : 오류 위치를 뺀 1차원 배열입니다. valid 로 원래 위치를 찾을 수 있습니다.
+        valid (numpy.ndarray): 입력과 같은 모양의 부울 배열로, 정상적으로 계산된 위치가 True 입니다.
+        errors (dict): 오류 종류 -> 개수 입니다. 오류가 없는 종류는 들어있지 않습니다.
+
+    Examples:
+        >>> EngineeringCalculator().log_batch([100, 0, -1], error_policy='skip')
+        CheckedResult(values=array([2.]), valid=array([ True, False, False]), errors={'divide_by_zero': 1, 'invalid': 1})
+    """
+    __slots__ = ()
+
+
+def check_array(values: any, flags: dict, options: 'Options', error: tuple = None) -> CheckedResult:
+    """
+    배치 매서드의 결과에 error_policy 를 적용하고 소수점 자릿수, 실수형 변환을 적용합니다.
+    오류는 배치 매서드가 만든 오류 종류별 마스크로만 세므로 원소마다 예외를 발생시키거나 잡지 않습니다.
+
+    Args:
+        values (numpy.ndarray): 연산 결과 배열을 받습니다. 'nan' 은 이 배열의 오류 위치를 바로 nan 으로 바꿉니다.
+        flags (dict): 오류 종류 -> 그 오류가 난 위치가 True 인 부울 배열을 받습니다.
+        options (Options): error_policy, precision, return_float 를 받습니다.
+        error (tuple): error_policy='raise' 에서 발생시킬 (예외 클래스, 메시지)를 받습니다.
+            (기본값: None, 오류 종류에 맞는 math 모듈의 예외)
+
+    Returns:
+        CheckedResult: 결과 배열, 유효성 마스크, 오류 종류별 개수를 반환합니다.
+
+    Raises:
+        ValueError, OverflowError, ZeroDivisionError: error_policy='raise' 이고 오류가 난 위치가 있는 경우 발생합니다.
+    """
+    import numpy as np  # 배치 연산에서만 numpy를 불러옴
+
+    errors = {}
+    invalid = None
+    for kind in ERROR_KINDS:
+        mask = flags.get(kind)
+        if mask is None:
+            continue
+        count = int(np.count_nonzero(mask))
+        if count:
+            errors[kind] = count
+            invalid = mask if invalid is None else invalid | mask
+
+    if invalid is None:
+        valid = np.ones(np.shape(values), dtype=bool)
+    else:
+        if options.error_policy == 'raise':
+            kind = next(iter(errors))
+            exception, message = error or _MATH_ERRORS[kind]
+            first = int(np.flatnonzero(flags[kind])[0])
+            raise exception(f"{message} ({kind} {errors[kind]}개, 첫 위치 {first})")
+        valid = ~invalid
+
+    policy = options.error_policy
+    if policy == 'mask':
+        values = np.ma.MaskedArray(values, mask=~valid)
+    elif policy == 'skip':
+        values = values[valid]
+    elif invalid is not None:
+        values[invalid] = np.nan  # 오류 위치는 nan으로 표시
+    values = round_array(values=values, precision=options.precision)  # 소수점 자릿수 맞춤
+    values = fl_array(values=values, return_float=options.return_float)  # 결과를 실수형으로 반환할지 지정
+
+    return CheckedResult(values=values, valid=valid, errors=errors)
+
+
+DTYPES = ('float32', 'float64', 'complex64', 'complex128')  # dtype 으로 쓸 수 있는 값
+_SINGLE_DTYPES = frozenset({'float32', 'complex64'})  # 단정밀도
+
+
+def compute_dtype(options: 'Options', default: any = float, complex_: bool = False) -> any:
+    """
+    배치 매서드가 계산하고 결과를 저장할 numpy 자료형을 반환합니다.
+    dtype 연산 조건은 정밀도를 고르는 값으로, 'float32' 와 'complex64' 는 단정밀도, 'float64' 와 'complex128' 은 배정밀도입니다.
+    실수를 계산하는 곳에는 실수 자료형을, 복소수를 계산하는 곳에는 같은 정밀도의 복소수 자료형을 반환합니다.
+
+    Args:
+        options (Options): dtype 을 받습니다.
+        default (any): dtype 이 None 일 때 반환할 자료형을 받습니다. (기본값: float, 기존 동작)
+        complex_ (bool): True 이면 복소수 자료형을 반환합니다. (기본값: False)
+
+    Returns:
+        any: numpy 자료형을 반환합니다. (예 : numpy.float32)
+
+    Examples:
+        >>> compute_dtype(Options(dtype='complex64'))
+        <class 'numpy.float32'>
+        >>> compute_dtype(Options(dtype='float32'), complex_=True)
+        <class 'numpy.complex64'>
+    """
+    if options.dtype is None:
+        return default
+    import numpy as np  # 배치 연산에서만 numpy를 불러옴
+
+    if options.dtype in _SINGLE_DTYPES:
+        return np.complex64 if complex_ else np.float32
+    return np.complex128 if complex_ else np.float64
+
+
+MIN_MAX_ERROR = 1e-9  # max_error 의 하한 (표 크기 약 10 만 칸)
+MAX_MAX_ERROR = 0.1  # max_error 의 상한
+
+
+class Options:
+    """
+    연산 조건(precision, return_float, angle_unit, coordinate, max_error, error_policy, dtype)을 담는 변경 불가능한 객체입니다.
+
+    만들 때 한번만 값을 검사하고, 이후에는 값을 바꿀 수 없습니다. (바꾸려면 replace 매서드로 새 객체를 만듭니다.)
+    계산기를 만들 때 Calculator(options=Options(...)) 로 묶어두거나, 매서드를 부를 때 options=Options(...) 로 넘길 수 있습니다.
+
+    Attributes:
+        precision (int): 소수점 자릿수입니다. 0 이면 반올림하지 않습니다. (기본값: 0)
+        return_float (bool): 결과를 실수형으로 반환할지 여부입니다. (기본값: False)
+        angle_unit (str): 각도 단위입니다. 'radian' 또는 'degree' 입니다. (기본값: 'radian')
+        coordinate (str): 좌표계 변환 방향입니다. None, 'cartesian' 또는 'polar' 입니다. (기본값: None)
+        max_error (float): 삼각함수 배치 매서드(sin_batch, cos_batch, tan_batch)의 최대 절대 오차입니다.
+            None 이면 정확한 값을 계산하고, 값을 주면 미리 계산해둔 표로 빠르게 계산합니다. (기본값: None)
+        error_policy (str): 0나누기, 정의역 오류, 오버플로를 처리하는 방법입니다. (기본값: None, 기존 동작)
+            None 이면 기존과 같이 divide, complex_divide 는 오류를 출력하고 None 을 반환하고, 공학용 매서드는 예외를 발생시키며,
+            배치 매서드는 BatchResult(공학용) 또는 inf, nan 이 든 배열(divide_batch)을 반환합니다.
+            값을 주면 오류를 출력하지 않고, 배치 매서드는 CheckedResult 를 반환합니다.
+                - 'raise' : 예외를 발생시킵니다. 배치 매서드는 오류가 하나라도 있으면 예외를 발생시킵니다.
+                - 'nan' : 오류 위치의 값을 nan 으로 채웁니다.
+                - 'mask' : 스칼라 매서드는 nan 을, 배치 매서드는 오류 위치를 가린 numpy.ma.MaskedArray 를 반환합니다.
+                - 'skip' : 스칼라 매서드는 None 을, 배치 매서드는 오류 위치를 뺀 배열을 반환합니다.
+        dtype (str): 배치 매서드가 계산하고 결과를 저장하는 자료형입니다. (기본값: None, 실수는 float64, 복소수는 complex128)
+            'float32', 'complex64' 는 단정밀도로, 메모리와 메모리 대역폭을 절반만 씁니다. 스칼라 매서드는 항상 파이썬 float 로 계산합니다.
+            정밀도별 오차는 README 의 'dtype 별 정확도' 표를 참고하세요. (benchmark/bench_dtype.py 로 측정)
+            numpy 의 dtype 객체(numpy.float32 등)를 넘기면 이름으로 바꿔 저장합니다.
+
+    Raises:
+        TypeError: 알 수 없는 연산 조건이거나 자료형이 맞지 않는 경우 발생합니다.
+        ValueError: 연산 조건의 값이 허용 범위를 벗어난 경우 발생합니다.
+
+    Examples:
+        >>> options = Options(precision=4, angle_unit='degree')
+        >>> options.precision
+        4
+        >>> options.replace(precision=2)
+        Options(precision=2, return_float=False, angle_unit='degree', coordinate=None, max_error=None, error_policy=None, dtype=None)
+    """
+
+    __slots__ = ('precision', 'return_float', 'angle_unit', 'coordinate', 'max_error', 'error_policy', 'dtype',
+                 '_key', '_hash')
+    _FIELDS = ('precision', 'return_float', 'angle_unit', 'coordinate', 'max_error', 'error_policy', 'dtype')
+
+    def __init__(self, precision: int = 0, return_float: bool = False, angle_unit: str = 'radian',
+                 coordinate: str = None, max_error: float = None, error_policy: str = None, dtype: str = None):
+        # precision 검사. None 은 반올림하지 않음(0)으로 취급
+        if precision is None:
+            precision = 0
+        if not isinstance(precision, int) or isinstance(precision, bool):
+            raise TypeError(f"precision 은 정수여야 합니다: {precision!r}")
+        if precision < 0:
+            raise ValueError(f"precision 은 0 이상이어야 합니다: {precision!r}")
+        # return_float 검사
+        if not isinstance(return_float, bool):
+            raise TypeError(f"return_float 는 True 또는 False 여야 합니다: {return_float!r}")
+        # angle_unit, coordinate 검사
+        if angle_unit not in ('radian', 'degree'):
+            raise ValueError(f"angle_unit 은 'radian' 또는 'degree' 여야 합니다: {angle_unit!r}")
+        if coordinate not in (None, 'cartesian', 'polar'):
+            raise ValueError(f"coordinate 는 'cartesian' 또는 'polar' 여야 합니다: {coordinate!r}")
+        # max_error 검사. 너무 작으면 표가 커지고, 너무 크면 오차 한계를 보장할 수 없음
+        if max_error is not None:
+            if not isinstance(max_error, (int, float)) or isinstance(max_error, bool):
+                raise TypeError(f"max_error 는 실수여야 합니다: {max_error!r}")
+            if not MIN_MAX_ERROR <= max_error <= MAX_MAX_ERROR:
+                raise ValueError(f"max_error 는 {MIN_MAX_ERROR} 이상 {MAX_MAX_ERROR} 이하여야 합니다: {max_error!r}")
+            max_error = float(max_error)
+        # error_policy 검사
+        if error_policy is not None and error_policy not in ERROR_POLICIES:
+            raise ValueError(f"error_policy 는 {ERROR_POLICIES} 중 하나여야 합니다: {error_policy!r}")
+        # dtype 검사. numpy 를 불러오지 않도록 numpy.float32, numpy.dtype('float32') 는 이름으로 바꿈
+        if dtype is not None:
+            dtype = getattr(dtype, 'name', None) or getattr(dtype, '__name__', dtype)
+            if dtype not in DTYPES:
+                raise ValueError(f"dtype 은 {DTYPES} 중 하나여야 합니다: {dtype!r}")
+
+        object.__setattr__(self, 'precision', precision)
+        object.__setattr__(self, 'return_float', return_float)
+        object.__setattr__(self, 'angle_unit', angle_unit)
+        object.__setattr__(self, 'coordinate', coordinate)
+        object.__setattr__(self, 'max_error', max_error)
+        object.__setattr__(self, 'error_policy', error_policy)
+        object.__setattr__(self, 'dtype', dtype)
+        # 비교, 해시에 쓰는 키와 해시값은 만들 때 한번만 계산
+        key = (precision, return_float, angle_unit, coordinate, max_error, error_policy, dtype)
+        object.__setattr__(self, '_key', key)
+        object.__setattr__(self, '_hash', hash(key))
+
+    def __setattr__(self, key: str, value: any):
+        raise AttributeError("Options 는 값을 바꿀 수 없습니다. replace 매서드를 사용하세요.")
+
+    def __delattr__(self, key: str):
+        raise AttributeError("Options 는 값을 지울 수 없습니다.")
+
+    def key(self) -> tuple:
+        """연산 조건들을 튜플로 반환합니다. 비교, 해시, 캐시 키로 사용합니다."""
+        return self._key
+
+    def replace(self, **changes: dict[str, any]) -> 'Options':
+        """
+        일부 연산 조건만 바꾼 새 Options 객체를 반환합니다.
+
+        Args:
+            **changes (dict[str, any]): 바꿀 연산 조건들을 키워드 인자로 받습니다.
+
+        Returns:
+            Options: 새 Options 객체를 반환합니다.
+        """
+        values = dict(zip(self._FIELDS, self._key))
+        for name in changes:
+            if name not in values:
+                raise TypeError(f"알 수 없는 연산 조건입니다: {name!r}")
+        values.update(changes)
+        return Options(**values)
+
+    def __eq__(self, other: any) -> bool:
+        if not isinstance(other, Options):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> tuple:
+        # 값을 바꿀 수 없는 객체라 pickle 할 때 생성자로 다시 만듦 (멀티프로세스 전달용)
+        return (Options, self.key())
+
+    def __repr__(self) -> str:
+        return (f"Options(precision={self.precision!r}, return_float={self.return_float!r}, "
+                f"angle_unit={self.angle_unit!r}, coordinate={self.coordinate!r}, max_error={self.max_error!r}, "
+                f"error_policy={self.error_policy!r}, dtype={self.dtype!r})")
+
+
+DEFAULT_OPTIONS = Options()  # 아무 연산 조건도 없을 때 쓰는 기본값
+
+_OPTIONS_CACHE = OrderedDict()  # (기준 Options 의 키, 키워드 인자들) -> 검사가 끝난 Options (최근에 쓴 순서)
+_OPTIONS_CACHE_SIZE = 1024  # 캐시가 끝없이 커지지 않도록 최대 크기 지정 (넘치면 가장 오래 쓰지 않은 조합부터 지움)
+
+
+def resolve_options(options: Options, kwargs: dict[str, any]) -> Options:
+    """
+    계산기에 묶인 Options 와 매서드 호출 때 들어온 키워드 인자를 합친 Options 를 반환합니다.
+
+    키워드 인자가 없으면 묶인 Options 를 그대로 반환하므로 검사 비용이 없습니다.
+    options=Options(...) 키워드가 있으면 그 Options 를 기준으로 사용합니다.
+    그 외의 키워드 인자 조합은 처음 한번만 검사하고 캐시해둡니다. (값이 같아도 자료형이 다르면 따로 검사합니다.)
+    캐시가 가득 차면 가장 오랫동안 쓰지 않은 조합부터 지우므로(LRU) 자주 쓰는 조합은 계속 캐시에 남습니다.
+
+    Args:
+        options (Options): 계산기에 묶인 기본 Options 를 받습니다.
+        kwargs (dict[str, any]): 매서드 호출 때 들어온 키워드 인자를 받습니다.
+            - options (Options): 이번 호출에만 쓸 Options 입니다.
+            - precision, return_float, angle_unit, coordinate, max_error, error_policy, dtype: Options 의 값을 덮어씁니다.
+
+    Returns:
+        Options: 이번 호출에 사용할 Options 를 반환합니다.
+
+    Raises:
+        TypeError: 알 수 없는 키워드 인자이거나 연산 조건의 자료형이 맞지 않는 경우 발생합니다. (예 : precision=2.0, return_float=1)
+        ValueError: 연산 조건의 값이 허용 범위를 벗어난 경우 발생합니다. (예 : angle_unit='deg')
+    """
+    if not kwargs:
+        return options  # 키워드 인자가 없으면 묶인 Options 그대로 사용
+
+    per_call = kwargs.get('options')
+    if per_call is not None:
+        if len(kwargs) == 1:
+            return per_call
+        options = per_call
+
+    # 2 와 2.0, 1 과 True 는 같은 키가 되므로 값의 자료형도 키에 넣음 (검사 결과가 자료형에 따라 다름)
+    cache_key = (options._key, *kwargs.items(), *map(type, kwargs.values()))
+    try:
+        resolved = _OPTIONS_CACHE[cache_key]
+        _OPTIONS_CACHE.move_to_end(cache_key)  # 최근에 쓴 조합으로 표시
+        return resolved
+    except KeyError:  # 캐시에 없거나 다른 스레드가 방금 지운 조합
+        pass
+    except TypeError:  # 해시할 수 없는 값이 들어오면 캐시하지 않음
+        cache_key = None
+
+    changes = {key: value for key, value in kwargs.items() if key != 'options'}
+    resolved = options.replace(**changes)
+
+    if cache_key is not None:
+        _OPTIONS_CACHE[cache_key] = resolved
+        if len(_OPTIONS_CACHE) > _OPTIONS_CACHE_SIZE:
+            try:
+                _OPTIONS_CACHE.popitem(last=False)  # 가장 오랫동안 쓰지 않은 조합 삭제
+            except KeyError:  # 다른 스레드가 먼저 지워서 비어있는 경우
+                pass
+    return resolved
@@ -7,8 +7,8 @@ setup(
     author='kimgwangjae98',
     author_email='gimgwangjae@gmail.com',
     url='https://github.com/kimgwangjae98/calculator',
-    install_requires=[],
-    packages=find_packages(exclude=[]),
+    install_requires=['numpy>=1.26'],
+    packages=find_packages(exclude=['test', 'benchmark']),
     keywords=['kimgawngjae_test_calu'],
     python_requires='>=3.11',
     package_data={},
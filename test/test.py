@@ -4,20 +4,9 @@ editor : Kim Gwang=Jae
 date : 2024-10-1
 
 이 파이썬 파일은 테스트용 파일입니다. basic,engineering,complex.py 파일들의 클래스들을 테스트하는 파일입니다.
+실행하기 전에 리포지토리 최상위 디렉토리에서 pip install -e . 로 calculator 패키지를 설치해주세요.
 """
-import os
-import sys
-sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
-# 상위 디렉토리 
-'''
-os.path.dirname(__file__) : 이는 현재 수행중인 코드를 담고 있는 파일의 위치한 Path를 알려준다.
-os.path.abspath() : 절대경로를 구해준다.
-sys.path.append() : 해당 경로에 있는 파이썬 파일을 import 할 수 있게 해준다.
-'''
-
-from basic import Calculator
-from engineering import EngineeringCalculator
-from complex import ComplexCalculator
+from calculator import Calculator, EngineeringCalculator, ComplexCalculator
 
 if __name__ == '__main__':
     # 클래스 테스트용 코드
@@ -27,6 +16,11 @@ if __name__ == '__main__':
     print(calc.subtract(10, 2, 3, return_float=True))  # 출력: 5.0
     print(calc.multiply(2, 3, 4))  # 출력: 24
     print(calc.divide(100, 2, precision=3))  # 출력: 50.000
+    print(calc.add_batch([1, 2], [3, 4], [5, 6]))  # 출력: [ 9 12]
+    print(calc.add_iter(x for x in range(1, 101)))  # 출력: 5050
+    print(calc.multiply_accumulator().feed([2, 3]).feed([4]).result())  # 출력: 24
+    print(calc.statistics([2, 4, 4, 4, 5, 5, 7, 9], precision=2).stddev)  # 출력: 2.00
+    print(calc.divide_batch([100, 90], [2, 3], precision=3))  # 출력: [50. 30.]
 
     print("\nEngineering Calculator Demo:")
     eng_calc = EngineeringCalculator()
@@ -34,6 +28,11 @@ if __name__ == '__main__':
     print(eng_calc.square_root(16, precision=3))  # 출력: 4.000
     print(eng_calc.log(100, precision=4))  # 출력: 2.0000
     print(eng_calc.sin(30, angle_unit='degree', precision=4))  # 출력: 0.5000
+    print(eng_calc.square_root(eng_calc.add(1, 3, precision=2), precision=3))  # 출력: 2.000
+    print(eng_calc.evaluate("sin(30 deg) + sqrt(x) * log(y)", {'x': 16, 'y': 100}))  # 출력: 8.5
+    print(eng_calc.sin_batch([30, 90], angle_unit='degree', precision=4).values)  # 출력: [0.5 1. ]
+    print(eng_calc.pipeline().sin(angle_unit='degree').power(2).round(4)([30, 90]).values)  # 출력: [0.25 1.  ]
+    print(eng_calc.square_root_batch([16, -1]).valid)  # 출력: [ True False]
 
     eng_calc.divide(5, 0) # 에러처리 확인용 코드
     
@@ -48,5 +47,6 @@ if __name__ == '__main__':
     print(comp_calc.complex_argument(1 + 1j, precision = 3))  # 출력:0.785 
     print(comp_calc.cartesian_to_polar(1+1j, coordinate ='cartesian', precision = 3))  # 출력: [1.414, 0.785]
     print(comp_calc.cartesian_to_polar(1,0, coordinate ='polar'))  # 출력:0.785 
+    print(comp_calc.cartesian_to_polar_batch([1 + 1j, 2], coordinate='cartesian', precision=3))  # 출력: PolarArrays(magnitude=array([1.414, 2.   ]), angle=array([0.785, 0.   ]))
     
     comp_calc.divide(5, 0) # 에러처리 확인용 코드
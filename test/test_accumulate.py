@@ -0,0 +1,48 @@
+"""
+
+스트림 덧셈, 곱셈(add_iter, multiply_iter)과 누적기(accumulate.py)를 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import math
+import pickle
+
+from calculator import Calculator
+
+calc = Calculator()
+
+
+def test_iter_methods_match_variadic_methods():
+    values = [3, 1.5, 2, 7, 0.25]
+    assert calc.add_iter(iter(values)) == calc.add(*values)
+    assert calc.multiply_iter(x for x in values) == calc.multiply(*values)
+    assert str(calc.add_iter(range(1, 4), precision=2)) == '6.00'
+    assert calc.multiply_iter(range(1, 5), return_float=True) == 24.0
+    assert calc.multiply_iter(range(1, 301)) == math.factorial(300)  # 큰 정수도 정확히 곱함
+
+
+def test_iter_methods_on_empty_and_nan_input():
+    assert calc.add_iter(iter([])) == 0
+    assert calc.multiply_iter(iter([])) == 1
+    assert math.isnan(calc.add_iter([1, math.nan]))
+    assert math.isnan(calc.multiply_iter([5, 0, math.inf]))  # 0 * inf 는 nan
+
+
+def test_accumulators_feed_and_merge():
+    left = calc.add_accumulator(precision=2).feed([1, 2]).feed(x for x in (3,))
+    right = calc.add_accumulator().feed(range(4, 6))
+    assert str(left.merge(right).result()) == '15.00'
+    assert repr(right) == 'SumAccumulator(total=9)'
+
+    product = calc.multiply_accumulator(return_float=True).feed([2, 3])
+    assert product.merge(calc.multiply_accumulator().feed([4])).result() == 24.0
+    assert calc.multiply_accumulator().result() == 1 and calc.add_accumulator().result() == 0
+
+
+def test_chunked_and_merged_results_match_single_pass():
+    values = list(range(1, 200))
+    single = calc.multiply_iter(values)
+    workers = [calc.multiply_accumulator().feed(values[start:start + 37]) for start in range(0, len(values), 37)]
+    total = calc.multiply_accumulator()
+    for worker in workers:
+        total.merge(pickle.loads(pickle.dumps(worker)))  # 작업 프로세스에서 돌려받은 누적기처럼
+    assert total.result() == single
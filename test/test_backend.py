@@ -0,0 +1,81 @@
+"""
+
+실행 계층(EngineeringCalculator.execute, backend.py)을 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import json
+
+import numpy as np
+import pytest
+
+from calculator import ComplexCalculator, EngineeringCalculator, backend
+
+
+@pytest.fixture
+def calibration(tmp_path, monkeypatch):
+    path = tmp_path / 'calibration.json'
+    monkeypatch.setenv('CALCULATOR_CALIBRATION', str(path))
+    monkeypatch.setattr(backend, '_planner', None)
+    return path
+
+
+def test_execute_uses_defaults_without_calibrating(calibration, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("execute 가 보정을 하면 안 됨")
+
+    monkeypatch.setattr(backend.Planner, 'calibrate', fail)
+    eng_calc = EngineeringCalculator()
+    assert eng_calc.execute('sin', [30, 90], angle_unit='degree').values.tolist() == pytest.approx([0.5, 1.0])
+    assert eng_calc.last_backend == 'scalar'
+    eng_calc.execute('sin', list(range(backend.DEFAULT_SCALAR_MAX + 1)))
+    assert eng_calc.last_backend == 'vector'
+    ComplexCalculator().execute('complex_magnitude', [3 + 4j])
+    assert not calibration.exists()
+
+
+def test_backends_give_the_same_result(calibration):
+    eng_calc = EngineeringCalculator()
+    values = [0.5 * i for i in range(10)]
+    results = [eng_calc.execute('sqrt', values, backend=name, precision=3).values.tolist() for name in backend.BACKENDS]
+    assert results[0] == results[1] == results[2]
+
+
+def test_scalar_falls_back_to_vector(calibration):
+    eng_calc = EngineeringCalculator()
+    assert eng_calc.execute('divide', [1, 2], [0, 1], backend='scalar').tolist() == [np.inf, 2.0]
+    assert eng_calc.last_backend == 'vector'
+    eng_calc.execute('multiply', [2 ** 40], [2 ** 40], backend='scalar')
+    assert eng_calc.last_backend == 'vector'
+
+
+def test_invalid_backend_and_operation(calibration):
+    eng_calc = EngineeringCalculator()
+    with pytest.raises(ValueError):
+        eng_calc.execute('sin', [1], backend='gpu')
+    with pytest.raises(ValueError):
+        eng_calc.execute('bogus', [1])
+
+
+def test_calibrate_writes_file_and_is_read_back(calibration):
+    thresholds = backend.calibrate(['add'])
+    assert set(thresholds) == {'add'} and thresholds['add']['scalar_max'] <= backend.MAX_SCALAR_SIZE
+    assert json.loads(calibration.read_text(encoding='utf-8'))['thresholds'] == thresholds
+    planner = backend.Planner(str(calibration))
+    assert planner.thresholds == thresholds
+    assert planner.choose(EngineeringCalculator(), 'add', thresholds['add']['scalar_max']) == 'scalar'
+
+
+def test_saved_thresholds_from_other_environment_are_ignored(calibration):
+    calibration.write_text(json.dumps({'environment': {'python': '0.0'},
+                                       'thresholds': {'sin': {'scalar_max': 100, 'process_min': None}}}))
+    planner = backend.Planner(str(calibration))
+    assert planner.thresholds == {}
+    assert planner.choose(EngineeringCalculator(), 'sin', 50) == 'vector'
+
+
+def test_main_prints_defaults_and_calibrates(calibration, capsys):
+    assert backend.main(['sin']) == 0
+    assert '"default": true' in capsys.readouterr().out
+    assert not calibration.exists()
+    assert backend.main(['--calibrate', 'sin']) == 0
+    assert calibration.exists() and '"default"' not in capsys.readouterr().out
@@ -0,0 +1,75 @@
+"""
+
+Calculator 의 사칙연산 배치 매서드(add_batch, subtract_batch, multiply_batch, divide_batch)를 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import math
+
+import numpy as np
+import pytest
+
+from calculator import Calculator
+
+calc = Calculator()
+rng = np.random.default_rng(7)
+INTEGERS = [rng.integers(-1000, 1000, 50) for _ in range(3)]
+FLOATS = [rng.uniform(-100, 100, 50) for _ in range(3)]
+
+
+@pytest.mark.parametrize('name', ['add', 'subtract', 'multiply'])
+def test_integer_batch_matches_scalar(name):
+    result = getattr(calc, name + '_batch')(*INTEGERS)
+    assert np.issubdtype(result.dtype, np.integer)
+    expected = [getattr(calc, name)(*(int(column[i]) for column in INTEGERS)) for i in range(50)]
+    assert result.tolist() == expected
+
+
+@pytest.mark.parametrize('name', ['add', 'subtract', 'multiply', 'divide'])
+def test_float_batch_matches_scalar(name):
+    result = getattr(calc, name + '_batch')(*FLOATS)
+    expected = [getattr(calc, name)(*(float(column[i]) for column in FLOATS)) for i in range(50)]
+    assert np.allclose(result, expected, rtol=1e-13, atol=0)
+
+
+def test_divide_batch_matches_scalar_on_integers():
+    divisors = [np.where(column == 0, 1, column) for column in INTEGERS[1:]]
+    result = calc.divide_batch(INTEGERS[0], *divisors)
+    assert result.dtype == np.float64
+    expected = [calc.divide(int(INTEGERS[0][i]), *(int(column[i]) for column in divisors)) for i in range(50)]
+    assert np.allclose(result, expected, rtol=1e-15, atol=0)
+
+
+def test_precision_and_return_float():
+    assert calc.divide_batch([1, 2], [3, 3], precision=2).tolist() == [0.33, 0.67]
+    assert calc.subtract_batch([10.125, 5], [0.1, 1], precision=1).tolist() == [10.0, 4.0]
+    assert calc.add_batch([1, 2], [3, 4], return_float=True).dtype == np.float64
+    assert calc.add_batch([1, 2], [3, 4]).dtype.kind == 'i'
+    assert calc.multiply_batch([1.5, 2], [2, 2], return_float=True).tolist() == [3.0, 4.0]
+
+
+def test_two_dimensional_table_uses_columns():
+    table = np.array([[10, 1, 2], [20, 3, 4], [30, 5, 6]])
+    assert calc.add_batch(table).tolist() == [13, 27, 41]
+    assert calc.subtract_batch(table).tolist() == [7, 13, 19]
+    assert calc.multiply_batch(table).tolist() == [20, 240, 900]
+    assert calc.divide_batch(table).tolist() == [5.0, 20 / 12, 1.0]
+
+
+def test_broadcasting():
+    assert calc.add_batch([1, 2, 3], 10).tolist() == [11, 12, 13]
+    assert calc.subtract_batch(100, [1, 2], [3, 4]).tolist() == [96, 94]
+    grid = calc.multiply_batch(np.arange(3).reshape(3, 1), np.arange(4))
+    assert grid.shape == (3, 4) and grid.tolist() == np.outer(np.arange(3), np.arange(4)).tolist()
+    with pytest.raises(ValueError):
+        calc.add_batch([1, 2], [1, 2, 3])
+
+
+def test_divide_batch_by_zero_gives_inf_and_nan(capsys):
+    result = calc.divide_batch([1, -1, 0, 4], [0, 0, 0, 2])
+    assert result[0] == math.inf and result[1] == -math.inf and math.isnan(result[2]) and result[3] == 2
+    assert capsys.readouterr().out == ''  # 배치 매서드는 오류를 출력하지 않음
+
+
+def test_empty_input():
+    for name in ('add', 'subtract', 'multiply', 'divide'):
+        assert getattr(calc, name + '_batch')([], []).shape == (0,)
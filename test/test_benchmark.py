@@ -0,0 +1,53 @@
+"""
+
+벤치마크 모음(benchmark/suite.py)을 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다. (저장소 최상위 폴더에서 실행해야 benchmark 를 불러올 수 있음)
+"""
+import io
+import json
+
+import pytest
+
+from benchmark import suite
+
+
+def _result(seconds: dict) -> dict:
+    return {'meta': {}, 'results': {name: {'seconds': value} for name, value in seconds.items()}}
+
+
+def test_every_public_method_is_measured():
+    assert suite.missing_methods() == []
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')  # multiply_scan 의 큰 입력은 inf 로 넘침
+def test_every_case_runs():
+    log = io.StringIO()
+    current = suite.run('', min_time=0, repeat=1, log=log)
+    names = [suite.case_name(case, option_set, size)
+             for case in suite.CASES for size in case.sizes for option_set in case.option_sets]
+    assert sorted(current['results']) == sorted(names)
+    assert all(result['seconds'] > 0 for result in current['results'].values())
+    assert 'Calculator.add[none+metrics]/1' in current['results']
+
+
+def test_compare_statuses():
+    baseline = _result({'a': 1.0, 'b': 1.0, 'c': 1.0, 'd': 1.0})
+    current = _result({'a': 1.1, 'b': 1.2, 'c': 0.5, 'e': 1.0})
+    assert suite.compare(baseline, current, threshold=0.15) == [
+        ('a', 1.0, 1.1, 1.1, 'ok'),
+        ('b', 1.0, 1.2, 1.2, 'REGRESSION'),
+        ('c', 1.0, 0.5, 0.5, 'faster'),
+        ('d', 1.0, None, None, 'missing'),
+        ('e', None, 1.0, None, 'new'),
+    ]
+
+
+def test_main_compare_exit_code(tmp_path, capsys):
+    paths = []
+    for name, seconds in (('baseline', 1.0), ('current', 2.0)):
+        path = tmp_path / f'{name}.json'
+        path.write_text(json.dumps(_result({'x': seconds})), encoding='utf-8')
+        paths.append(str(path))
+    assert suite.main(['--compare', paths[0], paths[1]]) == 1
+    assert suite.main(['--compare', paths[0], paths[0]]) == 0
+    assert '1 cases, 1 regressions' in capsys.readouterr().out
@@ -0,0 +1,89 @@
+"""
+
+연산 결과 캐시(enable_cache, cache.py)를 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import threading
+
+import pytest
+
+from calculator import ComplexCalculator, EngineeringCalculator
+from calculator.cache import MemoCache
+
+
+def test_cached_results_match_uncached():
+    plain = EngineeringCalculator()
+    eng_calc = EngineeringCalculator()
+    cache = eng_calc.enable_cache(maxsize=16)
+    for _ in range(2):
+        assert eng_calc.sin(30, angle_unit='degree', precision=4) == plain.sin(30, angle_unit='degree', precision=4)
+        assert eng_calc.power(2, 10) == plain.power(2, 10)
+    assert cache.stats()['hits'] == 2 and cache.stats()['misses'] == 2
+
+
+def test_cache_key_includes_argument_types():
+    calc = ComplexCalculator()
+    calc.enable_cache()
+    results = [calc.complex_magnitude(value) for value in (1, 1.0, True)]
+    expected = [ComplexCalculator().complex_magnitude(value) for value in (1, 1.0, True)]
+    assert [type(result) for result in results] == [type(result) for result in expected]
+
+
+def test_cache_key_includes_options():
+    eng_calc = EngineeringCalculator()
+    eng_calc.enable_cache()
+    assert str(eng_calc.sin(30, angle_unit='degree', precision=2)) == '0.50'
+    assert str(eng_calc.sin(30, angle_unit='degree', precision=3)) == '0.500'
+    assert eng_calc.sin(30) != eng_calc.sin(30, angle_unit='degree')
+
+
+def test_lru_eviction_and_overwrite_order():
+    cache = MemoCache(maxsize=2, policy='lru')
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.put('a', 3)  # 다시 저장한 키는 최근에 쓴 값
+    cache.put('c', 4)
+    assert cache.get('b') == (False, None)
+    assert cache.get('a') == (True, 3)
+    assert cache.stats()['evictions'] == 1
+
+    fifo = MemoCache(maxsize=2, policy='size')
+    fifo.put('a', 1)
+    fifo.put('b', 2)
+    fifo.get('a')
+    fifo.put('c', 3)
+    assert fifo.get('a') == (False, None)  # 'size' 는 조회 순서와 상관없이 먼저 저장된 값을 지움
+
+
+def test_errors_and_unhashable_inputs_are_not_cached():
+    eng_calc = EngineeringCalculator()
+    cache = eng_calc.enable_cache()
+    with pytest.raises(ValueError):
+        eng_calc.square_root(-1)
+    assert len(cache) == 0
+    total = MemoCache().wrap(eng_calc, 'sin', lambda values, **kwargs: sum(values))
+    assert total([1, 2]) == 3  # 리스트는 해시할 수 없으므로 캐시 없이 계산
+
+
+def test_invalid_cache_arguments():
+    with pytest.raises(ValueError):
+        MemoCache(maxsize=0)
+    with pytest.raises(ValueError):
+        MemoCache(policy='random')
+
+
+def test_cache_is_thread_safe():
+    eng_calc = EngineeringCalculator()
+    cache = eng_calc.enable_cache(maxsize=64)
+
+    def work():
+        for i in range(500):
+            eng_calc.square_root(i % 100)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = cache.stats()
+    assert stats['hits'] + stats['misses'] == 2000 and stats['size'] <= 64
@@ -0,0 +1,90 @@
+"""
+
+명령줄 프로그램(python -m calculator, cli.py)을 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import io
+
+import pytest
+
+from calculator import ComplexCalculator, cli
+
+
+def evaluate(lines: list) -> list:
+    return cli.evaluate_lines(ComplexCalculator(), lines)
+
+
+def test_parse_line():
+    assert cli.parse_line("sin 30 angle_unit=degree precision=4") == \
+        ('sin', (30,), (('angle_unit', 'degree'), ('precision', 4)))
+    assert cli.parse_line("sqrt 2.5") == ('square_root', (2.5,), ())
+    assert cli.parse_line("complex_add 1+1j 2") == ('complex_add', (1 + 1j, 2), ())
+    assert cli.parse_line("   ") is None and cli.parse_line("# 주석") is None
+    with pytest.raises(ValueError):
+        cli.parse_line("unknown 1")
+    with pytest.raises(ValueError):
+        cli.parse_line("add 1 x")
+
+
+def test_single_lines():
+    assert evaluate(["sin 30 angle_unit=degree precision=4", "add 1 2 3", "", "# c",
+                     "cartesian_to_polar 1+1j coordinate=cartesian precision=3", "bogus"]) == \
+        ['0.5000', '6', '', '', '[1.414, 0.785]', "error: 알 수 없는 연산입니다: 'bogus'"]
+
+
+def test_zero_division_and_domain_errors_are_reported_not_printed(capsys):
+    assert evaluate(["divide 1 0", "sqrt -1", "log 0"]) == \
+        ['error: division by zero', 'error: math domain error', 'error: math domain error']
+    assert capsys.readouterr().out == ''
+
+
+def test_batched_lines_match_single_lines():
+    lines = [f"divide {i} {i % 3}" for i in range(20)] + [f"sqrt {i - 5} precision=3" for i in range(20)] \
+        + [f"add {i} {2 ** 40}" for i in range(20)] + [f"sin {i * 15} angle_unit=degree" for i in range(20)]
+    single = [cli.evaluate_one(ComplexCalculator(), cli.parse_line(line)) for line in lines]
+    assert evaluate(lines) == single
+
+
+def test_batched_big_integers_fall_back_to_single_lines():
+    lines = [f"multiply {2 ** 40} {2 ** 40}"] * 10
+    assert evaluate(lines) == [str(2 ** 80)] * 10
+
+
+def test_bad_option_in_batch():
+    lines = ["sqrt 4 precision=-1"] * 10
+    assert all(line.startswith('error: ') for line in evaluate(lines))
+
+
+def test_stream_and_main(tmp_path):
+    sink = io.StringIO()
+    cli.stream(ComplexCalculator(), iter(["add 1 2", "sqrt 16"] * 3), sink, chunk_size=4)
+    assert sink.getvalue() == "3\n4.0\n" * 3
+
+    source = tmp_path / 'jobs.txt'
+    source.write_text("add 1 2\ndivide 1 0\n", encoding='utf-8')
+    target = tmp_path / 'out.txt'
+    assert cli.main([str(source), '-o', str(target)]) == 0
+    assert target.read_text(encoding='utf-8') == "3\nerror: division by zero\n"
+
+
+def test_empty_input():
+    assert evaluate([]) == []
+    sink = io.StringIO()
+    cli.stream(ComplexCalculator(), iter([]), sink)
+    assert sink.getvalue() == ''
+
+
+def test_batched_error_messages_match_single_lines():
+    groups = [["power 10 400"] * 10, ["power 0 -1"] * 10, ["log 0", "log -1", "log 10"] * 4,
+              ["power 10 400", "power -8 0.5", "power 2 3", "power 0 -1"] * 3, [f"divide {i % 2} 0" for i in range(10)]]
+    for lines in groups:
+        single = [cli.evaluate_one(ComplexCalculator(), cli.parse_line(line)) for line in lines]
+        assert evaluate(lines) == single
+    assert evaluate(["power 10 400"] * 10)[0] == 'error: math range error'
+
+
+def test_batched_nan_inputs_match_single_lines():
+    lines = [f"{op} nan" for op in ('log', 'ln', 'sqrt', 'sin', 'cos', 'tan') for _ in range(8)] + ["power nan 2"] * 8
+    single = [cli.evaluate_one(ComplexCalculator(), cli.parse_line(line)) for line in lines]
+    assert single == ['nan'] * len(lines)
+    assert evaluate(lines) == single
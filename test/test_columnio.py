@@ -0,0 +1,85 @@
+"""
+
+열 파일을 메모리 매핑으로 계산하는 evaluate_columns(columnio.py)를 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import math
+
+import numpy as np
+import pytest
+
+from calculator import ComplexCalculator, EngineeringCalculator, columnio
+
+eng_calc = EngineeringCalculator()
+
+
+def _column(tmp_path, name: str, values: any, dtype: str = 'float64') -> str:
+    path = tmp_path / name
+    np.asarray(values, dtype=dtype).tofile(path)
+    return str(path)
+
+
+def test_chunked_results_match_batch_method(tmp_path):
+    x = np.linspace(-720, 720, 1001)
+    source = _column(tmp_path, 'angles.f64', x)
+    values, valid = str(tmp_path / 'sines.f64'), str(tmp_path / 'valid.bool')
+    summary = columnio.evaluate_columns(eng_calc, 'sin_batch', [source], [values, valid],
+                                        chunk_size=64, angle_unit='degree')
+    assert summary == {'rows': 1001, 'chunks': 16, 'invalid': 0, 'errors': {}}
+    expected = eng_calc.sin_batch(x, angle_unit='degree')
+    np.testing.assert_array_equal(np.fromfile(values), expected.values)
+    assert np.fromfile(valid, dtype=bool).all()
+
+
+def test_constants_npy_and_invalid_counts(tmp_path):
+    source = tmp_path / 'x.npy'
+    np.save(source, np.array([4.0, -1.0, math.nan, 9.0]))
+    target = tmp_path / 'roots.npy'
+    summary = columnio.evaluate_columns(eng_calc, 'power_batch', [source, 0.5], target, chunk_size=3)
+    assert summary['invalid'] == 1 and summary['chunks'] == 2  # nan 입력은 nan 결과 (오류 아님)
+    result = np.load(target)
+    assert result[0] == 2 and result[3] == 3
+
+
+def test_error_policy_counts_and_skip(tmp_path):
+    source = _column(tmp_path, 'x.f64', [1, 0, -1, 100])
+    summary = columnio.evaluate_columns(eng_calc, 'log_batch', [source], str(tmp_path / 'y.f64'),
+                                        chunk_size=2, error_policy='nan')
+    assert summary['errors'] == {'divide_by_zero': 1, 'invalid': 1} and summary['invalid'] == 2
+    with pytest.raises(ValueError):
+        columnio.evaluate_columns(eng_calc, 'log_batch', [source], str(tmp_path / 'z.f64'), error_policy='skip')
+
+
+def test_complex_columns_and_dtype(tmp_path):
+    z = np.array([3 + 4j, 1j, -2, 0])
+    source = _column(tmp_path, 'z.c128', z, 'complex128')
+    target = str(tmp_path / 'magnitude.f64')
+    columnio.evaluate_columns(ComplexCalculator(), 'complex_magnitude_batch', [source], target, dtype='complex128')
+    assert np.fromfile(target).tolist() == [5, 1, 2, 0]
+
+    main_target = str(tmp_path / 'magnitude.f32')
+    assert columnio.main(['complex_magnitude_batch', source, '-o', main_target, '--dtype', 'complex128',
+                          '--option', 'dtype=complex64']) == 0
+    assert np.fromfile(main_target, dtype=np.float32).tolist() == [5, 1, 2, 0]
+
+
+def test_empty_and_mismatched_columns(tmp_path):
+    empty = _column(tmp_path, 'empty.f64', [])
+    target = str(tmp_path / 'out.f64')
+    assert columnio.evaluate_columns(eng_calc, 'square_root_batch', [empty], target)['rows'] == 0
+    assert np.fromfile(target).size == 0
+    other = _column(tmp_path, 'other.f64', [1, 2])
+    with pytest.raises(ValueError):
+        columnio.evaluate_columns(eng_calc, 'add_batch', [empty, other], target)
+    with pytest.raises(ValueError):
+        columnio.evaluate_columns(eng_calc, 'add_batch', [other, other], [target, target])
+    with pytest.raises(ValueError):
+        columnio.evaluate_columns(eng_calc, 'add_batch', [other, other], target, chunk_size=0)
+
+
+def test_pipeline_operation_writes_into_array(tmp_path):
+    source = _column(tmp_path, 'x.f64', [1, 4, 9])
+    out, valid = np.empty(3), np.empty(3, dtype=bool)
+    pipe = eng_calc.pipeline().square_root().add(1)
+    assert columnio.evaluate_columns(None, pipe, [source], [out, valid], chunk_size=2)['chunks'] == 2
+    assert out.tolist() == [2, 3, 4] and valid.all()
@@ -0,0 +1,60 @@
+"""
+
+ComplexCalculator 의 배치 매서드(complex_magnitude_batch, complex_argument_batch, cartesian_to_polar_batch)를 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import cmath
+import math
+
+import numpy as np
+import pytest
+
+from calculator import ComplexCalculator
+from calculator.complex import PolarArrays
+
+calc = ComplexCalculator()
+VALUES = [1 + 1j, 3 - 4j, -2, 0, -1j]
+
+
+def test_magnitude_and_argument_match_scalar():
+    assert calc.complex_magnitude_batch(VALUES).tolist() == [abs(z) for z in VALUES]
+    assert calc.complex_argument_batch(VALUES).tolist() == [cmath.phase(z) for z in VALUES]
+    degrees = calc.complex_argument_batch(VALUES, angle_unit='degree', precision=6)
+    assert degrees.tolist() == [round(math.degrees(cmath.phase(z)), 6) for z in VALUES]
+
+
+def test_real_and_imaginary_arrays_give_same_result():
+    z = np.array(VALUES)
+    assert calc.complex_magnitude_batch(z.real, z.imag).tolist() == calc.complex_magnitude_batch(z).tolist()
+    assert calc.complex_argument_batch(z.real, z.imag).tolist() == calc.complex_argument_batch(z).tolist()
+
+
+def test_cartesian_to_polar_batch_round_trip():
+    polar = calc.cartesian_to_polar_batch(VALUES, coordinate='cartesian')
+    assert isinstance(polar, PolarArrays)
+    back = calc.cartesian_to_polar_batch(polar.magnitude, polar.angle, coordinate='polar')
+    assert np.allclose(back, VALUES, atol=1e-15)
+    degree = calc.cartesian_to_polar_batch([1, 2], [0, 90], coordinate='polar', angle_unit='degree', precision=3)
+    assert degree.tolist() == [1, 2j]
+
+
+@pytest.mark.parametrize('angle_unit', ['radian', 'degree'])
+def test_cartesian_to_polar_scalar_and_batch_agree(angle_unit):
+    polar = calc.cartesian_to_polar_batch(VALUES, coordinate='cartesian', angle_unit=angle_unit)
+    for index, value in enumerate(VALUES):
+        assert np.allclose(calc.cartesian_to_polar(value, coordinate='cartesian', angle_unit=angle_unit),
+                           [polar.magnitude[index], polar.angle[index]], rtol=1e-15, atol=1e-15)
+    angles = [0, 30, 90, 180, -45, 1]
+    batch = calc.cartesian_to_polar_batch([2] * len(angles), angles, coordinate='polar', angle_unit=angle_unit)
+    single = [calc.cartesian_to_polar(2, angle, coordinate='polar', angle_unit=angle_unit) for angle in angles]
+    assert np.allclose(batch, single, rtol=1e-15, atol=1e-15)
+
+
+def test_cartesian_to_polar_batch_rejects_unknown_coordinate():
+    with pytest.raises(ValueError):
+        calc.cartesian_to_polar_batch(VALUES, coordinate='spherical')
+
+
+def test_complex_batch_empty_input():
+    assert calc.complex_magnitude_batch([]).shape == (0,)
+    assert calc.cartesian_to_polar_batch([], coordinate='cartesian').angle.shape == (0,)
@@ -0,0 +1,71 @@
+"""
+
+배치 매서드의 계산 자료형 연산 조건(dtype, utils.compute_dtype)을 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import numpy as np
+import pytest
+
+from calculator import ComplexCalculator, cli, utils
+
+calc = ComplexCalculator()
+angles = np.linspace(-360, 360, 1001)
+
+
+def test_default_dtype_is_unchanged():
+    assert np.issubdtype(calc.add_batch([1, 2], [3, 4]).dtype, np.integer)
+    assert calc.divide_batch([1, 2], [3, 4]).dtype == np.float64
+    assert calc.sin_batch(angles).values.dtype == np.float64
+
+
+@pytest.mark.parametrize('method, columns', [
+    ('add_batch', ([1.5, 2], [3, 4])),
+    ('multiply_batch', ([1, 2], [3, 4])),
+    ('divide_batch', ([1, 2], [3, 4])),
+    ('square_root_batch', ([4.0, 2.0],)),
+    ('complex_magnitude_batch', ([3 + 4j],)),
+])
+def test_single_precision_result_dtype(method, columns):
+    result = getattr(calc, method)(*columns, dtype='float32')
+    values = getattr(result, 'values', result)
+    assert values.dtype == np.float32
+    expected = getattr(calc, method)(*columns)
+    assert np.allclose(values, getattr(expected, 'values', expected), rtol=1e-6)
+
+
+def test_single_precision_error_is_bounded():
+    for method in ('sin_batch', 'cos_batch'):
+        single = getattr(calc, method)(angles, angle_unit='degree', dtype='float32').values
+        double = getattr(calc, method)(angles.astype(np.float32), angle_unit='degree').values
+        assert single.dtype == np.float32 and np.max(np.abs(single - double)) <= 3e-7
+    table = calc.sin_batch([30.0], angle_unit='degree', max_error=1e-6, dtype='float32').values
+    assert table.dtype == np.float32 and abs(table[0] - 0.5) <= 1e-6
+
+
+def test_complex_dtypes():
+    assert calc.add_batch([1 + 1j], [2], dtype='float32').dtype == np.complex64
+    assert calc.add_batch([1 + 1j], [2], dtype='complex128').dtype == np.complex128
+    assert calc.complex_magnitude_batch([3 + 4j], dtype='complex64').dtype == np.float32
+    assert utils.compute_dtype(utils.Options(dtype='complex64')) is np.float32
+    assert utils.compute_dtype(utils.Options(dtype='float64'), complex_=True) is np.complex128
+    assert utils.compute_dtype(utils.Options(), default=int) is int
+
+
+def test_divide_zero_check_uses_computed_dtype():
+    single = calc.divide_batch([1.0, 1.0], [1e-50, 1.0], dtype='float32', error_policy='nan')
+    assert single.errors == {'divide_by_zero': 1} and single.valid.tolist() == [False, True]
+    double = calc.divide_batch([1.0, 1.0], [1e-50, 1.0], error_policy='nan')
+    assert double.errors == {} and double.valid.all()
+
+
+def test_invalid_dtype():
+    with pytest.raises(ValueError):
+        utils.Options(dtype='int8')
+    with pytest.raises(ValueError):
+        calc.add_batch([1], [2], dtype='float16')
+
+
+def test_cli_groups_ignore_dtype():
+    line = "divide 1 3 dtype=float32"
+    single = cli.evaluate_one(calc, cli.parse_line(line))
+    assert cli.evaluate_lines(calc, [line] * 10) == [str(single)] * 10
@@ -0,0 +1,70 @@
+"""
+
+EngineeringCalculator 의 배치 매서드(square_root_batch, power_batch, log_batch, ln_batch, sin_batch, cos_batch, tan_batch)를 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import math
+
+import numpy as np
+
+from calculator import EngineeringCalculator, utils
+
+eng_calc = EngineeringCalculator()
+
+
+def test_square_root_batch_matches_scalar():
+    result = eng_calc.square_root_batch([0, 2, 16, 1e300])
+    assert isinstance(result, utils.BatchResult)
+    assert result.valid.all()
+    assert result.values.tolist() == [math.sqrt(x) for x in (0, 2, 16, 1e300)]
+
+
+def test_square_root_batch_domain_errors():
+    result = eng_calc.square_root_batch([4, -1, math.nan, math.inf])
+    assert result.valid.tolist() == [True, False, True, True]  # nan 은 math.sqrt 처럼 nan 결과
+    assert result.values[0] == 2 and math.isnan(result.values[1]) and math.isnan(result.values[2])
+
+
+def test_log_ln_batch_domain_errors():
+    for method, function in ((eng_calc.log_batch, math.log10), (eng_calc.ln_batch, math.log)):
+        result = method([100, 0, -1, math.nan, 1])
+        assert result.valid.tolist() == [True, False, False, True, True]
+        assert result.values[0] == function(100) and result.values[4] == 0
+        assert np.isnan(result.values[1:4]).all()
+        assert method([0, -1, math.nan], error_policy='nan').errors == {'divide_by_zero': 1, 'invalid': 1}
+
+
+def test_power_batch_domain_errors():
+    result = eng_calc.power_batch([2, -8, 0, 10, math.nan, math.nan], [3, 0.5, -1, 400, 0, 1])
+    assert result.valid.tolist() == [True, False, False, False, True, True]
+    assert result.values[0] == 8 and result.values[4] == 1
+    assert eng_calc.power_batch([2, 3], 2).values.tolist() == [4, 9]  # 지수는 숫자 하나도 받음
+
+
+def test_trig_batch_matches_scalar():
+    angles = [0, 30, 45, 90, 180, -270]
+    for name in ('sin', 'cos', 'tan'):
+        result = getattr(eng_calc, name + '_batch')(angles, angle_unit='degree')
+        expected = [getattr(math, name)(math.radians(x)) for x in angles]
+        assert result.valid.all()
+        assert np.allclose(result.values, expected, rtol=1e-12, atol=1e-15)
+
+
+def test_trig_batch_infinite_is_invalid_and_nan_passes_through():
+    for name in ('sin', 'cos', 'tan'):
+        result = getattr(eng_calc, name + '_batch')([math.inf, -math.inf, math.nan, 0])
+        assert result.valid.tolist() == [False, False, True, True]
+        assert math.isnan(getattr(math, name)(math.nan)) and math.isnan(result.values[2])
+
+
+def test_batch_empty_input():
+    for name in ('square_root', 'log', 'ln', 'sin', 'cos', 'tan'):
+        result = getattr(eng_calc, name + '_batch')([])
+        assert result.values.shape == (0,) and result.valid.shape == (0,)
+    assert eng_calc.power_batch([], []).values.shape == (0,)
+
+
+def test_batch_precision_and_return_float():
+    result = eng_calc.square_root_batch([2, 3], precision=3)
+    assert result.values.tolist() == [1.414, 1.732]
+    assert eng_calc.square_root_batch([4], return_float=True).values.dtype == np.float64
@@ -0,0 +1,108 @@
+"""
+
+연산 조건 error_policy('raise', 'nan', 'mask', 'skip')와 utils.CheckedResult 를 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import math
+
+import numpy as np
+import pytest
+
+from calculator import ComplexCalculator, utils
+
+calc = ComplexCalculator()
+POLICIES = ['nan', 'mask', 'skip']
+
+
+@pytest.mark.parametrize('policy', POLICIES)
+def test_divide_batch_counts_errors_by_kind(policy, capsys):
+    result = calc.divide_batch([1, 0, 4, -3], [0, 0, 2, 0], error_policy=policy)
+    assert isinstance(result, utils.CheckedResult)
+    assert result.errors == {'divide_by_zero': 2, 'invalid': 1}
+    assert result.valid.tolist() == [False, False, True, False]
+    if policy == 'skip':
+        assert result.values.tolist() == [2.0]
+    elif policy == 'mask':
+        assert result.values.mask.tolist() == [True, True, False, True] and result.values[2] == 2
+    else:
+        assert np.isnan(result.values[[0, 1, 3]]).all() and result.values[2] == 2
+    assert capsys.readouterr().out == ''
+
+
+def test_divide_batch_raise():
+    with pytest.raises(ZeroDivisionError, match='divide_by_zero 1개, 첫 위치 1'):
+        calc.divide_batch([1, 1, 4], [2, 0, 2], error_policy='raise')
+    assert calc.divide_batch([1, 4], [2, 2], error_policy='raise').errors == {}
+
+
+@pytest.mark.parametrize('policy', POLICIES)
+def test_engineering_batch_policies(policy):
+    power = calc.power_batch([2, -8, 0, 10], [3, 0.5, -1, 400], error_policy=policy)
+    assert power.errors == {'divide_by_zero': 1, 'invalid': 1, 'overflow': 1}
+    assert power.valid.tolist() == [True, False, False, False]
+    for method, values, errors in (('square_root_batch', [4, -1], {'invalid': 1}),
+                                   ('log_batch', [100, 0, -1], {'divide_by_zero': 1, 'invalid': 1}),
+                                   ('ln_batch', [1, 0], {'divide_by_zero': 1}),
+                                   ('sin_batch', [0, math.inf], {'invalid': 1}),
+                                   ('cos_batch', [0, -math.inf], {'invalid': 1}),
+                                   ('tan_batch', [0, math.inf], {'invalid': 1})):
+        result = getattr(calc, method)(values, error_policy=policy)
+        assert result.errors == errors, method
+        assert len(result.values) == (1 if policy == 'skip' else len(values)), method
+
+
+def test_engineering_batch_raise_uses_math_exceptions():
+    with pytest.raises(OverflowError, match='math range error'):
+        calc.power_batch([2, 10], [3, 400], error_policy='raise')
+    with pytest.raises(ValueError, match='math domain error'):
+        calc.square_root_batch([-1], error_policy='raise')
+    with pytest.raises(ValueError):
+        calc.ln_batch([0], error_policy='raise')
+
+
+@pytest.mark.parametrize('policy', POLICIES + ['raise'])
+def test_scalar_engineering_methods(policy):
+    calls = [(ValueError, lambda: calc.square_root(-1, error_policy=policy)),
+             (ValueError, lambda: calc.log(0, error_policy=policy)),
+             (ValueError, lambda: calc.ln(-1, error_policy=policy)),
+             (ValueError, lambda: calc.sin(math.inf, error_policy=policy)),
+             (OverflowError, lambda: calc.power(10, 400, error_policy=policy))]
+    for error, call in calls:
+        if policy == 'raise':
+            with pytest.raises(error):
+                call()
+        elif policy == 'skip':
+            assert call() is None
+        else:
+            assert math.isnan(call())
+    assert calc.square_root(16, error_policy=policy) == 4
+
+
+def test_scalar_errors_are_counted():
+    counted = ComplexCalculator()
+    metrics = counted.enable_metrics()
+    counted.power(10, 400, error_policy='nan')
+    counted.square_root(-1, error_policy='skip')
+    snapshot = metrics.snapshot()
+    assert snapshot['power']['errors'] == {'OverflowError': 1}
+    assert snapshot['square_root']['errors'] == {'ValueError': 1}
+
+
+def test_complex_divide_error_policy(capsys):
+    with pytest.raises(ZeroDivisionError):
+        calc.complex_divide(1 + 1j, 0, error_policy='raise')
+    nan = calc.complex_divide(1 + 1j, 0, error_policy='nan')
+    assert math.isnan(nan.real) and math.isnan(nan.imag)
+    assert math.isnan(calc.complex_divide(1j, 0, error_policy='mask').real)
+    assert calc.complex_divide(1j, 0, error_policy='skip') is None
+    assert calc.complex_divide(4j, 2, error_policy='raise') == 2j
+    assert capsys.readouterr().out == ''
+    assert calc.complex_divide(1j, 0) is None  # error_policy 가 없으면 기존처럼 오류를 출력
+    assert '에러났습니다' in capsys.readouterr().out
+
+
+def test_invalid_error_policy():
+    with pytest.raises(ValueError):
+        calc.divide(1, 0, error_policy='ignore')
+    with pytest.raises(ValueError):
+        calc.divide_batch([1], [0], error_policy='warn')
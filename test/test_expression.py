@@ -0,0 +1,60 @@
+"""
+
+계산식 계산(EngineeringCalculator.evaluate, expression.py)을 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import math
+
+import pytest
+
+from calculator import ComplexCalculator, EngineeringCalculator, expression, utils
+
+eng_calc = EngineeringCalculator()
+
+
+def test_evaluate_functions_variables_and_degrees():
+    result = eng_calc.evaluate("sin(30 deg) + sqrt(x) * log(y)", {'x': 16, 'y': 100})
+    assert math.isclose(result, 8.5)
+    assert math.isclose(eng_calc.evaluate("cos(a deg)", {'a': 60}), 0.5)
+    assert str(eng_calc.evaluate("1 / 3", options=utils.Options(precision=3))) == '0.333'
+    assert ComplexCalculator().evaluate("magnitude(3 + 4j)") == 5
+
+
+def test_degree_suffix_does_not_split_identifiers():
+    assert math.isclose(eng_calc.evaluate("x30 deg + 1", {'x30': 1}), math.radians(1) + 1)
+    assert math.isclose(eng_calc.evaluate("1.5deg"), math.radians(1.5))
+    assert math.isclose(eng_calc.evaluate(".5 deg"), math.radians(0.5))
+
+
+def test_power_is_bounded():
+    assert eng_calc.evaluate("2 ** 10") == 1024
+    assert eng_calc.evaluate("2 ** -1") == 0.5
+    assert eng_calc.evaluate("1 ** (10 ** 100)") == 1
+    with pytest.raises(OverflowError):
+        eng_calc.evaluate("9 ** 9 ** 9 ** 9")
+    with pytest.raises(OverflowError):
+        eng_calc.evaluate("2 ** x", {'x': expression.MAX_POWER_BITS + 1})
+
+
+def test_variables_cannot_shadow_functions():
+    with pytest.raises(ValueError):
+        eng_calc.evaluate("sin(1)", {'sin': 2})
+    with pytest.raises(ValueError):
+        eng_calc.evaluate("x", {'x': 1, '_power': 2})
+    assert eng_calc.evaluate("options + 1", {'options': 2}) == 3  # options 도 변수 이름으로 쓸 수 있음
+
+
+def test_rejected_syntax():
+    for text in ("__import__('os')", "x.real", "[1, 2]", "'a'", "open(1)", "sin(x=1)", "lambda: 1"):
+        with pytest.raises((ValueError, SyntaxError)):
+            eng_calc.evaluate(text, {'x': 1})
+    with pytest.raises(NameError):
+        eng_calc.evaluate("x + 1")
+
+
+def test_compiled_expressions_are_cached():
+    text = "sqrt(z) + 12345"
+    expression.compile_expression(text)
+    hits = expression.compile_expression.cache_info().hits
+    assert eng_calc.evaluate(text, {'z': 4}) == 12347
+    assert expression.compile_expression.cache_info().hits == hits + 1
@@ -0,0 +1,65 @@
+"""
+
+작업 파일을 여러 프로세스로 나눠 계산하는 run_jobs(jobs.py)를 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import io
+import os
+
+from calculator import ComplexCalculator, cli, jobs
+
+
+def _write(tmp_path, lines: list) -> tuple:
+    source = tmp_path / 'jobs.txt'
+    source.write_text(''.join(line + '\n' for line in lines), encoding='utf-8')
+    return str(source), str(tmp_path / 'out.txt')
+
+
+def _read(path: str) -> list:
+    with open(path, encoding='utf-8') as f:
+        return f.read().splitlines()
+
+
+def _flaky_chunk(lines: list) -> list:
+    """'crash' 가 든 덩어리는 작업 프로세스를 죽이고, 'boom' 이 든 덩어리는 오류를 냅니다."""
+    if any('crash' in line for line in lines):
+        os._exit(1)
+    if any('boom' in line for line in lines):
+        raise RuntimeError('boom')
+    return cli.evaluate_lines(ComplexCalculator(), lines)
+
+
+def test_outputs_keep_input_order(tmp_path):
+    lines = [f"add {i} 1" for i in range(50)] + ["divide 1 0", "", "# 주석", "sqrt 16"]
+    source, target = _write(tmp_path, lines)
+    summary = jobs.run_jobs(source, target, workers=2, chunk_size=7, log=io.StringIO())
+    assert summary == {'chunks': 8, 'lines': 54, 'failed': []}
+    assert _read(target) == cli.evaluate_lines(ComplexCalculator(), lines)
+
+
+def test_empty_input(tmp_path):
+    source, target = _write(tmp_path, [])
+    assert jobs.run_jobs(source, target, workers=1) == {'chunks': 0, 'lines': 0, 'failed': []}
+    assert _read(target) == []
+
+
+def test_failed_chunks_are_written_as_errors(tmp_path, monkeypatch):
+    monkeypatch.setattr(jobs, 'evaluate_chunk', _flaky_chunk)
+    lines = ["add 1 2", "add 3 4", "boom", "x", "add 5 6", "crash", "add 7 8"]
+    source, target = _write(tmp_path, lines)
+    log = io.StringIO()
+    summary = jobs.run_jobs(source, target, workers=2, chunk_size=2, log=log)
+    assert [index for index, _ in summary['failed']] == [1, 2]
+    assert summary['chunks'] == 4 and summary['lines'] == 7
+    outputs = _read(target)
+    assert outputs[:2] == ['3', '7'] and outputs[-1] == '15'
+    assert all(line.startswith('error: chunk 1 failed') for line in outputs[2:4])
+    assert all(line.startswith('error: chunk 2 failed') for line in outputs[4:6])
+    assert 'chunk 1 failed' in log.getvalue()
+
+
+def test_main_exit_code(tmp_path, capsys):
+    source, target = _write(tmp_path, ["multiply 2 3"])
+    assert jobs.main([source, target, '--workers', '1']) == 0
+    assert _read(target) == ['6']
+    assert '1 lines, 1 chunks, 0 failed' in capsys.readouterr().err
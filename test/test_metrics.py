@@ -0,0 +1,76 @@
+"""
+
+매서드별 호출 기록(enable_metrics, metrics.py)을 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import pytest
+
+from calculator import Calculator, EngineeringCalculator, metrics
+
+
+def test_calls_latency_and_errors_are_recorded():
+    calc = EngineeringCalculator()
+    recorder = calc.enable_metrics()
+    calc.add(1, 2)
+    calc.add(3, 4)
+    calc.divide(1, 0)  # 기존처럼 오류를 출력하고 None 을 반환하지만 횟수는 셈
+    calc.divide(1, 0, error_policy='nan')
+    with pytest.raises(ValueError):
+        calc.square_root(-1)
+    snapshot = recorder.snapshot()
+    assert snapshot['add']['calls'] == 2 and snapshot['add']['errors'] == {}
+    assert snapshot['add']['buckets']['+Inf'] == 2 and snapshot['add']['seconds'] > 0
+    assert snapshot['divide']['errors'] == {'ZeroDivisionError': 2}
+    assert snapshot['square_root'] == dict(snapshot['square_root'], calls=1, errors={'ValueError': 1})
+    assert list(snapshot['add']['buckets']) == [repr(bound) for bound in metrics.BUCKETS] + ['+Inf']
+
+
+def test_buckets_are_cumulative():
+    recorder = metrics.Metrics()
+    for seconds in (5e-7, 3e-6, 3e-6, 2.0):
+        recorder.observe('sin', seconds)
+    buckets = recorder.snapshot()['sin']['buckets']
+    assert buckets['1e-06'] == 1 and buckets['5e-06'] == 3 and buckets['1.0'] == 3 and buckets['+Inf'] == 4
+
+
+def test_disable_metrics_restores_methods():
+    calc = Calculator()
+    calc.enable_metrics()
+    assert 'add' in vars(calc)
+    calc.disable_metrics()
+    assert 'add' not in vars(calc) and calc.metrics is None
+    assert calc.add(1, 2) == 3
+
+
+def test_metrics_can_be_shared_and_cleared():
+    recorder = metrics.Metrics()
+    first, second = Calculator(), Calculator()
+    first.enable_metrics(recorder)
+    second.enable_metrics(recorder)
+    first.multiply(2, 3)
+    second.multiply(4, 5)
+    assert recorder.snapshot()['multiply']['calls'] == 2
+    recorder.clear()
+    assert recorder.snapshot() == {}
+
+
+def test_prometheus_text_and_sinks(tmp_path):
+    memory = metrics.MemorySink()
+    path = tmp_path / 'calculator.prom'
+    recorder = metrics.Metrics(sinks=[memory, metrics.PrometheusFileSink(str(path), prefix='calc')])
+    recorder.observe('divide', 1e-4)
+    recorder.count_error('divide', ZeroDivisionError())
+    snapshot = recorder.flush()
+    assert memory.last == snapshot
+    text = path.read_text(encoding='utf-8')
+    assert text == metrics.prometheus_text(snapshot, prefix='calc')
+    assert 'calc_errors_total{method="divide",error="ZeroDivisionError"} 1\n' in text
+    assert 'calc_latency_seconds_bucket{method="divide",le="0.0001"} 1\n' in text
+    assert 'calc_latency_seconds_count{method="divide"} 1\n' in text
+    assert metrics.prometheus_text({}).count('\n') == 4  # 기록이 없으면 HELP, TYPE 줄만
+
+
+def test_control_methods_are_not_recorded():
+    names = metrics.operation_names(EngineeringCalculator())
+    assert 'sin' in names and 'add_batch' in names
+    assert not set(names) & metrics.CONTROL_METHODS
@@ -0,0 +1,77 @@
+"""
+
+연산 조건 객체 utils.Options 와 resolve_options 의 검사, 캐시를 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import pickle
+
+import pytest
+
+from calculator import Calculator, EngineeringCalculator, utils
+
+
+def test_options_validation():
+    with pytest.raises(TypeError):
+        utils.Options(precision=2.0)
+    with pytest.raises(TypeError):
+        utils.Options(precision=True)
+    with pytest.raises(ValueError):
+        utils.Options(precision=-1)
+    with pytest.raises(TypeError):
+        utils.Options(return_float=1)
+    with pytest.raises(ValueError):
+        utils.Options(angle_unit='deg')
+    with pytest.raises(ValueError):
+        utils.Options(coordinate='spherical')
+    with pytest.raises(ValueError):
+        utils.Options(max_error=1.0)
+    assert utils.Options(precision=None).precision == 0
+
+
+def test_options_are_immutable_hashable_and_picklable():
+    options = utils.Options(precision=4, angle_unit='degree')
+    with pytest.raises(AttributeError):
+        options.precision = 2
+    assert options == utils.Options(angle_unit='degree', precision=4)
+    assert len({options, utils.Options(angle_unit='degree', precision=4)}) == 1
+    assert pickle.loads(pickle.dumps(options)) == options
+    assert options.replace(precision=2).precision == 2 and options.precision == 4
+    with pytest.raises(TypeError):
+        options.replace(unknown=1)
+
+
+def test_resolve_options_does_not_share_cache_between_types():
+    calc = Calculator()
+    assert str(calc.add(1, 2, precision=2)) == '3.00'
+    with pytest.raises(TypeError):
+        calc.add(1, 2, precision=2.0)  # 2 와 2.0 은 같은 캐시 키였음
+    assert calc.add(1, 2, return_float=True) == 3.0
+    with pytest.raises(TypeError):
+        calc.add(1, 2, return_float=1)
+
+
+def test_resolve_options_rejects_unknown_keywords():
+    with pytest.raises(TypeError):
+        Calculator().add(1, 2, precison=2)
+    with pytest.raises(ValueError):
+        EngineeringCalculator().sin(30, angle_unit='deg')
+
+
+def test_bound_and_per_call_options():
+    eng_calc = EngineeringCalculator(precision=4, angle_unit='degree')
+    assert str(eng_calc.sin(30)) == '0.5000'
+    assert str(eng_calc.sin(30, precision=2)) == '0.50'  # 호출 때 덮어씀
+    assert str(eng_calc.sin(30)) == '0.5000'  # 묶인 조건은 그대로
+    assert str(EngineeringCalculator().sin(30, options=utils.Options(angle_unit='degree', precision=1))) == '0.5'
+
+
+def test_resolve_options_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(utils, '_OPTIONS_CACHE_SIZE', 4)
+    monkeypatch.setattr(utils, '_OPTIONS_CACHE', type(utils._OPTIONS_CACHE)())
+    base = utils.DEFAULT_OPTIONS
+    hot = utils.resolve_options(base, {'precision': 1})
+    for precision in range(2, 12):
+        utils.resolve_options(base, {'precision': precision})
+        assert utils.resolve_options(base, {'precision': 1}) is hot  # 자주 쓰는 조합은 지워지지 않음
+        assert len(utils._OPTIONS_CACHE) <= 4
+    assert {options.precision for options in utils._OPTIONS_CACHE.values()} == {1, 9, 10, 11}
@@ -0,0 +1,41 @@
+"""
+
+calculator 패키지의 지연 불러오기(__init__.py 의 모듈 수준 __getattr__)를 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import json
+import subprocess
+import sys
+
+import pytest
+
+import calculator
+
+
+def _loaded_modules(code: str) -> dict:
+    """새 인터프리터에서 code 를 실행한 뒤 무거운 모듈들을 불러왔는지 반환합니다."""
+    script = (f"import sys\n{code}\nimport json\n"
+              "print(json.dumps({name: name in sys.modules for name in ('numpy', 'cmath', 'asyncio', 'calculator.engineering')}))")
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+def test_import_does_not_load_heavy_modules():
+    loaded = _loaded_modules("import calculator\nfrom calculator import Calculator\nCalculator().add(1, 2, precision=2)")
+    assert loaded == {'numpy': False, 'cmath': False, 'asyncio': False, 'calculator.engineering': False}
+
+
+def test_names_are_loaded_on_first_use():
+    loaded = _loaded_modules("from calculator import ComplexCalculator")
+    assert loaded['calculator.engineering'] and loaded['cmath'] and not loaded['asyncio']
+
+
+def test_package_attributes():
+    from calculator.basic import Calculator
+    assert calculator.Calculator is Calculator
+    assert calculator.registry.__name__ == 'calculator.registry'
+    assert set(calculator.__all__) <= set(dir(calculator)) and 'server' in dir(calculator)
+    with pytest.raises(AttributeError):
+        calculator.missing_name
+    with pytest.raises(ImportError):
+        from calculator import missing_name  # noqa: F401
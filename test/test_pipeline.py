@@ -0,0 +1,86 @@
+"""
+
+연산 파이프라인(EngineeringCalculator.pipeline, pipeline.py)을 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import math
+
+import numpy as np
+import pytest
+
+from calculator import EngineeringCalculator, utils
+from calculator.pipeline import Pipeline
+
+eng_calc = EngineeringCalculator()
+INPUTS = np.array([16, -1, 0, math.nan, math.inf, -math.inf, 1e-300, 99, 0.5, 2, 1e200, -8] * 5)
+
+
+def _chain(x: any, *steps: tuple) -> tuple:
+    """배치 매서드를 차례로 불러서 (결과, 유효성 마스크)를 반환합니다."""
+    valid = np.ones(len(x), dtype=bool)
+    for method, args, kwargs in steps:
+        result = getattr(eng_calc, method + '_batch')(x, *args, **kwargs)
+        if isinstance(result, utils.BatchResult):
+            valid &= result.valid
+            result = result.values
+        x = np.asarray(result, dtype=float)
+    return np.where(valid, x, np.nan), valid
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 32768])
+def test_pipeline_matches_batch_methods(chunk_size):
+    pipe = Pipeline(chunk_size=chunk_size).square_root().add(1).log().power(2).sin(angle_unit='degree')
+    result = pipe(INPUTS)
+    values, valid = _chain(INPUTS, ('square_root', (), {}), ('add', ([1] * len(INPUTS),), {}),
+                           ('log', (), {}), ('power', (2,), {}), ('sin', (), {'angle_unit': 'degree'}))
+    assert result.valid.tolist() == valid.tolist()
+    np.testing.assert_array_equal(result.values, values)
+
+
+@pytest.mark.parametrize('exponent', [0.5, -1, 0, 3, math.inf])
+def test_power_step_matches_power_batch(exponent):
+    result = Pipeline(chunk_size=5).power(exponent)(INPUTS)
+    expected = eng_calc.power_batch(INPUTS, exponent)
+    assert result.valid.tolist() == expected.valid.tolist()
+    np.testing.assert_array_equal(result.values[result.valid], expected.values[expected.valid])
+
+
+def test_nan_passes_through_domain_steps():
+    for step in ('square_root', 'log', 'ln', 'sin', 'cos', 'tan'):
+        result = getattr(Pipeline(), step)()([math.nan, 1.0])
+        assert result.valid.tolist() == [True, True] and math.isnan(result.values[0]), step
+    assert Pipeline().power(2)([math.nan]).valid.tolist() == [True]
+    assert Pipeline().power(0)([math.nan]).values.tolist() == [1]  # nan 의 0 거듭제곱은 1
+
+
+def test_divide_by_zero_and_rounding():
+    result = eng_calc.pipeline().divide(0)([1, 2, 0])
+    assert not result.valid.any() and np.isnan(result.values).all()
+    assert eng_calc.pipeline(precision=2).divide(3)([1, 2]).values.tolist() == [0.33, 0.67]
+    assert Pipeline().multiply(10).round(1).subtract(0.05)([0.123]).values.tolist() == [1.2 - 0.05]
+
+
+def test_shape_out_and_empty_input(tmp_path):
+    x = np.arange(12.0).reshape(3, 4)
+    result = Pipeline(chunk_size=5).square_root()(x)
+    assert result.values.shape == result.valid.shape == (3, 4)
+    np.testing.assert_array_equal(result.values, np.sqrt(x))
+
+    out = np.lib.format.open_memmap(str(tmp_path / 'out.npy'), mode='w+', dtype=float, shape=(3, 4))
+    assert Pipeline().add(1)(x, out=out).values is out
+    with pytest.raises(ValueError):
+        Pipeline().add(1)(x, out=np.empty(3))
+    assert Pipeline().sin()([]).values.size == 0
+
+
+def test_steps_return_new_pipelines_and_validate_arguments():
+    base = eng_calc.pipeline().square_root()
+    longer = base.add(1)
+    assert repr(base) == 'Pipeline(square_root())' and repr(longer) == 'Pipeline(square_root().add(1))'
+    for bad in (lambda: base.add('1'), lambda: base.power(True), lambda: base.round(1.5)):
+        with pytest.raises(TypeError):
+            bad()
+    with pytest.raises(ValueError):
+        Pipeline(chunk_size=0)
+    with pytest.raises(ValueError):
+        base.sin(angle_unit='deg')
@@ -0,0 +1,52 @@
+"""
+
+큰 정수 곱셈 트리(utils.product)와 그것을 쓰는 곱셈, 나눗셈 매서드를 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import math
+from fractions import Fraction
+
+from calculator import Calculator, ComplexCalculator, utils
+
+calc = Calculator()
+
+
+def test_product_matches_math_prod_for_big_integers():
+    values = [3 ** k + k for k in range(300)]
+    expected = math.prod(values)
+    assert utils.product(values) == expected
+    assert utils.product(tuple(values), start=-7) == -7 * expected
+    assert utils.product(iter(values)) == expected
+    assert utils.product(value for value in range(1, 5001)) == math.factorial(5000)  # 여러 덩어리에 걸친 반복자
+
+
+def test_product_keeps_float_and_complex_order():
+    values = [0.1, 0.2, 0.3] * 30
+    assert utils.product(values) == math.prod(values)
+    mixed = [1, -1, 7] * 120 + [1, -1] * 2000 + [0.5, 1e-300, 3]  # 정수 덩어리 뒤에 실수가 오는 반복자
+    assert utils.product(iter(mixed)) == math.prod(mixed)
+    assert utils.product([1 + 1j] * 40) == math.prod([1 + 1j] * 40)
+    assert utils.product([Fraction(1, 3)] * 100, start=2) == 2 * Fraction(1, 3 ** 100)
+
+
+def test_product_edge_cases():
+    assert utils.product([]) == 1 and utils.product(iter([]), start=5) == 5
+    assert utils.product([0] + list(range(1, 100))) == 0
+    assert utils.product([True] * 100) == 1 and type(utils.product([True] * 100)) is int
+    assert math.isnan(utils.product([2.0, math.nan, 0]))
+
+
+def test_iterator_product_matches_sequence_product():
+    for values in ([2, 3], [1.5, 2.0, 0.1], list(range(1, 100)), list(range(1, 3 * utils._PRODUCT_BLOCK)), [2] * 10 + [0.5]):
+        result = utils.product(iter(values), start=3)
+        assert result == utils.product(values, start=3) and type(result) is type(utils.product(values, start=3))
+    assert calc.divide(100, 2, 5) == 10 and calc.divide(5) == 5
+
+
+def test_methods_use_exact_big_integer_products():
+    values = list(range(1, 400))
+    assert calc.multiply(*values) == math.factorial(399)
+    assert calc.multiply_iter(iter(values)) == math.factorial(399)
+    assert calc.divide(10 ** 30, *[2] * 64) == 10 ** 30 / 2 ** 64
+    assert calc.divide(1, *values, 0) is None  # 0나누기는 기존처럼 출력하고 None
+    assert ComplexCalculator().complex_multiply(*[1j] * 400) == 1
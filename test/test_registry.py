@@ -0,0 +1,66 @@
+"""
+
+연산 목록(registry.py)이 계산기 클래스들과 맞는지 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import numpy as np
+import pytest
+
+import calculator
+from calculator import ComplexCalculator, EngineeringCalculator, registry, utils
+
+calc = ComplexCalculator()
+SAMPLE_OPTIONS = {'precision': 3, 'return_float': True, 'angle_unit': 'degree', 'coordinate': 'cartesian',
+                  'max_error': 1e-5, 'error_policy': 'nan'}
+
+
+def _arguments(operation: registry.Operation) -> tuple:
+    number = 0.5 + 1j if operation.domain == 'complex' else 0.5
+    return (number,) * (operation.arity or 2)
+
+
+@pytest.mark.parametrize('name', sorted(registry.OPERATIONS))
+def test_operations_match_calculator_methods(name):
+    operation = registry.get(name)
+    assert hasattr(getattr(calculator, operation.kind), name)
+    kwargs = {option: SAMPLE_OPTIONS[option] for option in operation.options}
+    assert registry.bind(calc, name)(*_arguments(operation), **kwargs) is not None  # 목록의 연산 조건을 모두 받음
+    if operation.batch is not None:
+        columns = [np.array(value, ndmin=1) for value in _arguments(operation)]
+        if name == 'cartesian_to_polar':
+            columns = columns[:1]
+        kwargs.pop('error_policy', None)
+        result = registry.bind(calc, name, batch=True)(*columns, **kwargs)
+        assert isinstance(result, utils.BatchResult) == operation.masked
+
+
+def test_integer_and_errors_metadata():
+    for name, operation in registry.OPERATIONS.items():
+        if operation.integer:
+            assert type(registry.bind(calc, name)(6, 3)) is int
+        for error in operation.errors:
+            assert issubclass(error, Exception)
+    with pytest.raises(ZeroDivisionError):
+        registry.bind(calc, 'divide')(1, 0, error_policy='raise')
+
+
+def test_get_aliases_and_unknown_names():
+    assert registry.get('sqrt') is registry.get('square_root')
+    assert registry.get('pow').batch == 'power_batch'
+    for name in ('nope', None, ['sin']):
+        with pytest.raises(ValueError):
+            registry.get(name)
+    with pytest.raises(ValueError):
+        registry.bind(calc, 'complex_add', batch=True)  # 배치 매서드가 없는 연산
+
+
+def test_bind_drops_options_for_plain_operations():
+    assert registry.bind(calc, 'complex_add')(1j, 2, precision=4) == 2 + 1j
+    sin = registry.bind(EngineeringCalculator(), 'sin')
+    assert str(sin(30, angle_unit='degree', precision=4)) == '0.5000'
+
+
+def test_cacheable_operations():
+    names = registry.cacheable(EngineeringCalculator())
+    assert 'sin' in names and 'add' not in names and 'complex_magnitude' not in names
+    assert 'complex_magnitude' in registry.cacheable(calc)
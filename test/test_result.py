@@ -0,0 +1,66 @@
+"""
+
+precision 을 지정한 결과 자료형 utils.Result 를 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import math
+import pickle
+
+import pytest
+
+from calculator import Calculator, EngineeringCalculator, utils
+
+
+def test_result_formats_only_when_printed():
+    result = Calculator().divide(1, 3, precision=4)
+    assert isinstance(result, utils.Result)
+    assert str(result) == repr(result) == f"{result}" == '0.3333'
+    assert result.value == 1 / 3  # 원래 값은 반올림하지 않음
+    assert f"{result:.2f}" == '0.33'
+
+
+def test_result_format_spec_keeps_precision_padding():
+    result = Calculator().add(1, 2, precision=2)
+    assert f"{result:>8}" == '    3.00' and f"{result:*<6}" == '3.00**' and f"{result:08}" == '00003.00'
+    assert f"{utils.Result(1 / 3, 3):>7}" == '  0.333'
+    assert f"{utils.Result(-1.5, 2):+}" == '-1.50'
+    big = 10 ** 30
+    assert f"{utils.Result(big, 1):>40}" == f"{big}.0".rjust(40)
+    assert f"{result:.1f}" == '3.0' and f"{result:e}" == format(3, 'e')  # 자릿수, 형식을 지정하면 그대로 따름
+    assert f"{utils.Result(0.25, 2):.>8}" == '....0.25'  # 채움 문자 '.' 은 자릿수 지정이 아님
+
+
+def test_result_pads_integers_without_float_conversion():
+    assert str(Calculator().add(1, 2, 3, precision=2)) == '6.00'
+    big = 10 ** 30
+    assert str(utils.Result(big, 1)) == f"{big}.0"  # 큰 정수를 실수로 바꾸지 않음
+
+
+def test_result_arithmetic_uses_raw_value():
+    result = utils.Result(1 / 3, 2)
+    assert result * 3 == 1.0
+    assert 1 - result == 1 - 1 / 3
+    assert result + utils.Result(1, 5) == 1 / 3 + 1
+    assert result == 1 / 3 and result < 1 and not result > 1
+    assert float(result) == 1 / 3 and int(utils.Result(2.7, 1)) == 2 and round(result, 1) == 0.3
+    assert hash(utils.Result(2, 3)) == hash(2)
+
+
+def test_result_chains_into_other_methods():
+    eng_calc = EngineeringCalculator()
+    assert eng_calc.square_root(Calculator().add(7, 9, precision=2)) == 4
+    assert math.isclose(eng_calc.sin(Calculator().divide(math.pi, 2, precision=1)), 1.0)
+
+
+def test_result_is_immutable_and_picklable():
+    result = utils.Result(2.5, 3)
+    with pytest.raises(AttributeError):
+        result.value = 1
+    copy = pickle.loads(pickle.dumps(result))
+    assert copy.value == 2.5 and copy.precision == 3
+    assert utils.Result(result, 1).value == 2.5  # Result 를 다시 감싸지 않음
+
+
+def test_round_result_without_precision_returns_value():
+    assert utils.round_result(1 / 3, 0) == 1 / 3
+    assert not isinstance(utils.round_result(5, 0), utils.Result)
@@ -0,0 +1,89 @@
+"""
+
+누적 연산 스캔(add_scan, divide_scan_batch 등, scan.py)을 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import numpy as np
+import pytest
+
+from calculator import Calculator, scan
+
+calc = Calculator()
+OPERATIONS = ('add', 'subtract', 'multiply', 'divide')
+
+
+@pytest.mark.parametrize('operation', OPERATIONS)
+def test_scan_matches_repeated_calls(operation):
+    values = [100, -20, 35, 0.5, 4, -3]
+    expected = [getattr(calc, operation)(*values[:i + 1]) for i in range(len(values))]
+    assert getattr(calc, operation + '_scan')(values) == expected
+    assert getattr(calc, operation + '_scan')(iter(values)) == expected  # 반복자는 한번만 읽음
+    batch = getattr(calc, operation + '_scan_batch')(values)
+    np.testing.assert_allclose(batch, expected, rtol=1e-15)
+
+
+def test_scan_options_and_types():
+    assert [str(value) for value in calc.add_scan([1, 2.5], precision=2)] == ['1.00', '3.50']
+    assert calc.multiply_scan([2, 3], return_float=True) == [2.0, 6.0]
+    assert calc.add_scan_batch([100, -20, 35]).tolist() == [100, 80, 115]
+    assert calc.add_scan_batch([100, -20, 35]).dtype.kind == 'i'
+    assert calc.divide_scan_batch([1, 2, 4]).dtype == np.float64  # 나눗셈은 항상 실수형
+    assert calc.multiply_scan(range(1, 30))[-1] == np.prod(np.arange(1, 30, dtype=object))  # 큰 정수도 정확함
+
+
+def test_empty_and_single_inputs():
+    for operation in OPERATIONS:
+        assert getattr(calc, operation + '_scan')([]) == []
+        assert getattr(calc, operation + '_scan_batch')([]).size == 0
+        assert getattr(calc, operation + '_scan')([7]) == [7]
+        assert getattr(calc, operation + '_scan_batch')([7]).tolist() == [7]
+
+
+def test_divide_scan_by_zero_keeps_old_behavior(capsys):
+    assert calc.divide_scan([1, 0, 2]) == [1, None, None]
+    assert '에러났습니다' in capsys.readouterr().out
+    assert calc.divide_scan_batch([1.0, 0.0, 2.0]).tolist() == [1, np.inf, np.inf]
+
+
+def test_divide_scan_error_policy_matches_divide(capsys):
+    with pytest.raises(ZeroDivisionError):
+        calc.divide_scan([1, 0, 2], error_policy='raise')
+    with pytest.raises(ZeroDivisionError):
+        calc.divide_scan_batch([1.0, 0.0, 2.0], error_policy='raise')
+    for policy in ('nan', 'mask', 'skip'):
+        expected = [calc.divide(*[8, 2, 0, 4][:i + 1], error_policy=policy) for i in range(4)]
+        result = calc.divide_scan([8, 2, 0, 4], error_policy=policy)
+        assert result[:2] == expected[:2] and [repr(value) for value in result[2:]] == [repr(value) for value in expected[2:]]
+    assert capsys.readouterr().out == ''
+
+    checked = calc.divide_scan_batch([0.0, 2.0, 0.0, 4.0], error_policy='nan')
+    assert checked.valid.tolist() == [True, True, False, False]
+    assert checked.errors == {'invalid': 2}
+    assert calc.divide_scan_batch([8, 2, 0], error_policy='skip').values.tolist() == [8, 4]
+    assert calc.divide_scan_batch([8, 2, 4], error_policy='mask', precision=2).values.tolist() == [8, 4, 1]
+
+
+def test_divide_scan_error_policy_is_counted():
+    counted = Calculator()
+    metrics = counted.enable_metrics()
+    counted.divide_scan([1, 0, 2], error_policy='nan')
+    assert metrics.snapshot()['divide_scan']['errors'] == {'ZeroDivisionError': 2}
+
+
+@pytest.mark.parametrize('operation', OPERATIONS)
+def test_blocked_parallel_scan_matches_single_thread(operation, monkeypatch):
+    monkeypatch.setattr(scan, 'PARALLEL_MIN_SIZE', 64)
+    monkeypatch.setattr(scan, 'BLOCK_MIN_SIZE', 16)
+    values = np.random.default_rng(0).uniform(0.9, 1.1, 1000)
+    single = scan.prefix_array(operation, values, workers=1)
+    blocked = scan.prefix_array(operation, values, workers=4)
+    np.testing.assert_allclose(blocked, single, rtol=1e-12)
+    integers = np.arange(1000)
+    assert scan.prefix_array('add', integers, workers=3).tolist() == np.cumsum(integers).tolist()
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        list(scan.prefix('power', [1, 2]))
+    with pytest.raises(ValueError):
+        scan.prefix_array('add', np.ones((2, 2)))
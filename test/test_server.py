@@ -0,0 +1,85 @@
+"""
+
+JSON 계산 서버(server.py)를 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import asyncio
+
+import pytest
+
+from calculator import server
+
+
+def run(coroutine: any) -> any:
+    return asyncio.run(coroutine)
+
+
+def test_parse_request():
+    assert server.parse_request({"op": "sin", "args": [30], "kwargs": {"precision": 4, "angle_unit": "degree"}}) == \
+        ('sin', (30,), (('angle_unit', 'degree'), ('precision', 4)))
+    assert server.parse_request({"op": "complex_add", "args": ["1+1j", 2]}) == ('complex_add', (1 + 1j, 2), ())
+    for message in ([1], {"args": [1]}, {"op": "nope"}, {"op": "add", "args": 1},
+                    {"op": "add", "args": [True]}, {"op": "add", "args": [[1]]},
+                    {"op": "sin", "args": [1], "kwargs": {"precision": [1]}}):
+        with pytest.raises(ValueError):
+            server.parse_request(message)
+
+
+def test_make_response():
+    assert server.make_response(1, '6') == {'id': 1, 'result': '6'}
+    assert server.make_response('a', 'error: division by zero') == {'id': 'a', 'error': 'division by zero'}
+
+
+def test_single_requests_are_coalesced():
+    async def demo():
+        async with server.CalculatorServer(port=0, window=0.05) as calc_server:
+            messages = [{"id": i, "op": "divide", "args": [i, i % 2]} for i in range(6)]
+            responses = await asyncio.gather(*[server.request(message, port=calc_server.port) for message in messages])
+            return responses, calc_server.coalescer.batches
+
+    responses, batches = run(demo())
+    assert responses[0] == {'id': 0, 'error': 'division by zero'}
+    assert responses[1] == {'id': 1, 'result': '1.0'}
+    assert batches < 6
+
+
+def test_batch_request_keeps_order_and_reports_bad_items():
+    async def demo():
+        async with server.CalculatorServer(port=0) as calc_server:
+            return await server.request([{"id": 1, "op": "add", "args": [1, 2]}, {"id": 2, "op": "bogus"},
+                                         "x", {"id": 4, "op": "sqrt", "args": [-1]}], port=calc_server.port)
+
+    responses = run(demo())
+    assert responses[0] == {'id': 1, 'result': '3'}
+    assert responses[1]['id'] == 2 and 'error' in responses[1]
+    assert responses[2]['id'] is None and 'error' in responses[2]
+    assert responses[3] == {'id': 4, 'error': 'math domain error'}
+    assert run(server.CalculatorServer().handle_message([])) == []
+
+
+def test_batch_request_is_split_by_max_batch():
+    async def demo():
+        async with server.CalculatorServer(port=0, window=0, max_batch=4, queue_size=4) as calc_server:
+            messages = [{"id": i, "op": "multiply", "args": [i, 2]} for i in range(10)]
+            responses = await server.request(messages, port=calc_server.port)
+            return responses, calc_server.coalescer.batches, calc_server.coalescer.requests
+
+    responses, batches, requests = run(demo())
+    assert [response['result'] for response in responses] == [str(i * 2) for i in range(10)]
+    assert requests == 10 and batches >= 3  # 한 묶음은 max_batch 개를 넘지 않음
+
+
+def test_invalid_json_line():
+    async def demo():
+        async with server.CalculatorServer(port=0) as calc_server:
+            reader, writer = await asyncio.open_connection(calc_server.host, calc_server.port)
+            writer.write(b'{not json\n\n{"id": 7, "op": "add", "args": [1]}\n')
+            await writer.drain()
+            lines = [await reader.readline(), await reader.readline()]
+            writer.close()
+            await writer.wait_closed()
+            return lines
+
+    first, second = run(demo())
+    assert b'"error"' in first
+    assert second.strip() == b'{"id": 7, "result": "1"}'
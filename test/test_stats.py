@@ -0,0 +1,67 @@
+"""
+
+한번 읽으면서 구하는 통계(Calculator.statistics, stats.py)를 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import math
+import pickle
+
+import numpy as np
+import pytest
+
+from calculator import Calculator, stats
+
+calc = Calculator()
+
+
+def _assert_matches_numpy(result: stats.Statistics, values: np.ndarray, ddof: int = 0):
+    assert result.count == values.size
+    assert math.isclose(result.mean, values.mean(), rel_tol=1e-12)
+    assert math.isclose(result.variance, values.var(ddof=ddof), rel_tol=1e-9)
+    assert math.isclose(result.stddev, values.std(ddof=ddof), rel_tol=1e-9)
+    assert result.minimum == values.min() and result.maximum == values.max()
+
+
+def test_statistics_matches_numpy():
+    values = np.random.default_rng(0).normal(1e9, 1.0, 200001)  # 평균이 커도 분산의 자릿수를 잃지 않음
+    _assert_matches_numpy(calc.statistics(values.tolist()), values)
+    _assert_matches_numpy(calc.statistics(values, ddof=1), values, ddof=1)
+    _assert_matches_numpy(calc.statistics(iter(values.tolist())), values)
+    assert str(calc.statistics(2, 4, [4, 4, 5], (x for x in (5, 7, 9)), precision=2)) == \
+        'Statistics(count=8, mean=5.00, variance=4.00, stddev=2.00, minimum=2.00, maximum=9.00)'
+
+
+def test_merged_shards_match_single_pass():
+    values = np.random.default_rng(1).uniform(-5, 5, 100000)
+    shards = [calc.statistics_accumulator().feed(part) for part in np.array_split(values, 7)]
+    shards[3] = calc.statistics_accumulator().feed(values[:0]).merge(shards[3])  # 빈 누적기에 합쳐도 같음
+    total = calc.statistics_accumulator()
+    for shard in shards:
+        total.merge(pickle.loads(pickle.dumps(shard)))
+    _assert_matches_numpy(total.result(), values)
+    single = calc.statistics_accumulator().feed(values).result()
+    assert math.isclose(total.result().variance, single.variance, rel_tol=1e-12)
+
+
+def test_empty_and_too_few_values():
+    empty = calc.statistics()
+    assert empty.count == 0 and all(math.isnan(value) for value in empty[1:])
+    assert calc.statistics([], np.array([])).count == 0
+    one = calc.statistics(5)
+    assert one.mean == 5 and one.variance == 0 and math.isnan(calc.statistics(5, ddof=1).variance)
+    merged = calc.statistics_accumulator().merge(calc.statistics_accumulator().feed([1, 3]))
+    assert merged.result().mean == 2
+
+
+@pytest.mark.parametrize('values', [[1, math.nan, 3], [math.nan, 1], [1, 2, math.nan]])
+def test_nan_propagates_like_numpy(values):
+    for result in (calc.statistics(values), calc.statistics(np.array(values)),
+                   calc.statistics_accumulator().feed(values[:1]).merge(
+                       calc.statistics_accumulator().feed(values[1:])).result()):
+        assert all(math.isnan(value) for value in result[1:])
+
+
+def test_infinite_values():
+    result = calc.statistics([math.inf, -math.inf])
+    assert math.isnan(result.mean) and result.minimum == -math.inf and result.maximum == math.inf
+    assert calc.statistics(np.array([math.inf, 1.0])).mean == math.inf
@@ -0,0 +1,79 @@
+"""
+
+숫자 표 읽기, 쓰기(tableio.py)와 배열 고정 소수점 변환 format_fixed 를 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import io
+import json
+import math
+
+import numpy as np
+import pytest
+
+from calculator import Calculator, EngineeringCalculator, tableio
+
+
+@pytest.mark.parametrize('precision', [1, 2, 4, 9])
+def test_format_fixed_matches_python_formatting(precision):
+    rng = np.random.default_rng(precision)
+    values = np.concatenate([
+        rng.uniform(-1e6, 1e6, 5000),
+        rng.standard_normal(5000) * 10.0 ** rng.integers(-12, 12, 5000),
+        np.arange(-200, 200) / 8 + 0.5 * 10.0 ** -precision,  # 반올림 경계에 걸친 값
+        [0.0, -0.0, 0.5, 1.5, 2.5, -2.5, 1e-300, 2.0 ** 53, 2.0 ** 53 + 2, 1e22, -1e300, 0.125, 0.375,
+         math.nan, math.inf, -math.inf],
+    ])
+    assert tableio.format_fixed(values, precision) == ['%.*f' % (precision, x) for x in values]
+
+
+def test_format_fixed_integers_complex_and_repr():
+    assert tableio.format_fixed(np.array([0, -7, 2 ** 62]), 2) == ['0.00', '-7.00', f'{2 ** 62}.00']
+    assert tableio.format_fixed(np.array([1 + 2j, complex(0, -0.5)]), 1) == ['1.0+2.0j', '0.0-0.5j']
+    assert tableio.format_fixed(np.array([0.1, 1 / 3]), 0) == [repr(0.1), repr(1 / 3)]  # precision 0 은 repr
+    assert tableio.format_fixed(np.array([], dtype=float), 3) == []
+
+
+def test_read_table_header_and_chunks(tmp_path):
+    path = tmp_path / 'operands.csv'
+    path.write_text("x,y\n1,2\n3.5,4\n-1,1e3\n", encoding='utf-8')
+    names, table = tableio.read_table(path)
+    assert names == ['x', 'y'] and table.tolist() == [[1, 2], [3.5, 4], [-1, 1000]]
+    names, chunks = tableio.open_table(path, chunk_rows=2)
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+
+    names, table = tableio.read_table(io.StringIO("1+2j\t-3.5j\n"), delimiter='\t', dtype=complex)
+    assert names is None and table.tolist() == [[1 + 2j, -3.5j]]
+    assert tableio.read_table(io.StringIO("a,b\n"))[1].shape == (0, 2)
+
+
+def test_write_table_formats(tmp_path):
+    column = np.array([0.5, math.nan, -2 / 3])
+    assert tableio.write_table(tmp_path / 'out.csv', [column], names=['sin'], precision=2) == 3
+    assert (tmp_path / 'out.csv').read_text() == "sin\n0.50\nnan\n-0.67\n"
+
+    tableio.write_table(tmp_path / 'out.jsonl', [column, np.array([1j, 2, 3])], names=['a', 'b'], precision=1)
+    rows = [json.loads(line) for line in (tmp_path / 'out.jsonl').read_text().splitlines()]
+    assert rows == [{'a': 0.5, 'b': [0.0, 1.0]}, {'a': None, 'b': [2.0, 0.0]}, {'a': -0.7, 'b': [3.0, 0.0]}]
+
+    tableio.write_table(tmp_path / 'out.bin', np.array([[1.0, 2.0], [3.0, 4.0]]))
+    assert np.fromfile(tmp_path / 'out.bin').tolist() == [1, 2, 3, 4]
+    with pytest.raises(ValueError):
+        tableio.TableWriter(io.BytesIO(), output_format='xml')
+
+
+def test_evaluate_table(tmp_path):
+    source = tmp_path / 'operands.csv'
+    source.write_text("x,y\n1,2\n3,0\n-4,8\n", encoding='utf-8')
+    target = tmp_path / 'out.csv'
+    summary = tableio.evaluate_table(Calculator(), 'divide_batch', source, target, chunk_rows=2, precision=3)
+    assert summary == {'rows': 3, 'chunks': 2, 'invalid': 0}
+    assert target.read_text() == "divide\n0.500\ninf\n-0.500\n"
+
+    summary = tableio.evaluate_table(EngineeringCalculator(), 'log_batch', io.StringIO("10\n0\n-1\n"),
+                                     tmp_path / 'log.csv', error_policy='skip')
+    assert summary['invalid'] == 2 and (tmp_path / 'log.csv').read_text() == "1.0\n"
+
+    empty = tmp_path / 'empty.csv'
+    empty.write_text("", encoding='utf-8')
+    assert tableio.evaluate_table(Calculator(), 'add_batch', empty, tmp_path / 'none.csv')['rows'] == 0
+    assert (tmp_path / 'none.csv').read_text() == ''
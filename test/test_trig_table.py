@@ -0,0 +1,64 @@
+"""
+
+max_error 를 준 삼각함수 배치 매서드(sin_batch, cos_batch, tan_batch, trig_table.py)의 오차 한계를 검사하는 테스트 파일입니다.
+python -m pytest test 로 실행합니다.
+"""
+import math
+
+import numpy as np
+import pytest
+
+from calculator import EngineeringCalculator, trig_table
+
+eng_calc = EngineeringCalculator()
+
+
+def _inputs(angle_unit: str) -> np.ndarray:
+    turn = 360.0 if angle_unit == 'degree' else 2 * math.pi
+    rng = np.random.default_rng(0)
+    return np.concatenate([rng.uniform(-turn, turn, 50000), rng.uniform(-1e6, 1e6, 5000),
+                           np.linspace(-turn, turn, 4097), [0.0, turn / 4, turn / 2, -turn / 4]])
+
+
+@pytest.mark.parametrize('max_error', [1e-9, 1e-7, 1e-5, 1e-3, 0.1])
+@pytest.mark.parametrize('angle_unit', ['radian', 'degree'])
+def test_table_error_is_bounded(max_error, angle_unit):
+    x = _inputs(angle_unit)
+    radians = np.radians(x) if angle_unit == 'degree' else x
+    for name in ('sin', 'cos', 'tan'):
+        values = getattr(trig_table, name)(x, angle_unit, max_error)
+        exact = getattr(np, name)(radians)
+        finite = np.abs(exact) < 1e6  # tan 의 극점 근처는 정확한 함수끼리도 차이가 큼
+        assert np.abs(values - exact)[finite].max() <= max_error, name
+
+
+def test_batch_methods_use_table_and_keep_bound():
+    x = _inputs('degree')
+    result = eng_calc.sin_batch(x, angle_unit='degree', max_error=1e-5)
+    assert result.valid.all()
+    assert np.abs(result.values - np.sin(np.radians(x))).max() <= 1e-5
+    assert trig_table.get_table(1e-5).size >= trig_table.MIN_SIZE
+
+
+def test_large_nan_and_infinite_inputs_use_exact_functions():
+    x = np.concatenate([np.linspace(0, 1, 2000), [1e300, -1e300, math.nan, math.inf]])
+    values = trig_table.sin(x, 'radian', 1e-3)
+    assert values[-4] == np.sin(1e300) and values[-3] == np.sin(-1e300)
+    assert np.isnan(values[-2:]).all()
+    result = eng_calc.cos_batch(x, max_error=1e-3)
+    assert result.valid.tolist()[-4:] == [True, True, True, False]  # nan 은 math.cos 처럼 nan 결과
+
+
+def test_small_and_empty_arrays():
+    x = np.linspace(-3, 3, 10)
+    assert trig_table.sin(x, 'radian', 1e-2).tolist() == np.sin(x).tolist()  # 작은 배열은 정확한 함수
+    assert eng_calc.sin_batch([], max_error=1e-3).values.size == 0
+
+
+def test_max_error_validation():
+    for value in (0, 1e-12, 1.0, -1e-5):
+        with pytest.raises(ValueError):
+            eng_calc.sin_batch([1.0], max_error=value)
+    for value in ('1e-5', True):
+        with pytest.raises(TypeError):
+            eng_calc.sin_batch([1.0], max_error=value)